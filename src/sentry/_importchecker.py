@@ -4,7 +4,10 @@ import atexit
 import builtins
 import functools
 import os
+import re
+import resource
 import sys
+import time
 from typing import IO
 
 real_import = builtins.__import__
@@ -13,9 +16,25 @@ real_import = builtins.__import__
 TRACK_IMPORTS = os.environ.get("SENTRY_TRACK_IMPORTS") == "1"
 TRACKED_PACKAGES = ("sentry", "getsentry")
 
+# With `SENTRY_PROFILE_IMPORTS=1`, the time spent importing every module and the growth of
+# the maximum RSS while doing so are recorded, and written to
+# `import-profile-<entry point>.txt` when the process exits. The report is written to
+# `SENTRY_PROFILE_IMPORTS_DIR`, or to the root of the checkout. Long running processes, like
+# consumers and workers, write it when they are shut down. Times are only exact for imports of
+# the main thread.
+PROFILE_IMPORTS = os.environ.get("SENTRY_PROFILE_IMPORTS") == "1"
+PROFILE_REPORT_SIZE = 50
+
 observations: set[tuple[str, str]] = set()
 import_order: list[str] = []
 
+# module name -> (cumulative seconds, self seconds, max RSS growth in KiB). Parent packages
+# imported along with a module, and modules imported with `importlib.import_module`, are
+# accounted to the module that imported them.
+import_profile: dict[str, tuple[float, float, int]] = {}
+# Seconds spent in nested imports, for every import that is in progress.
+_nested_import_times: list[float] = []
+
 
 def resolve_full_name(base, name, level):
     """Resolve a relative module name to an absolute one."""
@@ -124,10 +143,111 @@ def checking_import(name, globals=None, locals=None, fromlist=(), level=0):
         track_import(from_name, to_name, fromlist)
 
 
-def write_files():
+def get_entry_point() -> str:
+    """
+    Name of the entry point of this process, for instance `sentry-run-worker`.
+    """
+    words = [os.path.basename(sys.argv[0]) if sys.argv else "python"]
+    # Options and their values are skipped, subcommands name the entry point.
+    words.extend(arg for arg in sys.argv[1:4] if not arg.startswith("-") and "=" not in arg)
+    return re.sub(r"[^\w.-]+", "-", "-".join(words)).strip("-")
+
+
+def _get_max_rss() -> int:
+    # KiB on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _get_loaded_module(name, fromlist, loaded_before):
+    if loaded_before is None:
+        return name if name in sys.modules else None
+    # `from package import module` imports the module with an already imported package.
+    for item in fromlist or ():
+        module_name = f"{name}.{item}"
+        if module_name in sys.modules and module_name not in loaded_before:
+            return module_name
+    return None
+
+
+def profile_import(wrapped_import):
+    @functools.wraps(wrapped_import)
+    def profiling_import(name, globals=None, locals=None, fromlist=(), level=0):
+        if globals is None:
+            globals = sys._getframe(1).f_globals
+
+        to_name = name
+        if level:
+            package = globals.get("__package__") or globals.get("__name__")
+            if not package:
+                return wrapped_import(name, globals, locals, fromlist, level)
+            to_name = resolve_full_name(package, name, level)
+
+        # Fast path for modules that were imported before, which are most imports.
+        if to_name in sys.modules and not fromlist:
+            return wrapped_import(name, globals, locals, fromlist, level)
+
+        loaded_before = (
+            {f"{to_name}.{item}" for item in fromlist if f"{to_name}.{item}" in sys.modules}
+            if to_name in sys.modules
+            else None
+        )
+        start = time.perf_counter()
+        start_rss = _get_max_rss()
+        _nested_import_times.append(0.0)
+        try:
+            return wrapped_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = _nested_import_times.pop()
+            if _nested_import_times:
+                _nested_import_times[-1] += elapsed
+
+            module_name = _get_loaded_module(to_name, fromlist, loaded_before)
+            if module_name is not None and module_name not in import_profile:
+                import_profile[module_name] = (
+                    elapsed,
+                    elapsed - nested,
+                    _get_max_rss() - start_rss,
+                )
+
+    return profiling_import
+
+
+def emit_import_profile(filename):
+    total = sum(self_time for _, self_time, _ in import_profile.values())
+
+    def _write_modules(f, title, key):
+        f.write(f"\n{title}:\n")
+        f.write(f"  {'cumulative':>10}  {'self':>10}  {'max rss':>10}  module\n")
+        top_n = sorted(import_profile.items(), key=key, reverse=True)
+        for name, (cumulative, self_time, rss) in top_n[:PROFILE_REPORT_SIZE]:
+            f.write(
+                f"  {cumulative * 1000:8.1f}ms  {self_time * 1000:8.1f}ms  {rss / 1024:7.1f}MiB  {name}\n"
+            )
+
+    with open(filename, "w") as f:
+        f.write(f"Entry point: {' '.join(sys.argv)}\n")
+        f.write(f"Modules imported: {len(import_profile)}\n")
+        f.write(f"Import time: {total * 1000:.1f}ms\n")
+        f.write(f"Max RSS: {_get_max_rss() / 1024:.1f}MiB\n")
+        _write_modules(f, "Slowest imports", key=lambda item: item[1][0])
+        _write_modules(f, "Slowest modules, excluding their imports", key=lambda item: item[1][1])
+        _write_modules(f, "Largest imports", key=lambda item: item[1][2])
+
+
+def get_base_dir():
     import sentry
 
-    base = os.path.abspath(os.path.join(sentry.__file__, "../../.."))
+    return os.path.abspath(os.path.join(sentry.__file__, "../../.."))
+
+
+def write_import_profile():
+    directory = os.environ.get("SENTRY_PROFILE_IMPORTS_DIR") or get_base_dir()
+    emit_import_profile(os.path.join(directory, f"import-profile-{get_entry_point()}.txt"))
+
+
+def write_files():
+    base = get_base_dir()
 
     emit_dot(os.path.join(base, "import-graph.dot"))
     emit_ascii_tree(os.path.join(base, "import-graph.txt"))
@@ -136,3 +256,7 @@ def write_files():
 if TRACK_IMPORTS:
     builtins.__import__ = checking_import
     atexit.register(write_files)
+
+if PROFILE_IMPORTS:
+    builtins.__import__ = profile_import(builtins.__import__)
+    atexit.register(write_import_profile)
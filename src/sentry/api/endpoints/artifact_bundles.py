@@ -16,6 +16,7 @@ from sentry.api.exceptions import ResourceDoesNotExist, SentryAPIException
 from sentry.api.paginator import OffsetPaginator
 from sentry.api.serializers import serialize
 from sentry.api.serializers.models.artifactbundle import ArtifactBundlesSerializer
+from sentry.debug_files.artifact_bundles import invalidate_artifact_bundle_lookups
 from sentry.models.artifactbundle import ArtifactBundle, ProjectArtifactBundle
 from sentry.utils.db import atomic_transaction
 
@@ -189,6 +190,8 @@ class ArtifactBundlesEndpoint(ProjectEndpoint, ArtifactBundlesMixin):
                             for project_artifact_bundle in project_artifact_bundles:
                                 if project_id == project_artifact_bundle.project_id:
                                     project_artifact_bundle.delete()
+
+                    invalidate_artifact_bundle_lookups(found_project_ids)
                 else:
                     error = f"Artifact bundle with {bundle_id} found but it is not connected to project {project_id}"
 
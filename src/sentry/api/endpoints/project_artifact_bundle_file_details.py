@@ -101,7 +101,9 @@ class ProjectArtifactBundleFileDetailsEndpoint(
             )
 
         try:
-            archive = ArtifactBundleArchive(artifact_bundle.file.getfile(), build_memory_map=False)
+            archive = ArtifactBundleArchive(
+                artifact_bundle.file.getfile(), checksum=artifact_bundle.file.checksum
+            )
         except Exception as exc:
             sentry_sdk.capture_exception(exc)
             return Response(
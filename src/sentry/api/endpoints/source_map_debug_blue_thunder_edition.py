@@ -471,8 +471,9 @@ class ReleaseLookupData:
             self.source_file_lookup_result = "wrong-dist"
         for possible_release_artifact_bundle in possible_release_artifact_bundles:
             if possible_release_artifact_bundle.dist_name == (self.event.dist or ""):
+                artifact_bundle_file = possible_release_artifact_bundle.artifact_bundle.file
                 with ArtifactBundleArchive(
-                    possible_release_artifact_bundle.artifact_bundle.file.getfile()
+                    artifact_bundle_file.getfile(), checksum=artifact_bundle_file.checksum
                 ) as archive:
                     archive_urls = archive.get_all_urls()
                     for potential_source_file_name in self.matching_source_file_names:
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import copy
 import functools
 import re
+import threading
+from collections import OrderedDict
 from collections.abc import Callable, Generator, Mapping, Sequence
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
@@ -689,6 +692,10 @@ class SearchVisitor(NodeVisitor[list[QueryToken]]):
         super().__init__()
 
         self.config = config
+        # Set when the result depends on the current time, such as for relative dates.
+        self.is_time_dependent = False
+        # Set when the result is resolved further depending on the request, such as `is:`.
+        self.is_context_dependent = False
 
         if TYPE_CHECKING:
             from sentry.search.events.builder.discover import UnresolvedQuery
@@ -911,6 +918,7 @@ class SearchVisitor(NodeVisitor[list[QueryToken]]):
         (search_key, _, value) = children
 
         if self.is_date_key(search_key.name):
+            self.is_time_dependent = True
             try:
                 dt_range = parse_datetime_range(value.text)
             except InvalidQuery as exc:
@@ -1206,6 +1214,7 @@ class SearchVisitor(NodeVisitor[list[QueryToken]]):
         operator_s = handle_negation(negation, operator)
         is_date_aggregate = any(key in search_key.name for key in self.config.date_keys)
         if is_date_aggregate:
+            self.is_time_dependent = True
             try:
                 dt_range = parse_datetime_range(search_value.text)
             except InvalidQuery as exc:
@@ -1269,6 +1278,7 @@ class SearchVisitor(NodeVisitor[list[QueryToken]]):
         ],
     ) -> SearchFilter:
         negation, _, _, _, search_value = children
+        self.is_context_dependent = True
 
         translators = self.config.is_filter_translation
 
@@ -1691,6 +1701,83 @@ default_config = SearchConfig(
 )
 
 
+PARSE_CACHE_SIZE = 1000
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_tree(query: str) -> Node:
+    return event_search_grammar.parse(query)
+
+
+class _SearchResultCache:
+    """
+    Bounded cache of the tokens of parsed queries, by query and config.
+
+    Configs are not hashable, they are compared by identity instead. Entries keep a
+    reference to their config, so that its id is not reused while they are cached.
+    Configs are expected not to be changed once they are used.
+
+    Tokens can hold mutable values such as lists, so they are copied both when they are
+    cached and when they are returned.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[
+            tuple[str, int], tuple[SearchConfig[Any], Sequence[QueryToken]]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, query: str, config: SearchConfig[Any]) -> Sequence[QueryToken] | None:
+        key = (query, id(config))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] is not config:
+                return None
+            self._entries.move_to_end(key)
+            tokens = entry[1]
+        return copy.deepcopy(list(tokens))
+
+    def set(self, query: str, config: SearchConfig[Any], tokens: Sequence[QueryToken]) -> None:
+        tokens = copy.deepcopy(tuple(tokens))
+        with self._lock:
+            self._entries[(query, id(config))] = (config, tokens)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_search_results = _SearchResultCache(PARSE_CACHE_SIZE)
+
+# Values that are resolved after parsing depending on the request, like the current user
+# or the latest release. Results with them are not cached, nor are results of `is:` filters.
+CONTEXT_DEPENDENT_VALUES = frozenset(["me", "my_teams", "latest"])
+
+
+def _has_context_dependent_values(tokens: Sequence[QueryToken]) -> bool:
+    for token in tokens:
+        if isinstance(token, ParenExpression):
+            if _has_context_dependent_values(token.children):
+                return True
+        elif isinstance(token, SearchFilter):
+            raw_value = token.value.raw_value
+            values = raw_value if isinstance(raw_value, (list, tuple)) else [raw_value]
+            if any(
+                isinstance(value, str) and value.lower() in CONTEXT_DEPENDENT_VALUES
+                for value in values
+            ):
+                return True
+    return False
+
+
+def clear_parse_caches() -> None:
+    _parse_tree.cache_clear()
+    _search_results.clear()
+
+
 @overload
 def parse_search_query(
     query: str,
@@ -1724,8 +1811,16 @@ def parse_search_query(
     if config is None:
         config = default_config
 
+    # The result only depends on the query and the config if there are no params and
+    # callbacks, see `_search_results`.
+    cacheable = params is None and get_field_type is None and get_function_result_type is None
+    if cacheable:
+        cached = _search_results.get(query, config)
+        if cached is not None:
+            return cached
+
     try:
-        tree = event_search_grammar.parse(query)
+        tree = _parse_tree(query)
     except IncompleteParseError as e:
         idx = e.column()
         prefix = query[max(0, idx - 5) : idx]
@@ -1737,9 +1832,18 @@ def parse_search_query(
             )
         )
 
-    return SearchVisitor(
+    visitor = SearchVisitor(
         config,
         params=params,
         get_field_type=get_field_type,
         get_function_result_type=get_function_result_type,
-    ).visit(tree)
+    )
+    tokens = visitor.visit(tree)
+    if (
+        cacheable
+        and not visitor.is_time_dependent
+        and not visitor.is_context_dependent
+        and not _has_context_dependent_values(tokens)
+    ):
+        _search_results.set(query, config, tokens)
+    return tokens
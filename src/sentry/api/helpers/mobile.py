@@ -1,12 +1,22 @@
 from __future__ import annotations
 
-from sentry.api.helpers.android_models import ANDROID_MODELS
+import functools
+
 from sentry.api.helpers.ios_models import IOS_MODELS
 
 
+# The table of Android devices is large, it is only loaded once a device name is looked up.
+@functools.cache
+def _get_android_models() -> dict[str, str]:
+    from sentry.api.helpers.android_models import ANDROID_MODELS
+
+    return ANDROID_MODELS
+
+
 def get_readable_device_name(device: str) -> str | None:
     if device in IOS_MODELS:
         return IOS_MODELS[device]
-    if device in ANDROID_MODELS:
-        return ANDROID_MODELS[device]
+    android_models = _get_android_models()
+    if device in android_models:
+        return android_models[device]
     return None
@@ -142,6 +142,9 @@ SENTRY_SPAN_BUFFER_CLUSTER = "default"
 SENTRY_ASSEMBLE_CLUSTER = "default"
 SENTRY_UPTIME_DETECTOR_CLUSTER = "default"
 SENTRY_WORKFLOW_ENGINE_REDIS_CLUSTER = "default"
+# Must be a redis cluster (or a single host): event frequency counters are read with
+# multi-key commands that rely on hash tags.
+SENTRY_RULE_FREQUENCY_COUNTERS_REDIS_CLUSTER = "default"
 
 # Hosts that are allowed to use system token authentication.
 # http://en.wikipedia.org/wiki/Reserved_IP_addresses
@@ -1906,6 +1909,9 @@ SENTRY_METRICS_PREFIX = "sentry."
 SENTRY_METRICS_SKIP_INTERNAL_PREFIXES: list[str] = []  # Order this by most frequent prefixes.
 SENTRY_METRICS_SKIP_ALL_INTERNAL = False
 SENTRY_METRICS_DISALLOW_BAD_TAGS = IS_DEV
+# Options of the client-side metrics aggregator (see `sentry.metrics.preaggregation`),
+# or None to send every metric to the backend when it is recorded.
+SENTRY_METRICS_PREAGGREGATION: dict[str, Any] | None = None
 
 # Metrics product
 SENTRY_METRICS_INDEXER = "sentry.sentry_metrics.indexer.postgres.postgres_v2.PostgresIndexer"
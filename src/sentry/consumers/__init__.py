@@ -75,6 +75,19 @@ def issue_occurrence_options() -> list[click.Option]:
     ]
 
 
+def query_subscription_options() -> list[click.Option]:
+    """Return a list of query subscription results options."""
+    return [
+        *multiprocessing_options(default_max_batch_size=100),
+        click.Option(
+            ["--mode", "mode"],
+            type=click.Choice(["parallel", "batched"]),
+            default="parallel",
+            help="The mode to process subscription updates in. Parallel processes updates one by one with multi-processing, batched processes the updates of a batch together in a single process.",
+        ),
+    ]
+
+
 def ingest_replay_recordings_options() -> list[click.Option]:
     """Return a list of ingest-replay-recordings options."""
     options = multiprocessing_options(default_max_batch_size=10)
@@ -143,6 +156,13 @@ def uptime_options() -> list[click.Option]:
         click.Option(["--processes", "num_processes"], default=1, type=int),
         click.Option(["--input-block-size"], type=int, default=None),
         click.Option(["--output-block-size"], type=int, default=None),
+        click.Option(
+            ["--local-state", "local_state"],
+            type=bool,
+            is_flag=True,
+            default=False,
+            help="Keep the state of subscriptions of the assigned partitions in memory, writing it to redis after every batch. Only used in batched-parallel mode.",
+        ),
     ]
     return options
 
@@ -287,38 +307,47 @@ KAFKA_CONSUMERS: Mapping[str, ConsumerDefinition] = {
     "events-subscription-results": {
         "topic": Topic.EVENTS_SUBSCRIPTIONS_RESULTS,
         "strategy_factory": "sentry.snuba.query_subscriptions.run.QuerySubscriptionStrategyFactory",
-        "click_options": multiprocessing_options(default_max_batch_size=100),
+        "click_options": query_subscription_options(),
         "static_args": {"dataset": "events"},
     },
     "transactions-subscription-results": {
         "topic": Topic.TRANSACTIONS_SUBSCRIPTIONS_RESULTS,
         "strategy_factory": "sentry.snuba.query_subscriptions.run.QuerySubscriptionStrategyFactory",
-        "click_options": multiprocessing_options(default_max_batch_size=100),
+        "click_options": query_subscription_options(),
         "static_args": {"dataset": "transactions"},
     },
     "generic-metrics-subscription-results": {
         "topic": Topic.GENERIC_METRICS_SUBSCRIPTIONS_RESULTS,
         "validate_schema": True,
         "strategy_factory": "sentry.snuba.query_subscriptions.run.QuerySubscriptionStrategyFactory",
-        "click_options": multiprocessing_options(default_max_batch_size=100),
+        "click_options": query_subscription_options(),
         "static_args": {"dataset": "generic_metrics"},
     },
     "metrics-subscription-results": {
         "topic": Topic.METRICS_SUBSCRIPTIONS_RESULTS,
         "strategy_factory": "sentry.snuba.query_subscriptions.run.QuerySubscriptionStrategyFactory",
-        "click_options": multiprocessing_options(default_max_batch_size=100),
+        "click_options": query_subscription_options(),
         "static_args": {"dataset": "metrics"},
     },
     "eap-spans-subscription-results": {
         "topic": Topic.EAP_SPANS_SUBSCRIPTIONS_RESULTS,
         "strategy_factory": "sentry.snuba.query_subscriptions.run.QuerySubscriptionStrategyFactory",
-        "click_options": multiprocessing_options(default_max_batch_size=100),
+        "click_options": query_subscription_options(),
         "static_args": {"dataset": "events_analytics_platform"},
     },
     "ingest-events": {
         "topic": Topic.INGEST_EVENTS,
         "strategy_factory": "sentry.ingest.consumer.factory.IngestStrategyFactory",
-        "click_options": ingest_events_options(),
+        "click_options": [
+            *ingest_events_options(),
+            click.Option(
+                ["--batched-preparation", "batched_preparation"],
+                is_flag=True,
+                default=False,
+                help="Deduplicate, fetch projects for and store a whole batch of events at once, "
+                "before dispatching each event.",
+            ),
+        ],
         "static_args": {
             "consumer_type": ConsumerType.Events,
         },
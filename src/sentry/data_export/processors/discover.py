@@ -8,7 +8,7 @@ from sentry.models.group import Group
 from sentry.models.project import Project
 from sentry.search.events.fields import get_function_alias
 from sentry.search.events.types import SnubaParams
-from sentry.snuba import discover
+from sentry.snuba import discover, transactions
 from sentry.snuba.utils import get_dataset
 
 from ..base import ExportError
@@ -84,6 +84,12 @@ class DiscoverProcessor:
         if dataset is None:
             dataset = discover
 
+        # Exports read every column of large pages, the discover based datasets can process
+        # those a column at a time
+        extra_kwargs = {}
+        if dataset in (discover, transactions):
+            extra_kwargs["columnar"] = True
+
         def data_fn(offset, limit):
             return dataset.query(
                 selected_columns=fields,
@@ -97,6 +103,7 @@ class DiscoverProcessor:
                 auto_fields=True,
                 auto_aggregations=True,
                 use_aggregate_conditions=True,
+                **extra_kwargs,
             )
 
         return data_fn
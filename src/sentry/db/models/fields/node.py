@@ -89,6 +89,13 @@ class NodeData(MutableMapping[str, Any]):
     def copy(self):
         return self.data.copy()
 
+    @property
+    def is_fetched(self) -> bool:
+        """
+        Whether the data is present, or still needs to be fetched from nodestore.
+        """
+        return self._node_data is not None or not self.id
+
     @cached_property
     def data(self):
         """
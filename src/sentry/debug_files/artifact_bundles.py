@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import random
-from datetime import datetime, timedelta
+import uuid
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
 
 import sentry_sdk
 from django.conf import settings
@@ -22,8 +24,9 @@ from sentry.models.artifactbundle import (
 )
 from sentry.models.organization import Organization
 from sentry.models.project import Project
-from sentry.utils import metrics, redis
+from sentry.utils import json, metrics, redis
 from sentry.utils.db import atomic_transaction
+from sentry.utils.hashlib import md5_text
 
 # The number of Artifact Bundles that we return in case of incomplete indexes.
 MAX_BUNDLES_QUERY = 5
@@ -39,6 +42,10 @@ AVAILABLE_FOR_RENEWAL_DAYS = 30
 # optimize it based on the time taken to perform the indexing (on average).
 INDEXING_CACHE_TIMEOUT = 600
 
+# Number of seconds for which the lookup cache version of a project is kept. Cached lookups must expire well before
+# that, see `_get_lookup_cache_version`.
+LOOKUP_CACHE_VERSION_TIMEOUT = 24 * 60 * 60
+
 # ===== Indexing of Artifact Bundles =====
 
 
@@ -128,7 +135,7 @@ def index_urls_in_bundle(
 ):
     # We first open up the bundle and extract all the things we want to index from it.
     archive = existing_archive or ArtifactBundleArchive(
-        artifact_bundle.file.getfile(), build_memory_map=False
+        artifact_bundle.file.getfile(), checksum=artifact_bundle.file.checksum
     )
     urls_to_index = []
     try:
@@ -181,6 +188,9 @@ def index_urls_in_bundle(
         metrics.incr("artifact_bundle_indexing.bundles_indexed")
         metrics.incr("artifact_bundle_indexing.urls_indexed", len(urls_to_index))
 
+    # Lookups of the bundle now go through the url index.
+    invalidate_artifact_bundle_lookups_for_bundle(artifact_bundle.id)
+
 
 # ===== Renewal of Artifact Bundles =====
 
@@ -283,13 +293,73 @@ def renew_artifact_bundle(artifact_bundle_id: int, threshold_date: datetime, now
     # If the transaction succeeded, and we did actually modify some rows, we want to track the metric.
     if updated_rows_count > 0:
         metrics.incr("artifact_bundle_renewal.were_renewed")
+        # Cached lookups still have the old `date_added`, which would make us try renewing the bundle again.
+        invalidate_artifact_bundle_lookups_for_bundle(artifact_bundle_id)
+
+
+# ===== Caching of Artifact Bundle Lookups =====
+#
+# With `symbolicator.sourcemaps-lookup-cache-ttl` set, the results of `query_artifact_bundles_containing_file` are
+# cached in redis. The cache keys contain a version per project, which is replaced whenever bundles of the project are
+# uploaded, deleted, indexed or renewed, which invalidates all the cached lookups of the project at once. Bundles
+# that expire are deleted in bulk, cached lookups may still contain them until they expire themselves.
+
+
+def _get_lookup_cache_version_key(project_id: int) -> str:
+    return f"ab::p:{project_id}:lookup_version"
+
+
+def _get_lookup_cache_key(
+    project_id: int, version: str, release: str, dist: str, url: str, debug_id: str | None
+) -> str:
+    digest = md5_text(json.dumps([release, dist, url, debug_id])).hexdigest()
+    return f"ab::p:{project_id}:v:{version}:lookup:{digest}"
+
+
+def _get_lookup_cache_version(redis_client: RedisCluster, project_id: int) -> str:
+    # Projects whose lookups were never invalidated, or not for longer than `LOOKUP_CACHE_VERSION_TIMEOUT`, have no
+    # version. Lookups cached with an older version are expired by then.
+    version = redis_client.get(_get_lookup_cache_version_key(project_id))
+    return version or "0"
+
+
+def invalidate_artifact_bundle_lookups(project_ids: Iterable[int]) -> None:
+    """
+    Invalidates the cached artifact bundle lookups of the given projects.
+    """
+    if not options.get("symbolicator.sourcemaps-lookup-cache-ttl"):
+        return
+
+    redis_client = get_redis_cluster_for_artifact_bundles()
+    with redis_client.pipeline(transaction=False) as pipeline:
+        for project_id in set(project_ids):
+            pipeline.set(
+                _get_lookup_cache_version_key(project_id),
+                uuid.uuid4().hex,
+                ex=LOOKUP_CACHE_VERSION_TIMEOUT,
+            )
+        pipeline.execute()
+
+
+def invalidate_artifact_bundle_lookups_for_bundle(artifact_bundle_id: int) -> None:
+    """
+    Invalidates the cached artifact bundle lookups of all the projects of the given bundle.
+    """
+    if not options.get("symbolicator.sourcemaps-lookup-cache-ttl"):
+        return
+
+    invalidate_artifact_bundle_lookups(
+        ProjectArtifactBundle.objects.filter(artifact_bundle_id=artifact_bundle_id).values_list(
+            "project_id", flat=True
+        )
+    )
 
 
 # ===== Querying of Artifact Bundles =====
 
 
 def _maybe_renew_and_return_bundles(
-    bundles: dict[int, tuple[datetime, str]]
+    bundles: dict[int, tuple[datetime, str]],
 ) -> list[tuple[int, str]]:
     maybe_renew_artifact_bundles(
         {id: date_added for id, (date_added, _resolved) in bundles.items()}
@@ -318,17 +388,58 @@ def query_artifact_bundles_containing_file(
     was resolved with.
     """
 
+    ttl = options.get("symbolicator.sourcemaps-lookup-cache-ttl")
+    if not ttl:
+        return _maybe_renew_and_return_bundles(
+            _query_artifact_bundles_containing_file(project, release, dist, url, debug_id)
+        )
+
+    redis_client = get_redis_cluster_for_artifact_bundles()
+    version = _get_lookup_cache_version(redis_client, project.id)
+    cache_key = _get_lookup_cache_key(project.id, version, release, dist, url, debug_id)
+
+    cached = redis_client.get(cache_key)
+    if cached is not None:
+        metrics.incr("artifact_bundle_lookup.cache", tags={"result": "hit"})
+        artifact_bundles = {
+            id: (datetime.fromtimestamp(timestamp, UTC), resolved)
+            for id, timestamp, resolved in json.loads(cached)
+        }
+    else:
+        metrics.incr("artifact_bundle_lookup.cache", tags={"result": "miss"})
+        artifact_bundles = _query_artifact_bundles_containing_file(
+            project, release, dist, url, debug_id
+        )
+        redis_client.set(
+            cache_key,
+            json.dumps(
+                [
+                    (id, date_added.timestamp(), resolved)
+                    for id, (date_added, resolved) in artifact_bundles.items()
+                ]
+            ),
+            ex=min(ttl, LOOKUP_CACHE_VERSION_TIMEOUT // 2),
+        )
+
+    return _maybe_renew_and_return_bundles(artifact_bundles)
+
+
+def _query_artifact_bundles_containing_file(
+    project: Project,
+    release: str,
+    dist: str,
+    url: str,
+    debug_id: str | None,
+) -> dict[int, tuple[datetime, str]]:
     if debug_id:
         bundles = get_artifact_bundles_containing_debug_id(project, debug_id)
         if bundles:
-            return _maybe_renew_and_return_bundles(
-                {id: (date_added, "debug-id") for id, date_added in bundles}
-            )
+            return {id: (date_added, "debug-id") for id, date_added in bundles}
 
     total_bundles, indexed_bundles = get_bundles_indexing_state(project, release, dist)
 
     if not total_bundles:
-        return []
+        return {}
 
     # If all the bundles for this release are fully indexed, we will only query
     # the url index.
@@ -365,7 +476,7 @@ def query_artifact_bundles_containing_file(
         bundles = get_artifact_bundles_containing_url(project, release, dist, url)
         update_bundles(bundles, "index")
 
-    return _maybe_renew_and_return_bundles(artifact_bundles)
+    return artifact_bundles
 
 
 # NOTE on queries and index usage:
@@ -3,10 +3,15 @@ from __future__ import annotations
 import logging
 import re
 from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
+from django import db
+
+from sentry import options
 from sentry.constants import ObjectStatus
 from sentry.db.models.base import Model
+from sentry.deletions.throttle import wait_for_budget
 from sentry.users.services.user.model import RpcUser
 from sentry.users.services.user.service import user_service
 from sentry.utils import metrics
@@ -24,27 +29,70 @@ def _delete_children(
     relations: Sequence[BaseRelation],
     transaction_id: str | None = None,
     actor_id: int | None = None,
+    parallel: bool = False,
 ) -> bool:
+    """
+    Delete all the rows of the given relations.
+
+    Relations are deleted one after another, in order. If `parallel` is set, the relations
+    must not depend on each other, and with more than one `deletions.child-relations.workers`
+    they are deleted concurrently, one relation per worker at a time.
+    """
+    workers = options.get("deletions.child-relations.workers") if parallel else 1
+    if workers > 1 and len(relations) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(workers, len(relations)), thread_name_prefix="deletions"
+        ) as pool:
+            futures = [
+                pool.submit(_delete_relation_in_thread, manager, relation, transaction_id, actor_id)
+                for relation in relations
+            ]
+            for future in futures:
+                future.result()
+        return False
+
     # Ideally this runs through the deletion manager
     for relation in relations:
-        task = manager.get(
-            transaction_id=transaction_id,
-            actor_id=actor_id,
-            task=relation.task,
-            **relation.params,
-        )
-
-        # If we want smaller tasks then this also has to return when has_more is true.
-        # This could significant increase the number of tasks we spawn. Get better estimates
-        # by collecting metrics.
-        has_more = True
-        while has_more:
-            has_more = task.chunk()
-            if has_more:
-                metrics.incr("deletions.should_spawn", tags={"task": type(task).__name__})
+        _delete_relation(manager, relation, transaction_id, actor_id)
     return False
 
 
+def _delete_relation(
+    manager: DeletionTaskManager,
+    relation: BaseRelation,
+    transaction_id: str | None,
+    actor_id: int | None,
+) -> None:
+    task = manager.get(
+        transaction_id=transaction_id,
+        actor_id=actor_id,
+        task=relation.task,
+        **relation.params,
+    )
+
+    # If we want smaller tasks then this also has to return when has_more is true.
+    # This could significant increase the number of tasks we spawn. Get better estimates
+    # by collecting metrics.
+    has_more = True
+    while has_more:
+        has_more = task.chunk()
+        if has_more:
+            metrics.incr("deletions.should_spawn", tags={"task": type(task).__name__})
+
+
+def _delete_relation_in_thread(
+    manager: DeletionTaskManager,
+    relation: BaseRelation,
+    transaction_id: str | None,
+    actor_id: int | None,
+) -> None:
+    try:
+        _delete_relation(manager, relation, transaction_id, actor_id)
+    finally:
+        # Worker threads open their own connections, which are not closed otherwise.
+        db.connections.close_all()
+
+
 class BaseRelation:
     def __init__(self, params: Mapping[str, Any], task: type[BaseDeletionTask[Any]] | None) -> None:
         self.task = task
@@ -170,8 +218,10 @@ class BaseDeletionTask(Generic[ModelT]):
         for instance in instance_list:
             self.delete_instance(instance)
 
-    def delete_children(self, relations: list[BaseRelation]) -> bool:
-        return _delete_children(self.manager, relations, self.transaction_id, self.actor_id)
+    def delete_children(self, relations: list[BaseRelation], parallel: bool = False) -> bool:
+        return _delete_children(
+            self.manager, relations, self.transaction_id, self.actor_id, parallel=parallel
+        )
 
     def mark_deletion_in_progress(self, instance_list: Sequence[ModelT]) -> None:
         pass
@@ -215,6 +265,7 @@ class ModelDeletionTask(BaseDeletionTask[ModelT]):
         remaining = self.chunk_size
 
         while remaining > 0:
+            wait_for_budget(self.model, query_limit)
             queryset = getattr(self.model, self.manager_name).filter(**self.query)
             if self.order_by:
                 queryset = queryset.order_by(self.order_by)
@@ -285,6 +336,7 @@ class BulkModelDeletionTask(ModelDeletionTask[ModelT]):
         return self._delete_instance_bulk()
 
     def _delete_instance_bulk(self) -> bool:
+        wait_for_budget(self.model, self.chunk_size)
         try:
             return bulk_delete_objects(
                 model=self.model,
@@ -5,6 +5,7 @@ from collections import defaultdict
 from collections.abc import Mapping, Sequence
 from typing import Any
 
+from django.core.cache import cache
 from sentry_sdk import set_tag
 from snuba_sdk import DeleteQuery, Request
 
@@ -16,6 +17,7 @@ from sentry.models.rulefirehistory import RuleFireHistory
 from sentry.notifications.models.notificationmessage import NotificationMessage
 from sentry.snuba.dataset import Dataset
 from sentry.tasks.delete_seer_grouping_records import call_delete_seer_grouping_records_by_hash
+from sentry.utils.hashlib import md5_text
 from sentry.utils.snuba import bulk_snuba_queries
 
 from ..base import BaseDeletionTask, BaseRelation, ModelDeletionTask, ModelRelation
@@ -64,6 +66,9 @@ class EventsBaseDeletionTask(BaseDeletionTask[Group]):
 
     # Number of events fetched from eventstore per chunk() call.
     DEFAULT_CHUNK_SIZE = 10000
+    # Number of seconds for which the progress of a deletion is kept. Retries of a deletion
+    # resume from the last processed event instead of fetching all events again.
+    CHECKPOINT_TIMEOUT = 24 * 60 * 60
     referrer = "deletions.group"
     dataset: Dataset
 
@@ -71,10 +76,10 @@ class EventsBaseDeletionTask(BaseDeletionTask[Group]):
         self, manager: DeletionTaskManager, groups: Sequence[Group], **kwargs: Any
     ) -> None:
         self.groups = groups
-        # Use self.last_event to keep track of the last event processed in the chunk method.
-        self.last_event: Event | None = None
         self.set_group_and_project_ids()
         super().__init__(manager, **kwargs)
+        # The (timestamp, event_id) of the last event processed in the chunk method.
+        self.last_event: tuple[str, str] | None = self.get_checkpoint()
 
     def set_group_and_project_ids(self) -> None:
         group_ids = []
@@ -88,12 +93,13 @@ class EventsBaseDeletionTask(BaseDeletionTask[Group]):
     def get_unfetched_events(self) -> list[Event]:
         conditions = []
         if self.last_event is not None:
+            timestamp, event_id = self.last_event
             conditions.extend(
                 [
-                    ["timestamp", "<=", self.last_event.timestamp],
+                    ["timestamp", "<=", timestamp],
                     [
-                        ["timestamp", "<", self.last_event.timestamp],
-                        ["event_id", "<", self.last_event.event_id],
+                        ["timestamp", "<", timestamp],
+                        ["event_id", "<", event_id],
                     ],
                 ]
             )
@@ -110,6 +116,28 @@ class EventsBaseDeletionTask(BaseDeletionTask[Group]):
         )
         return events
 
+    def _get_checkpoint_key(self) -> str | None:
+        # Deletions are only resumed when they are retried with the same transaction.
+        if self.transaction_id is None:
+            return None
+        group_ids = md5_text(",".join(map(str, sorted(self.group_ids)))).hexdigest()
+        return f"deletions:events:{self.dataset.value}:{self.transaction_id}:{group_ids}"
+
+    def get_checkpoint(self) -> tuple[str, str] | None:
+        key = self._get_checkpoint_key()
+        return cache.get(key) if key is not None else None
+
+    def set_checkpoint(self, events: Sequence[Event]) -> None:
+        self.last_event = (events[-1].timestamp, events[-1].event_id)
+        key = self._get_checkpoint_key()
+        if key is not None:
+            cache.set(key, self.last_event, self.CHECKPOINT_TIMEOUT)
+
+    def delete_checkpoint(self) -> None:
+        key = self._get_checkpoint_key()
+        if key is not None:
+            cache.delete(key)
+
     @property
     def tenant_ids(self) -> Mapping[str, Any]:
         result = {"referrer": self.referrer}
@@ -135,12 +163,13 @@ class ErrorEventsDeletionTask(EventsBaseDeletionTask):
             self.delete_events_from_nodestore(events)
             self.delete_dangling_attachments_and_user_reports(events)
             # This value will be used in the next call to chunk
-            self.last_event = events[-1]
+            self.set_checkpoint(events)
             # As long as it returns True the task will keep iterating
             return True
         else:
             # Now that all events have been deleted from the eventstore, we can delete the events from snuba
             self.delete_events_from_snuba()
+            self.delete_checkpoint()
             return False
 
     def delete_events_from_nodestore(self, events: Sequence[Event]) -> None:
@@ -185,12 +214,13 @@ class IssuePlatformEventsDeletionTask(EventsBaseDeletionTask):
             # https://github.com/getsentry/sentry/blob/a86b9b672709bc9c4558cffb2c825965b8cee0d1/src/sentry/issues/occurrence_consumer.py#L324-L339
             self.delete_events_from_nodestore(events)
             # This value will be used in the next call to chunk
-            self.last_event = events[-1]
+            self.set_checkpoint(events)
             # As long as it returns True the task will keep iterating
             return True
         else:
             # Now that all events have been deleted from the eventstore, we can delete the occurrences from Snuba
             self.delete_events_from_snuba()
+            self.delete_checkpoint()
             return False
 
     def delete_events_from_nodestore(self, events: Sequence[Event]) -> None:
@@ -255,9 +285,10 @@ class GroupDeletionTask(ModelDeletionTask[Group]):
 
     def _delete_children(self, instance_list: Sequence[Group]) -> None:
         group_ids = [group.id for group in instance_list]
-        # Remove child relations for all groups first.
+        # Remove child relations for all groups first. They only depend on the groups, so they
+        # are deleted in parallel.
         child_relations: list[BaseRelation] = []
-        for model in _GROUP_RELATED_MODELS:
+        for model in dict.fromkeys(_GROUP_RELATED_MODELS):
             child_relations.append(ModelRelation(model, {"group_id__in": group_ids}))
 
         org = instance_list[0].project.organization
@@ -287,7 +318,7 @@ class GroupDeletionTask(ModelDeletionTask[Group]):
                         BaseRelation(params=params, task=IssuePlatformEventsDeletionTask)
                     )
 
-        self.delete_children(child_relations)
+        self.delete_children(child_relations, parallel=True)
 
     def delete_instance(self, instance: Group) -> None:
         from sentry import similarity
@@ -1,4 +1,5 @@
 from sentry.deletions.base import ModelDeletionTask
+from sentry.deletions.throttle import wait_for_budget
 from sentry.models.grouphistory import GroupHistory
 
 
@@ -28,6 +29,7 @@ class GroupHistoryDeletionTask(ModelDeletionTask[GroupHistory]):
                 chunk_ids = list(queryset.order_by("id").values_list("id", flat=True)[:10000])
                 if not chunk_ids:
                     break
+                wait_for_budget(self.model, len(chunk_ids))
                 # Delete records for these IDs
                 self.model.objects.filter(id__in=chunk_ids).delete()
 
@@ -0,0 +1,47 @@
+"""
+Throughput budgets of deletions.
+
+The `deletions.rows-per-second` option maps database aliases to the number of rows that
+deletions may delete from them per second, across all processes. Deletion tasks reserve the
+rows of a chunk with `wait_for_budget` before deleting it, which blocks until the database
+has budget left. Databases without a budget are not throttled.
+"""
+
+from __future__ import annotations
+
+from time import sleep, time
+
+from django.db import router
+
+from sentry import options
+from sentry.db.models.base import Model
+from sentry.ratelimits.leaky_bucket import LeakyBucketRateLimiter
+from sentry.utils import metrics
+
+
+def wait_for_budget(model: type[Model], rows: int) -> None:
+    """
+    Block until `rows` rows of `model` may be deleted within the budget of its database.
+    """
+    if rows <= 0:
+        return
+
+    db = router.db_for_write(model)
+    rows_per_second = options.get("deletions.rows-per-second").get(db)
+    if not rows_per_second:
+        return
+
+    # Chunks larger than the budget of a second are let through once the bucket is empty.
+    limiter = LeakyBucketRateLimiter(
+        burst_limit=max(rows_per_second, rows), drip_rate=rows_per_second
+    )
+    waited = 0.0
+    while True:
+        info = limiter.use_and_get_info(key=f"deletions:{db}", timestamp=time(), incr_by=rows)
+        if not info.wait_time:
+            break
+        waited += info.wait_time
+        sleep(info.wait_time)
+
+    if waited:
+        metrics.timing("deletions.throttled", waited, tags={"db": db})
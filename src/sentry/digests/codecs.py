@@ -2,6 +2,10 @@ import pickle
 import zlib
 from typing import Any
 
+from sentry.digests.types import Notification
+from sentry.eventstore.models import Event
+from sentry.utils import json
+
 
 class Codec:
     def encode(self, value: Any) -> bytes:
@@ -17,3 +21,43 @@ class CompressedPickleCodec(Codec):
 
     def decode(self, value: bytes) -> Any:
         return pickle.loads(zlib.decompress(value))
+
+
+class ReferenceCodec(CompressedPickleCodec):
+    """
+    Encodes notifications as references to their event, group and rules instead
+    of pickling the whole event. The events of decoded notifications are not
+    fetched from nodestore yet, which `build_digest` does for all records of a
+    digest at once.
+
+    Notifications that cannot be restored from a reference (for instance the
+    ones of issue occurrences) are still pickled, as are records written before
+    switching to this codec. Pickled records start with the zlib header, and
+    references with the opening brace of a JSON object, so both can be decoded.
+    """
+
+    def encode(self, value: Any) -> bytes:
+        event = value.event
+        if event.group_id is None or getattr(event, "occurrence", None) is not None:
+            return super().encode(value)
+
+        return json.dumps(
+            {
+                "project_id": event.project_id,
+                "event_id": event.event_id,
+                "group_id": event.group_id,
+                "rules": list(value.rules),
+                "notification_uuid": value.notification_uuid,
+            }
+        ).encode("utf8")
+
+    def decode(self, value: bytes) -> Any:
+        if not value.startswith(b"{"):
+            return super().decode(value)
+
+        reference = json.loads(value)
+        return Notification(
+            Event(reference["project_id"], reference["event_id"], group_id=reference["group_id"]),
+            reference["rules"],
+            reference["notification_uuid"],
+        )
@@ -5,7 +5,7 @@ from collections import defaultdict
 from collections.abc import Mapping, Sequence
 from typing import Any, NamedTuple, TypeAlias
 
-from sentry import tsdb
+from sentry import eventstore, tsdb
 from sentry.digests.types import Notification, Record, RecordWithRuleObjects
 from sentry.eventstore.models import Event
 from sentry.models.group import Group, GroupStatus
@@ -161,6 +161,12 @@ def build_digest(project: Project, records: Sequence[Record]) -> DigestInfo:
     start = records[-1].datetime
     end = records[0].datetime
 
+    # Records encoded as references (see `ReferenceCodec`) do not contain the
+    # event data, which is fetched for all of them with a single request.
+    unfetched = [record.value.event for record in records if not record.value.event.data.is_fetched]
+    if unfetched:
+        eventstore.backend.bind_nodes(unfetched)
+
     groups = Group.objects.in_bulk(record.value.event.group_id for record in records)
     group_ids = list(groups)
     rules = Rule.objects.in_bulk(rule_id for record in records for rule_id in record.value.rules)
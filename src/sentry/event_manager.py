@@ -1773,7 +1773,14 @@ def _process_existing_aggregate(
     event: BaseEvent,
     incoming_group_values: Mapping[str, Any],
     release: Release | None,
+    times_seen: int = 1,
+    first_seen: datetime | None = None,
 ) -> bool:
+    """
+    Update an existing group with an incoming event. Several events of the group can be applied
+    at once, with the latest of them as `event`, their number as `times_seen` and the time of the
+    earliest one as `first_seen`.
+    """
     last_seen = max(event.datetime, group.last_seen)
     updated_group_values: dict[str, Any] = {"last_seen": last_seen}
     # Unclear why this is necessary, given that it's also in `updated_group_values`, but removing
@@ -1795,8 +1802,10 @@ def _process_existing_aggregate(
     # If the new event has a timestamp earlier than our current `fist_seen` value (which can happen,
     # for example because of misaligned internal clocks on two different host machines or because of
     # race conditions) then we want to use the current event's time
-    if group.first_seen > event.datetime:
-        updated_group_values["first_seen"] = event.datetime
+    if first_seen is None:
+        first_seen = event.datetime
+    if group.first_seen > first_seen:
+        updated_group_values["first_seen"] = first_seen
 
     is_regression = _handle_regression(group, event, release)
 
@@ -1826,7 +1835,7 @@ def _process_existing_aggregate(
 
     # We pass `times_seen` separately from all of the other columns so that `buffer_inr` knows to
     # increment rather than overwrite the existing value
-    buffer_incr(Group, {"times_seen": 1}, {"id": group.id}, updated_group_values)
+    buffer_incr(Group, {"times_seen": times_seen}, {"id": group.id}, updated_group_values)
 
     return bool(is_regression)
 
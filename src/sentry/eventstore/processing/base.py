@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import MutableMapping
+from collections.abc import MutableMapping, Sequence
 from datetime import timedelta
 from typing import Any
 
@@ -45,6 +45,14 @@ class EventProcessingStore(Service):
         self.inner.set(key, event, self.timeout)
         return key
 
+    def store_many(self, events: Sequence[Event]) -> list[str]:
+        """
+        Store several events at once, returning their keys in the same order.
+        """
+        items = [(cache_key_for_event(event), event) for event in events]
+        self.inner.set_many(items, self.timeout)
+        return [key for key, _ in items]
+
     def get(self, key: str, unprocessed: bool = False) -> MutableMapping[str, Any] | None:
         if unprocessed:
             key = self.__get_unprocessed_key(key)
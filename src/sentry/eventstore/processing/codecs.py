@@ -0,0 +1,182 @@
+"""
+Codecs for event payloads in the processing store.
+
+Payloads used to be stored as plain JSON. The compressed formats prefix the payload with
+a one byte header naming the format, followed by the zstd compressed serialized event.
+No JSON document starts with these bytes, so payloads written in any format, including
+the legacy one, can always be decoded. The format that is written is controlled by the
+`eventstore.processing.codec` option, which can therefore be changed at any time.
+
+Besides whole events, the codec can also encode the values of individual top-level keys
+of an event, which is what patch writes of the redis processing store are made of.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping
+from typing import Any
+
+import msgpack
+import orjson
+import zstandard
+
+from sentry import options
+from sentry.utils import json, metrics
+from sentry.utils.codecs import Codec
+
+logger = logging.getLogger(__name__)
+
+FORMAT_JSON = "json"
+FORMAT_ZSTD_MSGPACK = "zstd-msgpack"
+FORMAT_ZSTD_ORJSON = "zstd-orjson"
+
+_HEADERS = {
+    FORMAT_ZSTD_MSGPACK: b"\x01",
+    FORMAT_ZSTD_ORJSON: b"\x02",
+}
+_FORMATS_BY_HEADER = {header[0]: format for format, header in _HEADERS.items()}
+
+FORMATS = (FORMAT_JSON, *_HEADERS)
+
+ZSTD_LEVEL = 3
+
+
+def _serialize(format: str, value: Any) -> bytes:
+    if format == FORMAT_ZSTD_MSGPACK:
+        return msgpack.packb(value)
+    elif format == FORMAT_ZSTD_ORJSON:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value).encode("utf8")
+
+
+def _json_key(key: Any) -> Any:
+    if isinstance(key, (str, bytes)):
+        return key
+    return json.dumps(key)
+
+
+def _unpack_msgpack(value: bytes) -> Any:
+    try:
+        return msgpack.unpackb(value)
+    except ValueError:
+        # msgpack keeps non-str map keys, which JSON writes as strings. Payloads with such
+        # keys are rare, so they are unpacked again with their keys converted as JSON would.
+        return msgpack.unpackb(
+            value,
+            strict_map_key=False,
+            object_pairs_hook=lambda pairs: {_json_key(key): item for key, item in pairs},
+        )
+
+
+def _deserialize(format: str, value: bytes) -> Any:
+    if format == FORMAT_ZSTD_MSGPACK:
+        return _unpack_msgpack(value)
+    elif format == FORMAT_ZSTD_ORJSON:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+class EventPayloadCodec(Codec[Any, bytes]):
+    """
+    Encode/decode event payloads to/from the (optionally compressed) bytes stored in the
+    processing store.
+
+    If `format` is not given, the `eventstore.processing.codec` option is read for every
+    payload that is encoded.
+    """
+
+    def __init__(self, format: str | None = None, zstd_level: int = ZSTD_LEVEL) -> None:
+        if format is not None and format not in FORMATS:
+            raise ValueError(f"Unknown processing store codec: {format}")
+        self.format = format
+        self.zstd_level = zstd_level
+
+    def get_format(self) -> str:
+        if self.format is not None:
+            return self.format
+
+        format = options.get("eventstore.processing.codec")
+        if format not in FORMATS:
+            logger.error("eventstore.processing.invalid_codec", extra={"codec": format})
+            return FORMAT_JSON
+        return format
+
+    def serialize(self, value: Any, format: str) -> tuple[str, bytes]:
+        """
+        Serialize a value without compressing it, returning the format that was used.
+        Values that cannot be represented in the requested format (for instance integers
+        that do not fit in 64 bits) fall back to JSON.
+        """
+        try:
+            return format, _serialize(format, value)
+        except (TypeError, ValueError, OverflowError):
+            if format == FORMAT_JSON:
+                raise
+            metrics.incr("eventstore.processing.codec.fallback", tags={"format": format})
+            return FORMAT_JSON, _serialize(FORMAT_JSON, value)
+
+    def compress(self, format: str, serialized: bytes) -> bytes:
+        if format == FORMAT_JSON:
+            return serialized
+        return _HEADERS[format] + zstandard.ZstdCompressor(level=self.zstd_level).compress(
+            serialized
+        )
+
+    def encode(self, value: Any) -> bytes:
+        format, serialized = self.serialize(value, self.get_format())
+        encoded = self.compress(format, serialized)
+        self.record_sizes(format, len(serialized), len(encoded))
+        return encoded
+
+    def decode(self, value: bytes | str) -> Any:
+        if isinstance(value, str):
+            return json.loads(value)
+
+        format = _FORMATS_BY_HEADER.get(value[0]) if value else None
+        if format is None:
+            return json.loads(value)
+        return _deserialize(format, zstandard.ZstdDecompressor().decompress(value[1:]))
+
+    def record_sizes(self, format: str, serialized_size: int, encoded_size: int) -> None:
+        tags = {"format": format}
+        metrics.distribution(
+            "eventstore.processing.serialized_size", serialized_size, tags=tags, unit="byte"
+        )
+        metrics.distribution(
+            "eventstore.processing.encoded_size", encoded_size, tags=tags, unit="byte"
+        )
+
+    def serialize_fields(self, value: Mapping[str, Any]) -> dict[str, tuple[str, bytes]]:
+        """
+        Serialize the value of every top-level key of an event separately.
+        """
+        format = self.get_format()
+        return {key: self.serialize(field, format) for key, field in value.items()}
+
+    def encode_joined(self, fields: Mapping[str, tuple[str, bytes]]) -> bytes:
+        """
+        Encode a whole event from its serialized top-level values, without serializing
+        them again.
+        """
+        formats = {format for format, _ in fields.values()}
+        format = formats.pop() if len(formats) == 1 else FORMAT_JSON
+
+        if format == FORMAT_ZSTD_MSGPACK:
+            parts = [msgpack.Packer().pack_map_header(len(fields))]
+            for key, (_, serialized) in fields.items():
+                parts.append(msgpack.packb(key))
+                parts.append(serialized)
+            serialized = b"".join(parts)
+        else:
+            # Events with values that fell back to JSON are stored as JSON altogether.
+            values = []
+            for key, (field_format, field) in fields.items():
+                if field_format == FORMAT_ZSTD_MSGPACK:
+                    field = _serialize(FORMAT_JSON, _unpack_msgpack(field))
+                values.append(orjson.dumps(key) + b":" + field)
+            serialized = b"{" + b",".join(values) + b"}"
+
+        encoded = self.compress(format, serialized)
+        self.record_sizes(format, len(serialized), len(encoded))
+        return encoded
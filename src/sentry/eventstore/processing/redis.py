@@ -1,20 +1,171 @@
-from sentry.utils.codecs import JSONCodec
+from __future__ import annotations
+
+import hashlib
+from collections.abc import MutableMapping, Sequence
+from typing import Any
+
+from sentry import options as sentry_options
+from sentry.utils import metrics
+from sentry.utils.cache import cache_key_for_event
 from sentry.utils.kvstore.encoding import KVStorageCodecWrapper
 from sentry.utils.kvstore.redis import RedisKVStorage
 from sentry.utils.redis import redis_clusters
 
-from .base import EventProcessingStore
+from .base import Event, EventProcessingStore
+from .codecs import EventPayloadCodec
+
+#: Marks a top-level key that was removed from the event in a patch.
+DELETED = b""
+
+#: Patch writes whose changes are larger than this fraction of the whole event rewrite
+#: the whole event instead.
+MAX_PATCH_RATIO = 0.5
+
+
+def _digest(serialized: bytes) -> bytes:
+    return hashlib.blake2b(serialized, digest_size=8).digest()
 
 
 class RedisClusterEventProcessingStore(EventProcessingStore):
     """
     Creates an instance of the processing store which uses a Redis Cluster
     client as its backend.
+
+    Events are encoded with `EventPayloadCodec`, the format can be pinned with
+    the `codec` option of the store.
+
+    With the `eventstore.processing.patch-writes` option, writing an event
+    that is already in the store only sends the top-level keys that changed
+    since. They are kept in a hash next to the event (`{<key>}:p`) and merged
+    into it when the event is read. Which keys changed is determined from
+    digests of the stored values, kept in another hash (`{<key>}:d`). Both
+    hashes are tagged with the key of the event, so that they are in the
+    same cluster slot as the event.
+
+    Patches are only read, and discarded by full writes, while patch writes
+    or `eventstore.processing.patch-reads` are enabled. Patch reads have to
+    stay enabled until patches written before patch writes were disabled
+    have expired.
     """
 
     def __init__(self, **options):
-        super().__init__(
-            KVStorageCodecWrapper(
-                RedisKVStorage(redis_clusters.get(options.pop("cluster", "default"))), JSONCodec()
-            )
+        self.client = redis_clusters.get_binary(options.pop("cluster", "default"))
+        self.codec = EventPayloadCodec(options.pop("codec", None))
+        super().__init__(KVStorageCodecWrapper(RedisKVStorage(self.client), self.codec))
+
+    def __get_patch_key(self, key: str) -> str:
+        return f"{{{key}}}:p"
+
+    def __get_digests_key(self, key: str) -> str:
+        return f"{{{key}}}:d"
+
+    def _has_patches(self) -> bool:
+        return sentry_options.get("eventstore.processing.patch-writes") or sentry_options.get(
+            "eventstore.processing.patch-reads"
+        )
+
+    def store(self, event: Event, unprocessed: bool = False) -> str:
+        if unprocessed:
+            return super().store(event, unprocessed=True)
+
+        key = cache_key_for_event(event)
+        if sentry_options.get("eventstore.processing.patch-writes"):
+            self._store_patch(key, event)
+        elif self._has_patches():
+            with self.client.pipeline(transaction=False) as pipeline:
+                self._store_full(pipeline, key, event)
+                pipeline.execute()
+        else:
+            self.client.set(key, self.codec.encode(event), ex=self.timeout)
+        return key
+
+    def store_many(self, events: Sequence[Event]) -> list[str]:
+        if sentry_options.get("eventstore.processing.patch-writes"):
+            # Patch writes depend on the digests stored for every event.
+            return [self.store(event) for event in events]
+
+        has_patches = self._has_patches()
+        keys = []
+        with self.client.pipeline(transaction=False) as pipeline:
+            for event in events:
+                key = cache_key_for_event(event)
+                if has_patches:
+                    self._store_full(pipeline, key, event)
+                else:
+                    pipeline.set(key, self.codec.encode(event), ex=self.timeout)
+                keys.append(key)
+            pipeline.execute()
+        return keys
+
+    def _store_full(self, pipeline: Any, key: str, event: Event) -> None:
+        pipeline.set(key, self.codec.encode(event), ex=self.timeout)
+        pipeline.delete(self.__get_patch_key(key), self.__get_digests_key(key))
+
+    def _store_patch(self, key: str, event: Event) -> None:
+        patch_key = self.__get_patch_key(key)
+        digests_key = self.__get_digests_key(key)
+
+        fields = self.codec.serialize_fields(event)
+        digests = {name.encode("utf8"): _digest(field) for name, (_, field) in fields.items()}
+        stored_digests = self.client.hgetall(digests_key)
+
+        changed = {name for name, digest in digests.items() if stored_digests.get(name) != digest}
+        removed = stored_digests.keys() - digests.keys()
+        changed_size = sum(len(fields[name.decode("utf8")][1]) for name in changed)
+        total_size = sum(len(field) for _, field in fields.values())
+
+        with self.client.pipeline(transaction=False) as pipeline:
+            if not stored_digests or changed_size > total_size * MAX_PATCH_RATIO:
+                pipeline.set(key, self.codec.encode_joined(fields), ex=self.timeout)
+                pipeline.delete(patch_key, digests_key)
+                pipeline.hset(digests_key, mapping=digests)
+                mode = "full"
+            else:
+                patch = {name: DELETED for name in removed}
+                for name in changed:
+                    format, field = fields[name.decode("utf8")]
+                    patch[name] = self.codec.compress(format, field)
+                if patch:
+                    pipeline.hset(patch_key, mapping=patch)
+                if changed:
+                    pipeline.hset(digests_key, mapping={name: digests[name] for name in changed})
+                if removed:
+                    pipeline.hdel(digests_key, *removed)
+                pipeline.expire(key, self.timeout)
+                pipeline.expire(patch_key, self.timeout)
+                mode = "patch"
+            pipeline.expire(digests_key, self.timeout)
+            pipeline.execute()
+
+        metrics.incr("eventstore.processing.store", tags={"mode": mode})
+        metrics.distribution(
+            "eventstore.processing.written_size",
+            total_size if mode == "full" else changed_size,
+            tags={"mode": mode},
+            unit="byte",
         )
+
+    def get(self, key: str, unprocessed: bool = False) -> MutableMapping[str, Any] | None:
+        if unprocessed or not self._has_patches():
+            return super().get(key, unprocessed=unprocessed)
+
+        with self.client.pipeline(transaction=False) as pipeline:
+            pipeline.get(key)
+            pipeline.hgetall(self.__get_patch_key(key))
+            value, patch = pipeline.execute()
+
+        if value is None:
+            return None
+
+        event = self.codec.decode(value)
+        for name, field in patch.items():
+            if field == DELETED:
+                event.pop(name.decode("utf8"), None)
+            else:
+                event[name.decode("utf8")] = self.codec.decode(field)
+        return event
+
+    def delete_by_key(self, key: str) -> None:
+        super().delete_by_key(key)
+        if self._has_patches():
+            self.client.delete(self.__get_patch_key(key), self.__get_digests_key(key))
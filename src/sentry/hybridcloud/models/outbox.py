@@ -10,7 +10,7 @@ from typing import Any, Self
 import sentry_sdk
 from django import db
 from django.db import OperationalError, connections, models, router, transaction
-from django.db.models import Count, Max, Min
+from django.db.models import Count, Max, Min, Q
 from django.db.transaction import Atomic
 from django.utils import timezone
 from sentry_sdk.tracing import Span
@@ -40,6 +40,9 @@ from sentry.utils import metrics
 
 THE_PAST = datetime.datetime(2016, 8, 1, 0, 0, 0, 0, tzinfo=datetime.UTC)
 
+# The number of messages deleted per query when processing batches of messages.
+OUTBOX_DELETE_BATCH_SIZE = 100
+
 
 class OutboxFlushError(Exception):
     def __init__(self, message: str, outbox: OutboxBase) -> None:
@@ -140,6 +143,49 @@ class OutboxBase(Model):
             else:
                 raise
 
+    @classmethod
+    def prepare_next_from_shards(cls, rows: Iterable[Mapping[str, Any]]) -> list[Self]:
+        """
+        Claim many shards at once, the way `prepare_next_from_shard` claims one. The first
+        message of every shard is locked with SKIP LOCKED, so that shards that are being
+        processed elsewhere are left out instead of failing the claim, and the claimed shards
+        are rescheduled with one update per schedule.
+        """
+        shard_filter = Q()
+        for row in rows:
+            shard_filter |= Q(**row)
+        if not shard_filter:
+            return []
+
+        using = router.db_for_write(cls)
+        with transaction.atomic(using=using, savepoint=False):
+            first_ids = [
+                row["first_id"]
+                for row in cls.objects.filter(shard_filter)
+                .values(*cls.sharding_columns)
+                .annotate(first_id=Min("id"))
+            ]
+            next_outboxes = list(
+                cls.objects.filter(id__in=first_ids)
+                .order_by("id")
+                .select_for_update(skip_locked=True)
+            )
+
+            # See `prepare_next_from_shard` for how shards are rescheduled.
+            now = timezone.now()
+            by_schedule: dict[datetime.datetime, Q] = {}
+            for next_outbox in next_outboxes:
+                next_schedule = next_outbox.next_schedule(now)
+                by_schedule[next_schedule] = by_schedule.get(next_schedule, Q()) | Q(
+                    **next_outbox.key_from(cls.sharding_columns)
+                )
+            for next_schedule, claimed_filter in by_schedule.items():
+                cls.objects.filter(claimed_filter).update(
+                    scheduled_for=next_schedule, scheduled_from=now
+                )
+
+        return next_outboxes
+
     def key_from(self, attrs: Iterable[str]) -> Mapping[str, Any]:
         return {k: _ensure_not_null(k, getattr(self, k)) for k in attrs}
 
@@ -287,38 +333,157 @@ class OutboxBase(Model):
         span.set_tag("outbox_category", OutboxCategory(message.category).name)
         span.set_tag("outbox_scope", OutboxScope(message.shard_scope).name)
 
+    def _send_coalesced_signal(self, coalesced: OutboxBase, is_synchronous_flush: bool) -> None:
+        with (
+            metrics.timer(
+                "outbox.send_signal.duration",
+                tags={
+                    "category": OutboxCategory(coalesced.category).name,
+                    "synchronous": int(is_synchronous_flush),
+                },
+            ),
+            sentry_sdk.start_span(op="outbox.process") as span,
+        ):
+            self._set_span_data_for_coalesced_message(span=span, message=coalesced)
+            try:
+                coalesced.send_signal()
+            except Exception as e:
+                raise OutboxFlushError(
+                    f"Could not flush shard category={coalesced.category} ({OutboxCategory(coalesced.category).name})",
+                    coalesced,
+                ) from e
+
     def process(self, is_synchronous_flush: bool) -> bool:
         with self.process_coalesced(is_synchronous_flush=is_synchronous_flush) as coalesced:
             if coalesced is not None and not self.should_skip_shard():
-                with (
-                    metrics.timer(
-                        "outbox.send_signal.duration",
-                        tags={
-                            "category": OutboxCategory(coalesced.category).name,
-                            "synchronous": int(is_synchronous_flush),
-                        },
-                    ),
-                    sentry_sdk.start_span(op="outbox.process") as span,
-                ):
-                    self._set_span_data_for_coalesced_message(span=span, message=coalesced)
-                    try:
-                        coalesced.send_signal()
-                    except Exception as e:
-                        raise OutboxFlushError(
-                            f"Could not flush shard category={coalesced.category} ({OutboxCategory(coalesced.category).name})",
-                            coalesced,
-                        ) from e
-
+                self._send_coalesced_signal(coalesced, is_synchronous_flush)
                 return True
         return False
 
+    def process_batch(self, latest_shard_row: OutboxBase | None, batch_size: int) -> bool:
+        """
+        Process the coalesced groups of up to `batch_size` messages at the head of the shard in
+        one transaction, in the order of their first message. Messages of all groups whose
+        signal was sent are deleted together once the signals were sent, and when a signal
+        fails, the messages of the groups before it are still deleted before the error is
+        raised.
+
+        :return: Whether any messages were processed, False once the shard is drained.
+        """
+        flush_all = not bool(latest_shard_row)
+        is_synchronous_flush = not flush_all
+        using: str = db.router.db_for_write(type(self))
+        error: OutboxFlushError | None = None
+        with transaction.atomic(using=using), django_test_transaction_water_mark(using=using):
+            try:
+                head = list(
+                    self.selected_messages_in_shard(latest_shard_row=latest_shard_row)
+                    .order_by("id")
+                    .select_for_update(nowait=flush_all)[:batch_size]
+                )
+            except OperationalError as e:
+                if "LockNotAvailable" in str(e):
+                    # If a non task flush process is running already, allow it to proceed without contention.
+                    return False
+                raise
+
+            if not head:
+                return False
+
+            # The first message at the head of the shard for every coalesced group, in order.
+            first_messages: dict[tuple[Any, ...], OutboxBase] = {}
+            for message in head:
+                first_messages.setdefault(
+                    tuple(message.key_from(self.coalesced_columns).values()), message
+                )
+
+            group_filter = Q()
+            for message in first_messages.values():
+                group_filter |= Q(**message.key_from(self.coalesced_columns))
+            groups: dict[
+                tuple[Any, ...], list[tuple[int, datetime.datetime, datetime.datetime]]
+            ] = {key: [] for key in first_messages}
+            # Coalescing is applied in python, see `process_coalesced`.
+            for outbox_id, date_added, scheduled_from, *key in self.objects.filter(
+                group_filter
+            ).values_list("id", "date_added", "scheduled_from", *self.coalesced_columns):
+                group = groups.get(tuple(key))
+                if group is not None:
+                    group.append((outbox_id, date_added, scheduled_from))
+
+            latest_ids = {key: max(group)[0] for key, group in groups.items() if group}
+            latest_messages = self.objects.in_bulk(latest_ids.values())
+
+            processed: list[tuple[Any, ...]] = []
+            for key in first_messages:
+                coalesced = latest_messages.get(latest_ids.get(key, -1))
+                if coalesced is None:
+                    continue
+                tags: dict[str, int | str] = {
+                    "category": OutboxCategory(coalesced.category).name,
+                    "synchronous": int(is_synchronous_flush),
+                }
+                metrics.timing(
+                    "outbox.coalesced_net_queue_time",
+                    datetime.datetime.now(tz=datetime.UTC).timestamp()
+                    - min(groups[key])[1].timestamp(),
+                    tags=tags,
+                )
+                try:
+                    # Each signal runs in its own savepoint, so a failing receiver only rolls
+                    # back its own writes and leaves the transaction usable for the deletes.
+                    with transaction.atomic(using=using):
+                        self._send_coalesced_signal(coalesced, is_synchronous_flush)
+                except OutboxFlushError as e:
+                    error = e
+                    break
+                processed.append(key)
+
+            # As in `process_coalesced`, the latest message of every group is only deleted after
+            # the others.
+            delete_ids = [
+                outbox_id
+                for key in processed
+                for outbox_id, _, _ in groups[key]
+                if outbox_id != latest_ids[key]
+            ]
+            delete_ids.extend(latest_ids[key] for key in processed)
+            for start in range(0, len(delete_ids), OUTBOX_DELETE_BATCH_SIZE):
+                self.objects.filter(
+                    id__in=delete_ids[start : start + OUTBOX_DELETE_BATCH_SIZE]
+                ).delete()
+
+            now = datetime.datetime.now(tz=datetime.UTC).timestamp()
+            for key in processed:
+                _, date_added, scheduled_from = min(groups[key])
+                tags = {
+                    "category": OutboxCategory(latest_messages[latest_ids[key]].category).name,
+                    "synchronous": int(is_synchronous_flush),
+                }
+                metrics.incr("outbox.processed", len(groups[key]), tags=tags)
+                metrics.timing("outbox.processing_lag", now - scheduled_from.timestamp(), tags=tags)
+                metrics.timing(
+                    "outbox.coalesced_net_processing_time", now - date_added.timestamp(), tags=tags
+                )
+
+        if error is not None:
+            raise error
+        return True
+
     @abc.abstractmethod
     def send_signal(self) -> None:
         pass
 
     def drain_shard(
-        self, flush_all: bool = False, _test_processing_barrier: threading.Barrier | None = None
+        self,
+        flush_all: bool = False,
+        _test_processing_barrier: threading.Barrier | None = None,
+        batch_size: int = 1,
     ) -> None:
+        """
+        Process all messages of the shard. With a `batch_size` larger than one, the coalesced
+        groups of that many messages are processed per transaction, see `process_batch`.
+        """
         in_test_assert_no_transaction(
             "drain_shard should only be called outside of any active transaction!"
         )
@@ -332,6 +497,12 @@ class OutboxBase(Model):
             if latest_shard_row is None:
                 return
 
+        # Skipped shards keep their latest messages, which the batches do not account for.
+        if batch_size > 1 and not self.should_skip_shard():
+            while self.process_batch(latest_shard_row, batch_size):
+                pass
+            return
+
         shard_row: OutboxBase | None
         while True:
             with self.process_shard(latest_shard_row) as shard_row:
@@ -350,22 +521,28 @@ class OutboxBase(Model):
                     break
 
     @classmethod
-    def get_shard_depths_descending(cls, limit: int | None = 10) -> list[dict[str, int | str]]:
+    def get_shard_depths_descending(
+        cls, limit: int | None = 10, with_lag: bool = False
+    ) -> list[dict[str, int | str]]:
         """
         Queries all outbox shards for their total depth, aggregated by their
         sharding columns as specified by the outbox class implementation.
 
         :param limit: Limits the query to the top N rows with the greatest shard
         depth. If limit is None, the entire set of rows will be returned.
+        :param with_lag: Also return the age of the oldest message of every shard
+        in seconds, as `lag`.
         :return: A list of dictionaries, containing shard depths and shard
         relevant column values.
         """
         if limit is not None:
             assert limit > 0, "Limit must be a positive integer if specified"
 
-        base_depth_query = (
-            cls.objects.values(*cls.sharding_columns).annotate(depth=Count("*")).order_by("-depth")
-        )
+        base_depth_query = cls.objects.values(*cls.sharding_columns).annotate(depth=Count("*"))
+        if with_lag:
+            base_depth_query = base_depth_query.annotate(oldest=Min("date_added"))
+        base_depth_query = base_depth_query.order_by("-depth")
+        now = timezone.now()
 
         if limit is not None:
             base_depth_query = base_depth_query[0:limit]
@@ -376,6 +553,8 @@ class OutboxBase(Model):
                 shard_column: shard_row[shard_column] for shard_column in cls.sharding_columns
             }
             shard_information["depth"] = shard_row["depth"]
+            if with_lag:
+                shard_information["lag"] = int((now - shard_row["oldest"]).total_seconds())
             aggregated_shard_information.append(shard_information)
 
         return aggregated_shard_information
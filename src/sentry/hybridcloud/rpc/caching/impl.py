@@ -1,9 +1,13 @@
+import threading
+import time
+from collections import OrderedDict
 from collections.abc import Generator, Mapping
-from typing import TypeVar
+from typing import Any, TypeVar
 
 from django.core.cache import cache
 from django.core.cache.backends.base import DEFAULT_TIMEOUT
 
+from sentry import options
 from sentry.hybridcloud.models.cacheversion import (
     CacheVersionBase,
     ControlCacheVersion,
@@ -14,6 +18,9 @@ from sentry.silo.base import SiloMode
 
 _V = TypeVar("_V")
 
+# Entries of the local cache expire after this many seconds, regardless of their version.
+LOCAL_CACHE_TTL = 60
+
 # Implementation uses generators so that testing concurrent read after writer properties is much easier.
 # In practice all generators are synchronously consumed, except for tests.
 
@@ -50,15 +57,21 @@ def _version_model(mode: SiloMode) -> type[CacheVersionBase]:
 
 def _delete_cache(key: str, mode: SiloMode) -> Generator[None, None, int]:
     version = _version_model(mode).incr_version(key)
+    local_cache.delete(key)
     yield
     return version
 
 
-def _get_cache(keys: list[str], mode: SiloMode) -> Generator[None, None, Mapping[str, str | int]]:
+def _get_versions(keys: list[str], mode: SiloMode) -> Generator[None, None, dict[str, int]]:
     versions = {cv.key: cv.version for cv in _version_model(mode).objects.filter(key__in=keys)}
     yield
+    return {key: versions.get(key, 0) for key in keys}
+
 
-    versioned_keys = [_versioned_key(key, versions.get(key, 0)) for key in keys]
+def _get_versioned_cache(
+    keys: list[str], versions: Mapping[str, int]
+) -> Generator[None, None, Mapping[str, str | int]]:
+    versioned_keys = [_versioned_key(key, versions[key]) for key in keys]
     existing = cache.get_many(versioned_keys)
     yield
     result: dict[str, str | int] = {}
@@ -66,10 +79,95 @@ def _get_cache(keys: list[str], mode: SiloMode) -> Generator[None, None, Mapping
         if versioned_key in existing:
             result[k] = existing[versioned_key]
             continue
-        result[k] = versions.get(k, 0)
+        result[k] = versions[k]
     return result
 
 
+def _get_cache(keys: list[str], mode: SiloMode) -> Generator[None, None, Mapping[str, str | int]]:
+    versions = yield from _get_versions(keys, mode)
+    return (yield from _get_versioned_cache(keys, versions))
+
+
+def _get_cache_with_local(
+    keys: list[str], mode: SiloMode
+) -> Generator[None, None, tuple[Mapping[str, Any], Mapping[str, str | int], Mapping[str, int]]]:
+    """
+    Like `_get_cache`, but keys whose current version is in the local cache are not read from
+    the cache. Returns the values of the local cache, the values (or versions) read from the
+    cache for the other keys, and the versions of all keys.
+    """
+    versions = yield from _get_versions(keys, mode)
+    local = local_cache.get_many(keys, versions)
+    missing = [key for key in keys if key not in local]
+    values: Mapping[str, str | int] = {}
+    if missing:
+        values = yield from _get_versioned_cache(missing, versions)
+    return local, values, versions
+
+
+class LocalCache:
+    """
+    A bounded, in-process LRU cache in front of the cache, holding the records that were read
+    from or written to it by this process.
+
+    Entries are only returned for the version of the key that they were cached at. Clearing a
+    key increments its version, which invalidates the entries of all processes, and the
+    `versions` that are compared to are read for every lookup, in one query for all keys.
+
+    The records are kept already built, callers are handed shallow copies of them so that
+    assigning to their fields does not change the cached record.
+
+    The size is controlled by the `hybridcloud.caching.local_cache_size` option, a size of 0
+    disables the local cache.
+    """
+
+    def __init__(self, ttl: float = LOCAL_CACHE_TTL) -> None:
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[int, float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: list[str], versions: Mapping[str, int]) -> dict[str, Any]:
+        if not options.get("hybridcloud.caching.local_cache_size"):
+            return {}
+
+        now = time.monotonic()
+        result: dict[str, Any] = {}
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                version, expires_at, value = entry
+                if version != versions[key] or expires_at < now:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                result[key] = value
+        return result
+
+    def set(self, key: str, version: int, value: Any) -> None:
+        size = options.get("hybridcloud.caching.local_cache_size")
+        if not size:
+            return
+
+        with self._lock:
+            self._entries[key] = (version, time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+local_cache = LocalCache()
+
+
 class CacheBackend:
     """
     'Exposes' the underlying caching and its versioning system so that tests can fully validate the
@@ -77,6 +175,7 @@ class CacheBackend:
     """
 
     get_cache = staticmethod(_get_cache)
+    get_cache_with_local = staticmethod(_get_cache_with_local)
     delete_cache = staticmethod(_delete_cache)
     set_cache = staticmethod(_set_cache)
 
@@ -79,9 +79,9 @@ class SiloCacheBackedCallable(Generic[_R]):
         return f"{self.base_key}:{object_id}"
 
     def resolve_from(
-        self, i: int, values: Mapping[str, int | str]
+        self, i: int, values: Mapping[str, int | str], versions: Mapping[str, int] | None = None
     ) -> Generator[None, None, _R | None]:
-        from .impl import _consume_generator, _delete_cache, _set_cache
+        from .impl import _consume_generator, _delete_cache, _set_cache, local_cache
 
         key = self.key_from(i)
         value = values[key]
@@ -89,7 +89,10 @@ class SiloCacheBackedCallable(Generic[_R]):
         if isinstance(value, str):
             try:
                 metrics.incr("hybridcloud.caching.one.cached", tags={"base_key": self.base_key})
-                return self.type_(**json.loads(value))
+                r = self.type_(**json.loads(value))
+                if versions is not None:
+                    local_cache.set(key, versions[key], r.copy())
+                return r
             except (pydantic.ValidationError, JSONDecodeError, TypeError):
                 version = yield from _delete_cache(key, self.silo_mode)
         else:
@@ -98,15 +101,19 @@ class SiloCacheBackedCallable(Generic[_R]):
         metrics.incr("hybridcloud.caching.one.rpc", tags={"base_key": self.base_key})
         r = self.cb(i)
         if r is not None:
-            _consume_generator(_set_cache(key, r.json(), version, self.timeout))
+            if _consume_generator(_set_cache(key, r.json(), version, self.timeout)):
+                local_cache.set(key, version, r.copy())
         return r
 
     def get_one(self, object_id: int) -> _R | None:
-        from .impl import _consume_generator, _get_cache
+        from .impl import _consume_generator, _get_cache_with_local
 
         key = self.key_from(object_id)
-        values = _consume_generator(_get_cache([key], self.silo_mode))
-        return _consume_generator(self.resolve_from(object_id, values))
+        local, values, versions = _consume_generator(_get_cache_with_local([key], self.silo_mode))
+        if key in local:
+            metrics.incr("hybridcloud.caching.one.local", tags={"base_key": self.base_key})
+            return local[key].copy()
+        return _consume_generator(self.resolve_from(object_id, values, versions))
 
 
 class SiloCacheBackedListCallable(Generic[_R]):
@@ -151,9 +158,12 @@ class SiloCacheBackedListCallable(Generic[_R]):
         return f"{self.base_key}:{object_id}"
 
     def resolve_from(
-        self, object_id: int, values: Mapping[str, int | str]
+        self,
+        object_id: int,
+        values: Mapping[str, int | str],
+        versions: Mapping[str, int] | None = None,
     ) -> Generator[None, None, list[_R]]:
-        from .impl import _consume_generator, _delete_cache, _set_cache
+        from .impl import _consume_generator, _delete_cache, _set_cache, local_cache
 
         key = self.key_from(object_id)
         value = values[key]
@@ -161,7 +171,10 @@ class SiloCacheBackedListCallable(Generic[_R]):
         if isinstance(value, str):
             try:
                 metrics.incr("hybridcloud.caching.list.cached", tags={"base_key": self.base_key})
-                return [self.type_(**item) for item in json.loads(value)]
+                items = [self.type_(**item) for item in json.loads(value)]
+                if versions is not None:
+                    local_cache.set(key, versions[key], tuple(item.copy() for item in items))
+                return items
             except (pydantic.ValidationError, JSONDecodeError, TypeError):
                 version = yield from _delete_cache(key, self.silo_mode)
         else:
@@ -171,15 +184,19 @@ class SiloCacheBackedListCallable(Generic[_R]):
         result = self.cb(object_id)
         if result is not None:
             cache_value = json.dumps([item.json() for item in result])
-            _consume_generator(_set_cache(key, cache_value, version, self.timeout))
+            if _consume_generator(_set_cache(key, cache_value, version, self.timeout)):
+                local_cache.set(key, version, tuple(item.copy() for item in result))
         return result
 
     def get_results(self, object_id: int) -> list[_R]:
-        from .impl import _consume_generator, _get_cache
+        from .impl import _consume_generator, _get_cache_with_local
 
         key = self.key_from(object_id)
-        values = _consume_generator(_get_cache([key], self.silo_mode))
-        return _consume_generator(self.resolve_from(object_id, values))
+        local, values, versions = _consume_generator(_get_cache_with_local([key], self.silo_mode))
+        if key in local:
+            metrics.incr("hybridcloud.caching.list.local", tags={"base_key": self.base_key})
+            return [item.copy() for item in local[key]]
+        return _consume_generator(self.resolve_from(object_id, values, versions))
 
 
 class SiloCacheManyBackedCallable(Generic[_R]):
@@ -224,22 +241,36 @@ class SiloCacheManyBackedCallable(Generic[_R]):
         return f"{self.base_key}:{object_id}"
 
     def get_many(self, ids: list[int]) -> list[_R]:
-        from .impl import _consume_generator, _delete_cache, _get_cache, _set_cache
+        from .impl import (
+            _consume_generator,
+            _delete_cache,
+            _get_cache_with_local,
+            _set_cache,
+            local_cache,
+        )
 
         keys = {i: self.key_from(i) for i in ids}
-        cache_values = _consume_generator(_get_cache(list(keys.values()), self.silo_mode))
+        # The versions of all keys are checked with a single query.
+        local, cache_values, versions = _consume_generator(
+            _get_cache_with_local(list(keys.values()), self.silo_mode)
+        )
 
         # Mapping between object_id and cache versions
         missing: dict[int, int] = {}
         found: dict[int, _R] = {}
 
         for object_id, cache_key in keys.items():
+            if cache_key in local:
+                found[object_id] = local[cache_key].copy()
+                continue
+
             version: int | None = None
             cache_value = cache_values[cache_key]
             if isinstance(cache_value, str):
                 # Found data in cache
                 try:
                     found[object_id] = self.type_(**json.loads(cache_value))
+                    local_cache.set(cache_key, versions[cache_key], found[object_id].copy())
                 except (pydantic.ValidationError, JSONDecodeError, TypeError):
                     version = _consume_generator(_delete_cache(cache_key, self.silo_mode))
             else:
@@ -253,8 +284,11 @@ class SiloCacheManyBackedCallable(Generic[_R]):
             "hybridcloud.caching.many.rpc", len(missing_keys), tags={"base_key": self.base_key}
         )
         metrics.incr(
-            "hybridcloud.caching.many.cached", len(found), tags={"base_key": self.base_key}
+            "hybridcloud.caching.many.cached",
+            len(found) - len(local),
+            tags={"base_key": self.base_key},
         )
+        metrics.incr("hybridcloud.caching.many.local", len(local), tags={"base_key": self.base_key})
 
         # This result could have different order than missing_object_ids, or have gaps
         cb_result = self.cb(missing_keys)
@@ -267,7 +301,10 @@ class SiloCacheManyBackedCallable(Generic[_R]):
                 continue
             cache_key = keys[record_id]
             record_version = missing[record_id]
-            _consume_generator(_set_cache(cache_key, record.json(), record_version, self.timeout))
+            if _consume_generator(
+                _set_cache(cache_key, record.json(), record_version, self.timeout)
+            ):
+                local_cache.set(cache_key, record_version, record.copy())
             found[record_id] = record
 
         return [found[id] for id in ids if id in found]
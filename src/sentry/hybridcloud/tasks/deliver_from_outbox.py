@@ -1,19 +1,24 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import sentry_sdk
 from celery import Task
+from django import db
 from django.conf import settings
 from django.db.models import Max, Min
 
+from sentry import options
 from sentry.hybridcloud.models.outbox import (
     ControlOutboxBase,
     OutboxBase,
     OutboxFlushError,
     RegionOutboxBase,
 )
+from sentry.hybridcloud.outbox.category import OutboxScope
 from sentry.hybridcloud.tasks.backfill_outboxes import backfill_outboxes_for
 from sentry.silo.base import SiloMode
 from sentry.tasks.base import instrumented_task
@@ -69,6 +74,9 @@ def enqueue_outbox_jobs(
 # non coalesced work.
 CONCURRENCY = 5
 
+# The number of deepest shards whose depth and lag are reported by the scheduler.
+SHARD_METRICS_LIMIT = 10
+
 
 def schedule_batch(
     silo_mode: SiloMode,
@@ -111,10 +119,30 @@ def schedule_batch(
                     outbox_identifier_hi=lo + (i + 1) * batch_size,
                 )
 
-            deepest_shard_information = outbox_model.get_shard_depths_descending(limit=1)
+            deepest_shard_information = outbox_model.get_shard_depths_descending(
+                limit=SHARD_METRICS_LIMIT, with_lag=True
+            )
             max_shard_depth = (
                 float(deepest_shard_information[0]["depth"]) if deepest_shard_information else 0.0
             )
+            for shard_information in deepest_shard_information:
+                shard_tags = {
+                    **metrics_tags,
+                    "shard_scope": OutboxScope(shard_information["shard_scope"]).name,
+                }
+                metrics.distribution(
+                    "deliver_from_outbox.shard_depth",
+                    shard_information["depth"],
+                    tags=shard_tags,
+                    sample_rate=1.0,
+                )
+                metrics.distribution(
+                    "deliver_from_outbox.shard_lag",
+                    shard_information["lag"],
+                    tags=shard_tags,
+                    sample_rate=1.0,
+                    unit="second",
+                )
             metrics.gauge(
                 "deliver_from_outbox.maximum_shard_depth",
                 value=max_shard_depth,
@@ -189,36 +217,90 @@ def drain_outbox_shards_control(
         raise
 
 
+def _capture_drain_error(e: Exception) -> None:
+    with sentry_sdk.isolation_scope() as scope:
+        if isinstance(e, OutboxFlushError):
+            scope.set_tag("outbox.category", e.outbox.category)
+            scope.set_tag("outbox.shard_scope", e.outbox.shard_scope)
+            scope.set_context(
+                "outbox",
+                {
+                    "shard_identifier": e.outbox.shard_identifier,
+                    "object_identifier": e.outbox.object_identifier,
+                    "payload": e.outbox.payload,
+                },
+            )
+        sentry_sdk.capture_exception(e)
+        # In production, it's ok to just continue processing forward, but in tests we aim to surface
+        # problems aggressively.
+        if in_test_environment():
+            raise
+
+
+def _drain_claimed_shard(shard_outbox: OutboxBase, batch_size: int) -> None:
+    try:
+        shard_outbox.drain_shard(flush_all=True, batch_size=batch_size)
+    except Exception as e:
+        _capture_drain_error(e)
+    finally:
+        # Worker threads open their own connections, which are not closed otherwise.
+        db.connections.close_all()
+
+
 def process_outbox_batch(
     outbox_identifier_hi: int, outbox_identifier_low: int, outbox_model: type[OutboxBase]
 ) -> int:
-    processed_count: int = 0
-    for shard_attributes in outbox_model.find_scheduled_shards(
+    """
+    Drain the shards that are scheduled in the given range of ids. With more than one
+    `hybrid_cloud.outbox.drain_workers`, as many shards are claimed at a time and drained
+    concurrently.
+    """
+    workers = options.get("hybrid_cloud.outbox.drain_workers")
+    batch_size = options.get("hybrid_cloud.outbox.drain_batch_size")
+    scheduled_shards = outbox_model.find_scheduled_shards(
         outbox_identifier_low, outbox_identifier_hi
-    ):
+    )
+    if workers > 1:
+        return _process_outbox_batch_parallel(scheduled_shards, outbox_model, workers, batch_size)
+
+    processed_count: int = 0
+    for shard_attributes in scheduled_shards:
         shard_outbox: OutboxBase | None = outbox_model.prepare_next_from_shard(shard_attributes)
         if not shard_outbox:
             continue
 
         try:
             processed_count += 1
-            shard_outbox.drain_shard(flush_all=True)
+            shard_outbox.drain_shard(flush_all=True, batch_size=batch_size)
         except Exception as e:
-            with sentry_sdk.isolation_scope() as scope:
-                if isinstance(e, OutboxFlushError):
-                    scope.set_tag("outbox.category", e.outbox.category)
-                    scope.set_tag("outbox.shard_scope", e.outbox.shard_scope)
-                    scope.set_context(
-                        "outbox",
-                        {
-                            "shard_identifier": e.outbox.shard_identifier,
-                            "object_identifier": e.outbox.object_identifier,
-                            "payload": e.outbox.payload,
-                        },
-                    )
-                sentry_sdk.capture_exception(e)
-                # In production, it's ok to just continue processing forward, but in tests we aim to surface
-                # problems aggressively.
-                if in_test_environment():
-                    raise
+            _capture_drain_error(e)
+    return processed_count
+
+
+def _process_outbox_batch_parallel(
+    scheduled_shards: list[Mapping[str, Any]],
+    outbox_model: type[OutboxBase],
+    workers: int,
+    batch_size: int,
+) -> int:
+    processed_count: int = 0
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="outbox-drain") as pool:
+        # Shards are claimed right before they are drained, claiming all of them upfront would
+        # let their schedule run out while waiting for a worker.
+        for start in range(0, len(scheduled_shards), workers):
+            claimed = outbox_model.prepare_next_from_shards(
+                scheduled_shards[start : start + workers]
+            )
+            metrics.distribution(
+                "deliver_from_outbox.claimed_shards",
+                len(claimed),
+                tags={"outbox_name": outbox_model._meta.label},
+            )
+            futures = [
+                pool.submit(_drain_claimed_shard, shard_outbox, batch_size)
+                for shard_outbox in claimed
+            ]
+            for future in futures:
+                future.result()
+            processed_count += len(claimed)
     return processed_count
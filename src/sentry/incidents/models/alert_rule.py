@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import abc
 import logging
+from collections import defaultdict
 from collections.abc import Callable, Collection, Iterable
 from enum import Enum, IntEnum, StrEnum
 from typing import TYPE_CHECKING, Any, ClassVar, Self
@@ -121,6 +122,44 @@ class AlertRuleManager(BaseManager["AlertRule"]):
 
         return alert_rule
 
+    def get_for_subscriptions(
+        self, subscriptions: Collection[QuerySubscription]
+    ) -> dict[int, AlertRule]:
+        """
+        Fetches the AlertRules associated with several Subscriptions, keyed by
+        subscription id. Attempts to fetch from cache then hits the database once.
+        Subscriptions that don't have exactly one AlertRule are left out.
+        """
+        cache_keys = {
+            self.__build_subscription_cache_key(subscription.id): subscription.id
+            for subscription in subscriptions
+        }
+        alert_rules = {
+            cache_keys[cache_key]: alert_rule
+            for cache_key, alert_rule in cache.get_many(cache_keys.keys()).items()
+            if alert_rule is not None
+        }
+
+        missing = [
+            subscription for subscription in subscriptions if subscription.id not in alert_rules
+        ]
+        if missing:
+            by_snuba_query: dict[int, list[AlertRule]] = defaultdict(list)
+            for alert_rule in self.filter(
+                snuba_query_id__in={subscription.snuba_query_id for subscription in missing}
+            ):
+                by_snuba_query[alert_rule.snuba_query_id].append(alert_rule)
+
+            fetched = {}
+            for subscription in missing:
+                found = by_snuba_query.get(subscription.snuba_query_id, [])
+                if len(found) == 1:
+                    alert_rules[subscription.id] = found[0]
+                    fetched[self.__build_subscription_cache_key(subscription.id)] = found[0]
+            cache.set_many(fetched, 3600)
+
+        return alert_rules
+
     @classmethod
     def clear_subscription_cache(cls, instance, **kwargs: Any) -> None:
         cache.delete(cls.__build_subscription_cache_key(instance.id))
@@ -295,6 +334,43 @@ class AlertRuleTriggerManager(BaseManager["AlertRuleTrigger"]):
             cache.set(cache_key, triggers, 3600)
         return triggers
 
+    def get_for_alert_rules(
+        self, alert_rules: Iterable[AlertRule]
+    ) -> dict[int, list[AlertRuleTrigger]]:
+        """
+        Fetches the AlertRuleTriggers associated with several AlertRules, keyed by
+        alert rule id. Attempts to fetch from cache then hits the database once.
+        """
+        cache_keys = {
+            self._build_trigger_cache_key(alert_rule.id): alert_rule.id
+            for alert_rule in alert_rules
+        }
+        triggers = {
+            cache_keys[cache_key]: alert_rule_triggers
+            for cache_key, alert_rule_triggers in cache.get_many(cache_keys.keys()).items()
+            if alert_rule_triggers is not None
+        }
+
+        missing = [
+            alert_rule_id for alert_rule_id in cache_keys.values() if alert_rule_id not in triggers
+        ]
+        if missing:
+            fetched: dict[int, list[AlertRuleTrigger]] = {
+                alert_rule_id: [] for alert_rule_id in missing
+            }
+            for trigger in AlertRuleTrigger.objects.filter(alert_rule_id__in=missing):
+                fetched[trigger.alert_rule_id].append(trigger)
+            cache.set_many(
+                {
+                    self._build_trigger_cache_key(alert_rule_id): alert_rule_triggers
+                    for alert_rule_id, alert_rule_triggers in fetched.items()
+                },
+                3600,
+            )
+            triggers.update(fetched)
+
+        return triggers
+
     @classmethod
     def clear_trigger_cache(cls, instance: AlertRuleTrigger, **kwargs: Any) -> None:
         cache.delete(cls._build_trigger_cache_key(instance.alert_rule_id))
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import logging
 import operator
+from collections import defaultdict
 from collections.abc import Sequence
 from copy import deepcopy
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import TypeVar, cast
+from typing import Any, TypeVar, cast
 
 from django.conf import settings
 from django.db import router, transaction
@@ -82,6 +84,23 @@ CRASH_RATE_ALERT_MINIMUM_THRESHOLD: int | None = None
 
 T = TypeVar("T")
 
+# (last_update, trigger_alert_counts, trigger_resolve_counts)
+AlertRuleStats = tuple[datetime, dict[int, int], dict[int, int]]
+# (alert_rule, subscription, last_update, changed alert counts, changed resolve counts)
+AlertRuleStatsUpdate = tuple[AlertRule, QuerySubscription, datetime, dict[int, int], dict[int, int]]
+
+
+@dataclass(frozen=True)
+class PreloadedAlertRule:
+    """
+    The alert rule of a subscription, with its triggers and stats, loaded together
+    with those of other subscriptions by `process_subscription_updates`.
+    """
+
+    alert_rule: AlertRule
+    triggers: list[AlertRuleTrigger]
+    stats: AlertRuleStats
+
 
 class SubscriptionProcessor:
     """
@@ -101,23 +120,38 @@ class SubscriptionProcessor:
         AlertRuleThresholdType.BELOW: (operator.lt, operator.gt),
     }
 
-    def __init__(self, subscription: QuerySubscription) -> None:
+    def __init__(
+        self,
+        subscription: QuerySubscription,
+        preloaded: PreloadedAlertRule | None = None,
+        defer_stats: bool = False,
+    ) -> None:
         self.subscription = subscription
-        try:
-            self.alert_rule = AlertRule.objects.get_for_subscription(subscription)
-        except AlertRule.DoesNotExist:
-            return
+        # When set, the stats are not written by `update_alert_rule_stats`, but
+        # returned by `process_updates`.
+        self.defer_stats = defer_stats
+        if preloaded is not None:
+            self.alert_rule = preloaded.alert_rule
+            self.triggers = preloaded.triggers
+            stats = preloaded.stats
+        else:
+            try:
+                self.alert_rule = AlertRule.objects.get_for_subscription(subscription)
+            except AlertRule.DoesNotExist:
+                return
 
-        self.triggers = AlertRuleTrigger.objects.get_for_alert_rule(self.alert_rule)
-        self.triggers.sort(key=lambda trigger: trigger.alert_threshold)
+            self.triggers = AlertRuleTrigger.objects.get_for_alert_rule(self.alert_rule)
+            self.triggers.sort(key=lambda trigger: trigger.alert_threshold)
+            stats = get_alert_rule_stats(self.alert_rule, self.subscription, self.triggers)
 
         (
             self.last_update,
             self.trigger_alert_counts,
             self.trigger_resolve_counts,
-        ) = get_alert_rule_stats(self.alert_rule, self.subscription, self.triggers)
+        ) = stats
         self.orig_trigger_alert_counts = deepcopy(self.trigger_alert_counts)
         self.orig_trigger_resolve_counts = deepcopy(self.trigger_resolve_counts)
+        self._updated_stats = deepcopy(stats)
 
     @property
     def active_incident(self) -> Incident | None:
@@ -593,6 +627,50 @@ class SubscriptionProcessor:
         # before the next one then we might alert twice.
         self.update_alert_rule_stats()
 
+    def process_updates(
+        self, subscription_updates: Sequence[QuerySubscriptionUpdate]
+    ) -> AlertRuleStatsUpdate | None:
+        """
+        Processes several updates of the subscription in order, with `defer_stats`
+        set. Every update is evaluated against the same state as if it was processed
+        by a new processor, but the stats are only returned once all updates have
+        been processed, to be written with `update_alert_rule_stats_many`.
+        """
+        assert self.defer_stats
+        for subscription_update in subscription_updates:
+            try:
+                with metrics.timer("incidents.subscription_procesor.process_update"):
+                    self.process_update(subscription_update)
+            except Exception:
+                logger.exception(
+                    "Failed to process subscription update",
+                    extra={"subscription_id": self.subscription.id},
+                )
+                # The update may have changed the status of the alert rule in a
+                # transaction that was rolled back.
+                if hasattr(self, "alert_rule"):
+                    try:
+                        self.alert_rule.refresh_from_db(fields=["status"])
+                    except AlertRule.DoesNotExist:
+                        break
+
+            if not hasattr(self, "alert_rule"):
+                return None
+
+            # Updates that were not recorded in the stats (skipped, or failed) leave
+            # no trace for the next one, and neither does the cached incident state,
+            # which is fetched again like a new processor would.
+            (
+                self.last_update,
+                self.trigger_alert_counts,
+                self.trigger_resolve_counts,
+            ) = deepcopy(self._updated_stats)
+            for attr in ("_active_incident", "_incident_triggers"):
+                if hasattr(self, attr):
+                    delattr(self, attr)
+
+        return self.get_alert_rule_stats_update()
+
     def calculate_event_date_from_update_date(self, update_date: datetime) -> datetime:
         """
         Calculates the date that an event actually happened based on the date that we
@@ -863,30 +941,106 @@ class SubscriptionProcessor:
                     status_method=IncidentStatusMethod.RULE_TRIGGERED,
                 )
 
-    def update_alert_rule_stats(self) -> None:
+    def get_alert_rule_stats_update(self) -> AlertRuleStatsUpdate:
         """
-        Updates stats about the alert rule, if they're changed.
-        :return:
+        Returns the stats about the alert rule to write, with the trigger counts
+        that changed since they were loaded.
         """
+        last_update, trigger_alert_counts, trigger_resolve_counts = self._updated_stats
         updated_trigger_alert_counts = {
             trigger_id: alert_count
-            for trigger_id, alert_count in self.trigger_alert_counts.items()
+            for trigger_id, alert_count in trigger_alert_counts.items()
             if alert_count != self.orig_trigger_alert_counts[trigger_id]
         }
         updated_trigger_resolve_counts = {
             trigger_id: alert_count
-            for trigger_id, alert_count in self.trigger_resolve_counts.items()
+            for trigger_id, alert_count in trigger_resolve_counts.items()
             if alert_count != self.orig_trigger_resolve_counts[trigger_id]
         }
-
-        update_alert_rule_stats(
+        return (
             self.alert_rule,
             self.subscription,
-            self.last_update,
+            last_update,
             updated_trigger_alert_counts,
             updated_trigger_resolve_counts,
         )
 
+    def update_alert_rule_stats(self) -> None:
+        """
+        Updates stats about the alert rule, if they're changed.
+        :return:
+        """
+        # Timestamps are stored in seconds, later updates see them truncated.
+        self._updated_stats = (
+            to_datetime(int(self.last_update.timestamp())),
+            deepcopy(self.trigger_alert_counts),
+            deepcopy(self.trigger_resolve_counts),
+        )
+        if not self.defer_stats:
+            update_alert_rule_stats(*self.get_alert_rule_stats_update())
+
+
+def process_subscription_updates(
+    updates: Sequence[tuple[QuerySubscriptionUpdate, QuerySubscription]],
+) -> None:
+    """
+    Processes the updates of several subscriptions, for instance all updates of a
+    batch of the query subscription consumer. The alert rules, triggers and stats
+    of all subscriptions are loaded in bulk, the updates of every subscription are
+    processed in order, and the stats that changed are written in a single
+    pipeline at the end.
+
+    Like in `SubscriptionProcessor.process_update`, stats are written after the
+    incidents were updated. If the process is killed before that, the updates are
+    processed again.
+    """
+    subscriptions: dict[int, QuerySubscription] = {}
+    updates_by_subscription: dict[int, list[QuerySubscriptionUpdate]] = defaultdict(list)
+    for subscription_update, subscription in updates:
+        subscriptions.setdefault(subscription.id, subscription)
+        updates_by_subscription[subscription.id].append(subscription_update)
+
+    alert_rules = AlertRule.objects.get_for_subscriptions(list(subscriptions.values()))
+    triggers = AlertRuleTrigger.objects.get_for_alert_rules(
+        {alert_rule.id: alert_rule for alert_rule in alert_rules.values()}.values()
+    )
+    for alert_rule_triggers in triggers.values():
+        alert_rule_triggers.sort(key=lambda trigger: trigger.alert_threshold)
+
+    subscription_ids = list(alert_rules)
+    stats = get_alert_rule_stats_many(
+        [
+            (
+                alert_rules[subscription_id],
+                subscriptions[subscription_id],
+                triggers[alert_rules[subscription_id].id],
+            )
+            for subscription_id in subscription_ids
+        ]
+    )
+    preloaded = {
+        subscription_id: PreloadedAlertRule(
+            alert_rule=alert_rules[subscription_id],
+            triggers=triggers[alert_rules[subscription_id].id],
+            stats=subscription_stats,
+        )
+        for subscription_id, subscription_stats in zip(subscription_ids, stats)
+    }
+
+    stats_updates = []
+    try:
+        for subscription_id, subscription_updates in updates_by_subscription.items():
+            processor = SubscriptionProcessor(
+                subscriptions[subscription_id],
+                preloaded.get(subscription_id),
+                defer_stats=True,
+            )
+            stats_update = processor.process_updates(subscription_updates)
+            if stats_update is not None:
+                stats_updates.append(stats_update)
+    finally:
+        update_alert_rule_stats_many(stats_updates)
+
 
 def build_alert_rule_stat_keys(alert_rule: AlertRule, subscription: QuerySubscription) -> list[str]:
     """
@@ -948,9 +1102,38 @@ def get_alert_rule_stats(
     alert_rule_keys = build_alert_rule_stat_keys(alert_rule, subscription)
     trigger_keys = build_trigger_stat_keys(alert_rule, subscription, triggers)
     results = get_redis_client().mget(alert_rule_keys + trigger_keys)
-    results = tuple(0 if result is None else int(result) for result in results)
-    last_update = to_datetime(results[0])
-    trigger_results = results[1:]
+    return _parse_alert_rule_stats(triggers, results)
+
+
+def get_alert_rule_stats_many(
+    entries: Sequence[tuple[AlertRule, QuerySubscription, list[AlertRuleTrigger]]],
+) -> list[AlertRuleStats]:
+    """
+    Fetches the stats of several alert rules and subscriptions in a single pipeline,
+    see `get_alert_rule_stats`.
+    """
+    if not entries:
+        return []
+
+    # The keys of every alert rule and project share a slot, but different ones don't.
+    pipeline = get_redis_client().pipeline()
+    for alert_rule, subscription, triggers in entries:
+        pipeline.mget(
+            build_alert_rule_stat_keys(alert_rule, subscription)
+            + build_trigger_stat_keys(alert_rule, subscription, triggers)
+        )
+    return [
+        _parse_alert_rule_stats(triggers, results)
+        for (_, _, triggers), results in zip(entries, pipeline.execute())
+    ]
+
+
+def _parse_alert_rule_stats(
+    triggers: list[AlertRuleTrigger], results: Sequence[str | None]
+) -> AlertRuleStats:
+    parsed = tuple(0 if result is None else int(result) for result in results)
+    last_update = to_datetime(parsed[0])
+    trigger_results = parsed[1:]
     trigger_alert_counts = {}
     trigger_resolve_counts = {}
 
@@ -973,8 +1156,33 @@ def update_alert_rule_stats(
     """
     Updates stats about the alert rule, subscription and triggers if they've changed.
     """
+    update_alert_rule_stats_many(
+        [(alert_rule, subscription, last_update, alert_counts, resolve_counts)]
+    )
+
+
+def update_alert_rule_stats_many(updates: Sequence[AlertRuleStatsUpdate]) -> None:
+    """
+    Updates stats about several alert rules in a single pipeline, see
+    `update_alert_rule_stats`.
+    """
+    if not updates:
+        return
+
     pipeline = get_redis_client().pipeline()
+    for update in updates:
+        _add_alert_rule_stats_update(pipeline, *update)
+    pipeline.execute()
+
 
+def _add_alert_rule_stats_update(
+    pipeline: Any,
+    alert_rule: AlertRule,
+    subscription: QuerySubscription,
+    last_update: datetime,
+    alert_counts: dict[int, int],
+    resolve_counts: dict[int, int],
+) -> None:
     counts_with_stat_keys = zip(ALERT_RULE_TRIGGER_STAT_KEYS, (alert_counts, resolve_counts))
     for stat_key, trigger_counts in counts_with_stat_keys:
         for trigger_id, alert_count in trigger_counts.items():
@@ -988,7 +1196,6 @@ def update_alert_rule_stats(
 
     last_update_key = build_alert_rule_stat_keys(alert_rule, subscription)[0]
     pipeline.set(last_update_key, int(last_update.timestamp()), ex=REDIS_TTL)
-    pipeline.execute()
 
 
 def get_redis_client() -> RetryingRedisCluster:
@@ -0,0 +1,262 @@
+"""
+Batched preparation of "simple" event messages.
+
+`process_simple_event_message` handles one message at a time, and every message costs
+a deduplication lookup, a project lookup, two killswitch evaluations and a processing
+store write. In this mode, the consumer batches messages and every batch is handled as
+a whole by the (possibly multiprocessing) processing step: it checks deduplication with
+a single `get_many`, fetches all projects and organizations with `get_many_from_cache`,
+evaluates each killswitch once per distinct context, writes all events to the processing
+store in one pipeline and then dispatches each event. Payloads are therefore still only
+parsed in the worker processes.
+
+Every message of a batch is passed on with its outcome, so that offsets are committed in
+order, and invalid messages are only rejected once the batch is unbatched so that they
+are sent to the DLQ individually.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from collections.abc import MutableMapping
+from dataclasses import dataclass
+from typing import Any, Union
+
+import msgpack
+import orjson
+from arroyo.backends.kafka.consumer import KafkaPayload
+from arroyo.dlq import InvalidMessage
+from arroyo.processing.strategies.batching import ValuesBatch
+from arroyo.types import BrokerValue, Message
+from django.core.cache import cache
+
+from sentry.eventstore.processing.base import EventProcessingStore
+from sentry.ingest.types import ConsumerType
+from sentry.killswitches import KillswitchMatcher
+from sentry.models.organization import Organization
+from sentry.models.project import Project
+from sentry.utils import metrics
+from sentry.utils.cache import cache_key_for_event
+from sentry.utils.event_tracker import TransactionStageStatus, track_sampled_event
+
+from .processors import (
+    IngestMessage,
+    Retriable,
+    dispatch_event,
+    get_deduplication_key,
+    get_parsed_killswitch_context,
+    get_processing_store,
+    get_raw_killswitch_context,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PreparedEvent:
+    # The ingest message, without its payload.
+    message: IngestMessage
+    project: Project
+    organization: Organization | None
+    data: MutableMapping[str, Any]
+    cache_key: str
+    payload_size: int
+
+
+@dataclass(frozen=True)
+class InvalidEvent:
+    reason: str
+
+
+# `None` is used for messages that were skipped.
+PreparedMessage = Union[PreparedEvent, InvalidEvent, None]
+
+# `None` is used for messages that were dispatched or skipped.
+ProcessedMessage = Union[InvalidEvent, None]
+
+
+@dataclass
+class _PendingEvent:
+    index: int
+    message: IngestMessage
+    project: Project | None = None
+    data: MutableMapping[str, Any] | None = None
+    cache_key: str | None = None
+
+
+def _decode(raw_payload: bytes) -> IngestMessage:
+    message: IngestMessage = msgpack.unpackb(raw_payload, use_list=False)
+    message_type = message["type"]
+    if message_type != "event":
+        raise ValueError(f"Unsupported message type: {message_type}")
+    for field in ("project_id", "event_id", "payload"):
+        if field not in message:
+            raise KeyError(field)
+    return message
+
+
+def prepare_event_batch(
+    batch: Message[ValuesBatch[KafkaPayload]], consumer_type: str
+) -> ValuesBatch[PreparedMessage]:
+    values = batch.payload
+    prepared: list[PreparedMessage] = [None] * len(values)
+    pending: list[_PendingEvent] = []
+
+    metrics.distribution(
+        "ingest_consumer.batch.size", len(values), tags={"consumer": consumer_type}
+    )
+
+    for index, value in enumerate(values):
+        raw_payload = value.payload.value
+        metrics.distribution(
+            "ingest_consumer.payload_size",
+            len(raw_payload),
+            tags={"consumer": consumer_type},
+            unit="byte",
+        )
+        try:
+            pending.append(_PendingEvent(index, _decode(raw_payload)))
+        except Exception as exc:
+            prepared[index] = InvalidEvent(repr(exc))
+
+    # Deduplication, see `process_event`. Events are only remembered once they are
+    # dispatched, so duplicates within the batch are skipped here as well.
+    deduplication_keys = [
+        get_deduplication_key(int(event.message["project_id"]), event.message["event_id"])
+        for event in pending
+    ]
+    try:
+        duplicates = set(cache.get_many(deduplication_keys))
+    except Exception as exc:
+        raise Retriable(exc)
+
+    unique = []
+    for event, key in zip(pending, deduplication_keys):
+        if key in duplicates:
+            logger.warning(
+                "pre-process-forwarder detected a duplicated event with id:%s for project:%s.",
+                event.message["event_id"],
+                event.message["project_id"],
+            )
+        else:
+            duplicates.add(key)
+            unique.append(event)
+    pending = unique
+
+    raw_killswitch = KillswitchMatcher("store.load-shed-pipeline-projects")
+    pending = [
+        event
+        for event in pending
+        if not raw_killswitch.matches(get_raw_killswitch_context(event.message))
+    ]
+
+    with metrics.timer("ingest_consumer.fetch_project"):
+        projects = {
+            project.id: project
+            for project in Project.objects.get_many_from_cache(
+                {int(event.message["project_id"]) for event in pending}
+            )
+        }
+        organizations = {
+            organization.id: organization
+            for organization in Organization.objects.get_many_from_cache(
+                {project.organization_id for project in projects.values()}
+            )
+        }
+
+    parsed_killswitch = KillswitchMatcher("store.load-shed-parsed-pipeline-projects")
+    by_store: dict[EventProcessingStore, list[_PendingEvent]] = defaultdict(list)
+    for event in pending:
+        event.project = projects.get(int(event.message["project_id"]))
+        if event.project is None:
+            continue
+
+        try:
+            event.data = orjson.loads(event.message["payload"])
+            event.cache_key = cache_key_for_event(event.data)
+        except Exception as exc:
+            prepared[event.index] = InvalidEvent(repr(exc))
+            continue
+
+        if parsed_killswitch.matches(
+            get_parsed_killswitch_context(event.message, event.project, event.data)
+        ):
+            continue
+
+        by_store[get_processing_store(consumer_type, event.data)].append(event)
+
+    with metrics.timer("ingest_consumer._store_event"):
+        for processing_store, events in by_store.items():
+            try:
+                processing_store.store_many([event.data for event in events if event.data])
+            except Exception as exc:
+                raise Retriable(exc)
+
+    for events in by_store.values():
+        for event in events:
+            assert event.project is not None and event.data is not None
+            assert event.cache_key is not None
+            if consumer_type == ConsumerType.Transactions:
+                track_sampled_event(
+                    event.data["event_id"],
+                    ConsumerType.Transactions,
+                    TransactionStageStatus.REDIS_PUT,
+                )
+            prepared[event.index] = PreparedEvent(
+                message={k: v for k, v in event.message.items() if k != "payload"},
+                project=event.project,
+                organization=organizations.get(event.project.organization_id),
+                data=event.data,
+                cache_key=event.cache_key,
+                payload_size=len(event.message["payload"]),
+            )
+
+    return [
+        BrokerValue(prepared_message, value.partition, value.offset, value.timestamp)
+        for value, prepared_message in zip(values, prepared)
+    ]
+
+
+def process_event_batch(
+    batch: Message[ValuesBatch[KafkaPayload]], consumer_type: str
+) -> ValuesBatch[ProcessedMessage]:
+    """
+    Prepares a batch of messages with `prepare_event_batch` and dispatches its events.
+    """
+    processed: list[BrokerValue[ProcessedMessage]] = []
+    for value in prepare_event_batch(batch, consumer_type):
+        prepared = value.payload
+        if isinstance(prepared, PreparedEvent):
+            try:
+                dispatch_event(
+                    prepared.message,
+                    prepared.project,
+                    prepared.data,
+                    prepared.cache_key,
+                    payload_size=prepared.payload_size,
+                    organization=prepared.organization,
+                )
+            except KeyError as exc:  # ex: missing start_time in the message
+                prepared = InvalidEvent(repr(exc))
+            except Exception as exc:
+                raise Retriable(exc)
+            else:
+                prepared = None
+        processed.append(BrokerValue(prepared, value.partition, value.offset, value.timestamp))
+
+    return processed
+
+
+def reject_invalid_event_message(raw_message: Message[ProcessedMessage]) -> None:
+    """
+    Sends messages that `process_event_batch` found to be invalid to the DLQ.
+    """
+    if raw_message.payload is None:
+        return
+
+    raw_value = raw_message.value
+    assert isinstance(raw_value, BrokerValue)
+    raise InvalidMessage(raw_value.partition, raw_value.offset) from ValueError(
+        raw_message.payload.reason
+    )
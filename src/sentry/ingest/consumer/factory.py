@@ -12,6 +12,7 @@ from arroyo.processing.strategies import (
     ProcessingStrategyFactory,
     RunTask,
 )
+from arroyo.processing.strategies.batching import BatchStep, UnbatchStep
 from arroyo.types import Commit, FilteredPayload, Message, Partition
 
 from sentry.ingest.types import ConsumerType
@@ -19,6 +20,7 @@ from sentry.processing.backpressure.arroyo import HealthChecker, create_backpres
 from sentry.utils.arroyo import MultiprocessingPool, run_task_with_multiprocessing
 
 from .attachment_event import decode_and_process_chunks, process_attachments_and_events
+from .batched_event import process_event_batch, reject_invalid_event_message
 from .simple_event import process_simple_event_message
 
 
@@ -69,11 +71,17 @@ class IngestStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         max_batch_time: int,
         input_block_size: int | None,
         output_block_size: int | None,
+        batched_preparation: bool = False,
     ):
         self.consumer_type = consumer_type
         self.is_attachment_topic = consumer_type == ConsumerType.Attachments
         self.reprocess_only_stuck_events = reprocess_only_stuck_events
         self.stop_at_timestamp = stop_at_timestamp
+        self.max_batch_size = max_batch_size
+        self.max_batch_time = max_batch_time
+        # Stuck events are checked one by one against the processing store, so
+        # reprocessing them is never batched.
+        self.batched_preparation = batched_preparation and not reprocess_only_stuck_events
 
         self.multi_process = None
         self._pool = MultiprocessingPool(num_processes)
@@ -100,6 +108,26 @@ class IngestStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
 
         final_step = CommitOffsets(commit)
 
+        if not self.is_attachment_topic and self.batched_preparation:
+            # Deduplication, project fetching, killswitches and processing store writes
+            # are done for a whole batch. Every batch is handed to a worker on its own, and
+            # only invalid messages are rejected per message afterwards.
+            reject_step = RunTask(function=reject_invalid_event_message, next_step=final_step)
+            process_step = maybe_multiprocess_step(
+                mp._replace(max_batch_size=1) if mp is not None else None,
+                partial(process_event_batch, consumer_type=self.consumer_type),
+                UnbatchStep(next_step=reject_step),
+                self._pool,
+            )
+            batch_step = BatchStep(
+                max_batch_size=self.max_batch_size,
+                max_batch_time=self.max_batch_time,
+                next_step=process_step,
+            )
+            return create_backpressure_step(
+                health_checker=self.health_checker, next_step=batch_step
+            )
+
         if not self.is_attachment_topic:
             event_function = partial(
                 process_simple_event_message,
@@ -14,6 +14,7 @@ from sentry import eventstore, features
 from sentry.attachments import CachedAttachment, attachment_cache
 from sentry.event_manager import EventManager, save_attachment
 from sentry.eventstore.processing import event_processing_store, transaction_processing_store
+from sentry.eventstore.processing.base import EventProcessingStore
 from sentry.feedback.usecases.create_feedback import FeedbackCreationSource, is_in_feedback_denylist
 from sentry.ingest.types import ConsumerType
 from sentry.ingest.userreport import Conflict, save_userreport
@@ -103,10 +104,8 @@ def process_event(
     Perform some initial filtering and deserialize the message payload.
     """
     payload = message["payload"]
-    start_time = float(message["start_time"])
     event_id = message["event_id"]
     project_id = int(message["project_id"])
-    remote_addr = message.get("remote_addr")
     attachments = message.get("attachments") or ()
 
     sentry_sdk.set_extra("event_id", event_id)
@@ -127,7 +126,7 @@ def process_event(
     # keeping it around because it does provide some protection against
     # reprocessing good events if a single consumer is in a restart loop.
     with sentry_sdk.start_span(op="deduplication_check"):
-        deduplication_key = f"ev:{project_id}:{event_id}"
+        deduplication_key = get_deduplication_key(project_id, event_id)
 
         try:
             cached_value = cache.get(deduplication_key)
@@ -146,12 +145,7 @@ def process_event(
         op="killswitch_matches_context", name="store.load-shed-pipeline-projects"
     ):
         if killswitch_matches_context(
-            "store.load-shed-pipeline-projects",
-            {
-                "project_id": project_id,
-                "event_id": event_id,
-                "has_attachments": bool(attachments),
-            },
+            "store.load-shed-pipeline-projects", get_raw_killswitch_context(message)
         ):
             # This killswitch is for the worst of scenarios and should probably not
             # cause additional load on our logging infrastructure
@@ -163,12 +157,7 @@ def process_event(
     with sentry_sdk.start_span(op="orjson.loads"):
         data = orjson.loads(payload)
 
-    # We also need to check "type" as transactions are also sent to ingest-attachments
-    # along with other event types if they have attachments.
-    if consumer_type == ConsumerType.Transactions or data.get("type") == "transaction":
-        processing_store = transaction_processing_store
-    else:
-        processing_store = event_processing_store
+    processing_store = get_processing_store(consumer_type, data)
 
     sentry_sdk.set_extra("event_type", data.get("type"))
 
@@ -177,13 +166,7 @@ def process_event(
     ):
         if killswitch_matches_context(
             "store.load-shed-parsed-pipeline-projects",
-            {
-                "organization_id": project.organization_id,
-                "project_id": project.id,
-                "event_type": data.get("type") or "null",
-                "has_attachments": bool(attachments),
-                "event_id": event_id,
-            },
+            get_parsed_killswitch_context(message, project, data),
         ):
             return
 
@@ -211,87 +194,159 @@ def process_event(
                     data["event_id"], ConsumerType.Transactions, TransactionStageStatus.REDIS_PUT
                 )
 
-            save_attachments(attachments, cache_key)
+        dispatch_event(
+            message,
+            project,
+            data,
+            cache_key,
+            payload_size=len(payload),
+            no_celery_mode=no_celery_mode,
+        )
+    except Exception as exc:
+        if isinstance(exc, KeyError):  # ex: missing event_id in message["payload"]
+            raise
+        raise Retriable(exc)
+
+
+def get_processing_store(consumer_type: str, data: Mapping[str, Any]) -> EventProcessingStore:
+    # We also need to check "type" as transactions are also sent to ingest-attachments
+    # along with other event types if they have attachments.
+    if consumer_type == ConsumerType.Transactions or data.get("type") == "transaction":
+        return transaction_processing_store
+    else:
+        return event_processing_store
+
+
+def get_raw_killswitch_context(message: IngestMessage) -> dict[str, Any]:
+    """
+    Context of the `store.load-shed-pipeline-projects` killswitch, checked before the
+    payload is parsed.
+    """
+    return {
+        "project_id": int(message["project_id"]),
+        "event_id": message["event_id"],
+        "has_attachments": bool(message.get("attachments")),
+    }
+
+
+def get_parsed_killswitch_context(
+    message: IngestMessage, project: Project, data: Mapping[str, Any]
+) -> dict[str, Any]:
+    """
+    Context of the `store.load-shed-parsed-pipeline-projects` killswitch, checked after
+    the payload is parsed.
+    """
+    return {
+        "organization_id": project.organization_id,
+        "project_id": project.id,
+        "event_type": data.get("type") or "null",
+        "has_attachments": bool(message.get("attachments")),
+        "event_id": message["event_id"],
+    }
+
+
+def dispatch_event(
+    message: IngestMessage,
+    project: Project,
+    data: MutableMapping[str, Any],
+    cache_key: str | None,
+    payload_size: int,
+    no_celery_mode: bool = False,
+    organization: Organization | None = None,
+) -> None:
+    """
+    Hand an event that was already stored in the processing store (unless in no celery
+    mode) over to the task that processes or saves it, and remember it for
+    deduplication.
+
+    The organization of the project is fetched unless it is passed.
+    """
+    start_time = float(message["start_time"])
+    event_id = message["event_id"]
+    project_id = int(message["project_id"])
+    remote_addr = message.get("remote_addr")
+    attachments = message.get("attachments") or ()
+
+    if cache_key is not None:
+        save_attachments(attachments, cache_key)
+
+    try:
+        # Records rc-processing usage broken down by
+        # event type.
+        event_type = data.get("type")
+        if event_type == "error":
+            app_feature = "errors"
+        elif event_type == "transaction":
+            app_feature = "transactions"
+        else:
+            app_feature = None
+
+        if app_feature is not None:
+            record(settings.EVENT_PROCESSING_STORE, app_feature, payload_size, UsageUnit.BYTES)
+    except Exception:
+        pass
+
+    if organization is None:
+        organization = Organization.objects.get_from_cache(id=project.organization_id)
+    project.set_cached_field_value("organization", organization)
+    if data.get("type") == "transaction":
+        if no_celery_mode:
+            with sentry_sdk.start_span(op="ingest_consumer.process_transaction_no_celery"):
+                sentry_sdk.set_tag("no_celery_mode", True)
+
+                process_transaction_no_celery(data, project_id, attachments, start_time)
+        else:
+            assert cache_key is not None
+            # No need for preprocess/process for transactions thus submit
+            # directly transaction specific save_event task.
+            save_event_transaction.delay(
+                cache_key=cache_key,
+                data=None,
+                start_time=start_time,
+                event_id=event_id,
+                project_id=project_id,
+            )
 
         try:
-            # Records rc-processing usage broken down by
-            # event type.
-            event_type = data.get("type")
-            if event_type == "error":
-                app_feature = "errors"
-            elif event_type == "transaction":
-                app_feature = "transactions"
-            else:
-                app_feature = None
-
-            if app_feature is not None:
-                record(settings.EVENT_PROCESSING_STORE, app_feature, len(payload), UsageUnit.BYTES)
+            collect_span_metrics(project, data)
         except Exception:
             pass
+    elif data.get("type") == "feedback":
+        if not is_in_feedback_denylist(project.organization):
+            save_event_feedback.delay(
+                cache_key=None,  # no need to cache as volume is low
+                data=data,
+                start_time=start_time,
+                event_id=event_id,
+                project_id=project_id,
+            )
+        else:
+            metrics.incr("feedback.ingest.filtered", tags={"reason": "org.denylist"})
+    else:
+        # Preprocess this event, which spawns either process_event or
+        # save_event. Pass data explicitly to avoid fetching it again from the
+        # cache.
+        with sentry_sdk.start_span(op="ingest_consumer.process_event.preprocess_event"):
+            preprocess_event(
+                cache_key=cache_key,
+                data=data,
+                start_time=start_time,
+                event_id=event_id,
+                project=project,
+                has_attachments=bool(attachments),
+            )
 
-        project.set_cached_field_value(
-            "organization", Organization.objects.get_from_cache(id=project.organization_id)
-        )
-        if data.get("type") == "transaction":
-            if no_celery_mode:
-                with sentry_sdk.start_span(op="ingest_consumer.process_transaction_no_celery"):
-                    sentry_sdk.set_tag("no_celery_mode", True)
-
-                    process_transaction_no_celery(data, project_id, attachments, start_time)
-            else:
-                assert cache_key is not None
-                # No need for preprocess/process for transactions thus submit
-                # directly transaction specific save_event task.
-                save_event_transaction.delay(
-                    cache_key=cache_key,
-                    data=None,
-                    start_time=start_time,
-                    event_id=event_id,
-                    project_id=project_id,
-                )
+    # remember for an 1 hour that we saved this event (deduplication protection)
+    with sentry_sdk.start_span(op="cache.set"):
+        cache.set(get_deduplication_key(project_id, event_id), "", CACHE_TIMEOUT)
 
-            try:
-                collect_span_metrics(project, data)
-            except Exception:
-                pass
-        elif data.get("type") == "feedback":
-            if not is_in_feedback_denylist(project.organization):
-                save_event_feedback.delay(
-                    cache_key=None,  # no need to cache as volume is low
-                    data=data,
-                    start_time=start_time,
-                    event_id=event_id,
-                    project_id=project_id,
-                )
-            else:
-                metrics.incr("feedback.ingest.filtered", tags={"reason": "org.denylist"})
-        else:
-            # Preprocess this event, which spawns either process_event or
-            # save_event. Pass data explicitly to avoid fetching it again from the
-            # cache.
-            with sentry_sdk.start_span(op="ingest_consumer.process_event.preprocess_event"):
-                preprocess_event(
-                    cache_key=cache_key,
-                    data=data,
-                    start_time=start_time,
-                    event_id=event_id,
-                    project=project,
-                    has_attachments=bool(attachments),
-                )
+    # emit event_accepted once everything is done
+    with sentry_sdk.start_span(op="event_accepted.send_robust"):
+        event_accepted.send_robust(ip=remote_addr, data=data, project=project, sender=process_event)
 
-        # remember for an 1 hour that we saved this event (deduplication protection)
-        with sentry_sdk.start_span(op="cache.set"):
-            cache.set(deduplication_key, "", CACHE_TIMEOUT)
 
-        # emit event_accepted once everything is done
-        with sentry_sdk.start_span(op="event_accepted.send_robust"):
-            event_accepted.send_robust(
-                ip=remote_addr, data=data, project=project, sender=process_event
-            )
-    except Exception as exc:
-        if isinstance(exc, KeyError):  # ex: missing event_id in message["payload"]
-            raise
-        raise Retriable(exc)
+def get_deduplication_key(project_id: int, event_id: str) -> str:
+    return f"ev:{project_id}:{event_id}"
 
 
 def save_attachments(attachments: Any, cache_key: str) -> None:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping, Sequence
 from datetime import datetime
 from hashlib import md5
 from typing import Any, TypedDict
@@ -24,6 +24,7 @@ from sentry.event_manager import (
 from sentry.eventstore.models import Event, GroupEvent, augment_message_with_occurrence
 from sentry.issues.grouptype import FeedbackGroup, should_create_group
 from sentry.issues.issue_occurrence import IssueOccurrence, IssueOccurrenceData
+from sentry.models.group import Group
 from sentry.models.groupassignee import GroupAssignee
 from sentry.models.grouphash import GroupHash
 from sentry.models.release import Release
@@ -70,6 +71,141 @@ def save_issue_occurrence(
     return occurrence, group_info
 
 
+@sentry_sdk.tracing.trace
+@metrics.wraps("issues.ingest.save_issue_occurrences")
+def save_issue_occurrences(
+    items: Sequence[tuple[IssueOccurrenceData, Event]],
+    on_saved: Callable[[int], None] | None = None,
+) -> list[tuple[IssueOccurrence, GroupInfo | None]]:
+    """
+    Save occurrences of the same project, type and fingerprint, in order, with the same outcome
+    as saving each of them with `save_issue_occurrence`:
+
+    - the occurrences are written to nodestore at once,
+    - occurrences are saved one by one until one of them resolves the group, and the updates of
+      the group by all remaining occurrences are coalesced into one.
+
+    Every occurrence is sent to the eventstream once it was saved, after which `on_saved` is
+    called with its index. Occurrences that were saved before a failure are thereby sent and
+    marked, like they would be one by one.
+    """
+    occurrences = []
+    for occurrence_data, event in items:
+        occurrence = IssueOccurrence.from_dict(occurrence_data)
+        if occurrence.event_id != event.event_id:
+            raise ValueError("IssueOccurrence must have the same event_id as the passed Event")
+        if occurrences and (
+            occurrence.project_id != occurrences[0].project_id
+            or occurrence.type != occurrences[0].type
+            or occurrence.fingerprint != occurrences[0].fingerprint
+        ):
+            raise ValueError("IssueOccurrences must have the same project, type and fingerprint")
+        occurrences.append(occurrence)
+    if not occurrences:
+        return []
+
+    IssueOccurrence.save_many(occurrences)
+
+    events = [event for _, event in items]
+    releases_by_version: dict[str | None, Release | None] = {}
+    for event in events:
+        if event.release not in releases_by_version:
+            try:
+                releases_by_version[event.release] = Release.get(event.project, event.release)
+            except Release.DoesNotExist:
+                # See `save_issue_occurrence`
+                releases_by_version[event.release] = None
+    releases = [releases_by_version[event.release] for event in events]
+
+    def saved(index: int, group_info: GroupInfo | None) -> None:
+        if group_info:
+            send_issue_occurrence_to_eventstream(events[index], occurrences[index], group_info)
+        if on_saved is not None:
+            on_saved(index)
+
+    group_infos: list[GroupInfo | None] = []
+    while len(group_infos) < len(occurrences) and (not group_infos or group_infos[-1] is None):
+        index = len(group_infos)
+        group_info = save_issue_from_occurrence(occurrences[index], events[index], releases[index])
+        if group_info:
+            environment = events[index].get_environment()
+            _get_or_create_group_environment(environment, releases[index], [group_info])
+            _increment_release_associated_counts(
+                group_info.group.project, environment, releases[index], [group_info]
+            )
+            _get_or_create_group_release(environment, releases[index], events[index], [group_info])
+        group_infos.append(group_info)
+        saved(index, group_info)
+
+    resolved = len(group_infos)
+    if resolved < len(occurrences):
+        resolved_group_info = group_infos[-1]
+        assert resolved_group_info is not None
+        group_infos.extend(
+            _save_occurrences_to_existing_group(
+                resolved_group_info.group,
+                occurrences[resolved:],
+                events[resolved:],
+                releases[resolved:],
+            )
+        )
+        for index in range(resolved, len(occurrences)):
+            saved(index, group_infos[index])
+
+    return list(zip(occurrences, group_infos))
+
+
+def _save_occurrences_to_existing_group(
+    group: Group,
+    occurrences: Sequence[IssueOccurrence],
+    events: Sequence[Event],
+    releases: Sequence[Release | None],
+) -> list[GroupInfo]:
+    """
+    Apply occurrences to the existing group that the occurrences before them were saved to, with a
+    single update of the group, see `save_issue_occurrences`.
+
+    The group is updated last, so that it is not updated for occurrences that are retried because
+    a step before failed.
+    """
+    group_infos = [GroupInfo(group=group, is_new=False, is_regression=False) for _ in events]
+    latest_by_environment: dict[tuple[int, int | None], int] = {}
+    for index, (event, release, group_info) in enumerate(zip(events, releases, group_infos)):
+        environment = event.get_environment()
+        key = (environment.id, release.id if release else None)
+        if key not in latest_by_environment:
+            _get_or_create_group_environment(environment, release, [group_info])
+            _increment_release_associated_counts(group.project, environment, release, [group_info])
+            latest_by_environment[key] = index
+        else:
+            group_info.is_new_group_environment = False
+            if event.datetime >= events[latest_by_environment[key]].datetime:
+                latest_by_environment[key] = index
+
+    for index in latest_by_environment.values():
+        _get_or_create_group_release(
+            events[index].get_environment(), releases[index], events[index], [group_infos[index]]
+        )
+
+    latest = max(range(len(events)), key=lambda index: (events[index].datetime, index))
+    occurrence, event, release = occurrences[latest], events[latest], releases[latest]
+    issue_kwargs = _create_issue_kwargs(occurrence, event, release)
+    issue_kwargs["message"] = augment_message_with_occurrence(issue_kwargs["message"], occurrence)
+    group_event = GroupEvent.from_event(event, group)
+    group_event.occurrence = occurrence
+    # Only the first occurrence regresses the group, and is the first in its environment.
+    group_infos[0].is_regression = _process_existing_aggregate(
+        group,
+        group_event,
+        issue_kwargs,
+        release,
+        times_seen=len(events),
+        first_seen=min(event.datetime for event in events),
+    )
+    metrics.distribution("issues.ingest.coalesced_occurrences", len(events))
+    return group_infos
+
+
 def process_occurrence_data(data: dict[str, Any]) -> None:
     if "fingerprint" not in data:
         return
@@ -196,6 +196,17 @@ class IssueOccurrence:
             self.build_storage_identifier(self.id, self.project_id), self.to_dict()
         )
 
+    @classmethod
+    def save_many(cls, occurrences: Sequence[IssueOccurrence]) -> None:
+        nodestore.backend.set_multi(
+            {
+                cls.build_storage_identifier(
+                    occurrence.id, occurrence.project_id
+                ): occurrence.to_dict()
+                for occurrence in occurrences
+            }
+        )
+
     @classmethod
     def fetch(cls, id_: str, project_id: int) -> IssueOccurrence | None:
         results = nodestore.backend.get(cls.build_storage_identifier(id_, project_id))
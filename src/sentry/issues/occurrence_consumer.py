@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from collections import defaultdict
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Any
 from uuid import UUID
@@ -22,7 +22,11 @@ from sentry import features, nodestore, options
 from sentry.event_manager import GroupInfo
 from sentry.eventstore.models import Event
 from sentry.issues.grouptype import InvalidGroupTypeError, get_group_type_by_type_id
-from sentry.issues.ingest import process_occurrence_data, save_issue_occurrence
+from sentry.issues.ingest import (
+    process_occurrence_data,
+    save_issue_occurrence,
+    save_issue_occurrences,
+)
 from sentry.issues.issue_occurrence import DEFAULT_LEVEL, IssueOccurrence, IssueOccurrenceData
 from sentry.issues.json_schemas import EVENT_PAYLOAD_SCHEMA, LEGACY_EVENT_PAYLOAD_SCHEMA
 from sentry.issues.producer import PayloadType
@@ -105,6 +109,23 @@ def lookup_event(project_id: int, event_id: str) -> Event:
     return event
 
 
+@sentry_sdk.tracing.trace
+def lookup_events(project_id: int, event_ids: Sequence[str]) -> dict[str, Event]:
+    """
+    Look up multiple events of a project at once. Events that were not found are left out.
+    """
+    node_ids = {event_id: Event.generate_node_id(project_id, event_id) for event_id in event_ids}
+    nodes = nodestore.backend.get_multi(list(node_ids.values()))
+    events = {}
+    for event_id, node_id in node_ids.items():
+        data = nodes.get(node_id)
+        if data is not None:
+            event = Event(event_id=event_id, project_id=project_id)
+            event.data = data
+            events[event_id] = event
+    return events
+
+
 @sentry_sdk.tracing.trace
 def create_event(project_id: int, event_id: str, event_data: dict[str, Any]) -> Event:
     return Event(
@@ -320,16 +341,17 @@ def _get_kwargs(payload: Mapping[str, Any]) -> Mapping[str, Any]:
         raise InvalidEventPayloadError(e)
 
 
-@sentry_sdk.tracing.trace
-@metrics.wraps("occurrence_consumer.process_occurrence_message")
-def process_occurrence_message(
+def _get_ingest_kwargs(
     message: Mapping[str, Any], txn: Transaction | NoOpSpan | Span
-) -> tuple[IssueOccurrence, GroupInfo | None] | None:
+) -> Mapping[str, Any] | None:
+    """
+    Processes an occurrence message into the kwargs to ingest it with, or None if the occurrence
+    is dropped.
+    """
     with metrics.timer("occurrence_consumer._process_message._get_kwargs"):
         kwargs = _get_kwargs(message)
     occurrence_data = kwargs["occurrence_data"]
     metric_tags = {"occurrence_type": occurrence_data["type"]}
-    is_buffered_spans = kwargs.get("is_buffered_spans", False)
 
     metrics.incr(
         "occurrence_ingest.messages",
@@ -365,6 +387,20 @@ def process_occurrence_message(
         txn.set_tag("result", "dropped_rate_limited")
         return None
 
+    return kwargs
+
+
+@sentry_sdk.tracing.trace
+@metrics.wraps("occurrence_consumer.process_occurrence_message")
+def process_occurrence_message(
+    message: Mapping[str, Any], txn: Transaction | NoOpSpan | Span
+) -> tuple[IssueOccurrence, GroupInfo | None] | None:
+    kwargs = _get_ingest_kwargs(message, txn)
+    if kwargs is None:
+        return None
+    metric_tags = {"occurrence_type": kwargs["occurrence_data"]["type"]}
+    is_buffered_spans = kwargs.get("is_buffered_spans", False)
+
     if "event_data" in kwargs and is_buffered_spans:
         return create_event_and_issue_occurrence(kwargs["occurrence_data"], kwargs["event_data"])
     elif "event_data" in kwargs:
@@ -388,7 +424,7 @@ def process_occurrence_message(
 @sentry_sdk.tracing.trace
 @metrics.wraps("occurrence_consumer.process_message")
 def _process_message(
-    message: Mapping[str, Any]
+    message: Mapping[str, Any],
 ) -> tuple[IssueOccurrence | None, GroupInfo | None] | None:
     """
     :raises InvalidEventPayloadError: when the message is invalid
@@ -502,11 +538,141 @@ def process_occurrence_group(items: list[Mapping[str, Any]]) -> None:
                 sample_rate=1.0,
             )
 
+    if options.get("issues.occurrence-consumer.batched-saving.enabled"):
+        _process_occurrence_group_batched(items)
+        return
+
     for item in items:
-        cache_key = f"occurrence_consumer.process_occurrence_group.{item['id']}"
+        cache_key = _get_processed_cache_key(item)
         if cache.get(cache_key):
             logger.info("Skipping processing of occurrence %s due to cache hit", item["id"])
             continue
         _process_message(item)
         # just need a 300 second cache
         cache.set(cache_key, 1, 300)
+
+
+def _get_processed_cache_key(item: Mapping[str, Any]) -> str:
+    return f"occurrence_consumer.process_occurrence_group.{item['id']}"
+
+
+@metrics.wraps("occurrence_consumer.process_occurrence_group_batched")
+def _process_occurrence_group_batched(items: list[Mapping[str, Any]]) -> None:
+    """
+    Process a group of related occurrences like `process_occurrence_group`, but save consecutive
+    occurrences with the same fingerprint together with `save_issue_occurrences`. Status changes
+    are processed in order, between them.
+    """
+    # Occurrences that are ready to be saved, with their cache key.
+    pending: list[tuple[str, Mapping[str, Any]]] = []
+
+    with sentry_sdk.start_transaction(
+        op="_process_occurrence_group_batched",
+        name="issues.occurrence_consumer",
+    ) as txn:
+        try:
+            for item in items:
+                cache_key = _get_processed_cache_key(item)
+                if cache.get(cache_key):
+                    logger.info("Skipping processing of occurrence %s due to cache hit", item["id"])
+                    continue
+
+                payload_type = item.get("payload_type", PayloadType.OCCURRENCE.value)
+                if payload_type != PayloadType.OCCURRENCE.value:
+                    _save_pending_occurrences(pending)
+                    _process_message(item)
+                    cache.set(cache_key, 1, 300)
+                    continue
+
+                try:
+                    kwargs = _get_ingest_kwargs(item, txn)
+                except InvalidGroupTypeError as e:
+                    metrics.incr(
+                        "occurrence_ingest.invalid_group_type",
+                        tags={"occurrence_type": e.group_type_id},
+                    )
+                    kwargs = None
+                except (ValueError, KeyError) as e:
+                    txn.set_tag("result", "error")
+                    raise InvalidEventPayloadError(e)
+
+                if kwargs is None:
+                    cache.set(cache_key, 1, 300)
+                else:
+                    pending.append((cache_key, kwargs))
+        finally:
+            # Occurrences before an invalid one are still saved, as they would be one by one.
+            _save_pending_occurrences(pending)
+
+
+def _save_pending_occurrences(pending: list[tuple[str, Mapping[str, Any]]]) -> None:
+    """
+    Resolve the events of pending occurrences, and save consecutive occurrences of the same
+    project, type and fingerprint together. Events to look up are read from nodestore at once.
+    """
+    if not pending:
+        return
+    items, pending[:] = list(pending), []
+
+    lookups: dict[int, list[str]] = defaultdict(list)
+    for _, kwargs in items:
+        if "event_data" not in kwargs:
+            occurrence_data = kwargs["occurrence_data"]
+            lookups[occurrence_data["project_id"]].append(occurrence_data["event_id"])
+    looked_up = {
+        project_id: lookup_events(project_id, event_ids)
+        for project_id, event_ids in lookups.items()
+    }
+
+    error: Exception | None = None
+    runs: list[list[tuple[str, IssueOccurrenceData, Event]]] = []
+    for cache_key, kwargs in items:
+        occurrence_data = kwargs["occurrence_data"]
+        project_id = occurrence_data["project_id"]
+        event_id = occurrence_data["event_id"]
+        try:
+            if "event_data" in kwargs:
+                event_data = kwargs["event_data"]
+                if event_id != event_data["event_id"]:
+                    raise InvalidEventPayloadError(
+                        f"event_id in occurrence({event_id}) is different from event_id in event_data({event_data['event_id']})"
+                    )
+                if kwargs.get("is_buffered_spans"):
+                    event = create_event(project_id, event_id, event_data)
+                else:
+                    event = save_event_from_occurrence(event_data)
+            else:
+                event = looked_up[project_id].get(event_id)
+                if event is None:
+                    raise EventLookupError(
+                        f"Failed to lookup event({event_id}) for project_id({project_id})"
+                    )
+        except Exception as e:
+            error = e
+            break
+
+        key = (project_id, occurrence_data["type"], occurrence_data["fingerprint"])
+        if runs and key == (
+            runs[-1][0][1]["project_id"],
+            runs[-1][0][1]["type"],
+            runs[-1][0][1]["fingerprint"],
+        ):
+            runs[-1].append((cache_key, occurrence_data, event))
+        else:
+            runs.append([(cache_key, occurrence_data, event)])
+
+    for run in runs:
+        cache_keys = [cache_key for cache_key, _, _ in run]
+        with metrics.timer(
+            "occurrence_consumer._process_message.save_issue_occurrence",
+            tags={"method": "save_issue_occurrences"},
+        ):
+            # Occurrences are marked as processed one by one, so that the ones that were saved
+            # before a failure are not saved again when the batch is retried.
+            save_issue_occurrences(
+                [(occurrence_data, event) for _, occurrence_data, event in run],
+                on_saved=lambda index, cache_keys=cache_keys: cache.set(cache_keys[index], 1, 300),
+            )
+
+    if error is not None:
+        raise error
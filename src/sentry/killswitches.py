@@ -265,6 +265,51 @@ def killswitch_matches_context(killswitch_name: str, context: Context, emit_metr
     return rv
 
 
+class KillswitchMatcher:
+    """
+    Evaluates a killswitch for many contexts, such as all the messages of a consumer
+    batch.
+
+    The option is read once, when the matcher is created, and the result is computed
+    once per distinct combination of the fields that the killswitch's conditions
+    actually use. Contexts that only differ in other fields (most commonly `event_id`)
+    share a result.
+    """
+
+    def __init__(self, killswitch_name: str, emit_metrics: bool = True) -> None:
+        assert killswitch_name in ALL_KILLSWITCH_OPTIONS
+        self.killswitch_name = killswitch_name
+        self.emit_metrics = emit_metrics
+        self.option_value = normalize_value(killswitch_name, options.get(killswitch_name))
+        self.fields = sorted(
+            {
+                field
+                for condition in self.option_value
+                for field, matching_value in condition.items()
+                if matching_value is not None
+            }
+        )
+        self._results: dict[tuple[Any, ...], bool] = {}
+
+    def matches(self, context: Context) -> bool:
+        assert set(ALL_KILLSWITCH_OPTIONS[self.killswitch_name].fields) == set(context)
+        key = tuple(context[field] for field in self.fields)
+        rv = self._results.get(key)
+        if rv is None:
+            rv = self._results[key] = _value_matches(
+                self.killswitch_name, self.option_value, context
+            )
+            if self.emit_metrics:
+                metrics.incr(
+                    "killswitches.run",
+                    tags={
+                        "killswitch_name": self.killswitch_name,
+                        "decision": "matched" if rv else "passed",
+                    },
+                )
+        return rv
+
+
 def _value_matches(
     killswitch_name: str, raw_option_value: LegacyKillswitchConfig, context: Context
 ) -> bool:
@@ -0,0 +1,298 @@
+"""
+Client-side pre-aggregation of metrics.
+
+Every metric used to be sent to the metrics backend as soon as it was recorded. The
+`PreAggregatingMetricsBackend` instead records metrics into a thread-local buffer of the
+`MetricsAggregator`, and a background thread periodically flushes all buffers to the
+wrapped backend:
+
+- counters are summed per series (key, instance, tags and unit),
+- gauges only keep the last value of every series.
+
+Timings and distributions are sent to the wrapped backend right away. The backends have
+no way to send a value with its count, so buffering them would not save any sends.
+
+The number of series buffered per thread is bounded. Metrics of new series beyond that
+bound are sent to the wrapped backend right away, and counted as
+`metrics.preaggregation.overflow`.
+
+This is enabled with `SENTRY_METRICS_PREAGGREGATION`, which holds the options of the
+aggregator, for instance `{"flush_interval": 10, "max_series": 10000}`.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from random import random
+from typing import Any
+
+from .base import MetricsBackend, Tags
+
+__all__ = ["MetricsAggregator", "PreAggregatingMetricsBackend"]
+
+logger = logging.getLogger("sentry.errors")
+
+FLUSH_INTERVAL = 10.0
+MAX_SERIES = 10000
+
+FrozenTags = tuple[tuple[str, Any], ...]
+# (key, instance, tags, sample rate or unit)
+Series = tuple[str, str | None, FrozenTags, Any]
+# (key, instance, tags, sample rate, unit)
+SampledSeries = tuple[str, str | None, FrozenTags, float, str | None]
+
+
+def _freeze_tags(tags: Tags | None) -> FrozenTags:
+    if not tags:
+        return ()
+    return tuple(sorted(tags.items()))
+
+
+class _Buffer:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.thread = threading.current_thread()
+        self.size = 0
+        self.counters: dict[Series, float] = {}
+        self.gauges: dict[SampledSeries, float] = {}
+
+    def swap(self) -> _Buffer:
+        """
+        Take the buffered metrics out of this buffer.
+        """
+        taken = _Buffer()
+        with self.lock:
+            taken.counters, self.counters = self.counters, {}
+            taken.gauges, self.gauges = self.gauges, {}
+            self.size = 0
+        return taken
+
+
+class MetricsAggregator:
+    """
+    Buffers counters and gauges per thread and flushes them to the wrapped backend in the
+    background.
+    """
+
+    def __init__(
+        self,
+        inner: MetricsBackend,
+        flush_interval: float = FLUSH_INTERVAL,
+        max_series: int = MAX_SERIES,
+    ) -> None:
+        self.inner = inner
+        self.flush_interval = flush_interval
+        self.max_series = max_series
+        self._reset()
+        os.register_at_fork(after_in_child=self._reset)
+        atexit.register(self.flush)
+
+    def _reset(self) -> None:
+        # Forked processes start without the buffers and the flusher thread of their
+        # parent.
+        self._local = threading.local()
+        self._buffers: list[_Buffer] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flusher: threading.Thread | None = None
+
+    def _get_buffer(self) -> _Buffer:
+        try:
+            return self._local.buffer
+        except AttributeError:
+            pass
+
+        buffer = self._local.buffer = _Buffer()
+        with self._lock:
+            self._buffers.append(buffer)
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._run_flusher, name="metrics-aggregator", daemon=True
+                )
+                self._flusher.start()
+        return buffer
+
+    def _run_flusher(self) -> None:
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush()
+
+    def _record_overflow(self, key: str) -> None:
+        self.inner.incr("metrics.preaggregation.overflow", tags={"key": key})
+
+    def incr(
+        self,
+        key: str,
+        instance: str | None,
+        tags: Tags | None,
+        amount: float | int,
+        sample_rate: float,
+        unit: str | None,
+    ) -> None:
+        if sample_rate < 1:
+            # Counters are sampled here rather than in the wrapped backend, sampling the
+            # sums would be far less accurate.
+            if random() >= sample_rate:
+                return
+            amount = amount / sample_rate
+
+        buffer = self._get_buffer()
+        series: Series = (key, instance, _freeze_tags(tags), unit)
+        with buffer.lock:
+            counters = buffer.counters
+            buffered = series in counters or buffer.size < self.max_series
+            if buffered:
+                if series in counters:
+                    counters[series] += amount
+                else:
+                    counters[series] = amount
+                    buffer.size += 1
+
+        if not buffered:
+            self._record_overflow(key)
+            self.inner.incr(key, instance, tags, amount, 1, unit)
+
+    def gauge(
+        self,
+        key: str,
+        value: float,
+        instance: str | None,
+        tags: Tags | None,
+        sample_rate: float,
+        unit: str | None,
+    ) -> None:
+        buffer = self._get_buffer()
+        series: SampledSeries = (key, instance, _freeze_tags(tags), sample_rate, unit)
+        with buffer.lock:
+            gauges = buffer.gauges
+            buffered = series in gauges or buffer.size < self.max_series
+            if buffered:
+                if series not in gauges:
+                    buffer.size += 1
+                gauges[series] = value
+
+        if not buffered:
+            self._record_overflow(key)
+            self.inner.gauge(key, value, instance, tags, sample_rate, unit)
+
+    def flush(self) -> None:
+        """
+        Send the metrics buffered by all threads to the wrapped backend.
+        """
+        with self._flush_lock:
+            with self._lock:
+                buffers = list(self._buffers)
+                # Buffers of threads that are gone are flushed one last time.
+                self._buffers = [buffer for buffer in buffers if buffer.thread.is_alive()]
+
+            counters: dict[Series, float] = defaultdict(float)
+            gauges: dict[SampledSeries, float] = {}
+            for buffer in buffers:
+                taken = buffer.swap()
+                for series, amount in taken.counters.items():
+                    counters[series] += amount
+                gauges.update(taken.gauges)
+
+            try:
+                self._send(counters, gauges)
+            except Exception:
+                logger.exception("Unable to flush aggregated metrics")
+
+    def _send(
+        self,
+        counters: dict[Series, float],
+        gauges: dict[SampledSeries, float],
+    ) -> None:
+        for (key, instance, tags, unit), amount in counters.items():
+            if amount == int(amount):
+                amount = int(amount)
+            self.inner.incr(key, instance, dict(tags), amount, 1, unit)
+        for (key, instance, tags, sample_rate, unit), value in gauges.items():
+            self.inner.gauge(key, value, instance, dict(tags), sample_rate, unit)
+
+
+class PreAggregatingMetricsBackend(MetricsBackend):
+    """
+    A wrapper around any metrics backend that pre-aggregates metrics with a
+    `MetricsAggregator` before sending them to it.
+    """
+
+    def __init__(self, aggregator: MetricsAggregator) -> None:
+        self.aggregator = aggregator
+        self.inner = aggregator.inner
+
+    def incr(
+        self,
+        key: str,
+        instance: str | None = None,
+        tags: Tags | None = None,
+        amount: float | int = 1,
+        sample_rate: float = 1,
+        unit: str | None = None,
+        stacklevel: int = 0,
+    ) -> None:
+        self.aggregator.incr(key, instance, tags, amount, sample_rate, unit)
+
+    def timing(
+        self,
+        key: str,
+        value: float,
+        instance: str | None = None,
+        tags: Tags | None = None,
+        sample_rate: float = 1,
+        stacklevel: int = 0,
+    ) -> None:
+        self.inner.timing(key, value, instance, tags, sample_rate, stacklevel + 1)
+
+    def gauge(
+        self,
+        key: str,
+        value: float,
+        instance: str | None = None,
+        tags: Tags | None = None,
+        sample_rate: float = 1,
+        unit: str | None = None,
+        stacklevel: int = 0,
+    ) -> None:
+        self.aggregator.gauge(key, value, instance, tags, sample_rate, unit)
+
+    def distribution(
+        self,
+        key: str,
+        value: float,
+        instance: str | None = None,
+        tags: Tags | None = None,
+        sample_rate: float = 1,
+        unit: str | None = None,
+        stacklevel: int = 0,
+    ) -> None:
+        self.inner.distribution(key, value, instance, tags, sample_rate, unit, stacklevel + 1)
+
+    def event(
+        self,
+        title: str,
+        message: str,
+        alert_type: str | None = None,
+        aggregation_key: str | None = None,
+        source_type_name: str | None = None,
+        priority: str | None = None,
+        instance: str | None = None,
+        tags: Tags | None = None,
+        stacklevel: int = 0,
+    ) -> None:
+        self.inner.event(
+            title,
+            message,
+            alert_type,
+            aggregation_key,
+            source_type_name,
+            priority,
+            instance,
+            tags,
+            stacklevel + 1,
+        )
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import threading
 import zipfile
+from collections import OrderedDict
 from collections.abc import Callable, Iterable, Mapping
 from enum import Enum
 from typing import IO, Any
@@ -27,6 +29,18 @@ from sentry.utils.hashlib import sha1_text
 NULL_UUID = "00000000-00000000-00000000-00000000"
 NULL_STRING = ""
 
+# Number of parsed manifests that are kept per process, see `ArtifactBundleArchive`.
+MANIFEST_CACHE_SIZE = 100
+
+_ParsedManifest = tuple[
+    dict[str, Any],
+    dict[tuple[str, "SourceFileType"], tuple[str, str, dict[str, Any]]],
+    dict[str, tuple[str, dict[str, Any]]],
+]
+
+_manifest_cache: OrderedDict[str, _ParsedManifest] = OrderedDict()
+_manifest_cache_lock = threading.Lock()
+
 
 class SourceFileType(Enum):
     SOURCE = 1
@@ -209,20 +223,45 @@ class ProjectArtifactBundle(Model):
 
 
 class ArtifactBundleArchive:
-    """Read-only view of uploaded ZIP artifact bundle."""
+    """Read-only view of uploaded ZIP artifact bundle.
 
-    def __init__(self, fileobj: IO, build_memory_map: bool = True):
+    If the `checksum` of the bundle file is given, the parsed manifest and the memory maps are kept in a
+    per-process cache, and reused when the same file is opened again. Files are immutable, so the cache does not
+    need to be invalidated.
+    """
+
+    def __init__(self, fileobj: IO, build_memory_map: bool = True, checksum: str | None = None):
         self._fileobj = fileobj
         self._zip_file = zipfile.ZipFile(self._fileobj)
         self._entries_by_debug_id: dict[tuple[str, SourceFileType], tuple[str, str, dict[str, Any]]]
         self._entries_by_debug_id = {}
         self._entries_by_url: dict[str, tuple[str, dict[str, Any]]] = {}
 
-        self.manifest = self._read_manifest()
+        if checksum is not None:
+            self._load_cached_manifest(checksum)
+        else:
+            self.manifest = self._read_manifest()
+            if build_memory_map:
+                self._build_memory_maps()
+
         self.artifact_count = len(self.manifest.get("files", {}))
 
-        if build_memory_map:
+    def _load_cached_manifest(self, checksum: str):
+        with _manifest_cache_lock:
+            parsed = _manifest_cache.get(checksum)
+            if parsed is not None:
+                _manifest_cache.move_to_end(checksum)
+
+        if parsed is None:
+            self.manifest = self._read_manifest()
             self._build_memory_maps()
+            parsed = (self.manifest, self._entries_by_debug_id, self._entries_by_url)
+            with _manifest_cache_lock:
+                _manifest_cache[checksum] = parsed
+                while len(_manifest_cache) > MANIFEST_CACHE_SIZE:
+                    _manifest_cache.popitem(last=False)
+        else:
+            self.manifest, self._entries_by_debug_id, self._entries_by_url = parsed
 
     def __enter__(self):
         return self
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any
 
 import sentry_sdk
 from django.db import models
-from django.db.models.signals import post_delete, post_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.utils import timezone
 
 from sentry import options  # noqa
@@ -18,6 +18,7 @@ from sentry.eventstore.models import Event, GroupEvent
 from sentry.models.activity import Activity
 from sentry.models.group import Group
 from sentry.models.groupowner import OwnerRuleType
+from sentry.ownership.compiled import get_compiled_rules
 from sentry.ownership.grammar import Matcher, Rule, load_schema, resolve_actors
 from sentry.types.activity import ActivityType
 from sentry.types.actor import Actor
@@ -128,9 +129,10 @@ class ProjectOwnership(Model):
             ownership = cls(project_id=project_id)
 
         codeowners = ProjectCodeOwners.get_codeowners_cached(project_id)
+        schema_key = cls._get_schema_key(ownership, codeowners)
         ownership.schema = cls.get_combined_schema(ownership, codeowners)
 
-        rules = cls._matching_ownership_rules(ownership, data)
+        rules = cls._matching_ownership_rules(ownership, data, schema_key)
 
         if not rules:
             return [], None
@@ -199,7 +201,10 @@ class ProjectOwnership(Model):
         rules_with_owners = []
 
         with metrics.timer("projectownership.get_issue_owners_ownership_rules"):
-            ownership_rules = list(reversed(cls._matching_ownership_rules(ownership, data)))
+            schema_key = cls._get_schema_key(ownership)
+            ownership_rules = list(
+                reversed(cls._matching_ownership_rules(ownership, data, schema_key))
+            )
             hydrated_ownership_rules = cls._hydrate_rules(
                 project_id, ownership_rules, OwnerRuleType.OWNERSHIP_RULE.value
             )
@@ -213,7 +218,10 @@ class ProjectOwnership(Model):
             return rules_with_owners
 
         with metrics.timer("projectownership.get_issue_owners_codeowners_rules"):
-            codeowners_rules = list(reversed(cls._matching_ownership_rules(codeowners, data)))
+            schema_key = cls._get_schema_key(codeowners)
+            codeowners_rules = list(
+                reversed(cls._matching_ownership_rules(codeowners, data, schema_key))
+            )
             hydrated_codeowners_rules = cls._hydrate_rules(
                 project_id, codeowners_rules, OwnerRuleType.CODEOWNERS.value
             )
@@ -365,11 +373,35 @@ class ProjectOwnership(Model):
                     updated_assignment=assignment["updated_assignment"],
                 )
 
+    @staticmethod
+    def _get_schema_key(
+        *instances: ProjectOwnership | ProjectCodeOwners | None,
+    ) -> tuple[Any, ...] | None:
+        """
+        Identify the schema combined from the schemas of ownership records, to cache its
+        compiled rules. Saving a record updates its `last_updated` or `date_updated`, which
+        changes the key. Schemas of records that were not saved have no key.
+        """
+        key: list[tuple[Any, ...]] = []
+        for instance in instances:
+            if instance is None or instance.schema is None:
+                continue
+            if instance.id is None:
+                return None
+            updated = (
+                instance.last_updated
+                if isinstance(instance, ProjectOwnership)
+                else instance.date_updated
+            )
+            key.append((type(instance).__name__.lower(), instance.id, updated))
+        return tuple(key)
+
     @classmethod
     def _matching_ownership_rules(
         cls,
         ownership: ProjectOwnership | ProjectCodeOwners,
         data: Mapping[str, Any],
+        schema_key: tuple[Any, ...] | None = None,
     ) -> list[Rule]:
         if ownership.schema is None:
             return []
@@ -384,6 +416,15 @@ class ProjectOwnership(Model):
             tags={"ownership_type": ownership_type},
         )
 
+        if options.get("ownership.compiled-rules"):
+            compiled = get_compiled_rules(schema_key, ownership.schema)
+            metrics.distribution(
+                key="projectownership.matching_ownership_rules.rules",
+                value=len(compiled.rules),
+                tags={"ownership_type": ownership_type},
+            )
+            return compiled.get_matching_rules(data, munged_data)
+
         rules = load_schema(ownership.schema)
         metrics.distribution(
             key="projectownership.matching_ownership_rules.rules",
@@ -394,6 +435,13 @@ class ProjectOwnership(Model):
         return [rule for rule in rules if rule.test(data, munged_data)]
 
 
+def modify_last_updated(instance, **kwargs):
+    # Compiled rules are cached by `last_updated`, see `_get_schema_key`.
+    if instance.id is None:
+        return
+    instance.last_updated = timezone.now()
+
+
 def process_resource_change(instance, change, **kwargs):
     from sentry.models.groupowner import GroupOwner
     from sentry.models.projectownership import ProjectOwnership
@@ -407,6 +455,12 @@ def process_resource_change(instance, change, **kwargs):
     GroupOwner.invalidate_debounce_issue_owners_evaluation_cache(instance.project_id)
 
 
+pre_save.connect(
+    modify_last_updated,
+    sender=ProjectOwnership,
+    dispatch_uid="projectownership_modify_last_updated",
+    weak=False,
+)
 # Signals update the cached reads used in post_processing
 post_save.connect(
     lambda instance, **kwargs: process_resource_change(instance, "updated", **kwargs),
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import logging
+import operator
 import uuid
 from collections import defaultdict
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from concurrent.futures import ThreadPoolExecutor, wait
 from copy import deepcopy
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from functools import partial
+from functools import partial, reduce
 from typing import Any, Literal, NotRequired, TypedDict
 
 import sentry_sdk
@@ -18,15 +20,17 @@ from arroyo.processing.strategies.commit import CommitOffsets
 from arroyo.processing.strategies.run_task import RunTask
 from arroyo.types import BrokerValue, Commit, FilteredPayload, Message, Partition
 from django.db import router, transaction
+from django.db.models import Q
 from sentry_kafka_schemas.codecs import Codec
 from sentry_kafka_schemas.schema_types.ingest_monitors_v1 import IngestMonitorMessage
 from sentry_sdk.tracing import Span, Transaction
 
-from sentry import quotas, ratelimits
+from sentry import options, quotas, ratelimits
 from sentry.conf.types.kafka_definition import Topic, get_topic_codec
 from sentry.constants import DataCategory, ObjectStatus
 from sentry.db.postgres.transactions import in_test_hide_transaction_boundary
 from sentry.killswitches import killswitch_matches_context
+from sentry.models.environment import Environment
 from sentry.models.project import Project
 from sentry.monitors.clock_dispatch import try_monitor_clock_tick
 from sentry.monitors.constants import PermitCheckInStatus
@@ -86,19 +90,34 @@ CHECKIN_QUOTA_LIMIT = 6
 CHECKIN_QUOTA_WINDOW = 60
 
 
+@dataclass(frozen=True)
+class PreloadedCheckin:
+    """
+    State needed to process a check-in, loaded together with the rest of its
+    batch by `preload_checkin_groups`.
+    """
+
+    is_ratelimited: bool
+    monitor: Monitor | None = None
+    monitor_environment: MonitorEnvironment | None = None
+
+
 def _ensure_monitor_with_config(
     project: Project,
     monitor_slug: str,
     config: dict[str, Any] | None,
+    preloaded_monitor: Monitor | None = None,
 ) -> Monitor | None:
-    try:
-        monitor = Monitor.objects.get(
-            slug=monitor_slug,
-            project_id=project.id,
-            organization_id=project.organization_id,
-        )
-    except Monitor.DoesNotExist:
-        monitor = None
+    monitor = preloaded_monitor
+    if monitor is None:
+        try:
+            monitor = Monitor.objects.get(
+                slug=monitor_slug,
+                project_id=project.id,
+                organization_id=project.organization_id,
+            )
+        except Monitor.DoesNotExist:
+            monitor = None
 
     if not config:
         return monitor
@@ -192,21 +211,31 @@ def check_killswitch(
     return is_blocked
 
 
-def check_ratelimit(metric_kwargs: dict[str, str], item: CheckinItem) -> bool:
-    """
-    Enforce check-in rate limits. Returns True if rate limit is enforced.
-    """
+def _get_ratelimit_key(item: CheckinItem) -> str:
     # Use the kafka message timestamp as part of the key to ensure we do not
     # rate-limit during backlog processing.
     ts = item.ts.replace(second=0, microsecond=0)
 
     ratelimit_key = f"{item.processing_key}:{ts}"
+    return f"monitor-checkins:{ratelimit_key}"
 
-    is_blocked = ratelimits.backend.is_limited(
-        f"monitor-checkins:{ratelimit_key}",
-        limit=CHECKIN_QUOTA_LIMIT,
-        window=CHECKIN_QUOTA_WINDOW,
-    )
+
+def check_ratelimit(
+    metric_kwargs: dict[str, str],
+    item: CheckinItem,
+    preloaded: PreloadedCheckin | None = None,
+) -> bool:
+    """
+    Enforce check-in rate limits. Returns True if rate limit is enforced.
+    """
+    if preloaded is not None:
+        is_blocked = preloaded.is_ratelimited
+    else:
+        is_blocked = ratelimits.backend.is_limited(
+            _get_ratelimit_key(item),
+            limit=CHECKIN_QUOTA_LIMIT,
+            window=CHECKIN_QUOTA_WINDOW,
+        )
 
     if is_blocked:
         metrics.incr(
@@ -415,7 +444,11 @@ def update_existing_check_in(
     existing_check_in.update(**updated_checkin)
 
 
-def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
+def _process_checkin(
+    item: CheckinItem,
+    txn: Transaction | Span,
+    preloaded: PreloadedCheckin | None = None,
+) -> None:
     params = item.payload
 
     # XXX: The start_time is when relay recieved the original envelope store
@@ -453,7 +486,7 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
         }
         raise ProcessingErrorsException([killswitch_error])
 
-    if check_ratelimit(metric_kwargs, item):
+    if check_ratelimit(metric_kwargs, item, preloaded):
         track_outcome(
             org_id=project.organization_id,
             project_id=project.id,
@@ -561,6 +594,7 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
             project,
             monitor_slug,
             monitor_config,
+            preloaded.monitor if preloaded else None,
         )
     except ProcessingErrorsException as e:
         ensure_config_errors = list(e.processing_errors)
@@ -670,9 +704,16 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
     # 02
     # Retrieve or upsert monitor environment for this check-in
     try:
-        monitor_environment = MonitorEnvironment.objects.ensure_environment(
-            project, monitor, environment
-        )
+        if (
+            preloaded is not None
+            and preloaded.monitor_environment is not None
+            and preloaded.monitor_environment.monitor_id == monitor.id
+        ):
+            monitor_environment = preloaded.monitor_environment
+        else:
+            monitor_environment = MonitorEnvironment.objects.ensure_environment(
+                project, monitor, environment
+            )
     except MonitorEnvironmentLimitsExceeded as e:
         metrics.incr(
             "monitors.checkin.result",
@@ -932,7 +973,7 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
         logger.exception("Failed to process check-in")
 
 
-def process_checkin(item: CheckinItem) -> None:
+def process_checkin(item: CheckinItem, preloaded: PreloadedCheckin | None = None) -> None:
     """
     Process an individual check-in
     """
@@ -943,20 +984,121 @@ def process_checkin(item: CheckinItem) -> None:
         ) as txn:
             # Deepcopy the checkin here so that it's not modified. We need the original when we get a
             # `ProcessingErrorsException`
-            _process_checkin(deepcopy(item), txn)
+            _process_checkin(deepcopy(item), txn, preloaded)
     except ProcessingErrorsException as e:
         handle_processing_errors(item, e)
     except Exception:
         logger.exception("Failed to process check-in")
 
 
-def process_checkin_group(items: list[CheckinItem]) -> None:
+def process_checkin_group(
+    items: list[CheckinItem],
+    preloaded: Sequence[PreloadedCheckin] | None = None,
+) -> None:
     """
     Process a group of related check-ins (all part of the same monitor)
     completely serially.
     """
-    for item in items:
-        process_checkin(item)
+    for index, item in enumerate(items):
+        process_checkin(item, preloaded[index] if preloaded else None)
+
+
+def preload_checkin_groups(
+    checkin_mapping: Mapping[str, list[CheckinItem]],
+) -> dict[str, list[PreloadedCheckin]]:
+    """
+    Loads what is needed to process a batch of check-ins in a few round trips,
+    instead of a few per check-in: the rate limits of all check-ins are checked
+    in a single redis pipeline, and the monitors and monitor environments they
+    refer to are fetched with one query each.
+
+    Monitors and monitor environments are only preloaded for the first
+    check-in of each group. The following check-ins of the group load them
+    again, since processing the check-ins before them updates them.
+    """
+    groups = [group for group in checkin_mapping.values() if group]
+
+    ratelimited = iter(
+        ratelimits.backend.is_limited_many(
+            [_get_ratelimit_key(item) for group in groups for item in group],
+            limit=CHECKIN_QUOTA_LIMIT,
+            window=CHECKIN_QUOTA_WINDOW,
+        )
+    )
+
+    slugs_by_project: dict[int, set[str]] = defaultdict(set)
+    for group in groups:
+        slugs_by_project[int(group[0].message["project_id"])].add(group[0].valid_monitor_slug)
+
+    monitors: dict[tuple[int, str], Monitor] = {}
+    if slugs_by_project:
+        query = reduce(
+            operator.or_,
+            (
+                Q(project_id=project_id, slug__in=slugs)
+                for project_id, slugs in slugs_by_project.items()
+            ),
+        )
+        monitors = {
+            (monitor.project_id, monitor.slug): monitor for monitor in Monitor.objects.filter(query)
+        }
+
+    environment_ids: dict[tuple[int, str], int] = {}
+    monitor_environments: dict[tuple[int, int], MonitorEnvironment] = {}
+    if monitors:
+        environment_names = {
+            group[0].payload.get("environment") or "production" for group in groups
+        }
+        environment_ids = {
+            (organization_id, name): environment_id
+            for environment_id, organization_id, name in Environment.objects.filter(
+                organization_id__in={monitor.organization_id for monitor in monitors.values()},
+                name__in=environment_names,
+            ).values_list("id", "organization_id", "name")
+        }
+        if environment_ids:
+            monitor_environments = {
+                (monitor_environment.monitor_id, monitor_environment.environment_id): (
+                    monitor_environment
+                )
+                for monitor_environment in MonitorEnvironment.objects.filter(
+                    monitor_id__in=[monitor.id for monitor in monitors.values()],
+                    environment_id__in=set(environment_ids.values()),
+                )
+            }
+
+    preloaded: dict[str, list[PreloadedCheckin]] = {}
+    used: set[Monitor | MonitorEnvironment] = set()
+    for processing_key, group in checkin_mapping.items():
+        if not group:
+            continue
+
+        first = group[0]
+        monitor = monitors.get((int(first.message["project_id"]), first.valid_monitor_slug))
+        monitor_environment = None
+        if monitor is not None:
+            environment_id = environment_ids.get(
+                (monitor.organization_id, first.payload.get("environment") or "production")
+            )
+            if environment_id is not None:
+                monitor_environment = monitor_environments.get((monitor.id, environment_id))
+
+            # Groups are processed in parallel, they cannot share instances.
+            if monitor in used:
+                monitor = deepcopy(monitor)
+            used.add(monitor)
+            if monitor_environment is not None:
+                if monitor_environment in used:
+                    monitor_environment = deepcopy(monitor_environment)
+                used.add(monitor_environment)
+                monitor_environment.monitor = monitor
+
+        preloaded[processing_key] = [
+            PreloadedCheckin(next(ratelimited), monitor, monitor_environment),
+            *(PreloadedCheckin(next(ratelimited)) for _ in group[1:]),
+        ]
+
+    return preloaded
 
 
 def process_batch(
@@ -1008,8 +1150,18 @@ def process_batch(
 
     # Submit check-in groups for processing
     with sentry_sdk.start_transaction(op="process_batch", name="monitors.monitor_consumer"):
+        preloaded: Mapping[str, list[PreloadedCheckin]] = {}
+        if options.get("crons.consumer.preload_batch"):
+            try:
+                preloaded = preload_checkin_groups(checkin_mapping)
+            except Exception:
+                # Check-ins are still processed, they load what they need
+                # themselves.
+                logger.exception("Failed to preload check-in batch")
+
         futures = [
-            executor.submit(process_checkin_group, group) for group in checkin_mapping.values()
+            executor.submit(process_checkin_group, group, preloaded.get(processing_key))
+            for processing_key, group in checkin_mapping.items()
         ]
         wait(futures)
 
@@ -72,6 +72,7 @@ class NodeStorage(local, Service):
         "get_multi",
         "set",
         "set_bytes",
+        "set_multi",
         "set_subkeys",
         "cleanup",
         "validate",
@@ -243,6 +244,30 @@ class NodeStorage(local, Service):
         """
         return self.set_subkeys(item_id, {None: data}, ttl=ttl)
 
+    @sentry_sdk.tracing.trace
+    def set_multi(
+        self, items: Mapping[str, Mapping[str, Any]], ttl: timedelta | None = None
+    ) -> None:
+        """
+        Set the values of multiple items at once, see `set`.
+
+        Note: This is not guaranteed to be atomic and may result in a partial
+        write.
+
+        >>> nodestore.set_multi({'key1': {'foo': 'bar'}, 'key2': {'foo': 'baz'}})
+        """
+        bytes_items = {item_id: self._encode({None: data}) for item_id, data in items.items()}
+        for bytes_data in bytes_items.values():
+            metrics.distribution("nodestore.set_bytes", len(bytes_data))
+        self._set_bytes_multi(bytes_items, ttl=ttl)
+        # set cache only after encoding and write to nodestore has succeeded
+        if options.get("nodestore.set-subkeys.enable-set-cache-item"):
+            self._set_cache_items({item_id: data for item_id, data in items.items() if data})
+
+    def _set_bytes_multi(self, items: Mapping[str, bytes], ttl: timedelta | None = None) -> None:
+        for item_id, data in items.items():
+            self._set_bytes(item_id, data, ttl)
+
     @sentry_sdk.tracing.trace
     def set_subkeys(
         self, item_id: str, data: dict[str | None, Mapping[str, Any]], ttl: timedelta | None = None
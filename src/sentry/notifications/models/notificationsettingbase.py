@@ -1,5 +1,10 @@
+from __future__ import annotations
+
+from typing import Any
+
 import sentry_sdk
 from django.conf import settings
+from django.core.cache import cache
 from django.db import models
 
 from sentry.backup.scopes import RelocationScope
@@ -30,3 +35,21 @@ class NotificationSettingBase(DefaultFieldsModelExisting):
         except AssertionError as err:
             sentry_sdk.capture_exception(err)
         super().save(*args, **kwargs)
+
+    @classmethod
+    def get_recipient_cache_key(cls, user_id: int | None, team_id: int | None) -> str:
+        """
+        The key under which all settings of a user or team are cached, see
+        `NotificationController`.
+        """
+        if user_id is not None:
+            return f"{cls._meta.db_table}:user:{user_id}"
+        return f"{cls._meta.db_table}:team:{team_id}"
+
+    @classmethod
+    def clear_recipient_cache(cls, user_id: int | None = None, team_id: int | None = None) -> None:
+        cache.delete(cls.get_recipient_cache_key(user_id, team_id))
+
+
+def clear_recipient_cache(instance: NotificationSettingBase, **kwargs: Any) -> None:
+    type(instance).clear_recipient_cache(user_id=instance.user_id, team_id=instance.team_id)
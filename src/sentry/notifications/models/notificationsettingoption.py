@@ -1,8 +1,12 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
 
 from sentry.backup.scopes import RelocationScope
 from sentry.db.models import control_silo_model, sane_repr
-from sentry.notifications.models.notificationsettingbase import NotificationSettingBase
+from sentry.notifications.models.notificationsettingbase import (
+    NotificationSettingBase,
+    clear_recipient_cache,
+)
 
 
 @control_silo_model
@@ -37,3 +41,7 @@ class NotificationSettingOption(NotificationSettingBase):
         "team_id",
         "value",
     )
+
+
+post_save.connect(clear_recipient_cache, sender=NotificationSettingOption, weak=False)
+post_delete.connect(clear_recipient_cache, sender=NotificationSettingOption, weak=False)
@@ -1,8 +1,12 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
 
 from sentry.backup.scopes import RelocationScope
 from sentry.db.models import control_silo_model, sane_repr
-from sentry.notifications.models.notificationsettingbase import NotificationSettingBase
+from sentry.notifications.models.notificationsettingbase import (
+    NotificationSettingBase,
+    clear_recipient_cache,
+)
 
 
 @control_silo_model
@@ -41,3 +45,7 @@ class NotificationSettingProvider(NotificationSettingBase):
         "type",
         "value",
     )
+
+
+post_save.connect(clear_recipient_cache, sender=NotificationSettingProvider, weak=False)
+post_delete.connect(clear_recipient_cache, sender=NotificationSettingProvider, weak=False)
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from collections import defaultdict
 from collections.abc import Iterable, Mapping, MutableMapping
-from typing import Union
+from typing import TypeVar, Union
 
+from django.core.cache import cache
 from django.db.models import Q
 
-from sentry import features
+from sentry import features, options
 from sentry.hybridcloud.services.organization_mapping.serial import serialize_organization_mapping
 from sentry.integrations.types import (
     EXTERNAL_PROVIDERS_REVERSE_VALUES,
@@ -39,6 +40,14 @@ from sentry.users.services.user.model import RpcUser
 Recipient = Union[Actor, Team, RpcUser, User]
 TEAM_NOTIFICATION_PROVIDERS = [ExternalProviderEnum.SLACK]
 
+# Settings of users and teams are cached for this long (in seconds) with
+# `notifications.cache-recipient-settings`, in case an invalidation was missed.
+RECIPIENT_SETTINGS_CACHE_TTL = 5 * 60
+
+NotificationSetting = TypeVar(
+    "NotificationSetting", NotificationSettingOption, NotificationSettingProvider
+)
+
 
 def sort_settings_by_scope(setting: NotificationSettingOption | NotificationSettingProvider) -> int:
     """
@@ -79,7 +88,10 @@ class NotificationController:
             org = serialize_organization_mapping(org_mapping) if org_mapping is not None else None
         else:
             org = None
-        if org and features.has("organizations:team-workflow-notifications", org):
+        self._has_team_workflow = bool(
+            org and features.has("organizations:team-workflow-notifications", org)
+        )
+        if self._has_team_workflow:
             self.recipients: list[Recipient] = []
             for recipient in recipients:
                 if recipient_is_team(recipient):
@@ -92,7 +104,13 @@ class NotificationController:
         else:
             self.recipients = list(recipients)
 
-        if self.recipients:
+        if not self.recipients:
+            self._setting_options = []
+            self._setting_providers = []
+        elif options.get("notifications.cache-recipient-settings"):
+            self._setting_options = self._get_cached_settings(NotificationSettingOption)
+            self._setting_providers = self._get_cached_settings(NotificationSettingProvider)
+        else:
             query = self._get_query()
             type_filter = Q(type=self.type.value) if self.type else Q()
             provider_filter = Q(provider=self.provider.value) if self.provider else Q()
@@ -102,9 +120,10 @@ class NotificationController:
             self._setting_providers = list(
                 NotificationSettingProvider.objects.filter(query & type_filter & provider_filter)
             )
-        else:
-            self._setting_options = []
-            self._setting_providers = []
+
+        # The settings of every recipient, with the most specific scope last.
+        self._setting_options_by_recipient = self._index_by_recipient(self._setting_options)
+        self._setting_providers_by_recipient = self._index_by_recipient(self._setting_providers)
 
     @property
     def get_all_setting_options(self) -> Iterable[NotificationSettingOption]:
@@ -114,15 +133,7 @@ class NotificationController:
     def get_all_setting_providers(self) -> Iterable[NotificationSettingProvider]:
         return self._setting_providers
 
-    def _get_query(self) -> Q:
-        """
-        Generates a query for all settings for a project, org, user, or team.
-
-        Args:
-            recipients: The recipients of the notification settings (user or team).
-            projects_ids: The projects to get notification settings for.
-            organization_id: The organization to get notification settings for.
-        """
+    def _get_recipient_ids(self) -> tuple[list[int], list[int]]:
         if not self.recipients:
             raise Exception("recipient, team_ids, or user_ids must be provided")
 
@@ -135,6 +146,132 @@ class NotificationController:
 
         if not user_ids and not team_ids:
             raise Exception("recipients must be either user or team")
+        return user_ids, team_ids
+
+    def _get_cached_settings(self, model: type[NotificationSetting]) -> list[NotificationSetting]:
+        """
+        Returns the same settings as the query of `_get_query`. All settings of each
+        recipient are cached, regardless of their scope, and filtered here.
+        """
+        user_ids, team_ids = self._get_recipient_ids()
+        keys = {
+            **{model.get_recipient_cache_key(user_id, None): user_id for user_id in user_ids},
+            **{model.get_recipient_cache_key(None, team_id): team_id for team_id in team_ids},
+        }
+        settings_by_key: dict[str, list[NotificationSetting]] = cache.get_many(list(keys))
+
+        missing_user_ids = [
+            user_id
+            for user_id in user_ids
+            if model.get_recipient_cache_key(user_id, None) not in settings_by_key
+        ]
+        missing_team_ids = [
+            team_id
+            for team_id in team_ids
+            if model.get_recipient_cache_key(None, team_id) not in settings_by_key
+        ]
+        if missing_user_ids or missing_team_ids:
+            fetched: dict[str, list[NotificationSetting]] = {
+                **{
+                    model.get_recipient_cache_key(user_id, None): [] for user_id in missing_user_ids
+                },
+                **{
+                    model.get_recipient_cache_key(None, team_id): [] for team_id in missing_team_ids
+                },
+            }
+            for setting in model.objects.filter(
+                Q(user_id__in=missing_user_ids) | Q(team_id__in=missing_team_ids)
+            ):
+                fetched[model.get_recipient_cache_key(setting.user_id, setting.team_id)].append(
+                    setting
+                )
+            cache.set_many(fetched, RECIPIENT_SETTINGS_CACHE_TTL)
+            settings_by_key.update(fetched)
+
+        project_ids = set(self.project_ids or ())
+        user_id_set, team_id_set = set(user_ids), set(team_ids)
+
+        def is_in_scope(setting: NotificationSetting) -> bool:
+            # The same conditions as the ones of `_get_query`.
+            if setting.scope_type == NotificationScopeEnum.PROJECT.value:
+                return setting.scope_identifier in project_ids
+            if setting.scope_type == NotificationScopeEnum.ORGANIZATION.value:
+                return bool(self.organization_id) and (
+                    setting.scope_identifier == self.organization_id
+                )
+            if setting.scope_type == NotificationScopeEnum.USER.value:
+                return setting.user_id is not None and setting.scope_identifier in user_id_set
+            if setting.scope_type == NotificationScopeEnum.TEAM.value:
+                return setting.team_id is not None and setting.scope_identifier in team_id_set
+            return False
+
+        settings = [
+            setting
+            for recipient_settings in settings_by_key.values()
+            for setting in recipient_settings
+            if is_in_scope(setting)
+            and (not self.type or setting.type == self.type.value)
+            and (
+                not self.provider
+                or not isinstance(setting, NotificationSettingProvider)
+                or setting.provider == self.provider.value
+            )
+        ]
+        return sorted(settings, key=lambda setting: setting.id)
+
+    @staticmethod
+    def _index_by_recipient(
+        settings: Iterable[NotificationSetting],
+    ) -> dict[tuple[ActorType, int], list[NotificationSetting]]:
+        settings_by_recipient: dict[tuple[ActorType, int], list[NotificationSetting]] = defaultdict(
+            list
+        )
+        for setting in settings:
+            if setting.user_id is not None:
+                settings_by_recipient[(ActorType.USER, setting.user_id)].append(setting)
+            elif setting.team_id is not None:
+                settings_by_recipient[(ActorType.TEAM, setting.team_id)].append(setting)
+
+        for recipient_settings in settings_by_recipient.values():
+            recipient_settings.sort(key=sort_settings_by_scope)
+        return dict(settings_by_recipient)
+
+    @staticmethod
+    def _get_recipient_settings(
+        settings_by_recipient: Mapping[tuple[ActorType, int], list[NotificationSetting]],
+        all_settings: Iterable[NotificationSetting],
+        recipient: Recipient,
+        **kwargs,
+    ) -> list[NotificationSetting]:
+        """
+        Returns the settings of a recipient matching the filters, sorted by scope with
+        the most specific scope last.
+        """
+        if recipient_is_user(recipient):
+            settings: Iterable[NotificationSetting] = settings_by_recipient.get(
+                (ActorType.USER, recipient.id), ()
+            )
+        elif recipient_is_team(recipient):
+            settings = settings_by_recipient.get((ActorType.TEAM, recipient.id), ())
+        else:
+            settings = sorted(all_settings, key=sort_settings_by_scope)
+
+        return [
+            setting
+            for setting in settings
+            if all(getattr(setting, arg) == kwargs[arg] for arg in kwargs)
+        ]
+
+    def _get_query(self) -> Q:
+        """
+        Generates a query for all settings for a project, org, user, or team.
+
+        Args:
+            recipients: The recipients of the notification settings (user or team).
+            projects_ids: The projects to get notification settings for.
+            organization_id: The organization to get notification settings for.
+        """
+        user_ids, team_ids = self._get_recipient_ids()
 
         project_settings = (
             Q(
@@ -225,13 +362,9 @@ class NotificationController:
 
         for recipient in self.recipients:
             # get the settings for this user/team
-            filter_kwargs = kwargs.copy()
-            if recipient_is_user(recipient):
-                filter_kwargs["user_id"] = recipient.id
-            elif recipient_is_team(recipient):
-                filter_kwargs["team_id"] = recipient.id
-            local_settings = self._filter_options(**filter_kwargs)
-            local_settings.sort(key=sort_settings_by_scope)
+            local_settings = self._get_recipient_settings(
+                self._setting_options_by_recipient, self._setting_options, recipient, **kwargs
+            )
             most_specific_recipient_options = most_specific_setting_options[recipient]
 
             for setting in local_settings:
@@ -288,25 +421,11 @@ class NotificationController:
             )
         )
 
-        if self.organization_id is not None:
-            org_mapping = OrganizationMapping.objects.filter(
-                organization_id=self.organization_id
-            ).first()
-            org = serialize_organization_mapping(org_mapping) if org_mapping is not None else None
-        else:
-            org = None
-        has_team_workflow = org and features.has("organizations:team-workflow-notifications", org)
-
         for recipient in self.recipients:
             # get the settings for this user/team
-            filter_kwargs = kwargs.copy()
-            if recipient_is_user(recipient):
-                filter_kwargs["user_id"] = recipient.id
-            elif recipient_is_team(recipient):
-                filter_kwargs["team_id"] = recipient.id
-
-            local_settings = self._filter_providers(**filter_kwargs)
-            local_settings.sort(key=sort_settings_by_scope)
+            local_settings = self._get_recipient_settings(
+                self._setting_providers_by_recipient, self._setting_providers, recipient, **kwargs
+            )
 
             most_specific_recipient_providers = most_specific_setting_providers[recipient]
             for setting in local_settings:
@@ -329,7 +448,7 @@ class NotificationController:
                     provider = ExternalProviderEnum(provider_str)
                     if provider_str not in most_specific_recipient_providers[type]:
                         # TODO(jangjodi): Remove this once the flag is removed
-                        if recipient_is_team(recipient) and (not has_team_workflow):
+                        if recipient_is_team(recipient) and (not self._has_team_workflow):
                             most_specific_recipient_providers[type][
                                 provider_str
                             ] = NotificationSettingsOptionEnum.NEVER
@@ -56,6 +56,8 @@ class DatabaseBackedNotificationsService(NotificationsService):
                         "value": NotificationSettingsOptionEnum.ALWAYS.value,
                     },
                 )
+        # Updates do not send signals, so the cached settings are cleared here.
+        NotificationSettingProvider.clear_recipient_cache(user_id=user_id, team_id=team_id)
 
     def update_notification_options(
         self,
@@ -78,6 +80,7 @@ class DatabaseBackedNotificationsService(NotificationsService):
             values={"value": value.value},
             **kwargs,
         )
+        NotificationSettingOption.clear_recipient_cache(**kwargs)
 
     def remove_notification_settings_for_provider_team(
         self, *, team_id: int, provider: ExternalProviders
@@ -775,6 +775,13 @@ register(
     default=0.0,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Number of seconds for which artifact bundle lookups of the artifact lookup endpoint are cached, 0 disables caching
+register(
+    "symbolicator.sourcemaps-lookup-cache-ttl",
+    type=Int,
+    default=0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 
 # Transaction events
 # True => kill switch to disable ingestion of transaction events for internal project.
@@ -1160,6 +1167,14 @@ register(
     flags=FLAG_MODIFIABLE_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Run the queries of the release health overview concurrently
+register(
+    "release-health.overview-concurrent-queries",
+    type=Bool,
+    default=False,
+    flags=FLAG_MODIFIABLE_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Switch for more performant project counter incr
 register(
     "store.projectcounter-modern-upsert-sample-rate", default=0.0, flags=FLAG_AUTOMATOR_MODIFIABLE
@@ -1257,6 +1272,11 @@ register("symbolicate.symx-os-description-list", default=[], flags=FLAG_AUTOMATO
 # Drop delete_old_primary_hash messages for a particular project.
 register("reprocessing2.drop-delete-old-primary-hash", default=[], flags=FLAG_AUTOMATOR_MODIFIABLE)
 
+# Deletions: the number of independent child relations of a deleted object that are deleted
+# concurrently, and the number of rows that deletions may delete per second, by database alias.
+register("deletions.child-relations.workers", type=Int, default=1, flags=FLAG_AUTOMATOR_MODIFIABLE)
+register("deletions.rows-per-second", type=Dict, default={}, flags=FLAG_AUTOMATOR_MODIFIABLE)
+
 # The poll limit for the tempest service.
 #
 # 348 every 5 min ~ 100k per day
@@ -1428,6 +1448,28 @@ register(
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Enables the in-process LRU cache of the indexer in front of the shared cache.
+register(
+    "sentry-metrics.indexer.local-cache.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Seconds that ids are kept in the in-process cache of the indexer.
+register(
+    "sentry-metrics.indexer.local-cache.ttl",
+    type=Int,
+    default=600,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Seconds that strings without an id are kept in the in-process cache of the indexer.
+register(
+    "sentry-metrics.indexer.local-cache.negative-ttl",
+    type=Int,
+    default=10,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Option to control sampling percentage of schema validation on the generic metrics pipeline
 # based on namespace.
 register(
@@ -2068,6 +2110,11 @@ register("hybridcloud.integrationproxy.retries", default=5, flags=FLAG_AUTOMATOR
 register("hybridcloud.endpoint_flag_logging", default=False, flags=FLAG_AUTOMATOR_MODIFIABLE)
 register("hybridcloud.rpc.method_retry_overrides", default={}, flags=FLAG_AUTOMATOR_MODIFIABLE)
 register("hybridcloud.rpc.method_timeout_overrides", default={}, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Maximum number of records of silo cache backed RPC methods that are kept in process, in front
+# of the cache. 0 disables the local cache.
+register(
+    "hybridcloud.caching.local_cache_size", type=Int, default=0, flags=FLAG_AUTOMATOR_MODIFIABLE
+)
 # Webhook processing controls
 register(
     "hybridcloud.webhookpayload.worker_threads",
@@ -2077,6 +2124,12 @@ register(
 
 # Break glass controls
 register("hybrid_cloud.rpc.disabled-service-methods", default=[], flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Outbox delivery: the number of shards drained concurrently by each drain task, and the
+# number of messages whose coalesced groups are processed per transaction.
+register("hybrid_cloud.outbox.drain_workers", type=Int, default=1, flags=FLAG_AUTOMATOR_MODIFIABLE)
+register(
+    "hybrid_cloud.outbox.drain_batch_size", type=Int, default=1, flags=FLAG_AUTOMATOR_MODIFIABLE
+)
 # == End hybrid cloud subsystem
 
 # Decides whether an incoming transaction triggers an update of the clustering rule applied to it.
@@ -2145,6 +2198,15 @@ register(
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Enables loading the monitors, monitor environments and rate limits of all
+# check-ins of a batch together before processing them in the batched-parallel
+# monitors consumer.
+register(
+    "crons.consumer.preload_batch",
+    default=False,
+    flags=FLAG_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Temporary killswitch to enable dispatching incident occurrences into the
 # incident_occurrence_consumer
 register(
@@ -2255,6 +2317,12 @@ register(
     default=14,
     flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
 )
+register(
+    "statistical_detectors.store.packed_states",
+    type=Bool,
+    default=False,
+    flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
+)
 register(
     "statistical_detectors.ratelimit.ema",
     type=Int,
@@ -2939,6 +3007,13 @@ register(
     default=False,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Maximum number of projects of one organization whose delayed rules are evaluated by
+# a single task, sharing their Snuba queries. 1 processes every project on its own.
+register(
+    "delayed_processing.cross_project_batch_size",
+    default=1,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 register(
     "delayed_workflow.rollout",
     type=Bool,
@@ -3072,6 +3147,15 @@ register(
     default=False,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+
+# Save consecutive occurrences of the same fingerprint in a group of the occurrence consumer
+# together, see `save_issue_occurrences`.
+register(
+    "issues.occurrence-consumer.batched-saving.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 register(
     "eventstore.adjacent_event_ids_use_snql",
     type=Bool,
@@ -3313,3 +3397,71 @@ register(
     default={},
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+
+# Evaluate workflows from the process-local compiled workflow graph instead of
+# querying for the workflows and their conditions on every event.
+register(
+    "workflow_engine.use_compiled_workflow_graph",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Record per-group event frequency counters in redis from post_process.
+register(
+    "rules.frequency-counters.write",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Answer event frequency conditions from the counters where possible. Only enable once
+# the counters have been written for at least their retention (2 hours).
+register(
+    "rules.frequency-counters.read",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Format of event payloads written to the processing store, one of "json", "zstd-msgpack"
+# and "zstd-orjson". Payloads in any format can be read, so this can be changed at any time.
+register(
+    "eventstore.processing.codec",
+    type=String,
+    default="json",
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Only write the top-level keys of an event that changed when it is stored again in the
+# redis processing store.
+register(
+    "eventstore.processing.patch-writes",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Read patches of events in the redis processing store while patch writes are disabled. This
+# has to stay enabled for a day (the TTL of events) after patch writes were disabled.
+register(
+    "eventstore.processing.patch-reads",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Match events against ownership rules and CODEOWNERS through the compiled index of the
+# schema, which only tests the rules that can match.
+register(
+    "ownership.compiled-rules",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Cache the notification settings of users and teams, which are invalidated when they
+# change, instead of querying them for every notification.
+register(
+    "notifications.cache-recipient-settings",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
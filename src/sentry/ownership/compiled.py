@@ -0,0 +1,189 @@
+"""
+Compiled index of ownership rules.
+
+Testing an event against an ownership schema used to test every rule against every
+frame, which costs rules × frames × keys glob matches for schemas with thousands of
+CODEOWNERS lines. `CompiledRules` indexes the rules of a schema by a literal string
+that any value matched by the rule's pattern must contain. All values of an event are
+then scanned for these literals in a single pass, and only the rules whose literal was
+found (and rules that have no such literal) are tested with `Rule.test`. The result is
+the same as testing every rule, in the same order.
+
+Compiled schemas are cached per process, keyed by the version of the ownership records
+that they were read from.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict, defaultdict
+from collections.abc import Hashable, Iterable, Mapping, Sequence
+from typing import Any
+
+from sentry.ownership.grammar import CODEOWNERS, MODULE, PATH, URL, Matcher, Rule, load_schema
+from sentry.utils.event_frames import find_stack_frames
+from sentry.utils.safe import get_path
+
+#: Characters that have a special meaning in glob or CODEOWNERS patterns. Literals are
+#: only taken from the parts of patterns between them.
+_SPECIAL_CHARACTERS = re.compile(r"\\.|\[[^\]]*\]?|[*?/\\\]]")
+
+# Values of frames that are tested by each matcher type, see `Matcher.test`.
+_PATH_VALUES = "path"
+_MODULE_VALUES = "module"
+_URL_VALUES = "url"
+_VALUES_BY_TYPE = {
+    PATH: _PATH_VALUES,
+    CODEOWNERS: _PATH_VALUES,
+    MODULE: _MODULE_VALUES,
+    URL: _URL_VALUES,
+}
+
+#: Required literals are cut to this length, which keeps the compiled regexes small.
+MAX_LITERAL_LENGTH = 64
+
+CACHE_SIZE = 500
+
+_cache: OrderedDict[Hashable, CompiledRules] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def get_required_literal(pattern: str) -> str | None:
+    """
+    Return a (case folded) string that is contained in every value that the pattern
+    matches, or None if there is no such string.
+    """
+    if "{" in pattern or not pattern.isascii():
+        # Alternatives, and case folding of non-ASCII characters, are left to the
+        # matchers.
+        return None
+
+    literals = [literal for literal in _SPECIAL_CHARACTERS.split(pattern) if literal]
+    if not literals:
+        return None
+    # Later parts of paths tend to be more specific.
+    return max(reversed(literals), key=len).casefold()[:MAX_LITERAL_LENGTH]
+
+
+def _compile_literals(literals: Iterable[str]) -> re.Pattern[str]:
+    """
+    Compile literals into a regex of their trie. Finding it at every position of a
+    string yields the longest literal that starts there.
+    """
+    trie: dict[str, Any] = {}
+    for literal in literals:
+        node = trie
+        for char in literal:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def to_regex(node: dict[str, Any]) -> str:
+        branches = [re.escape(char) + to_regex(child) for char, child in node.items() if char]
+        if not branches:
+            return ""
+        regex = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            regex = f"(?:{regex})?"
+        return regex
+
+    return re.compile(f"(?=({to_regex(trie)}))")
+
+
+class CompiledRules:
+    def __init__(self, rules: Sequence[Rule]) -> None:
+        self.rules = rules
+        # Indexes of rules that have to be tested for every event.
+        self.unindexed: list[int] = []
+        by_literal: dict[str, dict[str, list[int]]] = defaultdict(lambda: defaultdict(list))
+
+        for index, rule in enumerate(rules):
+            values = _VALUES_BY_TYPE.get(rule.matcher.type)
+            literal = get_required_literal(rule.matcher.pattern) if values else None
+            if values and literal:
+                by_literal[values][literal].append(index)
+            else:
+                self.unindexed.append(index)
+
+        self.by_literal = {values: dict(literals) for values, literals in by_literal.items()}
+        self.regexes = {
+            values: _compile_literals(literals) for values, literals in self.by_literal.items()
+        }
+
+    def _get_values(
+        self,
+        data: Mapping[str, Any],
+        munged_data: tuple[Sequence[Mapping[str, Any]], Sequence[str]],
+    ) -> dict[str, list[Any]]:
+        frames, keys = munged_data
+        values: dict[str, list[Any]] = {
+            _PATH_VALUES: [frame.get(key) for frame in frames for key in keys],
+            _URL_VALUES: [get_path(data, "request", "url")],
+        }
+        if _MODULE_VALUES in self.regexes:
+            values[_MODULE_VALUES] = [frame.get("module") for frame in find_stack_frames(data)]
+        return values
+
+    def _find_candidates(self, source: str, values: list[Any]) -> Iterable[int]:
+        literals = self.by_literal[source]
+        values = [value for value in values if value]
+        if not all(isinstance(value, str) for value in values):
+            for indexes in literals.values():
+                yield from indexes
+            return
+
+        text = "\n".join(values).casefold()
+        found: set[str] = set()
+        for match in self.regexes[source].finditer(text):
+            longest = match.group(1)
+            if longest in found:
+                continue
+            # Shorter literals starting at the same position are contained as well.
+            for end in range(1, len(longest) + 1):
+                literal = longest[:end]
+                if literal not in found and literal in literals:
+                    found.add(literal)
+                    yield from literals[literal]
+
+    def get_matching_rules(
+        self,
+        data: Mapping[str, Any],
+        munged_data: tuple[Sequence[Mapping[str, Any]], Sequence[str]] | None = None,
+    ) -> list[Rule]:
+        if munged_data is None:
+            munged_data = Matcher.munge_if_needed(data)
+
+        candidates = set(self.unindexed)
+        if self.regexes:
+            values = self._get_values(data, munged_data)
+            for source in self.regexes:
+                candidates.update(self._find_candidates(source, values[source]))
+
+        return [
+            self.rules[index]
+            for index in sorted(candidates)
+            if self.rules[index].test(data, munged_data)
+        ]
+
+
+def get_compiled_rules(key: Hashable | None, schema: Mapping[str, Any]) -> CompiledRules:
+    """
+    Return the compiled rules of a schema, compiling it if it was not compiled for `key`
+    yet. The key has to change whenever the schema does, schemas without a key are
+    compiled every time.
+    """
+    if key is None:
+        return CompiledRules(load_schema(schema))
+
+    with _cache_lock:
+        compiled = _cache.get(key)
+        if compiled is not None:
+            _cache.move_to_end(key)
+            return compiled
+
+    compiled = CompiledRules(load_schema(schema))
+    with _cache_lock:
+        _cache[key] = compiled
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return compiled
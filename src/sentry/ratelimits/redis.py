@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from time import time
 from typing import TYPE_CHECKING, Any
 
@@ -121,6 +122,32 @@ class RedisRateLimiter(RateLimiter):
 
         return result > limit, result, reset_time
 
+    def is_limited_many(
+        self, keys: Sequence[str], limit: int, window: int | None = None
+    ) -> list[bool]:
+        """
+        Does the rate limit checks of all keys in a single pipeline.
+        """
+        if not keys:
+            return []
+
+        request_time = time()
+        if window is None or window == 0:
+            window = self.window
+        expiration = window - int(request_time % window)
+        try:
+            pipe = self.client.pipeline()
+            for key in keys:
+                redis_key = self._construct_redis_key(key, window=window, request_time=request_time)
+                pipe.incr(redis_key)
+                pipe.expire(redis_key, expiration)
+            pipeline_result = pipe.execute()
+        except RedisError:
+            logger.exception("Failed to retrieve current rate limit values from redis")
+            return [False] * len(keys)
+
+        return [value > limit for value in pipeline_result[::2]]
+
     def reset(self, key: str, project: Project | None = None, window: int | None = None) -> None:
         redis_key = self._construct_redis_key(key, project=project, window=window)
         self.client.delete(redis_key)
@@ -1,12 +1,14 @@
 import logging
 from collections import defaultdict
 from collections.abc import Callable, Collection, Iterable, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Any, Literal, TypeVar
 
 from snuba_sdk import Column, Condition, Direction, Op
 from snuba_sdk.expressions import Granularity, Limit, Offset
 
+from sentry import options
 from sentry.models.environment import Environment
 from sentry.models.project import Project
 from sentry.release_health.base import (
@@ -70,6 +72,14 @@ logger = logging.getLogger(__name__)
 
 _V = TypeVar("_V")
 
+_overview_query_pool = ThreadPoolExecutor(max_workers=10)
+
+
+def _run_now(fn: Callable[..., _V], /, *args: Any, **kwargs: Any) -> Future[_V]:
+    future: Future[_V] = Future()
+    future.set_result(fn(*args, **kwargs))
+    return future
+
 
 def filter_projects_by_project_release(project_releases: Sequence[ProjectRelease]) -> Condition:
     return Condition(Column("project_id"), Op.IN, [proj for proj, _rel in project_releases])
@@ -709,74 +719,29 @@ class MetricsReleaseHealthBackend(ReleaseHealthBackend):
         return ret_val
 
     @staticmethod
-    def _get_errored_sessions_for_overview(
+    def _get_session_totals_for_overview(
         projects: Sequence[Project],
         where: list[Condition],
         org_id: int,
         granularity: int,
         start: datetime,
         end: datetime,
-    ) -> Mapping[tuple[int, str], int]:
-        """
-        Count of errored sessions, incl fatal (abnormal, crashed) sessions,
-        excl errored *preaggregated* sessions
+    ) -> tuple[
+        Mapping[tuple[int, str], int],
+        Mapping[tuple[int, str, str], int],
+        Mapping[tuple[int, str, str], int],
+    ]:
         """
-        project_ids = [p.id for p in projects]
-
-        select = [
-            MetricField(metric_mri=SessionMRI.ERRORED_SET.value, alias="value", op=None),
-        ]
-
-        groupby = [
-            MetricGroupByField(field="project_id"),
-            MetricGroupByField(field="release"),
-        ]
-
-        query = DeprecatingMetricsQuery(
-            org_id=org_id,
-            project_ids=project_ids,
-            select=select,
-            start=start,
-            end=end,
-            granularity=Granularity(granularity),
-            groupby=groupby,
-            where=where,
-            include_series=False,
-            include_totals=True,
-        )
-        raw_result = get_series(
-            projects=projects,
-            metrics_query=query,
-            use_case_id=USE_CASE_ID,
-        )
-        groups = raw_result["groups"]
-
-        ret_val = {}
+        Count of errored sessions (incl fatal sessions, excl errored *preaggregated*
+        sessions), counts of init, abnormal, crashed and errored preaggregated
+        sessions, and counts of all and crashed users, purpose-built for overview.
 
-        for group in groups:
-            by = group.get("by", {})
-            proj_id = by.get("project_id")
-            release = by.get("release")
-
-            value = get_path(group, "totals", "value")
-            ret_val[(proj_id, release)] = value
-        return ret_val
-
-    @staticmethod
-    def _get_session_by_status_for_overview(
-        projects: Sequence[Project],
-        where: list[Condition],
-        org_id: int,
-        granularity: int,
-        start: datetime,
-        end: datetime,
-    ) -> Mapping[tuple[int, str, str], int]:
-        """
-        Counts of init, abnormal and crashed sessions, purpose-built for overview
+        All of them share the same filters, so they are fetched with one query.
         """
         project_ids = [p.id for p in projects]
 
         select = [
+            MetricField(metric_mri=SessionMRI.ERRORED_SET.value, alias="errored", op=None),
             MetricField(metric_mri=SessionMRI.ABNORMAL.value, alias="abnormal", op=None),
             MetricField(metric_mri=SessionMRI.CRASHED.value, alias="crashed", op=None),
             MetricField(metric_mri=SessionMRI.ALL.value, alias="init", op=None),
@@ -785,6 +750,8 @@ class MetricsReleaseHealthBackend(ReleaseHealthBackend):
                 alias="errored_preaggr",
                 op=None,
             ),
+            MetricField(metric_mri=SessionMRI.ALL_USER.value, alias="all_users", op=None),
+            MetricField(metric_mri=SessionMRI.CRASHED_USER.value, alias="crashed_users", op=None),
         ]
 
         groupby = [
@@ -811,73 +778,32 @@ class MetricsReleaseHealthBackend(ReleaseHealthBackend):
         )
         groups = raw_result["groups"]
 
-        ret_val = {}
+        errored_sessions = {}
+        sessions = {}
+        users = {}
         for group in groups:
             by = group.get("by", {})
             proj_id = by.get("project_id")
             release = by.get("release")
 
             totals = group.get("totals", {})
+            errored = totals.get("errored")
+            if errored is not None:
+                errored_sessions[(proj_id, release)] = errored
             for status in ["abnormal", "crashed", "init", "errored_preaggr"]:
                 value = totals.get(status)
                 if value is not None and value != 0.0:
-                    ret_val[(proj_id, release, status)] = value
+                    sessions[(proj_id, release, status)] = value
 
-        return ret_val
+            # Groups without any users are only in the result because of the
+            # session metrics, and report zero users.
+            if totals.get("all_users"):
+                for status in ["all_users", "crashed_users"]:
+                    value = totals.get(status)
+                    if value is not None:
+                        users[(proj_id, release, status)] = value
 
-    @staticmethod
-    def _get_users_and_crashed_users_for_overview(
-        projects: Sequence[Project],
-        where: list[Condition],
-        org_id: int,
-        granularity: int,
-        start: datetime,
-        end: datetime,
-    ) -> Mapping[tuple[int, str, str], int]:
-
-        project_ids = [p.id for p in projects]
-
-        select = [
-            MetricField(metric_mri=SessionMRI.ALL_USER.value, alias="all_users", op=None),
-            MetricField(metric_mri=SessionMRI.CRASHED_USER.value, alias="crashed_users", op=None),
-        ]
-
-        groupby = [
-            MetricGroupByField(field="release"),
-            MetricGroupByField(field="project_id"),
-        ]
-
-        query = DeprecatingMetricsQuery(
-            org_id=org_id,
-            project_ids=project_ids,
-            select=select,
-            start=start,
-            end=end,
-            granularity=Granularity(granularity),
-            groupby=groupby,
-            where=where,
-            include_series=False,
-            include_totals=True,
-        )
-
-        raw_result = get_series(
-            projects=projects,
-            metrics_query=query,
-            use_case_id=USE_CASE_ID,
-        )
-        groups = raw_result["groups"]
-        ret_val = {}
-        for group in groups:
-            by = group.get("by", {})
-            proj_id = by.get("project_id")
-            release = by.get("release")
-
-            totals = group.get("totals", {})
-            for status in ["all_users", "crashed_users"]:
-                value = totals.get(status)
-                if value is not None:
-                    ret_val[(proj_id, release, status)] = value
-        return ret_val
+        return errored_sessions, sessions, users
 
     @staticmethod
     def _get_health_stats_for_overview(
@@ -972,8 +898,16 @@ class MetricsReleaseHealthBackend(ReleaseHealthBackend):
 
         where = [filter_projects_by_project_release(project_releases)]
 
+        # The queries are independent of each other, and optionally run
+        # concurrently.
+        if options.get("release-health.overview-concurrent-queries"):
+            submit: Callable[..., Any] = _overview_query_pool.submit
+        else:
+            submit = _run_now
+
         if health_stats_period:
-            health_stats_data = self._get_health_stats_for_overview(
+            health_stats_future = submit(
+                self._get_health_stats_for_overview,
                 projects=projects,
                 where=where,
                 org_id=org_id,
@@ -983,27 +917,34 @@ class MetricsReleaseHealthBackend(ReleaseHealthBackend):
                 end=now,
                 buckets=stats_buckets,
             )
-        else:
-            health_stats_data = {}
-
-        rv_durations = self._get_session_duration_data_for_overview(
-            projects, where, org_id, rollup, summary_start, now
-        )
-        rv_errored_sessions = self._get_errored_sessions_for_overview(
-            projects, where, org_id, rollup, summary_start, now
-        )
-        rv_sessions = self._get_session_by_status_for_overview(
-            projects, where, org_id, rollup, summary_start, now
+        durations_future = submit(
+            self._get_session_duration_data_for_overview,
+            projects,
+            where,
+            org_id,
+            rollup,
+            summary_start,
+            now,
         )
-        rv_users = self._get_users_and_crashed_users_for_overview(
-            projects, where, org_id, rollup, summary_start, now
+        totals_future = submit(
+            self._get_session_totals_for_overview,
+            projects,
+            where,
+            org_id,
+            rollup,
+            summary_start,
+            now,
         )
-
         # XXX: In order to be able to dual-read and compare results from both
         # old and new backend, this should really go back through the
         # release_health service instead of directly calling `self`. For now
         # that makes the entire backend too hard to test though.
-        release_adoption = self.get_release_adoption(project_releases, environments)
+        release_adoption_future = submit(self.get_release_adoption, project_releases, environments)
+
+        health_stats_data = health_stats_future.result() if health_stats_period else {}
+        rv_durations = durations_future.result()
+        rv_errored_sessions, rv_sessions, rv_users = totals_future.result()
+        release_adoption = release_adoption_future.result()
 
         rv: dict[ProjectRelease, ReleaseHealthOverview] = {}
 
@@ -3,7 +3,9 @@ from __future__ import annotations
 import abc
 import logging
 import multiprocessing
-from collections import defaultdict
+import threading
+import time
+from collections import OrderedDict, defaultdict
 from collections.abc import Mapping
 from concurrent.futures import ThreadPoolExecutor, wait
 from functools import partial
@@ -25,13 +27,71 @@ from sentry.utils.arroyo import MultiprocessingPool, run_task_with_multiprocessi
 
 logger = logging.getLogger(__name__)
 
+K = TypeVar("K")
+V = TypeVar("V")
 T = TypeVar("T")
 U = TypeVar("U", bound=BaseRemoteSubscription)
 
 FAKE_SUBSCRIPTION_ID = 12345
 
+# How long subscriptions are kept in process memory with local state, in seconds.
+LOCAL_SUBSCRIPTION_TTL = 60
+# How many subscriptions are kept in process memory with local state.
+LOCAL_SUBSCRIPTIONS_MAX_SIZE = 10_000
+
+
+class LocalState(Generic[K, V]):
+    """
+    Bounded, thread safe map of local state whose entries expire. Expired entries are
+    treated as missing, and the least recently used entries are evicted once there are
+    more than `max_size`.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V, ttl: float) -> None:
+        """
+        Set the value of a key, expiring in `ttl` seconds.
+        """
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
 
 class ResultProcessor(abc.ABC, Generic[T, U]):
+    def __init__(self, local_state: bool = False) -> None:
+        # Keep the state of subscriptions in process memory between results. This
+        # relies on every subscription being processed by a single consumer, since
+        # results of a subscription are always produced to the same partition. Local
+        # state is written through in `flush` after every batch, and dropped in
+        # `reset` when partitions are assigned.
+        self.local_state = local_state
+        self._local_subscriptions: LocalState[str, U] = LocalState(LOCAL_SUBSCRIPTIONS_MAX_SIZE)
+
     @property
     @abc.abstractmethod
     def subscription_model(self) -> type[U]:
@@ -46,13 +106,23 @@ class ResultProcessor(abc.ABC, Generic[T, U]):
             logger.exception("Failed to process message result")
 
     def get_subscription(self, result: T) -> U | None:
+        subscription_id = self.get_subscription_id(result)
+        if self.local_state:
+            local_subscription = self._local_subscriptions.get(subscription_id)
+            if local_subscription is not None:
+                return local_subscription
+
         try:
-            return self.subscription_model.objects.get_from_cache(
-                subscription_id=self.get_subscription_id(result)
+            subscription = self.subscription_model.objects.get_from_cache(
+                subscription_id=subscription_id
             )
         except self.subscription_model.DoesNotExist:
             return None
 
+        if self.local_state:
+            self._local_subscriptions.set(subscription_id, subscription, LOCAL_SUBSCRIPTION_TTL)
+        return subscription
+
     @abc.abstractmethod
     def get_subscription_id(self, result: T) -> str:
         pass
@@ -61,6 +131,19 @@ class ResultProcessor(abc.ABC, Generic[T, U]):
     def handle_result(self, subscription: U | None, result: T):
         pass
 
+    def flush(self) -> None:
+        """
+        Write through local state. Called after every batch, before its offsets are
+        committed.
+        """
+
+    def reset(self) -> None:
+        """
+        Drop local state, it is loaded again as results come in. Called when
+        partitions are assigned to the consumer.
+        """
+        self._local_subscriptions.clear()
+
 
 class ResultsStrategyFactory(ProcessingStrategyFactory[KafkaPayload], Generic[T, U]):
     parallel_executor: ThreadPoolExecutor | None = None
@@ -98,6 +181,7 @@ class ResultsStrategyFactory(ProcessingStrategyFactory[KafkaPayload], Generic[T,
         num_processes: int | None = None,
         input_block_size: int | None = None,
         output_block_size: int | None = None,
+        local_state: bool = False,
     ) -> None:
         self.mode = mode
         metric_tags = {"identifier": self.identifier, "mode": self.mode}
@@ -129,7 +213,10 @@ class ResultsStrategyFactory(ProcessingStrategyFactory[KafkaPayload], Generic[T,
         if output_block_size is not None:
             self.output_block_size = output_block_size
 
-        self.result_processor = self.result_processor_cls()
+        # Local state is only written through by batches.
+        self.result_processor = self.result_processor_cls(
+            local_state=local_state and self.batched_parallel
+        )
 
     @property
     @abc.abstractmethod
@@ -179,6 +266,10 @@ class ResultsStrategyFactory(ProcessingStrategyFactory[KafkaPayload], Generic[T,
         commit: Commit,
         partitions: Mapping[Partition, int],
     ) -> ProcessingStrategy[KafkaPayload]:
+        # Local state may belong to partitions that were revoked, or be outdated
+        # for partitions that were processed elsewhere meanwhile.
+        self.result_processor.reset()
+
         if self.batched_parallel:
             return self.create_thread_parallel_worker(commit)
         if self.parallel:
@@ -280,6 +371,7 @@ class ResultsStrategyFactory(ProcessingStrategyFactory[KafkaPayload], Generic[T,
                 for group in partitioned_values
             ]
             wait(futures)
+            self.result_processor.flush()
 
     def process_group(self, items: list[T]):
         """
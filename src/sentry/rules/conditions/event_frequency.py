@@ -22,7 +22,9 @@ from sentry.issues.grouptype import GroupCategory, get_group_type_by_type_id
 from sentry.models.group import Group
 from sentry.models.project import Project
 from sentry.rules import EventState
+from sentry.rules.conditions import frequency_counters
 from sentry.rules.conditions.base import EventCondition, GenericCondition
+from sentry.rules.conditions.frequency_counters import FrequencyCounterType
 from sentry.rules.match import MatchType
 from sentry.tsdb.base import TSDBModel
 from sentry.types.condition_activity import (
@@ -131,6 +133,8 @@ class _QSTypedDict(TypedDict):
 
 class BaseEventFrequencyCondition(EventCondition, abc.ABC):
     intervals = STANDARD_INTERVALS
+    # The pre-aggregated counter that can answer this condition's queries, if any.
+    counter_type: FrequencyCounterType | None = None
 
     def __init__(
         self,
@@ -227,6 +231,10 @@ class BaseEventFrequencyCondition(EventCondition, abc.ABC):
         """
         Queries Snuba for a unique condition for a single group.
         """
+        if self.counter_type is not None and frequency_counters.can_serve(start, end):
+            return frequency_counters.get_counts(
+                self.counter_type, [event.group_id], environment_id, start, end
+            )[event.group_id]
         return self.query_hook(event, start, end, environment_id)
 
     def query_hook(
@@ -248,6 +256,12 @@ class BaseEventFrequencyCondition(EventCondition, abc.ABC):
         """
         Queries Snuba for a unique condition for multiple groups.
         """
+        if self.counter_type is not None and frequency_counters.can_serve(start, end):
+            return dict(
+                frequency_counters.get_counts(
+                    self.counter_type, group_ids, environment_id, start, end
+                )
+            )
         return self.batch_query_hook(group_ids, start, end, environment_id, False)
 
     def batch_query_hook(
@@ -430,6 +444,7 @@ class BaseEventFrequencyCondition(EventCondition, abc.ABC):
 class EventFrequencyCondition(BaseEventFrequencyCondition):
     id = "sentry.rules.conditions.event_frequency.EventFrequencyCondition"
     label = "The issue is seen more than {value} times in {interval}"
+    counter_type = FrequencyCounterType.EVENTS
 
     def query_hook(
         self,
@@ -505,6 +520,7 @@ class EventFrequencyCondition(BaseEventFrequencyCondition):
 class EventUniqueUserFrequencyCondition(BaseEventFrequencyCondition):
     id = "sentry.rules.conditions.event_frequency.EventUniqueUserFrequencyCondition"
     label = "The issue is seen by more than {value} users in {interval}"
+    counter_type = FrequencyCounterType.USERS
 
     def query_hook(
         self,
@@ -580,6 +596,8 @@ class EventUniqueUserFrequencyCondition(BaseEventFrequencyCondition):
 class EventUniqueUserFrequencyConditionWithConditions(EventUniqueUserFrequencyCondition):
     id = "sentry.rules.conditions.event_frequency.EventUniqueUserFrequencyConditionWithConditions"
     label = "The issue is seen by more than {value} users in {interval} with conditions"
+    # The counters can't apply the rule's filters.
+    counter_type = None
 
     def query_hook(
         self,
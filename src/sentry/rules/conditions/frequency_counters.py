@@ -0,0 +1,246 @@
+"""
+Pre-aggregated event frequency counters for issue alert conditions.
+
+Event frequency conditions used to query Snuba every time they were checked. These
+counters are updated from post_process for every event of a group, and keep the number
+of events and an estimate of the number of unique users per group, environment and
+minute. Event frequency conditions read them instead of Snuba for windows that fit in
+the counters' retention.
+
+Windows rarely start or end on whole minutes. The events (or users) of the minutes at the
+edges of a window are prorated by how much of the part of the minute that has passed
+lies within the window, assuming they are spread evenly over it.
+
+The counters only have complete data from when they started to be written. Windows that
+start before then, like all windows right after writes are enabled, are queried from Snuba.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Collection
+from datetime import UTC, datetime, timedelta
+from enum import StrEnum
+
+from django.conf import settings
+from django.utils import timezone
+from sentry_redis_tools.clients import RedisCluster, StrictRedis
+
+from sentry import options
+from sentry.utils import metrics, redis
+
+logger = logging.getLogger(__name__)
+
+BUCKET_SIZE = 60
+#: How far back the counters go. Windows starting before that are queried from Snuba.
+RETENTION = timedelta(hours=2)
+KEY_TTL = int(RETENTION.total_seconds()) + BUCKET_SIZE
+
+#: Environment id the counters across all environments are stored under.
+ALL_ENVIRONMENTS = 0
+
+#: Holds the time since which the counters have been written.
+STARTED_KEY = "rfc:started"
+#: When no events are recorded for this long, the counters are started again.
+STARTED_KEY_TTL = 5 * BUCKET_SIZE
+
+#: When this process last refreshed the started key.
+_started_refreshed_at: float | None = None
+
+
+class FrequencyCounterType(StrEnum):
+    EVENTS = "e"
+    USERS = "u"
+
+
+def get_redis_client() -> RedisCluster | StrictRedis:
+    return redis.redis_clusters.get(settings.SENTRY_RULE_FREQUENCY_COUNTERS_REDIS_CLUSTER)
+
+
+def is_write_enabled() -> bool:
+    return options.get("rules.frequency-counters.write")
+
+
+def is_read_enabled() -> bool:
+    return options.get("rules.frequency-counters.read")
+
+
+def _get_key(
+    counter_type: FrequencyCounterType, group_id: int, environment_id: int, bucket: int
+) -> str:
+    # The hash tag keeps all buckets of a group and environment on the same node, so a
+    # window can be read with a single command.
+    return f"rfc:{{{group_id}:{environment_id}}}:{counter_type}:{bucket}"
+
+
+def _get_recorded_key(group_id: int, event_id: str) -> str:
+    return f"rfc:{{{group_id}:{ALL_ENVIRONMENTS}}}:r:{event_id}"
+
+
+def _get_bucket(timestamp: datetime) -> int:
+    return int(timestamp.timestamp()) // BUCKET_SIZE
+
+
+def _get_bucket_fractions(start: datetime, end: datetime) -> list[tuple[int, float]]:
+    """
+    Return the buckets of a window, with the fraction of their events that is counted
+    for the window. That is the fraction of the part of the bucket that has passed which
+    lies within the window, so it is 1 for the bucket of a window ending now.
+    """
+    now = timezone.now().timestamp()
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
+
+    fractions = []
+    for bucket in range(_get_bucket(start), _get_bucket(end) + 1):
+        bucket_start = bucket * BUCKET_SIZE
+        bucket_end = bucket_start + BUCKET_SIZE
+        passed = min(now, bucket_end) - bucket_start
+        overlap = min(end_ts, bucket_end) - max(start_ts, bucket_start)
+        fractions.append((bucket, min(1.0, overlap / passed) if passed > 0 else 1.0))
+    return fractions
+
+
+def record_event(
+    group_id: int,
+    event_id: str,
+    environment_id: int | None,
+    user: str | None,
+    timestamp: datetime,
+) -> None:
+    """
+    Count an event of the group, both for its environment and across all environments.
+    Events are only counted once, even if they are recorded again.
+    """
+    if timestamp < timezone.now() - RETENTION:
+        return
+
+    client = get_redis_client()
+    recorded_key = _get_recorded_key(group_id, event_id)
+    if not client.set(recorded_key, 1, ex=KEY_TTL, nx=True):
+        metrics.incr("rules.frequency_counters.duplicate")
+        return
+
+    bucket = _get_bucket(timestamp)
+    environment_ids = {ALL_ENVIRONMENTS}
+    if environment_id:
+        environment_ids.add(environment_id)
+
+    try:
+        with client.pipeline(transaction=False) as pipeline:
+            for env_id in environment_ids:
+                events_key = _get_key(FrequencyCounterType.EVENTS, group_id, env_id, bucket)
+                pipeline.incr(events_key)
+                pipeline.expire(events_key, KEY_TTL)
+                if user:
+                    users_key = _get_key(FrequencyCounterType.USERS, group_id, env_id, bucket)
+                    pipeline.pfadd(users_key, user)
+                    pipeline.expire(users_key, KEY_TTL)
+            pipeline.execute()
+    except Exception:
+        # Let the event be counted when it is recorded again.
+        client.delete(recorded_key)
+        raise
+
+    _refresh_started(client)
+
+
+def _refresh_started(client: RedisCluster | StrictRedis) -> None:
+    """
+    Record when the counters started to be written, and keep that time while they are. Each
+    process does so at most once per bucket, to not write the key for every event.
+    """
+    global _started_refreshed_at
+    now = time.monotonic()
+    if _started_refreshed_at is not None and now - _started_refreshed_at < BUCKET_SIZE:
+        return
+
+    with client.pipeline(transaction=False) as pipeline:
+        pipeline.set(STARTED_KEY, timezone.now().timestamp(), ex=STARTED_KEY_TTL, nx=True)
+        pipeline.expire(STARTED_KEY, STARTED_KEY_TTL)
+        pipeline.execute()
+    _started_refreshed_at = now
+
+
+def get_started_at() -> datetime | None:
+    """
+    Return since when the counters have been written, if they are.
+    """
+    value = get_redis_client().get(STARTED_KEY)
+    if value is None:
+        return None
+    return datetime.fromtimestamp(float(value), UTC)
+
+
+def can_serve(start: datetime, end: datetime) -> bool:
+    """
+    Whether a window can be read from the counters. That is only once they have been written
+    since before the first bucket of the window.
+    """
+    if not (is_read_enabled() and start >= timezone.now() - RETENTION and start <= end):
+        return False
+
+    started_at = get_started_at()
+    if started_at is None or _get_bucket(start) <= _get_bucket(started_at):
+        metrics.incr("rules.frequency_counters.warming_up")
+        return False
+    return True
+
+
+def get_counts(
+    counter_type: FrequencyCounterType,
+    group_ids: Collection[int],
+    environment_id: int | None,
+    start: datetime,
+    end: datetime,
+) -> dict[int, int]:
+    """
+    Return the number of events, or unique users, of each group between `start` and
+    `end`.
+
+    Users of the partial buckets at the edges of the window are prorated by the number
+    of users they add to the users of the buckets fully within it.
+    """
+    fractions = _get_bucket_fractions(start, end)
+    full = [bucket for bucket, fraction in fractions if fraction >= 1]
+    partial = [(bucket, fraction) for bucket, fraction in fractions if 0 < fraction < 1]
+    env_id = environment_id or ALL_ENVIRONMENTS
+    group_ids = list(group_ids)
+
+    with get_redis_client().pipeline(transaction=False) as pipeline:
+        for group_id in group_ids:
+            if counter_type == FrequencyCounterType.EVENTS:
+                pipeline.mget(
+                    [_get_key(counter_type, group_id, env_id, bucket) for bucket, _ in fractions]
+                )
+                continue
+
+            full_keys = [_get_key(counter_type, group_id, env_id, bucket) for bucket in full]
+            if full_keys:
+                pipeline.pfcount(*full_keys)
+            for bucket, _ in partial:
+                pipeline.pfcount(*full_keys, _get_key(counter_type, group_id, env_id, bucket))
+        results = iter(pipeline.execute())
+
+    counts = {}
+    for group_id in group_ids:
+        if counter_type == FrequencyCounterType.EVENTS:
+            count = sum(
+                int(value) * fraction
+                for value, (_, fraction) in zip(next(results), fractions)
+                if value is not None
+            )
+        else:
+            full_count = int(next(results)) if full else 0
+            count = full_count + sum(
+                (int(next(results)) - full_count) * fraction for _, fraction in partial
+            )
+        counts[group_id] = round(count)
+
+    metrics.incr(
+        "rules.frequency_counters.read",
+        amount=len(group_ids),
+        tags={"counter_type": counter_type.name.lower()},
+    )
+    return counts
@@ -2,6 +2,7 @@ import logging
 import math
 import uuid
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from itertools import islice
@@ -13,7 +14,9 @@ from sentry import buffer, options
 from sentry.buffer.base import BufferField
 from sentry.buffer.redis import BufferHookEvent, redis_buffer_registry
 from sentry.db import models
+from sentry.models.project import Project
 from sentry.utils import metrics
+from sentry.utils.iterators import chunked
 from sentry.utils.registry import NoRegistrationExistsError, Registry
 
 logger = logging.getLogger("sentry.delayed_processing")
@@ -47,6 +50,14 @@ class DelayedProcessingBase(ABC):
     def processing_task(self) -> Task:
         raise NotImplementedError
 
+    @property
+    def batch_processing_task(self) -> Task | None:
+        """
+        Optional task which processes the buffers of several projects of the same
+        organization at once, called with a list of project ids.
+        """
+        return None
+
 
 delayed_processing_registry = Registry[type[DelayedProcessingBase]]()
 
@@ -71,7 +82,9 @@ def bucket_num_groups(num_groups: int) -> str:
     return "1"
 
 
-def process_in_batches(project_id: int, processing_type: str) -> None:
+def process_in_batches(
+    project_id: int, processing_type: str, event_count: int | None = None
+) -> None:
     """
     This will check the number of alertgroup_to_event_data items in the Redis buffer for a project.
 
@@ -100,10 +113,11 @@ def process_in_batches(project_id: int, processing_type: str) -> None:
     task = processing_info.processing_task
     filters: dict[str, BufferField] = asdict(hash_args.filters)
 
-    event_count = buffer.backend.get_hash_length(model=hash_args.model, field=filters)
-    metrics.incr(
-        f"{processing_type}.num_groups", tags={"num_groups": bucket_num_groups(event_count)}
-    )
+    if event_count is None:
+        event_count = buffer.backend.get_hash_length(model=hash_args.model, field=filters)
+        metrics.incr(
+            f"{processing_type}.num_groups", tags={"num_groups": bucket_num_groups(event_count)}
+        )
 
     if event_count < batch_size:
         return task.delay(project_id)
@@ -135,6 +149,77 @@ def process_in_batches(project_id: int, processing_type: str) -> None:
             task.delay(project_id, batch_key)
 
 
+def process_across_projects(project_ids: list[int], processing_type: str) -> None:
+    """
+    Schedule the processing of several projects' buffers, grouping the projects of
+    each organization into tasks of up to `delayed_processing.cross_project_batch_size`
+    projects so that the processing task can share queries between them.
+
+    Projects with more items than `delayed_processing.batch_size` are still processed
+    on their own, in batches, by `process_in_batches`.
+    """
+    if not project_ids:
+        return
+
+    try:
+        handler = delayed_processing_registry.get(processing_type)
+    except NoRegistrationExistsError:
+        logger.exception(f"{processing_type}.no_registration")
+        return
+
+    task = handler(project_ids[0]).batch_processing_task
+    if task is None:
+        for project_id in project_ids:
+            process_in_batches(project_id, processing_type)
+        return
+
+    batch_size = options.get("delayed_processing.batch_size")
+    cross_project_batch_size = options.get("delayed_processing.cross_project_batch_size")
+
+    small_project_ids = []
+    for project_id in project_ids:
+        processing_info = handler(project_id)
+        hash_args = processing_info.hash_args
+        event_count = buffer.backend.get_hash_length(
+            model=hash_args.model, field=asdict(hash_args.filters)
+        )
+        metrics.incr(
+            f"{processing_type}.num_groups", tags={"num_groups": bucket_num_groups(event_count)}
+        )
+        if event_count < batch_size:
+            small_project_ids.append(project_id)
+        else:
+            process_in_batches(project_id, processing_type, event_count)
+
+    if not small_project_ids:
+        return
+
+    project_ids_by_organization: dict[int, list[int]] = defaultdict(list)
+    for project_id, organization_id in Project.objects.filter(id__in=small_project_ids).values_list(
+        "id", "organization_id"
+    ):
+        project_ids_by_organization[organization_id].append(project_id)
+
+    # Projects that no longer exist are handed to the task on their own, which logs and
+    # skips them like it does for single projects.
+    found_project_ids = {
+        project_id
+        for organization_project_ids in project_ids_by_organization.values()
+        for project_id in organization_project_ids
+    }
+    missing_project_ids = [
+        project_id for project_id in small_project_ids if project_id not in found_project_ids
+    ]
+
+    for organization_project_ids in [*project_ids_by_organization.values(), missing_project_ids]:
+        for chunk in chunked(organization_project_ids, cross_project_batch_size):
+            task.delay(chunk)
+            metrics.incr(
+                f"{processing_type}.cross_project_batch",
+                tags={"num_projects": bucket_num_groups(len(chunk))},
+            )
+
+
 def process_buffer() -> None:
     fetch_time = datetime.now(tz=timezone.utc)
     should_emit_logs = options.get("delayed_processing.emit_logs")
@@ -156,8 +241,13 @@ def process_buffer() -> None:
                 log_name = f"{processing_type}.project_id_list"
                 logger.info(log_name, extra={"project_ids": log_str})
 
-            for project_id, _ in project_ids:
-                process_in_batches(project_id, processing_type)
+            if options.get("delayed_processing.cross_project_batch_size") > 1:
+                process_across_projects(
+                    [project_id for project_id, _ in project_ids], processing_type
+                )
+            else:
+                for project_id, _ in project_ids:
+                    process_in_batches(project_id, processing_type)
 
             buffer.backend.delete_key(handler.buffer_key, min=0, max=fetch_time.timestamp())
 
@@ -25,7 +25,9 @@ from sentry.rules.conditions.event_frequency import (
     DEFAULT_COMPARISON_INTERVAL,
     BaseEventFrequencyCondition,
     ComparisonType,
+    EventFrequencyCondition,
     EventFrequencyConditionData,
+    EventUniqueUserFrequencyCondition,
     percent_increase,
 )
 from sentry.rules.processing.buffer_processing import (
@@ -53,6 +55,15 @@ logger = logging.getLogger("sentry.rules.delayed_processing")
 EVENT_LIMIT = 100
 COMPARISON_INTERVALS_VALUES = {k: v[1] for k, v in COMPARISON_INTERVALS.items()}
 
+#: Conditions whose batch queries only depend on the groups, environment and time
+#: windows, and can therefore be shared by projects of the same organization.
+CROSS_PROJECT_CONDITION_IDS = frozenset(
+    {
+        EventFrequencyCondition.id,
+        EventUniqueUserFrequencyCondition.id,
+    }
+)
+
 
 class UniqueConditionQuery(NamedTuple):
     """
@@ -546,22 +557,26 @@ def cleanup_redis_buffer(
     buffer.backend.delete_hash(model=Project, filters=filters, fields=hashes_to_delete)
 
 
-@instrumented_task(
-    name="sentry.rules.processing.delayed_processing",
-    queue="delayed_rules",
-    default_retry_delay=5,
-    max_retries=5,
-    soft_time_limit=50,
-    time_limit=60,
-    silo_mode=SiloMode.REGION,
-)
-def apply_delayed(project_id: int, batch_key: str | None = None, *args: Any, **kwargs: Any) -> None:
+class ProjectDelayedData(NamedTuple):
     """
-    Grab rules, groups, and events from the Redis buffer, evaluate the "slow" conditions in a bulk snuba query, and fire them if they pass
+    Everything read from the buffer and the database that is needed to evaluate the
+    delayed rules of a single project.
     """
+
+    project: Project
+    batch_key: str | None
+    rulegroup_to_event_data: dict[str, str]
+    rules_to_groups: DefaultDict[int, set[int]]
+    alert_rules: list[Rule]
+    condition_groups: dict[UniqueConditionQuery, DataAndGroups]
+
+
+def fetch_project_delayed_data(
+    project_id: int, batch_key: str | None = None
+) -> ProjectDelayedData | None:
     project = fetch_project(project_id)
     if not project:
-        return
+        return None
 
     rulegroup_to_event_data = fetch_rulegroup_to_event_data(project_id, batch_key)
     rules_to_groups = get_rules_to_groups(rulegroup_to_event_data)
@@ -575,9 +590,98 @@ def apply_delayed(project_id: int, batch_key: str | None = None, *args: Any, **k
             "rules_to_groups": rules_to_groups,
         },
     )
+    return ProjectDelayedData(
+        project=project,
+        batch_key=batch_key,
+        rulegroup_to_event_data=rulegroup_to_event_data,
+        rules_to_groups=rules_to_groups,
+        alert_rules=alert_rules,
+        condition_groups=condition_groups,
+    )
 
-    with metrics.timer("delayed_processing.get_condition_group_results.duration"):
-        condition_group_results = get_condition_group_results(condition_groups, project)
+
+def get_condition_group_results_for_projects(
+    projects_data: Sequence[ProjectDelayedData],
+) -> list[dict[UniqueConditionQuery, dict[int, int | float]] | None]:
+    """
+    Compute the condition group results for several projects at once.
+
+    Queries of conditions in `CROSS_PROJECT_CONDITION_IDS` only depend on the group ids,
+    the environment and the time windows, so identical unique queries of projects in
+    the same organization are merged and made once with the union of their groups.
+    Each project gets back the results for its own groups. The remaining conditions
+    are queried per project, exactly like `apply_delayed` does.
+    """
+    merged_groups: dict[tuple[int, UniqueConditionQuery], DataAndGroups] = {}
+    merged_projects: dict[tuple[int, UniqueConditionQuery], Project] = {}
+    per_project_groups: list[dict[UniqueConditionQuery, DataAndGroups]] = []
+    num_mergeable = 0
+
+    for project_data in projects_data:
+        organization_id = project_data.project.organization_id
+        project_groups = {}
+        for unique_condition, data_and_groups in project_data.condition_groups.items():
+            if unique_condition.cls_id not in CROSS_PROJECT_CONDITION_IDS:
+                project_groups[unique_condition] = data_and_groups
+                continue
+
+            num_mergeable += 1
+            merge_key = (organization_id, unique_condition)
+            existing = merged_groups.get(merge_key)
+            if existing is None:
+                merged_groups[merge_key] = DataAndGroups(
+                    data_and_groups.data, set(data_and_groups.group_ids)
+                )
+                merged_projects[merge_key] = project_data.project
+            else:
+                existing.group_ids.update(data_and_groups.group_ids)
+        per_project_groups.append(project_groups)
+
+    metrics.incr(
+        "delayed_processing.cross_project.saved_queries",
+        amount=num_mergeable - len(merged_groups),
+        sample_rate=1.0,
+    )
+
+    merged_results: dict[tuple[int, UniqueConditionQuery], dict[int, int | float]] = {}
+    for merge_key, data_and_groups in merged_groups.items():
+        _, unique_condition = merge_key
+        results = get_condition_group_results(
+            {unique_condition: data_and_groups}, merged_projects[merge_key]
+        )
+        merged_results[merge_key] = (results or {}).get(unique_condition, {})
+
+    projects_results: list[dict[UniqueConditionQuery, dict[int, int | float]] | None] = []
+    for project_data, project_groups in zip(projects_data, per_project_groups):
+        project_results = get_condition_group_results(project_groups, project_data.project) or {}
+        organization_id = project_data.project.organization_id
+        for unique_condition, data_and_groups in project_data.condition_groups.items():
+            merge_key = (organization_id, unique_condition)
+            if merge_key not in merged_results:
+                continue
+            result = merged_results[merge_key]
+            project_results[unique_condition] = {
+                group_id: result[group_id]
+                for group_id in data_and_groups.group_ids
+                if group_id in result
+            }
+        projects_results.append(project_results)
+
+    return projects_results
+
+
+def process_project_delayed_data(
+    project_data: ProjectDelayedData,
+    condition_group_results: dict[UniqueConditionQuery, dict[int, int | float]] | None,
+) -> None:
+    """
+    Fire the rules whose slow conditions passed and clear the processed data from the
+    buffer.
+    """
+    project = project_data.project
+    project_id = project.id
+    alert_rules = project_data.alert_rules
+    rules_to_groups = project_data.rules_to_groups
 
     has_workflow_engine = features.has(
         "organizations:workflow-engine-process-workflows", project.organization
@@ -623,11 +727,78 @@ def apply_delayed(project_id: int, batch_key: str | None = None, *args: Any, **k
                 extra={"rules_to_fire": list(rules_to_fire.keys()), "project_id": project_id},
             )
 
-    parsed_rulegroup_to_event_data = parse_rulegroup_to_event_data(rulegroup_to_event_data)
+    parsed_rulegroup_to_event_data = parse_rulegroup_to_event_data(
+        project_data.rulegroup_to_event_data
+    )
     with metrics.timer("delayed_processing.fire_rules.duration"):
         fire_rules(rules_to_fire, parsed_rulegroup_to_event_data, alert_rules, project)
 
-    cleanup_redis_buffer(project_id, rules_to_groups, batch_key)
+    cleanup_redis_buffer(project_id, rules_to_groups, project_data.batch_key)
+
+
+@instrumented_task(
+    name="sentry.rules.processing.delayed_processing",
+    queue="delayed_rules",
+    default_retry_delay=5,
+    max_retries=5,
+    soft_time_limit=50,
+    time_limit=60,
+    silo_mode=SiloMode.REGION,
+)
+def apply_delayed(project_id: int, batch_key: str | None = None, *args: Any, **kwargs: Any) -> None:
+    """
+    Grab rules, groups, and events from the Redis buffer, evaluate the "slow" conditions in a bulk snuba query, and fire them if they pass
+    """
+    project_data = fetch_project_delayed_data(project_id, batch_key)
+    if not project_data:
+        return
+
+    with metrics.timer("delayed_processing.get_condition_group_results.duration"):
+        condition_group_results = get_condition_group_results(
+            project_data.condition_groups, project_data.project
+        )
+
+    process_project_delayed_data(project_data, condition_group_results)
+
+
+@instrumented_task(
+    name="sentry.rules.processing.delayed_processing.apply_delayed_for_projects",
+    queue="delayed_rules",
+    default_retry_delay=5,
+    max_retries=5,
+    soft_time_limit=110,
+    time_limit=120,
+    silo_mode=SiloMode.REGION,
+)
+def apply_delayed_for_projects(project_ids: list[int], *args: Any, **kwargs: Any) -> None:
+    """
+    Same as `apply_delayed`, for several projects of one organization at once. Slow
+    conditions that are shared between the projects are evaluated in a single query.
+    """
+    projects_data = []
+    for project_id in project_ids:
+        project_data = fetch_project_delayed_data(project_id)
+        if project_data:
+            projects_data.append(project_data)
+
+    if not projects_data:
+        return
+
+    with metrics.timer("delayed_processing.get_condition_group_results.duration"):
+        projects_results = get_condition_group_results_for_projects(projects_data)
+
+    error: Exception | None = None
+    for project_data, condition_group_results in zip(projects_data, projects_results):
+        try:
+            process_project_delayed_data(project_data, condition_group_results)
+        except Exception as e:
+            # Keep processing the other projects. The failed project's data is left in the
+            # buffer, add the project back so that the next flush processes it again.
+            buffer.backend.push_to_sorted_set(PROJECT_ID_BUFFER_LIST_KEY, project_data.project.id)
+            error = error or e
+
+    if error is not None:
+        raise error
 
 
 @delayed_processing_registry.register("delayed_processing")  # default delayed processing
@@ -642,3 +813,7 @@ class DelayedRule(DelayedProcessingBase):
     @property
     def processing_task(self) -> Task:
         return apply_delayed
+
+    @property
+    def batch_processing_task(self) -> Task:
+        return apply_delayed_for_projects
@@ -313,6 +313,11 @@ def taskworker_scheduler(redis_cluster: str, **options: Any) -> None:
     help="The name of the processing pool being used",
     default="unknown",
 )
+@click.option(
+    "--batch-size",
+    help="The maximum number of tasks to fetch, and of results to send, at once",
+    default=1,
+)
 @log_options()
 @configuration
 def taskworker(**options: Any) -> None:
@@ -336,6 +341,7 @@ def run_taskworker(
     result_queue_maxsize: int,
     rebalance_after: int,
     processing_pool_name: str,
+    batch_size: int,
     **options: Any,
 ) -> None:
     """
@@ -354,6 +360,7 @@ def run_taskworker(
             result_queue_maxsize=result_queue_maxsize,
             rebalance_after=rebalance_after,
             processing_pool_name=processing_pool_name,
+            batch_size=batch_size,
             **options,
         )
         exitcode = worker.start()
@@ -1554,15 +1554,27 @@ class BaseQueryBuilder:
         )
 
     def run_query(
-        self, referrer: str | None, use_cache: bool = False, query_source: QuerySource | None = None
+        self,
+        referrer: str | None,
+        use_cache: bool = False,
+        query_source: QuerySource | None = None,
+        columnar: bool = False,
     ) -> Any:
         if not referrer:
             InvalidSearchQuery("Query missing referrer.")
-        return raw_snql_query(self.get_snql_query(), referrer, use_cache, query_source)
+        return raw_snql_query(
+            self.get_snql_query(), referrer, use_cache, query_source, columnar=columnar
+        )
 
     def process_results(self, results: Any) -> EventsResponse:
         with sentry_sdk.start_span(op="QueryBuilder", name="process_results") as span:
-            span.set_data("result_count", len(results.get("data", [])))
+            data = results.get("data", [])
+            # Results of `run_query(columnar=True)` map every column to its values.
+            columnar = isinstance(data, Mapping)
+            span.set_data(
+                "result_count",
+                len(next(iter(data.values()), ())) if columnar else len(data),
+            )
             translated_columns = self.alias_to_typed_tag_map
             if self.builder_config.transform_alias_to_input_format:
                 translated_columns.update(
@@ -1594,8 +1606,8 @@ class BaseQueryBuilder:
                     field_type = fields.get_json_meta_type(key, value.get("type"), self)
                     field_meta[key] = field_type
                 # Ensure all columns in the result have types.
-                if results["data"]:
-                    for key in results["data"][0]:
+                if data:
+                    for key in data if columnar else data[0]:
                         field_key = translated_columns.get(key, key)
                         field_key = self.prefixed_to_tag_map.get(field_key, field_key)
                         if field_key not in field_meta:
@@ -1618,8 +1630,27 @@ class BaseQueryBuilder:
 
                 return transformed
 
+            # Columnar results are processed a column at a time, so that the resolver and the
+            # resolved key of every column are looked up once instead of for every row.
+            def get_rows(columns: Mapping[str, Sequence[Any]]) -> list[dict[str, Any]]:
+                keys = []
+                values = []
+                for key, column in columns.items():
+                    processed = [process_value(value) for value in column]
+                    resolver = self.value_resolver_map.get(key)
+                    if resolver is not None:
+                        processed = [resolver(value) for value in processed]
+
+                    resolved_key = translated_columns.get(key, key)
+                    if not self.builder_config.skip_tag_resolution:
+                        resolved_key = self.prefixed_to_tag_map.get(resolved_key, resolved_key)
+                    keys.append(resolved_key)
+                    values.append(processed)
+
+                return [dict(zip(keys, row)) for row in zip(*values)]
+
             return {
-                "data": [get_row(row) for row in results["data"]],
+                "data": get_rows(data) if columnar else [get_row(row) for row in data],
                 "meta": {
                     "fields": field_meta,
                     "tips": {},
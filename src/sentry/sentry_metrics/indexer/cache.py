@@ -2,8 +2,12 @@ from __future__ import annotations
 
 import logging
 import random
-from collections.abc import Collection, Iterable, Mapping, MutableMapping, Sequence
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Collection, Hashable, Iterable, Mapping, MutableMapping, Sequence
 from datetime import datetime, timedelta
+from typing import Any
 
 from django.conf import settings
 from django.core.cache import caches
@@ -33,6 +37,7 @@ _INDEXER_CACHE_RESOLVE_CACHE_REPLENISHMENT_METRIC = (
 _INDEXER_CACHE_DOUBLE_WRITE_METRIC = "sentry_metrics.indexer.memcache.double-write"
 _INDEXER_CACHE_DOUBLE_READ_METRIC = "sentry_metrics.indexer.memcache.new-schema-read"
 _INDEXER_CACHE_STALE_KEYS_METRIC = "sentry_metrics.indexer.memcache.stale-keys"
+_INDEXER_LOCAL_CACHE_METRIC = "sentry_metrics.indexer.local_cache"
 
 # only used to compare to the older version of the PGIndexer
 _INDEXER_CACHE_FETCH_METRIC = "sentry_metrics.indexer.memcache.fetch"
@@ -41,9 +46,16 @@ _INDEXER_CACHE_FETCH_METRIC = "sentry_metrics.indexer.memcache.fetch"
 NAMESPACED_WRITE_FEAT_FLAG = "sentry-metrics.indexer.write-new-cache-namespace"
 NAMESPACED_READ_FEAT_FLAG = "sentry-metrics.indexer.read-new-cache-namespace"
 
+LOCAL_CACHE_FEAT_FLAG = "sentry-metrics.indexer.local-cache.enabled"
+
 BULK_RECORD_CACHE_NAMESPACE = "br"
 RESOLVE_CACHE_NAMESPACE = "res"
 
+LOCAL_CACHE_MAX_SIZE = 50000
+
+#: Returned by `LocalStringIndexerCache.get` for keys that are not cached.
+NOT_CACHED: Any = object()
+
 
 class StringIndexerCache:
     def __init__(self, cache_name: str, partition_key: str):
@@ -205,10 +217,101 @@ class StringIndexerCache:
             )
 
 
+class LocalStringIndexerCache:
+    """
+    A bounded in-process LRU cache in front of the shared `StringIndexerCache`.
+
+    Ids never change once they are assigned to a string, so they can be kept in
+    every process for a long time. Misses (`None`) can be cached too, but only
+    for a short time, since the string may be indexed by another process at any
+    moment. Like in the shared cache, the TTLs are jittered so that entries
+    written at the same time don't all expire at once.
+    """
+
+    def __init__(self, max_size: int = LOCAL_CACHE_MAX_SIZE) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_expiry(self, value: Any) -> float:
+        if value is None:
+            ttl = options.get("sentry-metrics.indexer.local-cache.negative-ttl")
+        else:
+            ttl = options.get("sentry-metrics.indexer.local-cache.ttl")
+        return time.monotonic() + ttl * (1 + random.uniform(0, 0.25))
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Return the cached value of a key, which may be a cached `None`, or
+        `NOT_CACHED`.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return NOT_CACHED
+            value, expiry = entry
+            if expiry < time.monotonic():
+                del self._entries[key]
+                return NOT_CACHED
+            self._entries.move_to_end(key)
+            return value
+
+    def get_many(self, keys: Iterable[Hashable]) -> dict[Hashable, Any]:
+        """
+        Return the cached values of the keys that are cached.
+        """
+        results = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not NOT_CACHED:
+                results[key] = value
+        return results
+
+    def set_many(self, key_values: Mapping[Hashable, Any]) -> None:
+        if not key_values:
+            return
+        expiries = {key: self._get_expiry(value) for key, value in key_values.items()}
+        with self._lock:
+            for key, value in key_values.items():
+                self._entries[key] = (value, expiries[key])
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self.set_many({key: value})
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _reverse_key(use_case_id: UseCaseID, org_id: int, id: int) -> tuple[str, int, int]:
+    return (use_case_id.value, org_id, id)
+
+
 class CachingIndexer(StringIndexer):
-    def __init__(self, cache: StringIndexerCache, indexer: StringIndexer) -> None:
+    def __init__(
+        self,
+        cache: StringIndexerCache,
+        indexer: StringIndexer,
+        local_cache: LocalStringIndexerCache | None = None,
+    ) -> None:
         self.cache = cache
         self.indexer = indexer
+        self.local_cache = local_cache if local_cache is not None else LocalStringIndexerCache()
+
+    def _set_local(self, key_values: Mapping[str, int | None]) -> None:
+        """
+        Cache ids of "use_case_id:org_id:string" keys locally, along with the
+        reverse mapping of the ids that were found.
+        """
+        entries: dict[Hashable, Any] = dict(key_values)
+        for key, id in key_values.items():
+            if id is not None:
+                use_case_id, org_id, string = key.split(":", 2)
+                entries[(use_case_id, int(org_id), id)] = string
+        self.local_cache.set_many(entries)
 
     def bulk_record(
         self, strings: Mapping[UseCaseID, Mapping[OrgId, set[str]]]
@@ -216,6 +319,29 @@ class CachingIndexer(StringIndexer):
         cache_keys = UseCaseKeyCollection(strings)
         metrics.gauge("sentry_metrics.indexer.lookups_per_batch", value=cache_keys.size)
         cache_key_strs = cache_keys.as_strings()
+
+        local_cache_enabled = options.get(LOCAL_CACHE_FEAT_FLAG)
+        local_results: dict[str, int] = {}
+        if local_cache_enabled:
+            # Cached misses are of no use here, the strings are written if they
+            # are not indexed yet.
+            local_results = {
+                key: id
+                for key, id in self.local_cache.get_many(cache_key_strs).items()
+                if id is not None
+            }
+            metrics.incr(
+                _INDEXER_LOCAL_CACHE_METRIC,
+                tags={"cache_hit": "true", "caller": "bulk_record"},
+                amount=len(local_results),
+            )
+            metrics.incr(
+                _INDEXER_LOCAL_CACHE_METRIC,
+                tags={"cache_hit": "false", "caller": "bulk_record"},
+                amount=len(cache_key_strs) - len(local_results),
+            )
+            cache_key_strs = [key for key in cache_key_strs if key not in local_results]
+
         cache_results = self.cache.get_many(BULK_RECORD_CACHE_NAMESPACE, cache_key_strs)
 
         hits = [k for k, v in cache_results.items() if v is not None]
@@ -238,9 +364,14 @@ class CachingIndexer(StringIndexer):
             amount=cache_keys.size,
         )
 
+        cache_hits = {k: v for k, v in cache_results.items() if v is not None}
+        if local_cache_enabled:
+            self._set_local(cache_hits)
+            cache_hits.update(local_results)
+
         cache_key_results = UseCaseKeyResults()
         cache_key_results.add_use_case_key_results(
-            [UseCaseKeyResult.from_string(k, v) for k, v in cache_results.items() if v is not None],
+            [UseCaseKeyResult.from_string(k, v) for k, v in cache_hits.items()],
             FetchType.CACHE_HIT,
         )
 
@@ -256,9 +387,11 @@ class CachingIndexer(StringIndexer):
             }
         )
 
-        self.cache.set_many(
-            BULK_RECORD_CACHE_NAMESPACE, db_record_key_results.get_mapped_strings_to_ints()
-        )
+        db_mapped = db_record_key_results.get_mapped_strings_to_ints()
+        self.cache.set_many(BULK_RECORD_CACHE_NAMESPACE, db_mapped)
+        if local_cache_enabled:
+            # This also replaces misses of the strings that were just indexed.
+            self._set_local(db_mapped)
 
         return cache_key_results.merge(db_record_key_results)
 
@@ -269,6 +402,20 @@ class CachingIndexer(StringIndexer):
     @metric_path_key_compatible_resolve
     def resolve(self, use_case_id: UseCaseID, org_id: int, string: str) -> int | None:
         key = f"{use_case_id.value}:{org_id}:{string}"
+
+        local_cache_enabled = options.get(LOCAL_CACHE_FEAT_FLAG)
+        if local_cache_enabled:
+            local_result = self.local_cache.get(key)
+            metrics.incr(
+                _INDEXER_LOCAL_CACHE_METRIC,
+                tags={
+                    "cache_hit": str(local_result is not NOT_CACHED).lower(),
+                    "caller": "resolve",
+                },
+            )
+            if local_result is not NOT_CACHED:
+                return local_result
+
         result = self.cache.get(RESOLVE_CACHE_NAMESPACE, key)
 
         if result and isinstance(result, int):
@@ -276,9 +423,13 @@ class CachingIndexer(StringIndexer):
                 _INDEXER_CACHE_RESOLVE_METRIC,
                 tags={"cache_hit": "true", "use_case": use_case_id.value},
             )
+            if local_cache_enabled:
+                self._set_local({key: result})
             return result
 
         id = self.indexer.resolve(use_case_id, org_id, string)
+        if local_cache_enabled:
+            self._set_local({key: id})
         if id is not None:
             metrics.incr(
                 _INDEXER_CACHE_RESOLVE_METRIC,
@@ -298,12 +449,48 @@ class CachingIndexer(StringIndexer):
 
     @metric_path_key_compatible_rev_resolve
     def reverse_resolve(self, use_case_id: UseCaseID, org_id: int, id: int) -> str | None:
-        return self.indexer.reverse_resolve(use_case_id, org_id, id)
+        if not options.get(LOCAL_CACHE_FEAT_FLAG):
+            return self.indexer.reverse_resolve(use_case_id, org_id, id)
+
+        key = _reverse_key(use_case_id, org_id, id)
+        string = self.local_cache.get(key)
+        metrics.incr(
+            _INDEXER_LOCAL_CACHE_METRIC,
+            tags={"cache_hit": str(string is not NOT_CACHED).lower(), "caller": "reverse_resolve"},
+        )
+        if string is NOT_CACHED:
+            string = self.indexer.reverse_resolve(use_case_id, org_id, id)
+            self.local_cache.set(key, string)
+        return string
 
     def bulk_reverse_resolve(
         self, use_case_id: UseCaseID, org_id: int, ids: Collection[int]
     ) -> Mapping[int, str]:
-        return self.indexer.bulk_reverse_resolve(use_case_id, org_id, ids)
+        if not options.get(LOCAL_CACHE_FEAT_FLAG):
+            return self.indexer.bulk_reverse_resolve(use_case_id, org_id, ids)
+
+        keys = {id: _reverse_key(use_case_id, org_id, id) for id in ids}
+        cached = self.local_cache.get_many(keys.values())
+        results = {id: cached[key] for id, key in keys.items() if key in cached}
+        missing = [id for id in ids if id not in results]
+        metrics.incr(
+            _INDEXER_LOCAL_CACHE_METRIC,
+            tags={"cache_hit": "true", "caller": "bulk_reverse_resolve"},
+            amount=len(results),
+        )
+        metrics.incr(
+            _INDEXER_LOCAL_CACHE_METRIC,
+            tags={"cache_hit": "false", "caller": "bulk_reverse_resolve"},
+            amount=len(missing),
+        )
+
+        if missing:
+            fetched = self.indexer.bulk_reverse_resolve(use_case_id, org_id, missing)
+            self.local_cache.set_many({keys[id]: fetched.get(id) for id in missing})
+            results.update(fetched)
+
+        # Cached misses are left out, like unmapped ids are.
+        return {id: string for id, string in results.items() if string is not None}
 
     def resolve_shared_org(self, string: str) -> int | None:
         raise NotImplementedError(
@@ -185,6 +185,7 @@ def query(
     fallback_to_transactions: bool = False,
     query_source: QuerySource | None = None,
     debug: bool = False,
+    columnar: bool = False,
 ) -> EventsResponse:
     """
     High-level API for doing arbitrary user queries against events.
@@ -218,6 +219,8 @@ def query(
     sample - The sample rate to run the query with
     fallback_to_transactions - Whether to fallback to the transactions dataset if the query
                     fails in metrics enhanced requests. To be removed once the discover dataset is split.
+    columnar - Whether Snuba results are decoded into columns and processed a column at a
+                    time. The returned data is the same, this is cheaper for large pages.
     """
     if not selected_columns:
         raise InvalidSearchQuery("No columns selected")
@@ -255,7 +258,7 @@ def query(
         builder.columns.extend(extra_columns)
 
     result = builder.process_results(
-        builder.run_query(referrer=referrer, query_source=query_source)
+        builder.run_query(referrer=referrer, query_source=query_source, columnar=columnar)
     )
     if debug:
         result["meta"]["query"] = str(builder.get_snql_query().query)
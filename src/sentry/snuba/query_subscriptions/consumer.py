@@ -1,5 +1,5 @@
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from datetime import timezone
 
 import sentry_sdk
@@ -16,8 +16,12 @@ from sentry.utils import metrics
 
 logger = logging.getLogger(__name__)
 TQuerySubscriptionCallable = Callable[[QuerySubscriptionUpdate, QuerySubscription], None]
+TQuerySubscriptionBatchCallable = Callable[
+    [Sequence[tuple[QuerySubscriptionUpdate, QuerySubscription]]], None
+]
 
 subscriber_registry: dict[str, TQuerySubscriptionCallable] = {}
+batch_subscriber_registry: dict[str, TQuerySubscriptionBatchCallable] = {}
 
 
 def register_subscriber(
@@ -32,6 +36,24 @@ def register_subscriber(
     return inner
 
 
+def register_batch_subscriber(
+    subscriber_key: str,
+) -> Callable[[TQuerySubscriptionBatchCallable], TQuerySubscriptionBatchCallable]:
+    """
+    Registers a callback that processes all updates of a batch of messages for a
+    subscription type at once, used by `handle_messages`. A subscriber for single
+    updates has to be registered for the type as well.
+    """
+
+    def inner(func: TQuerySubscriptionBatchCallable) -> TQuerySubscriptionBatchCallable:
+        if subscriber_key in batch_subscriber_registry:
+            raise Exception("Batch handler already registered for %s" % subscriber_key)
+        batch_subscriber_registry[subscriber_key] = func
+        return func
+
+    return inner
+
+
 def parse_message_value(
     value: bytes, jsoncodec: Codec[SubscriptionResult]
 ) -> QuerySubscriptionUpdate:
@@ -76,80 +98,13 @@ def handle_message(
     :param message:
     :return:
     """
-    with sentry_sdk.isolation_scope() as scope:
-        try:
-            with metrics.timer(
-                "snuba_query_subscriber.parse_message_value", tags={"dataset": dataset}
-            ):
-                contents = parse_message_value(message_value, jsoncodec)
-        except InvalidMessageError:
-            # If the message is in an invalid format, just log the error
-            # and continue
-            logger.exception(
-                "Subscription update could not be parsed",
-                extra={
-                    "offset": message_offset,
-                    "partition": message_partition,
-                    "value": message_value,
-                },
-            )
-            return
-        scope.set_tag("query_subscription_id", contents["subscription_id"])
-
-        try:
-            with metrics.timer(
-                "snuba_query_subscriber.fetch_subscription", tags={"dataset": dataset}
-            ):
-                subscription = QuerySubscription.objects.get_from_cache(
-                    subscription_id=contents["subscription_id"]
-                )
-                if subscription.status != QuerySubscription.Status.ACTIVE.value:
-                    metrics.incr("snuba_query_subscriber.subscription_inactive")
-                    return
-        except QuerySubscription.DoesNotExist:
-            metrics.incr(
-                "snuba_query_subscriber.subscription_doesnt_exist", tags={"dataset": dataset}
-            )
-            logger.warning(
-                "Received subscription update, but subscription does not exist",
-                extra={
-                    "offset": message_offset,
-                    "partition": message_partition,
-                    "value": message_value,
-                },
-            )
-            try:
-                if topic in topic_to_dataset:
-                    _delete_from_snuba(
-                        topic_to_dataset[topic],
-                        contents["subscription_id"],
-                        EntityKey(contents["entity"]),
-                    )
-                else:
-                    logger.exception(
-                        "Topic not registered with QuerySubscriptionConsumer, can't remove "
-                        "non-existent subscription from Snuba",
-                        extra={"topic": topic, "subscription_id": contents["subscription_id"]},
-                    )
-            except InvalidMessageError as e:
-                logger.exception(str(e))
-            except Exception:
-                logger.exception("Failed to delete unused subscription from snuba.")
-            return
-
-        if subscription.type not in subscriber_registry:
-            metrics.incr(
-                "snuba_query_subscriber.subscription_type_not_registered", tags={"dataset": dataset}
-            )
-            logger.error(
-                "Received subscription update, but no subscription handler registered",
-                extra={
-                    "offset": message_offset,
-                    "partition": message_partition,
-                    "value": message_value,
-                },
-            )
+    with sentry_sdk.isolation_scope():
+        result = get_subscription_update(
+            message_value, message_offset, message_partition, topic, dataset, jsoncodec
+        )
+        if result is None:
             return
+        contents, subscription = result
 
         sentry_sdk.set_tag("project_id", subscription.project_id)
         sentry_sdk.set_tag("query_subscription_id", contents["subscription_id"])
@@ -176,6 +131,156 @@ def handle_message(
             callback(contents, subscription)
 
 
+def handle_messages(
+    messages: Sequence[tuple[bytes, int, int]],
+    topic: str,
+    dataset: str,
+    jsoncodec: Codec[SubscriptionResult],
+) -> None:
+    """
+    Handles a batch of `(message_value, message_offset, message_partition)` messages.
+    The updates of subscription types that have a batch subscriber are passed to it
+    all at once, in the order of the messages. Other updates are passed to their
+    subscriber one by one, like in `handle_message`.
+    """
+    batches: dict[str, list[tuple[QuerySubscriptionUpdate, QuerySubscription]]] = {}
+    for message_value, message_offset, message_partition in messages:
+        with sentry_sdk.isolation_scope():
+            try:
+                result = get_subscription_update(
+                    message_value, message_offset, message_partition, topic, dataset, jsoncodec
+                )
+                if result is None:
+                    continue
+                contents, subscription = result
+                if subscription.type in batch_subscriber_registry:
+                    batches.setdefault(subscription.type, []).append(result)
+                    continue
+
+                with metrics.timer(
+                    "snuba_query_subscriber.callback.duration",
+                    instance=subscription.type,
+                    tags={"dataset": dataset},
+                ):
+                    subscriber_registry[subscription.type](contents, subscription)
+            except Exception:
+                # Same failsafe as for single messages, see `process_message`.
+                logger.exception(
+                    "Unexpected error while handling message in QuerySubscriptionStrategy. Skipping message.",
+                    extra={
+                        "offset": message_offset,
+                        "partition": message_partition,
+                        "value": message_value,
+                    },
+                )
+
+    for subscription_type, updates in batches.items():
+        metrics.distribution(
+            "snuba_query_subscriber.batch_callback.size",
+            len(updates),
+            tags={"dataset": dataset, "subscription_type": subscription_type},
+        )
+        with (
+            sentry_sdk.start_span(op="process_batch") as span,
+            metrics.timer(
+                "snuba_query_subscriber.batch_callback.duration",
+                instance=subscription_type,
+                tags={"dataset": dataset},
+            ),
+        ):
+            span.set_data("batch_size", len(updates))
+            try:
+                batch_subscriber_registry[subscription_type](updates)
+            except Exception:
+                logger.exception(
+                    "Unexpected error while handling a batch of subscription updates",
+                    extra={"subscription_type": subscription_type, "size": len(updates)},
+                )
+
+
+def get_subscription_update(
+    message_value: bytes,
+    message_offset: int,
+    message_partition: int,
+    topic: str,
+    dataset: str,
+    jsoncodec: Codec[SubscriptionResult],
+) -> tuple[QuerySubscriptionUpdate, QuerySubscription] | None:
+    """
+    Parses the value from Kafka and fetches its subscription. Returns None if the message
+    is invalid, or the subscription is gone or has no registered callback.
+    """
+    try:
+        with metrics.timer("snuba_query_subscriber.parse_message_value", tags={"dataset": dataset}):
+            contents = parse_message_value(message_value, jsoncodec)
+    except InvalidMessageError:
+        # If the message is in an invalid format, just log the error
+        # and continue
+        logger.exception(
+            "Subscription update could not be parsed",
+            extra={
+                "offset": message_offset,
+                "partition": message_partition,
+                "value": message_value,
+            },
+        )
+        return None
+    sentry_sdk.set_tag("query_subscription_id", contents["subscription_id"])
+
+    try:
+        with metrics.timer("snuba_query_subscriber.fetch_subscription", tags={"dataset": dataset}):
+            subscription = QuerySubscription.objects.get_from_cache(
+                subscription_id=contents["subscription_id"]
+            )
+            if subscription.status != QuerySubscription.Status.ACTIVE.value:
+                metrics.incr("snuba_query_subscriber.subscription_inactive")
+                return None
+    except QuerySubscription.DoesNotExist:
+        metrics.incr("snuba_query_subscriber.subscription_doesnt_exist", tags={"dataset": dataset})
+        logger.warning(
+            "Received subscription update, but subscription does not exist",
+            extra={
+                "offset": message_offset,
+                "partition": message_partition,
+                "value": message_value,
+            },
+        )
+        try:
+            if topic in topic_to_dataset:
+                _delete_from_snuba(
+                    topic_to_dataset[topic],
+                    contents["subscription_id"],
+                    EntityKey(contents["entity"]),
+                )
+            else:
+                logger.exception(
+                    "Topic not registered with QuerySubscriptionConsumer, can't remove "
+                    "non-existent subscription from Snuba",
+                    extra={"topic": topic, "subscription_id": contents["subscription_id"]},
+                )
+        except InvalidMessageError as e:
+            logger.exception(str(e))
+        except Exception:
+            logger.exception("Failed to delete unused subscription from snuba.")
+        return None
+
+    if subscription.type not in subscriber_registry:
+        metrics.incr(
+            "snuba_query_subscriber.subscription_type_not_registered", tags={"dataset": dataset}
+        )
+        logger.error(
+            "Received subscription update, but no subscription handler registered",
+            extra={
+                "offset": message_offset,
+                "partition": message_partition,
+                "value": message_value,
+            },
+        )
+        return None
+
+    return contents, subscription
+
+
 class InvalidMessageError(Exception):
     pass
 
@@ -1,6 +1,7 @@
 import logging
 from collections.abc import Mapping
 from functools import partial
+from typing import Literal
 
 import sentry_sdk
 from arroyo.backends.kafka.consumer import KafkaPayload
@@ -10,6 +11,7 @@ from arroyo.processing.strategies import (
     ProcessingStrategyFactory,
     RunTask,
 )
+from arroyo.processing.strategies.batching import BatchStep, ValuesBatch
 from arroyo.types import BrokerValue, Commit, Message, Partition
 from sentry_kafka_schemas import get_codec
 
@@ -33,6 +35,7 @@ class QuerySubscriptionStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         input_block_size: int | None,
         output_block_size: int | None,
         multi_proc: bool = True,
+        mode: Literal["parallel", "batched"] = "parallel",
     ):
         self.dataset = Dataset(dataset)
         self.logical_topic = dataset_to_logical_topic[self.dataset]
@@ -42,15 +45,29 @@ class QuerySubscriptionStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         self.input_block_size = input_block_size
         self.output_block_size = output_block_size
         self.multi_proc = multi_proc
-        self.pool = MultiprocessingPool(num_processes)
+        # Batched mode processes the updates of a whole batch together in the main
+        # process, see `process_batch`.
+        self.batched = mode == "batched"
+        self.pool = None if self.batched else MultiprocessingPool(num_processes)
 
     def create_with_partitions(
         self,
         commit: Commit,
         partitions: Mapping[Partition, int],
     ) -> ProcessingStrategy[KafkaPayload]:
+        if self.batched:
+            return BatchStep(
+                max_batch_size=self.max_batch_size,
+                max_batch_time=self.max_batch_time,
+                next_step=RunTask(
+                    partial(process_batch, self.dataset, self.topic, self.logical_topic),
+                    CommitOffsets(commit),
+                ),
+            )
+
         callable = partial(process_message, self.dataset, self.topic, self.logical_topic)
         if self.multi_proc:
+            assert self.pool is not None
             return run_task_with_multiprocessing(
                 function=callable,
                 next_step=CommitOffsets(commit),
@@ -64,7 +81,8 @@ class QuerySubscriptionStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
             return RunTask(callable, CommitOffsets(commit))
 
     def shutdown(self) -> None:
-        self.pool.close()
+        if self.pool:
+            self.pool.close()
 
 
 def process_message(
@@ -107,3 +125,27 @@ def process_message(
                     "value": message_value,
                 },
             )
+
+
+def process_batch(
+    dataset: Dataset,
+    topic: str,
+    logical_topic: str,
+    message: Message[ValuesBatch[KafkaPayload]],
+) -> None:
+    from sentry.snuba.query_subscriptions.consumer import handle_messages
+    from sentry.utils import metrics
+
+    with (
+        sentry_sdk.start_transaction(
+            op="handle_messages",
+            name="query_subscription_consumer_process_batch",
+            custom_sampling_context={"sample_rate": options.get("subscriptions-query.sample-rate")},
+        ),
+        metrics.timer("snuba_query_subscriber.handle_messages", tags={"dataset": dataset.value}),
+    ):
+        messages = []
+        for value in message.payload:
+            assert isinstance(value, BrokerValue)
+            messages.append((value.payload.value, value.offset, value.partition.index))
+        handle_messages(messages, topic, dataset.value, get_codec(logical_topic))
@@ -43,6 +43,7 @@ def query(
     fallback_to_transactions: bool = False,
     query_source: QuerySource | None = None,
     debug: bool = False,
+    columnar: bool = False,
 ) -> EventsResponse:
     return discover.query(
         selected_columns,
@@ -72,6 +73,7 @@ def query(
         fallback_to_transactions=fallback_to_transactions,
         query_source=query_source,
         debug=debug,
+        columnar=columnar,
     )
 
 
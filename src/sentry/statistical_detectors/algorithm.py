@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import logging
+import struct
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Mapping, MutableMapping
+from collections.abc import Callable, Mapping, MutableMapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
@@ -15,6 +16,8 @@ from sentry.utils.math import MovingAverage
 
 logger = logging.getLogger("sentry.tasks.statistical_detectors.algorithm")
 
+RawDetectorState = Mapping[str | bytes, bytes | float | int | str] | bytes | None
+
 
 @dataclass(frozen=True)
 class MovingAverageDetectorState(DetectorState):
@@ -43,6 +46,31 @@ class MovingAverageDetectorState(DetectorState):
 
         return d
 
+    # version, timestamp (-1 when missing), count, moving_avg_short, moving_avg_long
+    PACKED_FORMAT = struct.Struct("<Bqqdd")
+    PACKED_VERSION = 1
+
+    def to_bytes(self) -> bytes:
+        return self.PACKED_FORMAT.pack(
+            self.PACKED_VERSION,
+            -1 if self.timestamp is None else int(self.timestamp.timestamp()),
+            self.count,
+            self.moving_avg_short,
+            self.moving_avg_long,
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> MovingAverageDetectorState:
+        version, ts, count, moving_avg_short, moving_avg_long = cls.PACKED_FORMAT.unpack(data)
+        if version != cls.PACKED_VERSION:
+            raise ValueError(f"Unknown packed state version: {version}")
+        return cls(
+            timestamp=None if ts < 0 else datetime.fromtimestamp(ts, timezone.utc),
+            count=count,
+            moving_avg_short=moving_avg_short,
+            moving_avg_long=moving_avg_long,
+        )
+
     @classmethod
     def from_redis_dict(cls, data: Any) -> MovingAverageDetectorState:
         ts = data.get(cls.FIELD_TIMESTAMP)
@@ -99,6 +127,20 @@ class DetectorAlgorithm(ABC):
         payload: DetectorPayload,
     ) -> tuple[TrendType, float, DetectorState | None]: ...
 
+    def update_batch(
+        self,
+        raw_states: Sequence[RawDetectorState],
+        payloads: Sequence[DetectorPayload],
+    ) -> list[tuple[TrendType, float, DetectorState | None]]:
+        """
+        Update the states of many series at once. The results are in the same order as
+        the payloads, and must be identical to calling `update` for each of them.
+        """
+        return [
+            self.update(raw_state or {}, payload)  # type: ignore[arg-type]
+            for raw_state, payload in zip(raw_states, payloads)
+        ]
+
 
 class MovingAverageRelativeChangeDetector(DetectorAlgorithm):
     def __init__(
@@ -117,21 +159,54 @@ class MovingAverageRelativeChangeDetector(DetectorAlgorithm):
         self.moving_avg_long_factory = moving_avg_long_factory
         self.threshold = threshold
 
-    def update(
-        self,
-        raw_state: Mapping[str | bytes, bytes | float | int | str],
-        payload: DetectorPayload,
-    ) -> tuple[TrendType, float, DetectorState | None]:
+    def _decode_state(self, raw_state: RawDetectorState) -> MovingAverageDetectorState:
         try:
-            old = MovingAverageDetectorState.from_redis_dict(raw_state)
+            if isinstance(raw_state, bytes):
+                return MovingAverageDetectorState.from_bytes(raw_state)
+            return MovingAverageDetectorState.from_redis_dict(raw_state or {})
         except Exception as e:
-            old = MovingAverageDetectorState.empty()
-
             if raw_state:
                 # empty raw state implies that there was no
                 # previous state so no need to capture an exception
                 sentry_sdk.capture_exception(e)
+            return MovingAverageDetectorState.empty()
 
+    def update(
+        self,
+        raw_state: Mapping[str | bytes, bytes | float | int | str],
+        payload: DetectorPayload,
+    ) -> tuple[TrendType, float, DetectorState | None]:
+        return self._update_state(
+            self._decode_state(raw_state),
+            payload,
+            self.moving_avg_short_factory(),
+            self.moving_avg_long_factory(),
+        )
+
+    def update_batch(
+        self,
+        raw_states: Sequence[RawDetectorState],
+        payloads: Sequence[DetectorPayload],
+    ) -> list[tuple[TrendType, float, DetectorState | None]]:
+        # The moving averages are stateless, so a single instance of each is shared
+        # across the batch instead of being constructed for every series.
+        moving_avg_short = self.moving_avg_short_factory()
+        moving_avg_long = self.moving_avg_long_factory()
+        decode_state = self._decode_state
+        update_state = self._update_state
+
+        return [
+            update_state(decode_state(raw_state), payload, moving_avg_short, moving_avg_long)
+            for raw_state, payload in zip(raw_states, payloads)
+        ]
+
+    def _update_state(
+        self,
+        old: MovingAverageDetectorState,
+        payload: DetectorPayload,
+        moving_avg_short: MovingAverage,
+        moving_avg_long: MovingAverage,
+    ) -> tuple[TrendType, float, DetectorState | None]:
         if old.timestamp is not None and old.timestamp > payload.timestamp:
             # In the event that the timestamp is before the payload's timestamps,
             # we do not want to process this payload.
@@ -144,9 +219,6 @@ class MovingAverageRelativeChangeDetector(DetectorAlgorithm):
             )
             return TrendType.Skipped, 0, None
 
-        moving_avg_short = self.moving_avg_short_factory()
-        moving_avg_long = self.moving_avg_long_factory()
-
         new = MovingAverageDetectorState(
             timestamp=payload.timestamp,
             count=old.count + 1,
@@ -115,6 +115,7 @@ class RegressionDetector(ABC):
 
         algorithm = cls.detector_algorithm_factory()
         store = cls.detector_store_factory()
+        min_throughput_threshold = cls.min_throughput_threshold()
 
         for raw_payloads in chunked(cls.all_payloads(projects, start), batch_size):
             total_count += len(raw_payloads)
@@ -122,12 +123,12 @@ class RegressionDetector(ABC):
             raw_states = store.bulk_read_states(raw_payloads)
 
             payloads = []
-            states = []
+            old_states = []
 
             for raw_state, payload in zip(raw_states, raw_payloads):
                 # If the number of events is too low, then we skip updating
                 # to minimize false positives
-                if payload.count <= cls.min_throughput_threshold():
+                if payload.count <= min_throughput_threshold:
                     skipped_count += 1
                     continue
 
@@ -138,15 +139,25 @@ class RegressionDetector(ABC):
                 )
                 unique_project_ids.add(payload.project_id)
 
-                trend_type, score, new_state = algorithm.update(raw_state, payload)
+                payloads.append(payload)
+                old_states.append(raw_state)
+
+            results = algorithm.update_batch(old_states, payloads)
+
+            states = []
 
+            for payload, raw_state, (trend_type, score, new_state) in zip(
+                payloads, old_states, results
+            ):
                 if trend_type == TrendType.Regressed:
                     regressed_count += 1
                 elif trend_type == TrendType.Improved:
                     improved_count += 1
 
-                payloads.append(payload)
-                states.append(None if new_state is None else new_state.to_redis_dict())
+                # only the states that were updated need to be written back
+                states.append(
+                    None if new_state is None else store.encode_state(new_state, raw_state)
+                )
 
                 yield TrendBundle(
                     type=trend_type,
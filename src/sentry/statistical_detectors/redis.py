@@ -6,46 +6,77 @@ from django.conf import settings
 from sentry_redis_tools.clients import RedisCluster, StrictRedis
 
 from sentry.models.statistical_detectors import RegressionType
-from sentry.statistical_detectors.base import DetectorPayload
+from sentry.statistical_detectors.base import DetectorPayload, DetectorState
 from sentry.statistical_detectors.store import DetectorStore
 from sentry.utils import redis
 
 STATE_TTL = 24 * 60 * 60  # 1 day TTL
 
+RawState = Mapping[str | bytes, bytes | float | int | str] | bytes
+
+
+class RedisDetectorStore(DetectorStore[RawState]):
+    """
+    Stores the detector state for each series in redis.
+
+    By default each state is a hash of string fields. When `packed` is set, states are
+    written as a single fixed size binary string instead (see `DetectorState.to_bytes`),
+    which is several times smaller and cheaper to decode.
+
+    Either format can be switched to at any time. Reads fall back to the other format for
+    series that have not been written in the current format yet, and writes delete the
+    state in the other format so that a stale copy of it is never read back.
+    """
 
-class RedisDetectorStore(DetectorStore):
     def __init__(
         self,
         regression_type: RegressionType,
         client: RedisCluster | StrictRedis | None = None,
         ttl=STATE_TTL,
+        packed: bool = False,
     ):
         self.regression_type = regression_type
         self.ttl = ttl
-        self._client: RedisCluster | StrictRedis | None = None
+        self.packed = packed
+        self._client: RedisCluster | StrictRedis | None = client
 
     @property
-    def client(
-        self,
-        client: RedisCluster | StrictRedis | None = None,
-    ):
+    def client(self) -> RedisCluster | StrictRedis:
         if self._client is None:
-            self._client = self.get_redis_client() if client is None else client
+            self._client = self.get_redis_client()
         return self._client
 
-    def bulk_read_states(
-        self, payloads: list[DetectorPayload]
-    ) -> list[Mapping[str | bytes, bytes | float | int | str]]:
+    def bulk_read_states(self, payloads: list[DetectorPayload]) -> list[RawState]:
+        states = self._bulk_read_states(payloads, self.packed)
+
+        missing = [i for i, state in enumerate(states) if not state]
+        if missing:
+            fallback_states = self._bulk_read_states(
+                [payloads[i] for i in missing], not self.packed
+            )
+            for i, state in zip(missing, fallback_states):
+                if state:
+                    states[i] = state
+
+        return states
+
+    def _bulk_read_states(self, payloads: list[DetectorPayload], packed: bool) -> list[RawState]:
         with self.client.pipeline() as pipeline:
             for payload in payloads:
-                key = self.make_key(payload)
-                pipeline.hgetall(key)
-            return pipeline.execute()
+                if packed:
+                    pipeline.get(self.make_packed_key(payload))
+                else:
+                    pipeline.hgetall(self.make_key(payload))
+            states = pipeline.execute()
+
+        if packed:
+            return [b"" if state is None else state for state in states]
+        return states
 
     def bulk_write_states(
         self,
         payloads: list[DetectorPayload],
-        states: list[Mapping[str | bytes, bytes | float | int | str] | None],
+        states: list[RawState | None],
     ):
         # the number of new states must match the number of payloads
         assert len(states) == len(payloads)
@@ -54,17 +85,42 @@ class RedisDetectorStore(DetectorStore):
             for state, payload in zip(states, payloads):
                 if state is None:
                     continue
-                key = self.make_key(payload)
-                pipeline.hmset(key, state)
-                pipeline.expire(key, self.ttl)
+                if isinstance(state, bytes):
+                    pipeline.set(self.make_packed_key(payload), state, ex=self.ttl)
+                    pipeline.delete(self.make_key(payload))
+                else:
+                    key = self.make_key(payload)
+                    pipeline.hmset(key, state)
+                    pipeline.expire(key, self.ttl)
+                    pipeline.delete(self.make_packed_key(payload))
 
             pipeline.execute()
 
+    def encode_state(self, state: DetectorState, raw_state: RawState) -> RawState | None:
+        # States that are already stored as is do not need to be written back. A state
+        # read in the other format is always rewritten to migrate it.
+        if self.packed:
+            packed_state = state.to_bytes()
+            return None if packed_state == raw_state else packed_state
+
+        if raw_state and not isinstance(raw_state, bytes):
+            try:
+                if type(state).from_redis_dict(raw_state) == state:
+                    return None
+            except (KeyError, TypeError, ValueError):
+                pass
+        return state.to_redis_dict()
+
     def make_key(self, payload: DetectorPayload):
         return (
             f"sd:p:{payload.project_id}:{self.regression_type.abbreviate()}:{payload.fingerprint}"
         )
 
+    def make_packed_key(self, payload: DetectorPayload):
+        return (
+            f"sd:b:{payload.project_id}:{self.regression_type.abbreviate()}:{payload.fingerprint}"
+        )
+
     @staticmethod
     def get_redis_client() -> RedisCluster | StrictRedis:
         return redis.redis_clusters.get(settings.SENTRY_STATISTICAL_DETECTORS_REDIS_CLUSTER)
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
 
-from sentry.statistical_detectors.base import DetectorPayload
+from sentry.statistical_detectors.base import DetectorPayload, DetectorState
 
 T = TypeVar("T")
 
@@ -12,3 +12,6 @@ class DetectorStore(ABC, Generic[T]):
 
     @abstractmethod
     def bulk_write_states(self, payloads: list[DetectorPayload], states: list[T]): ...
+
+    @abstractmethod
+    def encode_state(self, state: DetectorState, raw_state: T) -> T | None: ...
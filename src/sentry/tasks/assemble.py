@@ -22,6 +22,7 @@ from sentry.debug_files.artifact_bundles import (
     INDEXING_THRESHOLD,
     get_bundles_indexing_state,
     index_artifact_bundles_for_release,
+    invalidate_artifact_bundle_lookups,
 )
 from sentry.debug_files.tasks import backfill_artifact_bundle_db_indexing
 from sentry.models.artifactbundle import (
@@ -636,6 +637,8 @@ class ArtifactBundlePostAssembler(PostAssembler[ArtifactBundleArchive]):
                     artifact_bundle=artifact_bundle,
                 ).update(date_added=date_snapshot)
 
+        invalidate_artifact_bundle_lookups(self.project_ids)
+
         metrics.incr("sourcemaps.upload.artifact_bundle")
 
         # If we don't have a release set, we don't want to run indexing, since we need at least the release for
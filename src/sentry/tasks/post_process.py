@@ -995,6 +995,32 @@ def process_workflow_engine_metric_issues(job: PostProcessJob) -> None:
         process_workflows(workflow_event_data)
 
 
+def process_frequency_counters(job: PostProcessJob) -> None:
+    """
+    Count the event in the pre-aggregated event frequency counters, before the rules
+    that read them are processed.
+    """
+    if job["is_reprocessed"]:
+        return
+
+    from sentry.rules.conditions import frequency_counters
+
+    if not frequency_counters.is_write_enabled():
+        return
+
+    group_event = job["event"]
+    if not group_event.group_id:
+        return
+
+    frequency_counters.record_event(
+        group_id=group_event.group_id,
+        event_id=group_event.event_id,
+        environment_id=group_event.get_environment().id,
+        user=group_event.get_tag("sentry:user"),
+        timestamp=group_event.datetime,
+    )
+
+
 def process_rules(job: PostProcessJob) -> None:
     if job["is_reprocessed"]:
         return
@@ -1559,6 +1585,7 @@ GROUP_CATEGORY_POST_PROCESS_PIPELINE = {
         process_commits,
         handle_owner_assignment,
         handle_auto_assignment,
+        process_frequency_counters,
         process_rules,
         process_workflow_engine,
         process_service_hooks,
@@ -1577,6 +1604,7 @@ GROUP_CATEGORY_POST_PROCESS_PIPELINE = {
     GroupCategory.FEEDBACK: [
         feedback_filter_decorator(process_snoozes),
         feedback_filter_decorator(process_inbox_adds),
+        feedback_filter_decorator(process_frequency_counters),
         feedback_filter_decorator(process_rules),
     ],
     GroupCategory.METRIC_ALERT: [
@@ -1587,5 +1615,6 @@ GROUP_CATEGORY_POST_PROCESS_PIPELINE = {
 GENERIC_POST_PROCESS_PIPELINE = [
     process_snoozes,
     process_inbox_adds,
+    process_frequency_counters,
     process_rules,
 ]
@@ -253,7 +253,10 @@ class EndpointRegressionDetector(RegressionDetector):
 
     @classmethod
     def detector_store_factory(cls) -> DetectorStore:
-        return RedisDetectorStore(regression_type=RegressionType.ENDPOINT)
+        return RedisDetectorStore(
+            regression_type=RegressionType.ENDPOINT,
+            packed=options.get("statistical_detectors.store.packed_states"),
+        )
 
     @classmethod
     def query_payloads(
@@ -299,7 +302,10 @@ class FunctionRegressionDetector(RegressionDetector):
 
     @classmethod
     def detector_store_factory(cls) -> DetectorStore:
-        return RedisDetectorStore(regression_type=RegressionType.FUNCTION)
+        return RedisDetectorStore(
+            regression_type=RegressionType.FUNCTION,
+            packed=options.get("statistical_detectors.store.packed_states"),
+        )
 
     @classmethod
     def query_payloads(
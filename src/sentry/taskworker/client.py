@@ -1,8 +1,9 @@
+import dataclasses
 import hashlib
 import hmac
 import logging
 import random
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING, Any
 
 import grpc
@@ -82,6 +83,13 @@ class RequestSignatureInterceptor(InterceptorBase):
         return continuation(call_details_with_meta, request)
 
 
+@dataclasses.dataclass(frozen=True)
+class TaskStatusUpdate:
+    task_id: str
+    status: TaskActivationStatus.ValueType
+    fetch_next_task: FetchNextTask | None = None
+
+
 class TaskworkerClient:
     """
     Taskworker RPC client wrapper
@@ -172,6 +180,42 @@ class TaskworkerClient:
             return response.task
         return None
 
+    def get_tasks(self, namespace: str | None = None, limit: int = 1) -> list[TaskActivation]:
+        """
+        Fetch up to `limit` pending tasks.
+
+        The requests are sent to the broker concurrently. Errors are only raised if
+        no task could be fetched, so that tasks that were fetched are not lost.
+        """
+        request = GetTaskRequest(namespace=namespace)
+        tasks = []
+        error = None
+        with metrics.timer("taskworker.get_tasks.rpc"):
+            host, stub = self._get_cur_stub()
+            calls = [stub.GetTask.future(request) for _ in range(limit)]
+            for call in calls:
+                try:
+                    response = call.result()
+                except grpc.RpcError as err:
+                    metrics.incr(
+                        "taskworker.client.rpc_error",
+                        tags={"method": "GetTask", "status": err.code().name},
+                    )
+                    if err.code() != grpc.StatusCode.NOT_FOUND:
+                        error = err
+                    continue
+                if response.HasField("task"):
+                    metrics.incr(
+                        "taskworker.client.get_task",
+                        tags={"namespace": response.task.namespace},
+                    )
+                    self._task_id_to_host[response.task.id] = host
+                    tasks.append(response.task)
+
+        if error is not None and not tasks:
+            raise error
+        return tasks
+
     def update_task(
         self,
         task_id: str,
@@ -208,3 +252,54 @@ class TaskworkerClient:
             self._task_id_to_host[response.task.id] = host
             return response.task
         return None
+
+    def update_tasks(
+        self, updates: Sequence[TaskStatusUpdate]
+    ) -> list[TaskActivation | grpc.RpcError | None]:
+        """
+        Update the status for several task activations.
+
+        The requests are sent to the brokers concurrently. The return value has an
+        entry for each update, in the same order: the next task that should be
+        executed if any, or the error of the update if it failed.
+        """
+        calls: list[tuple[str, CallFuture] | None] = []
+        with metrics.timer("taskworker.update_tasks.rpc"):
+            for update in updates:
+                metrics.incr(
+                    "taskworker.client.fetch_next",
+                    tags={"next": update.fetch_next_task is not None},
+                )
+                if update.task_id not in self._task_id_to_host:
+                    metrics.incr("taskworker.client.task_id_not_in_client")
+                    calls.append(None)
+                    continue
+                host = self._task_id_to_host.pop(update.task_id)
+                request = SetTaskStatusRequest(
+                    id=update.task_id,
+                    status=update.status,
+                    fetch_next_task=update.fetch_next_task,
+                )
+                calls.append((host, self._host_to_stubs[host].SetTaskStatus.future(request)))
+
+            results: list[TaskActivation | grpc.RpcError | None] = []
+            for call in calls:
+                if call is None:
+                    results.append(None)
+                    continue
+                host, future = call
+                try:
+                    response = future.result()
+                except grpc.RpcError as err:
+                    metrics.incr(
+                        "taskworker.client.rpc_error",
+                        tags={"method": "SetTaskStatus", "status": err.code().name},
+                    )
+                    results.append(None if err.code() == grpc.StatusCode.NOT_FOUND else err)
+                    continue
+                if response.HasField("task"):
+                    self._task_id_to_host[response.task.id] = host
+                    results.append(response.task)
+                else:
+                    results.append(None)
+        return results
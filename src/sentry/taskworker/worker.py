@@ -15,7 +15,7 @@ import grpc
 from django.conf import settings
 from sentry_protos.taskbroker.v1.taskbroker_pb2 import FetchNextTask, TaskActivation
 
-from sentry.taskworker.client import TaskworkerClient
+from sentry.taskworker.client import TaskStatusUpdate, TaskworkerClient
 from sentry.taskworker.constants import DEFAULT_REBALANCE_AFTER, DEFAULT_WORKER_QUEUE_SIZE
 from sentry.taskworker.workerchild import ProcessingResult, child_process
 from sentry.utils import metrics
@@ -31,6 +31,10 @@ class TaskWorker:
     As tasks are completed status changes will be sent back to the RPC host and new tasks
     will be fetched.
 
+    With a `batch_size` larger than one, up to that many tasks are fetched at once,
+    as many as there is room for in the child tasks queue, and up to that many results
+    are sent to the brokers at once.
+
     Taskworkers can be run with `sentry run taskworker`
     """
 
@@ -48,12 +52,14 @@ class TaskWorker:
         rebalance_after: int = DEFAULT_REBALANCE_AFTER,
         processing_pool_name: str | None = None,
         process_type: str = "spawn",
+        batch_size: int = 1,
         **options: dict[str, Any],
     ) -> None:
         self.options = options
         self._max_child_task_count = max_child_task_count
         self._namespace = namespace
         self._concurrency = concurrency
+        self._batch_size = batch_size
         self.client = TaskworkerClient(rpc_host, num_brokers, rebalance_after)
         if process_type == "fork":
             self.mp_context = multiprocessing.get_context("fork")
@@ -66,6 +72,7 @@ class TaskWorker:
         self._child_tasks: multiprocessing.Queue[TaskActivation] = self.mp_context.Queue(
             maxsize=child_tasks_queue_maxsize
         )
+        self._child_tasks_maxsize = child_tasks_queue_maxsize
         self._processed_tasks: multiprocessing.Queue[ProcessingResult] = self.mp_context.Queue(
             maxsize=result_queue_maxsize
         )
@@ -141,6 +148,9 @@ class TaskWorker:
         """
         Add a task to child tasks queue. Returns False if no new task was fetched.
         """
+        if self._batch_size > 1:
+            return self._add_tasks()
+
         if self._child_tasks.full():
             return False
 
@@ -163,6 +173,51 @@ class TaskWorker:
         else:
             return False
 
+    def _add_tasks(self) -> bool:
+        """
+        Fetch as many tasks as there is room for in the child tasks queue, up to the
+        batch size. Returns False if no new task was fetched.
+        """
+        capacity = min(self._get_child_tasks_capacity(), self._batch_size)
+        if not capacity:
+            return False
+
+        tasks = self.fetch_tasks(capacity)
+        for task in tasks:
+            self._put_child_task(task)
+        return bool(tasks)
+
+    def _get_child_tasks_capacity(self) -> int:
+        try:
+            return max(self._child_tasks_maxsize - self._child_tasks.qsize(), 0)
+        except NotImplementedError:
+            # qsize() is not implemented on macOS.
+            return 0 if self._child_tasks.full() else 1
+
+    def _put_child_task(self, task: TaskActivation) -> None:
+        # Tasks that could not be handed to a child before their processing deadline
+        # are not executed, the broker will deliver them again.
+        task_received = self._task_receive_timing.get(task.id)
+        if (
+            task_received is not None
+            and task.processing_deadline_duration
+            and time.monotonic() - task_received > task.processing_deadline_duration
+        ):
+            self._task_receive_timing.pop(task.id, None)
+            metrics.incr(
+                "taskworker.worker.child_task.deadline_exceeded",
+                tags={"processing_pool": self._processing_pool_name},
+            )
+            return
+
+        try:
+            self._child_tasks.put(task)
+        except queue.Full:
+            logger.warning(
+                "taskworker.add_task.child_task_queue_full",
+                extra={"task_id": task.id, "processing_pool": self._processing_pool_name},
+            )
+
     def start_result_thread(self) -> None:
         """
         Start a thread that delivers results and fetches new tasks.
@@ -181,7 +236,6 @@ class TaskWorker:
                 while not self._shutdown_event.is_set():
                     try:
                         result = self._processed_tasks.get(timeout=1.0)
-                        executor.submit(self._send_result, result)
                     except queue.Empty:
                         metrics.incr(
                             "taskworker.worker.result_thread.queue_empty",
@@ -189,6 +243,17 @@ class TaskWorker:
                         )
                         continue
 
+                    if self._batch_size > 1:
+                        results = [result]
+                        while len(results) < self._batch_size:
+                            try:
+                                results.append(self._processed_tasks.get_nowait())
+                            except queue.Empty:
+                                break
+                        executor.submit(self._send_results, results)
+                    else:
+                        executor.submit(self._send_result, result)
+
         self._result_thread = threading.Thread(target=result_thread)
         self._result_thread.start()
 
@@ -199,13 +264,7 @@ class TaskWorker:
         Run in a thread to avoid blocking the process, and during shutdown/
         See `start_result_thread`
         """
-        task_received = self._task_receive_timing.pop(result.task_id, None)
-        if task_received is not None:
-            metrics.distribution(
-                "taskworker.worker.complete_duration",
-                time.monotonic() - task_received,
-                tags={"processing_pool": self._processing_pool_name},
-            )
+        self._record_complete_duration(result)
 
         if fetch:
             fetch_next = None
@@ -230,6 +289,60 @@ class TaskWorker:
         self._send_update_task(result, fetch_next=None)
         return True
 
+    def _record_complete_duration(self, result: ProcessingResult) -> None:
+        task_received = self._task_receive_timing.pop(result.task_id, None)
+        if task_received is not None:
+            metrics.distribution(
+                "taskworker.worker.complete_duration",
+                time.monotonic() - task_received,
+                tags={"processing_pool": self._processing_pool_name},
+            )
+
+    def _send_results(self, results: list[ProcessingResult]) -> None:
+        """
+        Send several results to the brokers at once, and fetch as many new tasks as
+        there is room for in the child tasks queue.
+
+        Run in a thread, see `start_result_thread`
+        """
+        for result in results:
+            self._record_complete_duration(result)
+
+        capacity = self._get_child_tasks_capacity()
+        updates = [
+            TaskStatusUpdate(
+                task_id=result.task_id,
+                status=result.status,
+                fetch_next_task=(
+                    FetchNextTask(namespace=self._namespace) if index < capacity else None
+                ),
+            )
+            for index, result in enumerate(results)
+        ]
+
+        # Use the shutdown_event as a sleep mechanism
+        self._shutdown_event.wait(self._setstatus_backoff_seconds)
+        responses = self.client.update_tasks(updates)
+
+        failed = False
+        for result, response in zip(results, responses):
+            if isinstance(response, grpc.RpcError):
+                failed = True
+                if response.code() == grpc.StatusCode.UNAVAILABLE:
+                    self._processed_tasks.put(result)
+                logger.warning(
+                    "taskworker.send_update_task.failed",
+                    extra={"task_id": result.task_id, "error": response},
+                )
+            elif response is not None:
+                self._task_receive_timing[response.id] = time.monotonic()
+                self._put_child_task(response)
+
+        if failed:
+            self._setstatus_backoff_seconds = min(self._setstatus_backoff_seconds + 1, 10)
+        else:
+            self._setstatus_backoff_seconds = 0
+
     def _send_update_task(
         self, result: ProcessingResult, fetch_next: FetchNextTask | None
     ) -> TaskActivation | None:
@@ -294,6 +407,39 @@ class TaskWorker:
         self._spawn_children_thread = threading.Thread(target=spawn_children_thread)
         self._spawn_children_thread.start()
 
+    def fetch_tasks(self, limit: int) -> list[TaskActivation]:
+        # Use the shutdown_event as a sleep mechanism
+        self._shutdown_event.wait(self._gettask_backoff_seconds)
+        try:
+            activations = self.client.get_tasks(self._namespace, limit)
+        except grpc.RpcError as e:
+            logger.info(
+                "taskworker.fetch_task.failed",
+                extra={"error": e, "processing_pool": self._processing_pool_name},
+            )
+
+            self._gettask_backoff_seconds = min(self._gettask_backoff_seconds + 1, 10)
+            return []
+
+        metrics.distribution(
+            "taskworker.worker.fetch_tasks.count",
+            len(activations),
+            tags={"processing_pool": self._processing_pool_name},
+        )
+        if not activations:
+            metrics.incr(
+                "taskworker.worker.fetch_task.not_found",
+                tags={"processing_pool": self._processing_pool_name},
+            )
+            self._gettask_backoff_seconds = min(self._gettask_backoff_seconds + 1, 10)
+            return []
+
+        self._gettask_backoff_seconds = 0
+        now = time.monotonic()
+        for activation in activations:
+            self._task_receive_timing[activation.id] = now
+        return activations
+
     def fetch_task(self) -> TaskActivation | None:
         # Use the shutdown_event as a sleep mechanism
         self._shutdown_event.wait(self._gettask_backoff_seconds)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import math
 import random
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
@@ -21,6 +22,7 @@ from sentry import features, options, quotas
 from sentry.conf.types.kafka_definition import Topic, get_topic_codec
 from sentry.constants import ObjectStatus
 from sentry.remote_subscriptions.consumers.result_consumer import (
+    LocalState,
     ResultProcessor,
     ResultsStrategyFactory,
 )
@@ -71,6 +73,8 @@ ACTIVE_THRESHOLD_REDIS_TTL = timedelta(seconds=max(UptimeSubscription.IntervalSe
 SNUBA_UPTIME_RESULTS_CODEC: Codec[SnubaUptimeResult] = get_topic_codec(Topic.SNUBA_UPTIME_RESULTS)
 # We want to limit cardinality for provider tags. This controls how many tags we should include
 TOTAL_PROVIDERS_TO_INCLUDE_AS_TAGS = 30
+# How many state keys are kept in process memory with local state.
+LOCAL_STATE_MAX_SIZE = 100_000
 
 
 def _get_snuba_uptime_checks_producer() -> KafkaProducer:
@@ -111,6 +115,66 @@ def get_active_recovery_threshold():
 class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
     subscription_model = UptimeSubscription
 
+    def __init__(self, local_state: bool = False) -> None:
+        super().__init__(local_state)
+        # Values of the last update and consecutive status keys, with local state.
+        # They expire along with the redis keys. Missing keys are 0.
+        self._state: LocalState[str, int] = LocalState(LOCAL_STATE_MAX_SIZE)
+        # Values that still have to be written to redis, with their TTL. Keys
+        # with a value of 0 are deleted.
+        self._pending_state: dict[str, tuple[int, timedelta]] = {}
+
+    def get_state(self, keys: list[str]) -> list[int]:
+        """
+        Returns the values of state keys from local state, loading the keys
+        that are not known or expired from redis.
+        """
+        values: dict[str, int] = {}
+        missing = []
+        for key in keys:
+            # Pending values may have been evicted from local state already.
+            if key in self._pending_state:
+                values[key] = self._pending_state[key][0]
+            elif (value := self._state.get(key)) is not None:
+                values[key] = value
+            else:
+                missing.append(key)
+
+        if missing:
+            pipeline = _get_cluster().pipeline()
+            for key in missing:
+                pipeline.get(key)
+                pipeline.pttl(key)
+            loaded = pipeline.execute()
+            for key, raw_value, ttl_ms in zip(missing, loaded[::2], loaded[1::2]):
+                values[key] = 0 if raw_value is None else int(raw_value)
+                # Keys without a TTL, including missing keys, only change when they are set.
+                self._state.set(key, values[key], ttl_ms / 1000 if ttl_ms > 0 else math.inf)
+        return [values[key] for key in keys]
+
+    def set_state(self, key: str, value: int, ttl: timedelta) -> None:
+        self._state.set(key, value, ttl.total_seconds() if value else math.inf)
+        self._pending_state[key] = (value, ttl)
+
+    def flush(self) -> None:
+        pending, self._pending_state = self._pending_state, {}
+        if not pending:
+            return
+
+        pipeline = _get_cluster().pipeline()
+        for key, (value, ttl) in pending.items():
+            if value:
+                pipeline.set(key, value, ex=ttl)
+            else:
+                pipeline.delete(key)
+        pipeline.execute()
+        metrics.distribution("uptime.result_processor.flushed_state", len(pending))
+
+    def reset(self) -> None:
+        super().reset()
+        self._state.clear()
+        self._pending_state.clear()
+
     def get_subscription_id(self, result: CheckResult) -> str:
         return result["subscription_id"]
 
@@ -211,13 +275,16 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
 
         project_subscriptions = get_project_subscriptions_for_uptime_subscription(subscription.id)
 
-        cluster = _get_cluster()
-        last_updates: list[str | None] = cluster.mget(
-            build_last_update_key(sub) for sub in project_subscriptions
-        )
+        last_update_keys = [build_last_update_key(sub) for sub in project_subscriptions]
+        if self.local_state:
+            last_updates = self.get_state(last_update_keys)
+        else:
+            last_updates = [
+                0 if last_update_raw is None else int(last_update_raw)
+                for last_update_raw in _get_cluster().mget(last_update_keys)
+            ]
 
-        for last_update_raw, project_subscription in zip(last_updates, project_subscriptions):
-            last_update_ms = 0 if last_update_raw is None else int(last_update_raw)
+        for last_update_ms, project_subscription in zip(last_updates, project_subscriptions):
             self.handle_result_for_project(
                 project_subscription,
                 result,
@@ -321,12 +388,19 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
             logger.exception("Failed to process result for uptime project subscription")
 
         # Now that we've processed the result for this project subscription we track the last update date
-        cluster = _get_cluster()
-        cluster.set(
-            build_last_update_key(project_subscription),
-            int(result["scheduled_check_time_ms"]),
-            ex=LAST_UPDATE_REDIS_TTL,
-        )
+        if self.local_state:
+            self.set_state(
+                build_last_update_key(project_subscription),
+                int(result["scheduled_check_time_ms"]),
+                LAST_UPDATE_REDIS_TTL,
+            )
+        else:
+            cluster = _get_cluster()
+            cluster.set(
+                build_last_update_key(project_subscription),
+                int(result["scheduled_check_time_ms"]),
+                ex=LAST_UPDATE_REDIS_TTL,
+            )
 
         # After processing the result and updating Redis, produce message to Kafka
         if options.get("uptime.snuba_uptime_results.enabled"):
@@ -416,12 +490,18 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
         result: CheckResult,
         metric_tags: dict[str, str],
     ):
-        redis = _get_cluster()
         delete_status = (
             CHECKSTATUS_FAILURE if result["status"] == CHECKSTATUS_SUCCESS else CHECKSTATUS_SUCCESS
         )
         # Delete any consecutive results we have for the opposing status, since we received this status
-        redis.delete(build_active_consecutive_status_key(project_subscription, delete_status))
+        delete_key = build_active_consecutive_status_key(project_subscription, delete_status)
+        if self.local_state:
+            # Both counters are loaded at once, the other one is used below.
+            status_key = build_active_consecutive_status_key(project_subscription, result["status"])
+            if self.get_state([delete_key, status_key])[0]:
+                self.set_state(delete_key, 0, ACTIVE_THRESHOLD_REDIS_TTL)
+        else:
+            _get_cluster().delete(delete_key)
 
         if (
             project_subscription.uptime_status == UptimeStatus.OK
@@ -518,11 +598,16 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
         status: str,
         metric_tags: dict[str, str],
     ) -> bool:
-        pipeline = _get_cluster().pipeline()
         key = build_active_consecutive_status_key(project_subscription, status)
-        pipeline.incr(key)
-        pipeline.expire(key, ACTIVE_THRESHOLD_REDIS_TTL)
-        status_count = int(pipeline.execute()[0])
+        if self.local_state:
+            (status_count,) = self.get_state([key])
+            status_count += 1
+            self.set_state(key, status_count, ACTIVE_THRESHOLD_REDIS_TTL)
+        else:
+            pipeline = _get_cluster().pipeline()
+            pipeline.incr(key)
+            pipeline.expire(key, ACTIVE_THRESHOLD_REDIS_TTL)
+            status_count = int(pipeline.execute()[0])
         result = (
             status == CHECKSTATUS_FAILURE and status_count >= get_active_failure_threshold()
         ) or (status == CHECKSTATUS_SUCCESS and status_count >= get_active_recovery_threshold())
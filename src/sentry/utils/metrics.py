@@ -1,9 +1,10 @@
 import functools
 import logging
 import time
+from collections import defaultdict
 from collections.abc import Callable, Generator
 from contextlib import contextmanager
-from queue import Queue
+from queue import Empty, Queue
 from random import random
 from threading import Thread
 from typing import Any, TypeVar
@@ -39,8 +40,16 @@ def get_default_backend() -> MetricsBackend:
     from sentry.utils.imports import import_string
 
     cls: type[MetricsBackend] = import_string(settings.SENTRY_METRICS_BACKEND)
+    inner = cls(**settings.SENTRY_METRICS_OPTIONS)
 
-    return MiddlewareWrapper(cls(**settings.SENTRY_METRICS_OPTIONS))
+    if settings.SENTRY_METRICS_PREAGGREGATION is not None:
+        from sentry.metrics.preaggregation import MetricsAggregator, PreAggregatingMetricsBackend
+
+        inner = PreAggregatingMetricsBackend(
+            MetricsAggregator(inner, **settings.SENTRY_METRICS_PREAGGREGATION)
+        )
+
+    return MiddlewareWrapper(inner)
 
 
 backend = get_default_backend()
@@ -76,19 +85,38 @@ class InternalMetrics:
             from sentry.tsdb.base import TSDBModel
 
             while True:
-                key, instance, tags, amount, sample_rate = q.get()
-                amount = _sampled_value(amount, sample_rate)
-                if instance:
-                    full_key = f"{key}.{instance}"
-                else:
-                    full_key = key
+                items = [q.get()]
+                # Take everything that was queued in the meantime, so that every key
+                # is incremented once per batch.
+                while True:
+                    try:
+                        items.append(q.get_nowait())
+                    except Empty:
+                        break
+
+                counts: dict[str, int] = defaultdict(int)
+                for key, instance, tags, amount, sample_rate in items:
+                    if instance:
+                        full_key = f"{key}.{instance}"
+                    else:
+                        full_key = key
+                    counts[full_key] += _sampled_value(amount, sample_rate)
+
+                keys_by_count: dict[int, list[str]] = defaultdict(list)
+                for full_key, count in counts.items():
+                    keys_by_count[count].append(full_key)
+
                 try:
-                    tsdb.backend.incr(TSDBModel.internal, full_key, count=amount)
+                    for count, keys in keys_by_count.items():
+                        tsdb.backend.incr_multi(
+                            [(TSDBModel.internal, full_key) for full_key in keys], count=count
+                        )
                 except Exception:
                     logger = logging.getLogger("sentry.errors")
                     logger.exception("Unable to incr internal metric")
                 finally:
-                    q.task_done()
+                    for _ in items:
+                        q.task_done()
 
         t = Thread(target=worker, daemon=True)
         t.start()
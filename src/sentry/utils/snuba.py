@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import array
 import dataclasses
 import functools
 import logging
@@ -17,6 +18,7 @@ from hashlib import sha1
 from typing import Any
 from urllib.parse import urlparse
 
+import orjson
 import sentry_sdk
 import sentry_sdk.scope
 import urllib3
@@ -945,12 +947,19 @@ def raw_query(
 Translator = Callable[[Any], Any]
 
 
+def _identity(x: Any) -> Any:
+    return x
+
+
 @dataclasses.dataclass(frozen=True)
 class SnubaRequest:
     request: Request
     referrer: str | None  # TODO: this should use the referrer Enum
     forward: Translator
     reverse: Translator
+    # Only keep these columns of the result rows, see `bulk_snuba_queries_with_referrers`.
+    columns: tuple[str, ...] | None = None
+    columnar: bool = False
 
     def __post_init__(self) -> None:
         self.validate()
@@ -978,6 +987,8 @@ def raw_snql_query(
     query_source: (
         QuerySource | None
     ) = None,  # TODO: @athena Make this field required after updated all the callsites
+    columns: Sequence[str] | None = None,
+    columnar: bool = False,
 ) -> Mapping[str, Any]:
     """
     Alias for `bulk_snuba_queries`, kept for backwards compatibility.
@@ -990,6 +1001,8 @@ def raw_snql_query(
         referrer=referrer,
         use_cache=use_cache,
         query_source=query_source,
+        columns=columns,
+        columnar=columnar,
     )[0]
 
 
@@ -1000,6 +1013,8 @@ def bulk_snuba_queries(
     query_source: (
         QuerySource | None
     ) = None,  # TODO: @athena Make this field required after updated all the callsites
+    columns: Sequence[str] | None = None,
+    columnar: bool = False,
 ) -> ResultSet:
     """
     Alias for `bulk_snuba_queries_with_referrers` that uses the same referrer for every request.
@@ -1011,6 +1026,8 @@ def bulk_snuba_queries(
         [(request, referrer) for request in requests],
         use_cache=use_cache,
         query_source=query_source,
+        columns=columns,
+        columnar=columnar,
     )
 
 
@@ -1020,12 +1037,19 @@ def bulk_snuba_queries_with_referrers(
     query_source: (
         QuerySource | None
     ) = None,  # TODO: @athena Make this field required after updated all the callsites
+    columns: Sequence[str] | None = None,
+    columnar: bool = False,
 ) -> ResultSet:
     """
     The main entrypoint to running queries in Snuba. This function accepts
     Requests for either MQL or SnQL queries and runs them on the appropriate endpoint.
 
     Every request is paired with a referrer to be used for that request.
+
+    By default the `data` of every result is a list of rows. If `columns` is given, rows
+    only keep these columns. With `columnar`, `data` is a mapping of every column to its
+    values instead, and the values of non-nullable numeric columns are `array.array`s.
+    Both modes decode responses with orjson.
     """
 
     if "consistent" in OVERRIDE_OPTIONS:
@@ -1044,8 +1068,10 @@ def bulk_snuba_queries_with_referrers(
         SnubaRequest(
             request=request,
             referrer=referrer,
-            forward=lambda x: x,
-            reverse=lambda x: x,
+            forward=_identity,
+            reverse=_identity,
+            columns=tuple(columns) if columns is not None else None,
+            columnar=columnar,
         )
         for request, referrer in requests_with_referrers
     ]
@@ -1086,6 +1112,63 @@ def get_cache_key(query: Request) -> str:
     return f"sqc:{sha1(hashable.encode('utf-8')).hexdigest()}"
 
 
+def _get_request_cache_key(snuba_request: SnubaRequest) -> str:
+    cache_key = get_cache_key(snuba_request.request)
+    if snuba_request.columns is not None:
+        # The cached rows only have the projected columns.
+        columns = ",".join(snuba_request.columns)
+        cache_key = f"{cache_key}:{sha1(columns.encode('utf-8')).hexdigest()}"
+    return cache_key
+
+
+#: Typecodes of the arrays holding the values of numeric columns in columnar results.
+_ARRAY_TYPECODES = {
+    **{f"Int{bits}": "q" for bits in (8, 16, 32, 64)},
+    **{f"UInt{bits}": "Q" for bits in (8, 16, 32, 64)},
+    "Float32": "d",
+    "Float64": "d",
+}
+
+
+def _decode_response(data: bytes, use_orjson: bool) -> Any:
+    if use_orjson:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects some documents the json module accepts, for instance ones
+            # with integers that do not fit in 64 bits.
+            pass
+    return json.loads(data)
+
+
+def _project_result(body: MutableMapping[str, Any], columns: Sequence[str]) -> None:
+    body["data"] = [
+        {column: row[column] for column in columns if column in row} for row in body["data"]
+    ]
+    if "meta" in body:
+        body["meta"] = [column for column in body["meta"] if column["name"] in columns]
+
+
+def _to_columnar(body: MutableMapping[str, Any]) -> None:
+    rows = body["data"]
+    types = {column["name"]: column.get("type") for column in body.get("meta", ())}
+    names = list(rows[0]) if rows else list(types)
+
+    data: dict[str, Sequence[Any]] = {}
+    for name in names:
+        values = [row.get(name) for row in rows]
+        typecode = _ARRAY_TYPECODES.get(types.get(name))
+        if typecode is not None:
+            try:
+                data[name] = array.array(typecode, values)
+                continue
+            except (TypeError, OverflowError):
+                # For instance nulls, or floats in integer columns.
+                pass
+        data[name] = values
+    body["data"] = data
+
+
 def _apply_cache_and_build_results(
     snuba_requests: Sequence[SnubaRequest],
     use_cache: bool | None = False,
@@ -1107,7 +1190,7 @@ def _apply_cache_and_build_results(
 
     if use_cache:
         cache_keys = [
-            get_cache_key(snuba_request.request) for _, snuba_request in snuba_requests_list
+            _get_request_cache_key(snuba_request) for _, snuba_request in snuba_requests_list
         ]
         cache_data = cache.get_many(cache_keys)
         for (query_pos, snuba_request), cache_key in zip(snuba_requests_list, cache_keys):
@@ -1134,6 +1217,10 @@ def _apply_cache_and_build_results(
                 )
             results.append((query_pos, result))
 
+    for query_pos, result in results:
+        if snuba_requests[query_pos].columnar:
+            _to_columnar(result)
+
     # Sort so that we get the results back in the original param list order
     results.sort()
     # Drop the sort order val
@@ -1184,8 +1271,12 @@ def _bulk_snuba_query(snuba_requests: Sequence[SnubaRequest]) -> ResultSet:
         results = []
         for index, item in enumerate(query_results):
             referrer, response, _, reverse = item
+            snuba_request = snuba_requests_list[index]
             try:
-                body = json.loads(response.data)
+                body = _decode_response(
+                    response.data,
+                    use_orjson=snuba_request.columns is not None or snuba_request.columnar,
+                )
                 if SNUBA_INFO:
                     if "sql" in body:
                         log_snuba_info(
@@ -1253,8 +1344,13 @@ def _bulk_snuba_query(snuba_requests: Sequence[SnubaRequest]) -> ResultSet:
                 else:
                     raise SnubaError(f"HTTP {response.status}")
 
+            if snuba_request.columns is not None:
+                # Columns that are not kept are not translated either.
+                _project_result(body, snuba_request.columns)
+
             # Forward and reverse translation maps from model ids to snuba keys, per column
-            body["data"] = [reverse(d) for d in body["data"]]
+            if reverse is not _identity:
+                body["data"] = [reverse(d) for d in body["data"]]
             results.append(body)
 
         return results
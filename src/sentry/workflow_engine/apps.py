@@ -8,3 +8,6 @@ class Config(AppConfig):
         # Import our base DataConditionHandlers for the workflow engine platform
         import sentry.workflow_engine.handlers  # NOQA
         from sentry.workflow_engine.endpoints import serializers  # NOQA
+
+        # Register the model signals that invalidate compiled workflow graphs
+        import sentry.workflow_engine.processors.workflow_graph  # NOQA
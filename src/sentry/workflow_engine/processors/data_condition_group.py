@@ -89,8 +89,6 @@ def process_data_condition_group(
     is_fast: bool = True,
 ) -> DataConditionGroupResult:
     invalid_group_result: DataConditionGroupResult = (False, []), []
-    logic_result = False
-    condition_results: list[DataConditionResult] = []
 
     try:
         group = DataConditionGroup.objects.get_from_cache(id=data_condition_group_id)
@@ -111,12 +109,30 @@ def process_data_condition_group(
         return invalid_group_result
 
     conditions = get_data_conditions_for_group(data_condition_group_id)
+    fast_conditions, slow_conditions = split_conditions_by_speed(conditions)
+    return evaluate_split_conditions(fast_conditions, slow_conditions, logic_type, value, is_fast)
+
+
+def evaluate_split_conditions(
+    fast_conditions: list[DataCondition],
+    slow_conditions: list[DataCondition],
+    logic_type: DataConditionGroup.Type,
+    value: T,
+    is_fast: bool = True,
+) -> DataConditionGroupResult:
+    """
+    Evaluate the conditions of a DataConditionGroup that have already been loaded and
+    partitioned by speed. This does not query the database, so callers holding a
+    precompiled set of conditions (see `workflow_graph`) evaluate the exact same logic
+    as `process_data_condition_group`.
+    """
+    logic_result = False
+    condition_results: list[DataConditionResult] = []
 
     if is_fast:
-        conditions, remaining_conditions = split_conditions_by_speed(conditions)
+        conditions, remaining_conditions = fast_conditions, slow_conditions
     else:
-        _, conditions = split_conditions_by_speed(conditions)
-        remaining_conditions = []
+        conditions, remaining_conditions = slow_conditions, []
 
     if not conditions and remaining_conditions:
         # there are only slow conditions to evaluate, do not evaluate an empty list of conditions
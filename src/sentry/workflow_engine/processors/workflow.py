@@ -6,7 +6,7 @@ import sentry_sdk
 from django.db import router, transaction
 from django.db.models import Q
 
-from sentry import buffer, features
+from sentry import buffer, features, options
 from sentry.db.models.manager.base_query_set import BaseQuerySet
 from sentry.eventstore.models import GroupEvent
 from sentry.models.environment import Environment
@@ -22,6 +22,7 @@ from sentry.workflow_engine.models import (
 from sentry.workflow_engine.processors.action import filter_recently_fired_workflow_actions
 from sentry.workflow_engine.processors.data_condition_group import process_data_condition_group
 from sentry.workflow_engine.processors.detector import get_detector_by_event
+from sentry.workflow_engine.processors.workflow_graph import CompiledWorkflow, get_workflow_graph
 from sentry.workflow_engine.types import WorkflowEventData
 
 logger = logging.getLogger(__name__)
@@ -171,6 +172,64 @@ def evaluate_workflows_action_filters(
     return filter_recently_fired_workflow_actions(filtered_action_groups, event_data)
 
 
+def evaluate_compiled_workflow_triggers(
+    compiled_workflows: list[CompiledWorkflow], event_data: WorkflowEventData
+) -> list[CompiledWorkflow]:
+    """
+    Same as `evaluate_workflow_triggers`, but evaluates the precompiled trigger conditions
+    from the workflow graph instead of loading them for every workflow.
+    """
+    triggered: list[CompiledWorkflow] = []
+
+    for compiled in compiled_workflows:
+        evaluation, remaining_conditions = compiled.evaluate_trigger(event_data)
+
+        if remaining_conditions:
+            enqueue_workflow(
+                compiled.workflow,
+                remaining_conditions,
+                event_data.event,
+                WorkflowDataConditionGroupType.WORKFLOW_TRIGGER,
+            )
+        else:
+            if evaluation:
+                triggered.append(compiled)
+
+    create_workflow_fire_histories({compiled.workflow for compiled in triggered}, event_data)
+
+    return triggered
+
+
+def evaluate_compiled_workflows_action_filters(
+    compiled_workflows: list[CompiledWorkflow],
+    event_data: WorkflowEventData,
+) -> BaseQuerySet[Action]:
+    """
+    Same as `evaluate_workflows_action_filters`, but evaluates the precompiled action
+    filters from the workflow graph instead of querying for them.
+    """
+    filtered_action_groups: set[DataConditionGroup] = set()
+
+    for compiled in compiled_workflows:
+        workflow_event_data = replace(event_data, workflow_env=compiled.workflow.environment)
+
+        for action_filter in compiled.action_filters:
+            (evaluation, result), remaining_conditions = action_filter.evaluate(workflow_event_data)
+
+            if remaining_conditions:
+                enqueue_workflow(
+                    compiled.workflow,
+                    remaining_conditions,
+                    event_data.event,
+                    WorkflowDataConditionGroupType.ACTION_FILTER,
+                )
+            else:
+                if evaluation:
+                    filtered_action_groups.add(action_filter.condition_group)
+
+    return filter_recently_fired_workflow_actions(filtered_action_groups, event_data)
+
+
 def process_workflows(event_data: WorkflowEventData) -> set[Workflow]:
     """
     This method will get the detector based on the event, and then gather the associated workflows.
@@ -209,14 +268,21 @@ def process_workflows(event_data: WorkflowEventData) -> set[Workflow]:
     # TODO: remove fetching org, only used for feature flag checks
     organization = detector.project.organization
 
+    use_compiled_graph = options.get("workflow_engine.use_compiled_workflow_graph")
+    compiled_workflows: list[CompiledWorkflow] = []
+
     # Get the workflows, evaluate the when_condition_group, finally evaluate the actions for workflows that are triggered
-    workflows = set(
-        Workflow.objects.filter(
-            (Q(environment_id=None) | Q(environment_id=environment.id)),
-            detectorworkflow__detector_id=detector.id,
-            enabled=True,
-        ).distinct()
-    )
+    if use_compiled_graph:
+        compiled_workflows = get_workflow_graph(detector).get_workflows(environment.id)
+        workflows = {compiled.workflow for compiled in compiled_workflows}
+    else:
+        workflows = set(
+            Workflow.objects.filter(
+                (Q(environment_id=None) | Q(environment_id=environment.id)),
+                detectorworkflow__detector_id=detector.id,
+                enabled=True,
+            ).distinct()
+        )
 
     if workflows:
         metrics.incr(
@@ -237,7 +303,11 @@ def process_workflows(event_data: WorkflowEventData) -> set[Workflow]:
         )
 
     with sentry_sdk.start_span(op="workflow_engine.process_workflows.evaluate_workflow_triggers"):
-        triggered_workflows = evaluate_workflow_triggers(workflows, event_data)
+        if use_compiled_graph:
+            compiled_workflows = evaluate_compiled_workflow_triggers(compiled_workflows, event_data)
+            triggered_workflows = {compiled.workflow for compiled in compiled_workflows}
+        else:
+            triggered_workflows = evaluate_workflow_triggers(workflows, event_data)
 
         if triggered_workflows:
             metrics.incr(
@@ -258,7 +328,10 @@ def process_workflows(event_data: WorkflowEventData) -> set[Workflow]:
     with sentry_sdk.start_span(
         op="workflow_engine.process_workflows.evaluate_workflows_action_filters"
     ):
-        actions = evaluate_workflows_action_filters(triggered_workflows, event_data)
+        if use_compiled_graph:
+            actions = evaluate_compiled_workflows_action_filters(compiled_workflows, event_data)
+        else:
+            actions = evaluate_workflows_action_filters(triggered_workflows, event_data)
         metrics.incr(
             "workflow_engine.process_workflows.actions",
             amount=len(actions),
@@ -0,0 +1,328 @@
+"""
+A process-local, versioned cache of the workflows attached to a detector.
+
+`process_workflows` runs for every issue event, and without this cache each event has
+to query for the detector's workflows, their trigger and action filter condition
+groups, and the conditions in each group. The compiled graph loads all of that once per
+detector and stores it in process memory, already partitioned into fast and slow
+conditions, so evaluating an event only has to walk the in-memory structure.
+
+Every detector has a version token stored in the shared cache. Any change to a model
+that participates in the graph drops the token for the affected detectors, and a
+process will rebuild its local copy the next time it sees a token that does not match
+the one it compiled against.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, replace
+
+from django.core.cache import cache
+from django.db import router, transaction
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+
+from sentry.utils import metrics
+from sentry.workflow_engine.models import (
+    DataCondition,
+    DataConditionGroup,
+    Detector,
+    DetectorWorkflow,
+    Workflow,
+    WorkflowDataConditionGroup,
+)
+from sentry.workflow_engine.processors.data_condition import split_conditions_by_speed
+from sentry.workflow_engine.processors.data_condition_group import (
+    DataConditionGroupResult,
+    evaluate_split_conditions,
+)
+from sentry.workflow_engine.types import WorkflowEventData
+
+logger = logging.getLogger(__name__)
+
+GRAPH_VERSION_CACHE_TTL = 60 * 60 * 24
+MAX_CACHED_GRAPHS = 10_000
+
+
+def _version_cache_key(detector_id: int) -> str:
+    return f"workflow_engine:workflow_graph:version:{detector_id}"
+
+
+@dataclass(frozen=True)
+class CompiledConditionGroup:
+    condition_group: DataConditionGroup
+    logic_type: DataConditionGroup.Type
+    fast_conditions: tuple[DataCondition, ...]
+    slow_conditions: tuple[DataCondition, ...]
+
+    @property
+    def id(self) -> int:
+        return self.condition_group.id
+
+    def evaluate(
+        self, event_data: WorkflowEventData, is_fast: bool = True
+    ) -> DataConditionGroupResult:
+        return evaluate_split_conditions(
+            list(self.fast_conditions),
+            list(self.slow_conditions),
+            self.logic_type,
+            event_data,
+            is_fast,
+        )
+
+
+@dataclass(frozen=True)
+class CompiledWorkflow:
+    workflow: Workflow
+    trigger_group: CompiledConditionGroup | None
+    action_filters: tuple[CompiledConditionGroup, ...]
+
+    def matches_environment(self, environment_id: int | None) -> bool:
+        return (
+            self.workflow.environment_id is None or self.workflow.environment_id == environment_id
+        )
+
+    def evaluate_trigger(self, event_data: WorkflowEventData) -> tuple[bool, list[DataCondition]]:
+        """
+        Equivalent to `Workflow.evaluate_trigger_conditions`, without any queries.
+        """
+        if self.trigger_group is None:
+            return True, []
+
+        workflow_event_data = replace(event_data, workflow_env=self.workflow.environment)
+        (evaluation, _), remaining_conditions = self.trigger_group.evaluate(workflow_event_data)
+        return evaluation, remaining_conditions
+
+
+@dataclass(frozen=True)
+class CompiledWorkflowGraph:
+    detector_id: int
+    version: str
+    workflows: tuple[CompiledWorkflow, ...]
+
+    def get_workflows(self, environment_id: int | None) -> list[CompiledWorkflow]:
+        return [
+            compiled for compiled in self.workflows if compiled.matches_environment(environment_id)
+        ]
+
+
+def _compile_condition_groups(
+    condition_groups: Iterable[DataConditionGroup],
+) -> dict[int, CompiledConditionGroup]:
+    condition_groups = list(condition_groups)
+    conditions_by_group: dict[int, list[DataCondition]] = {dcg.id: [] for dcg in condition_groups}
+    for condition in DataCondition.objects.filter(
+        condition_group_id__in=list(conditions_by_group.keys())
+    ).order_by("id"):
+        conditions_by_group[condition.condition_group_id].append(condition)
+
+    compiled: dict[int, CompiledConditionGroup] = {}
+    for dcg in condition_groups:
+        try:
+            logic_type = DataConditionGroup.Type(dcg.logic_type)
+        except ValueError:
+            logger.exception(
+                "Invalid DataConditionGroup.logic_type found while compiling workflow graph",
+                extra={"logic_type": dcg.logic_type, "id": dcg.id},
+            )
+            continue
+
+        fast_conditions, slow_conditions = split_conditions_by_speed(conditions_by_group[dcg.id])
+        compiled[dcg.id] = CompiledConditionGroup(
+            condition_group=dcg,
+            logic_type=logic_type,
+            fast_conditions=tuple(fast_conditions),
+            slow_conditions=tuple(slow_conditions),
+        )
+    return compiled
+
+
+def build_workflow_graph(detector_id: int, version: str) -> CompiledWorkflowGraph:
+    """
+    Load every enabled workflow attached to the detector, along with all of the condition
+    groups and conditions they reference, in a fixed number of queries.
+    """
+    workflows = list(
+        Workflow.objects.filter(detectorworkflow__detector_id=detector_id, enabled=True)
+        .select_related("environment", "when_condition_group")
+        .distinct()
+        .order_by("id")
+    )
+    workflow_ids = [workflow.id for workflow in workflows]
+
+    action_filter_links = list(
+        WorkflowDataConditionGroup.objects.filter(workflow_id__in=workflow_ids)
+        .select_related("condition_group")
+        .order_by("id")
+    )
+
+    condition_groups: dict[int, DataConditionGroup] = {}
+    for workflow in workflows:
+        if workflow.when_condition_group is not None:
+            condition_groups[workflow.when_condition_group.id] = workflow.when_condition_group
+    for link in action_filter_links:
+        condition_groups[link.condition_group.id] = link.condition_group
+
+    compiled_groups = _compile_condition_groups(condition_groups.values())
+
+    action_filters_by_workflow: dict[int, list[CompiledConditionGroup]] = {
+        workflow_id: [] for workflow_id in workflow_ids
+    }
+    for link in action_filter_links:
+        if link.condition_group_id in compiled_groups:
+            action_filters_by_workflow[link.workflow_id].append(
+                compiled_groups[link.condition_group_id]
+            )
+
+    compiled_workflows = []
+    for workflow in workflows:
+        trigger_group = None
+        if workflow.when_condition_group_id is not None:
+            trigger_group = compiled_groups.get(workflow.when_condition_group_id)
+            if trigger_group is None:
+                # The trigger group is invalid, so the workflow can never be triggered.
+                continue
+
+        compiled_workflows.append(
+            CompiledWorkflow(
+                workflow=workflow,
+                trigger_group=trigger_group,
+                action_filters=tuple(action_filters_by_workflow[workflow.id]),
+            )
+        )
+
+    return CompiledWorkflowGraph(
+        detector_id=detector_id,
+        version=version,
+        workflows=tuple(compiled_workflows),
+    )
+
+
+class WorkflowGraphCache:
+    def __init__(self, max_size: int = MAX_CACHED_GRAPHS) -> None:
+        self.max_size = max_size
+        self._graphs: OrderedDict[int, CompiledWorkflowGraph] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_version(self, detector_id: int) -> str:
+        key = _version_cache_key(detector_id)
+        version = cache.get(key)
+        if version is None:
+            # `add` only succeeds for the first writer, so concurrent processes agree on
+            # a single token for this generation of the graph.
+            cache.add(key, uuid.uuid4().hex, GRAPH_VERSION_CACHE_TTL)
+            version = cache.get(key)
+        return version
+
+    def get(self, detector_id: int) -> CompiledWorkflowGraph:
+        version = self._get_version(detector_id)
+
+        with self._lock:
+            graph = self._graphs.get(detector_id)
+            if graph is not None and graph.version == version:
+                self._graphs.move_to_end(detector_id)
+                metrics.incr("workflow_engine.workflow_graph.cache", tags={"result": "hit"})
+                return graph
+
+        metrics.incr("workflow_engine.workflow_graph.cache", tags={"result": "miss"})
+        graph = build_workflow_graph(detector_id, version)
+
+        with self._lock:
+            self._graphs[detector_id] = graph
+            self._graphs.move_to_end(detector_id)
+            while len(self._graphs) > self.max_size:
+                self._graphs.popitem(last=False)
+
+        return graph
+
+    def clear(self) -> None:
+        with self._lock:
+            self._graphs.clear()
+
+
+workflow_graph_cache = WorkflowGraphCache()
+
+
+def get_workflow_graph(detector: Detector) -> CompiledWorkflowGraph:
+    return workflow_graph_cache.get(detector.id)
+
+
+def invalidate_workflow_graphs(detector_ids: Sequence[int]) -> None:
+    if not detector_ids:
+        return
+    cache.delete_many([_version_cache_key(detector_id) for detector_id in set(detector_ids)])
+
+
+def _detector_ids_for_workflow(workflow_id: int) -> list[int]:
+    return list(
+        DetectorWorkflow.objects.filter(workflow_id=workflow_id).values_list(
+            "detector_id", flat=True
+        )
+    )
+
+
+def _detector_ids_for_condition_group(condition_group_id: int) -> list[int]:
+    return list(
+        DetectorWorkflow.objects.filter(
+            Q(workflow__when_condition_group_id=condition_group_id)
+            | Q(workflow__workflowdataconditiongroup__condition_group_id=condition_group_id)
+        )
+        .values_list("detector_id", flat=True)
+        .distinct()
+    )
+
+
+def _schedule_invalidation(model: type, detector_ids: list[int]) -> None:
+    # Invalidate right away so other processes stop using the graph, and again once the
+    # transaction commits in case a reader rebuilt it from the pre-commit state.
+    invalidate_workflow_graphs(detector_ids)
+    transaction.on_commit(
+        lambda: invalidate_workflow_graphs(detector_ids), using=router.db_for_write(model)
+    )
+
+
+def _invalidate_for_detector(instance: Detector, **kwargs) -> None:
+    _schedule_invalidation(Detector, [instance.id])
+
+
+def _invalidate_for_detector_workflow(instance: DetectorWorkflow, **kwargs) -> None:
+    _schedule_invalidation(DetectorWorkflow, [instance.detector_id])
+
+
+def _invalidate_for_workflow(instance: Workflow, **kwargs) -> None:
+    _schedule_invalidation(Workflow, _detector_ids_for_workflow(instance.id))
+
+
+def _invalidate_for_workflow_data_condition_group(
+    instance: WorkflowDataConditionGroup, **kwargs
+) -> None:
+    _schedule_invalidation(
+        WorkflowDataConditionGroup, _detector_ids_for_workflow(instance.workflow_id)
+    )
+
+
+def _invalidate_for_data_condition_group(instance: DataConditionGroup, **kwargs) -> None:
+    _schedule_invalidation(DataConditionGroup, _detector_ids_for_condition_group(instance.id))
+
+
+def _invalidate_for_data_condition(instance: DataCondition, **kwargs) -> None:
+    _schedule_invalidation(
+        DataCondition, _detector_ids_for_condition_group(instance.condition_group_id)
+    )
+
+
+for _model, _receiver in (
+    (Detector, _invalidate_for_detector),
+    (DetectorWorkflow, _invalidate_for_detector_workflow),
+    (Workflow, _invalidate_for_workflow),
+    (WorkflowDataConditionGroup, _invalidate_for_workflow_data_condition_group),
+    (DataConditionGroup, _invalidate_for_data_condition_group),
+    (DataCondition, _invalidate_for_data_condition),
+):
+    post_save.connect(_receiver, sender=_model, weak=False)
+    post_delete.connect(_receiver, sender=_model, weak=False)
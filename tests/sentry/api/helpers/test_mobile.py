@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+from sentry.api.helpers.mobile import get_readable_device_name
+
+
+def test_get_readable_device_name():
+    assert get_readable_device_name("5058") == "i5C plus"
+    assert get_readable_device_name("iPhone5,3") == "iPhone 5c"
+    assert get_readable_device_name("unknown device") is None
+
+
+def test_android_models_loaded_lazily():
+    prog = """\
+import sys
+from sentry.api.helpers.mobile import get_readable_device_name
+assert "sentry.api.helpers.android_models" not in sys.modules
+get_readable_device_name("5058")
+assert "sentry.api.helpers.android_models" in sys.modules
+"""
+    subprocess.check_call((sys.executable, "-c", prog))
@@ -15,7 +15,9 @@ from sentry.api.event_search import (
     SearchFilter,
     SearchKey,
     SearchValue,
+    SearchVisitor,
     _RecursiveList,
+    clear_parse_caches,
     default_config,
     flatten,
     parse_search_query,
@@ -1055,3 +1057,87 @@ def test_translate_wildcard_as_clickhouse_pattern(pattern, clickhouse):
 def test_invalid_translate_wildcard_as_clickhouse_pattern(pattern):
     with pytest.raises(InvalidSearchQuery):
         assert translate_wildcard_as_clickhouse_pattern(pattern)
+
+
+class ParseSearchQueryCacheTest(SimpleTestCase):
+    def setUp(self):
+        clear_parse_caches()
+
+    def test_cached_results(self):
+        query = "user.email:foo@example.com release:1.2.1 hello"
+        result = parse_search_query(query)
+
+        with patch("sentry.api.event_search.SearchVisitor") as visitor:
+            assert parse_search_query(query) == result
+            assert not visitor.called
+
+        # results are copies
+        parse_search_query(query).append("OR")
+        assert parse_search_query(query) == result
+
+    def test_cached_values_are_copies(self):
+        query = "user.email:[foo@example.com,bar@example.com]"
+        parse_search_query(query)
+        parse_search_query(query)[0].value.raw_value.append("baz@example.com")
+
+        assert parse_search_query(query)[0].value.raw_value == [
+            "foo@example.com",
+            "bar@example.com",
+        ]
+
+    def test_results_are_cached_per_config(self):
+        query = "foo:>5"
+        config = SearchConfig.create_from(default_config, numeric_keys={"foo"})
+
+        assert parse_search_query(query) == [
+            SearchFilter(key=SearchKey(name="foo"), operator="=", value=SearchValue(">5"))
+        ]
+        assert parse_search_query(query, config=config) == [
+            SearchFilter(key=SearchKey(name="foo"), operator=">", value=SearchValue(5.0))
+        ]
+
+    def test_context_dependent_filters_are_not_cached(self):
+        config = SearchConfig.create_from(
+            default_config, is_filter_translation={"unresolved": ("status", 0)}
+        )
+        queries = [
+            "is:unresolved",
+            "release:latest",
+            "user.email:me",
+            "assigned:[me, my_teams]",
+            "(foo:bar OR release:latest)",
+        ]
+        for query in queries:
+            parse_search_query(query, config=config)
+
+        with patch("sentry.api.event_search.SearchVisitor", wraps=SearchVisitor) as visitor:
+            for query in queries:
+                parse_search_query(query, config=config)
+            assert visitor.call_count == len(queries)
+
+    def test_not_cached_with_callbacks(self):
+        query = "foo:>5"
+        parse_search_query(query, get_field_type=lambda _: "integer")
+
+        with patch("sentry.api.event_search.event_search_grammar") as grammar:
+            result = parse_search_query(query, get_field_type=lambda _: None)
+            # the parse tree is cached regardless
+            assert not grammar.parse.called
+        assert result == [
+            SearchFilter(key=SearchKey(name="foo"), operator="=", value=SearchValue(">5"))
+        ]
+
+    def test_relative_dates_are_not_cached(self):
+        start = timezone.now()
+        with freeze_time(start):
+            first = parse_search_query("timestamp:-24h")
+        with freeze_time(start + timedelta(hours=1)):
+            second = parse_search_query("timestamp:-24h")
+
+        assert first[0].value.raw_value == start - timedelta(hours=24)
+        assert second[0].value.raw_value == start - timedelta(hours=23)
+
+    def test_errors_are_not_cached(self):
+        for _ in range(2):
+            with pytest.raises(InvalidSearchQuery):
+                parse_search_query("(foo")
@@ -4,11 +4,20 @@ from io import BytesIO
 
 from django.core.files.base import ContentFile
 
-from sentry.debug_files.artifact_bundles import get_redis_cluster_for_artifact_bundles
-from sentry.models.artifactbundle import ArtifactBundle, ArtifactBundleIndex
+from sentry.debug_files.artifact_bundles import (
+    get_redis_cluster_for_artifact_bundles,
+    query_artifact_bundles_containing_file,
+)
+from sentry.models.artifactbundle import (
+    ArtifactBundle,
+    ArtifactBundleArchive,
+    ArtifactBundleIndex,
+    _manifest_cache,
+)
 from sentry.models.files.fileblob import FileBlob
 from sentry.tasks.assemble import assemble_artifacts
 from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
 from sentry.utils import json
 
 
@@ -164,3 +173,56 @@ class ArtifactLookupTest(TestCase):
         assert indexed[2].artifact_bundle == bundles[1]
         assert indexed[3].url == "~/path/to/other2.js"
         assert indexed[3].artifact_bundle == bundles[2]
+
+    @override_options({"symbolicator.sourcemaps-lookup-cache-ttl": 60})
+    def test_lookup_cache(self):
+        self.clear_cache()
+
+        def query():
+            return query_artifact_bundles_containing_file(
+                self.project, "1.0.0", "", "~/path/to/app.js", None
+            )
+
+        def upload(content):
+            bundle = make_compressed_zip_file(
+                {"path/in/zip/foo": {"url": "~/path/to/app.js", "content": content}}
+            )
+            with self.tasks():
+                upload_bundle(bundle, self.project, "1.0.0")
+
+        assert query() == []
+
+        # uploads invalidate the cached lookups of the project
+        upload(b"app_idx1")
+        (first,) = get_artifact_bundles(self.project, "1.0.0")
+        assert query() == [(first.id, "release")]
+
+        # cached lookups do not query the database
+        with self.assertNumQueries(0):
+            assert query() == [(first.id, "release")]
+
+        upload(b"app_idx2")
+        bundles = get_artifact_bundles(self.project, "1.0.0")
+        assert sorted(query()) == sorted((bundle.id, "release") for bundle in bundles)
+
+        # indexing the bundles invalidates the cached lookups as well
+        upload(b"app_idx3")
+        bundles = get_artifact_bundles(self.project, "1.0.0")
+        assert sorted(query()) == sorted((bundle.id, "index") for bundle in bundles)
+
+    def test_manifest_cache(self):
+        bundle = make_compressed_zip_file(
+            {"path/in/zip/foo": {"url": "~/path/to/app.js", "content": b"app_idx1"}}
+        )
+        checksum = sha1(bundle).hexdigest()
+        _manifest_cache.clear()
+
+        with ArtifactBundleArchive(BytesIO(bundle), checksum=checksum) as archive:
+            assert archive.get_all_urls() == ["~/path/to/app.js"]
+        assert checksum in _manifest_cache
+
+        with ArtifactBundleArchive(BytesIO(bundle), checksum=checksum) as archive:
+            assert archive.manifest is _manifest_cache[checksum][0]
+            assert archive.artifact_count == 1
+            file, _ = archive.get_file_by_url("~/path/to/app.js")
+            assert file.read() == b"app_idx1"
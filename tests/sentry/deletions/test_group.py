@@ -6,7 +6,7 @@ from uuid import uuid4
 
 from snuba_sdk import Column, Condition, Entity, Function, Op, Query, Request
 
-from sentry import nodestore
+from sentry import deletions, nodestore
 from sentry.deletions.defaults.group import ErrorEventsDeletionTask
 from sentry.deletions.tasks.groups import delete_groups
 from sentry.event_manager import GroupInfo
@@ -110,6 +110,38 @@ class DeleteGroupTest(TestCase, SnubaTestCase):
         assert Group.objects.filter(id=self.keep_event.group_id).exists()
         assert nodestore.backend.get(self.keep_node_id)
 
+    @mock.patch.object(ErrorEventsDeletionTask, "DEFAULT_CHUNK_SIZE", 1)
+    def test_resume_from_checkpoint(self) -> None:
+        group = self.event.group
+        manager = deletions.get_manager()
+        transaction_id = uuid4().hex
+
+        task = ErrorEventsDeletionTask(manager, groups=[group], transaction_id=transaction_id)
+        assert task.last_event is None
+        assert task.chunk()
+        (deleted_node_id, _), (remaining_node_id, remaining_event_id) = sorted(
+            [(self.node_id, self.event_id), (self.node_id2, self.event_id2)],
+            key=lambda node: nodestore.backend.get(node[0]) is not None,
+        )
+        assert not nodestore.backend.get(deleted_node_id)
+        assert nodestore.backend.get(remaining_node_id)
+
+        # A retry of the deletion continues after the last processed event.
+        task = ErrorEventsDeletionTask(manager, groups=[group], transaction_id=transaction_id)
+        assert task.last_event is not None
+        assert [event.event_id for event in task.get_unfetched_events()] == [remaining_event_id]
+        # Other deletions start from the beginning.
+        other_task = ErrorEventsDeletionTask(manager, groups=[group], transaction_id=uuid4().hex)
+        assert other_task.last_event is None
+
+        while task.chunk():
+            pass
+        assert not nodestore.backend.get(remaining_node_id)
+        assert nodestore.backend.get(self.keep_node_id)
+
+        task = ErrorEventsDeletionTask(manager, groups=[group], transaction_id=transaction_id)
+        assert task.last_event is None
+
     def test_grouphistory_relation(self) -> None:
         other_event = self.store_event(
             data={"timestamp": before_now(minutes=1).isoformat(), "fingerprint": ["group3"]},
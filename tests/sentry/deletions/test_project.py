@@ -1,4 +1,7 @@
+from unittest import mock
+
 from sentry import eventstore
+from sentry.deletions.base import _delete_relation_in_thread
 from sentry.deletions.tasks.scheduled import run_scheduled_deletions
 from sentry.incidents.models.alert_rule import AlertRule
 from sentry.incidents.models.incident import Incident
@@ -156,6 +159,33 @@ class DeleteProjectTest(APITestCase, TransactionTestCase, HybridCloudTestMixin):
         assert AlertRule.objects.filter(id=metric_alert_rule.id).exists()
         assert RuleSnooze.objects.filter(id=rule_snooze.id).exists()
 
+    def test_delete_group_relations_in_parallel(self):
+        project = self.create_project(name="test")
+        event = self.store_event(data={}, project_id=project.id)
+        assert event.group is not None
+        group = event.group
+        GroupAssignee.objects.create(group=group, project=project, user_id=self.user.id)
+        GroupMeta.objects.create(group=group, key="foo", value="bar")
+        GroupSeen.objects.create(group=group, project=project, user_id=self.user.id)
+        self.ScheduledDeletion.schedule(instance=project, days=0)
+
+        with (
+            self.options({"deletions.child-relations.workers": 4}),
+            mock.patch(
+                "sentry.deletions.base._delete_relation_in_thread",
+                wraps=_delete_relation_in_thread,
+            ) as delete_relation_in_thread,
+            self.tasks(),
+        ):
+            run_scheduled_deletions()
+
+        assert delete_relation_in_thread.called
+        assert not Project.objects.filter(id=project.id).exists()
+        assert not Group.objects.filter(id=group.id).exists()
+        assert not GroupAssignee.objects.filter(group_id=group.id).exists()
+        assert not GroupMeta.objects.filter(group_id=group.id).exists()
+        assert not GroupSeen.objects.filter(group_id=group.id).exists()
+
     def test_delete_error_events(self):
         keeper = self.create_project(name="keeper")
         project = self.create_project(name="test")
@@ -0,0 +1,43 @@
+from unittest import mock
+
+from sentry.deletions.throttle import wait_for_budget
+from sentry.models.group import Group
+from sentry.testutils.cases import TestCase
+
+
+class WaitForBudgetTest(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.now = 1_000_000.0
+        self.sleeps: list[float] = []
+
+        def sleep(seconds: float) -> None:
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+        patcher = mock.patch.multiple(
+            "sentry.deletions.throttle", time=lambda: self.now, sleep=sleep
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_no_budget(self) -> None:
+        wait_for_budget(Group, 1000)
+        wait_for_budget(Group, 1000)
+        assert self.sleeps == []
+
+    def test_budget(self) -> None:
+        with self.options({"deletions.rows-per-second": {"default": 100}}):
+            wait_for_budget(Group, 100)
+            assert self.sleeps == []
+
+            wait_for_budget(Group, 50)
+            assert sum(self.sleeps) == 0.5
+
+            # Chunks larger than the budget wait until the bucket is empty.
+            wait_for_budget(Group, 200)
+            assert sum(self.sleeps) == 1.5
+
+        with self.options({"deletions.rows-per-second": {"other": 100}}):
+            wait_for_budget(Group, 1000)
+            assert sum(self.sleeps) == 1.5
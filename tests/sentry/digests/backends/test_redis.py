@@ -158,3 +158,28 @@ class RedisBackendTestCase(TestCase):
 
         with backend.digest("timeline", 0) as records:
             assert len(records) == n
+
+    def test_reference_codec(self):
+        backend = RedisBackend(codec={"path": "sentry.digests.codecs.ReferenceCodec"})
+        pickled = RedisBackend()
+
+        # Records written with the previous codec can still be read.
+        pickled.add("timeline", Record("record:1", self.notification, time.time()))
+        backend.add("timeline", Record("record:2", self.notification, time.time()))
+
+        connection = backend._get_connection("timeline")
+        value = connection.get("d:t:timeline:r:record:2")
+        assert len(value) < len(pickled.codec.encode(self.notification))
+
+        with backend.digest("timeline", 0) as records:
+            records_by_key = {record.key: record for record in records}
+
+        assert records_by_key.keys() == {"record:1", "record:2"}
+        for record in records_by_key.values():
+            assert record.value.event.event_id == self.event.event_id
+            assert record.value.event.group_id == self.event.group_id
+            assert list(record.value.rules) == list(self.notification.rules)
+            assert record.value.notification_uuid == self.notification.notification_uuid
+
+        assert records_by_key["record:1"].value.event.data.is_fetched
+        assert not records_by_key["record:2"].value.event.data.is_fetched
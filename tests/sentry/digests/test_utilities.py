@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 from collections.abc import Iterable, Mapping, Sequence
+from unittest import mock
 
+from sentry import nodestore
+from sentry.digests.codecs import ReferenceCodec
 from sentry.digests.notifications import Digest, DigestInfo, build_digest, event_to_record
 from sentry.digests.utils import (
     get_event_from_groups_in_digest,
@@ -60,6 +63,37 @@ class UtilitiesHelpersTestCase(TestCase, SnubaTestCase):
             e.event_id for e in events
         }
 
+    def test_build_digest_from_references(self):
+        project = self.create_project(fire_project_created=True)
+        rule = project.rule_set.all()[0]
+        events = [
+            self.store_event(
+                data={"fingerprint": [f"group{i}"], "timestamp": before_now(minutes=1).isoformat()},
+                project_id=project.id,
+            )
+            for i in range(3)
+        ]
+
+        codec = ReferenceCodec()
+        records = []
+        for event in events:
+            record = event_to_record(event, (rule,))
+            records.append(record._replace(value=codec.decode(codec.encode(record.value))))
+
+        with (
+            mock.patch.object(
+                nodestore.backend, "get_multi", wraps=nodestore.backend.get_multi
+            ) as get_multi,
+            mock.patch.object(nodestore.backend, "get") as get,
+        ):
+            digest = build_digest(project, sort_records(records))[0]
+            assert {e.event_id: e.title for e in get_event_from_groups_in_digest(digest)} == {
+                e.event_id: e.title for e in events
+            }
+
+        assert get_multi.call_count == 1
+        assert get.call_count == 0
+
 
 def assert_get_personalized_digests(
     project: Project,
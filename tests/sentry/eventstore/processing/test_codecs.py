@@ -0,0 +1,79 @@
+import pytest
+
+from sentry.eventstore.processing.codecs import (
+    FORMAT_JSON,
+    FORMAT_ZSTD_MSGPACK,
+    FORMAT_ZSTD_ORJSON,
+    FORMATS,
+    EventPayloadCodec,
+)
+from sentry.testutils.helpers.options import override_options
+
+EVENT = {
+    "event_id": "a" * 32,
+    "project": 1,
+    "message": "hello world " * 100,
+    "tags": [["foo", "bar"]],
+    "extra": {"nested": {"float": 1.5, "none": None, "bool": True}},
+}
+
+
+@pytest.mark.parametrize("format", FORMATS)
+def test_roundtrip(format):
+    codec = EventPayloadCodec(format)
+    encoded = codec.encode(EVENT)
+    assert codec.decode(encoded) == EVENT
+
+    # Payloads can be read by codecs writing any other format.
+    for other in FORMATS:
+        assert EventPayloadCodec(other).decode(encoded) == EVENT
+
+
+@pytest.mark.parametrize("format", FORMATS)
+def test_non_str_keys(format):
+    event = {**EVENT, "contexts": {1: "int", 1.5: "float", None: "none"}}
+    codec = EventPayloadCodec(format)
+    # Keys come back as strings, like from JSON.
+    assert codec.decode(codec.encode(event)) == {
+        **EVENT,
+        "contexts": {"1": "int", "1.5": "float", "null": "none"},
+    }
+
+
+def test_compressed_formats_are_smaller():
+    json_size = len(EventPayloadCodec(FORMAT_JSON).encode(EVENT))
+    assert len(EventPayloadCodec(FORMAT_ZSTD_MSGPACK).encode(EVENT)) < json_size
+    assert len(EventPayloadCodec(FORMAT_ZSTD_ORJSON).encode(EVENT)) < json_size
+
+
+def test_decodes_legacy_payloads():
+    codec = EventPayloadCodec(FORMAT_ZSTD_MSGPACK)
+    assert codec.decode('{"foo":"bar"}') == {"foo": "bar"}
+    assert codec.decode(b'{"foo":"bar"}') == {"foo": "bar"}
+
+
+def test_format_from_option():
+    codec = EventPayloadCodec()
+    assert codec.encode(EVENT)[:1] == b"{"
+    with override_options({"eventstore.processing.codec": FORMAT_ZSTD_ORJSON}):
+        assert codec.encode(EVENT)[:1] == b"\x02"
+
+
+@pytest.mark.parametrize("format", [FORMAT_ZSTD_MSGPACK, FORMAT_ZSTD_ORJSON])
+def test_falls_back_to_json(format):
+    event = {"event_id": "a" * 32, "big": 2**70}
+    codec = EventPayloadCodec(format)
+    assert codec.decode(codec.encode(event)) == event
+    assert codec.decode(codec.encode_joined(codec.serialize_fields(event))) == event
+
+
+@pytest.mark.parametrize("format", FORMATS)
+def test_encode_joined(format):
+    codec = EventPayloadCodec(format)
+    encoded = codec.encode_joined(codec.serialize_fields(EVENT))
+    assert codec.decode(encoded) == EVENT
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        EventPayloadCodec("gzip-xml")
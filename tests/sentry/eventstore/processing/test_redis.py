@@ -0,0 +1,131 @@
+import pytest
+
+from sentry.eventstore.processing.codecs import FORMAT_ZSTD_MSGPACK, FORMATS
+from sentry.eventstore.processing.redis import RedisClusterEventProcessingStore
+from sentry.testutils.helpers.options import override_options
+from sentry.utils import json
+
+
+def make_event(**kwargs):
+    return {
+        "event_id": "a" * 32,
+        "project": 1,
+        "exception": {"values": [{"type": "Error", "value": "x" * 1000}]},
+        "debug_meta": {"images": [{"code_file": "foo.so"}] * 20},
+        **kwargs,
+    }
+
+
+@pytest.fixture
+def store():
+    store = RedisClusterEventProcessingStore()
+    store.client.flushdb()
+    return store
+
+
+@pytest.mark.parametrize("format", FORMATS)
+def test_store_and_get(format):
+    store = RedisClusterEventProcessingStore(codec=format)
+    event = make_event()
+
+    key = store.store(event)
+    assert store.get(key) == event
+
+    store.store(make_event(unprocessed=True), unprocessed=True)
+    assert store.get(key, unprocessed=True) == make_event(unprocessed=True)
+
+    store.delete_by_key(key)
+    assert store.get(key) is None
+    assert store.get(key, unprocessed=True) is None
+
+
+def test_reads_legacy_payloads(store):
+    event = make_event()
+    store.client.set(f"e:{event['event_id']}:1", json.dumps(event))
+    assert store.get(f"e:{event['event_id']}:1") == event
+
+
+@override_options({"eventstore.processing.patch-writes": True})
+@pytest.mark.parametrize("format", FORMATS)
+def test_patch_writes(store, format):
+    store = RedisClusterEventProcessingStore(codec=format)
+    event = make_event(level="error")
+    key = store.store(event)
+    patch_key = f"{{{key}}}:p"
+    assert not store.client.exists(patch_key)
+
+    # Only the changed keys are written.
+    event["level"] = "fatal"
+    event["errors"] = [{"type": "native_missing_dsym"}]
+    del event["debug_meta"]
+    store.store(event)
+    assert store.get(key) == event
+    assert set(store.client.hkeys(patch_key)) == {b"level", b"errors", b"debug_meta"}
+
+    # Unchanged events are not written again.
+    store.store(event)
+    assert store.get(key) == event
+    assert len(store.client.hkeys(patch_key)) == 3
+
+    # Large changes rewrite the whole event.
+    event["exception"] = {"values": [{"type": "Error", "value": "y" * 1000}]}
+    store.store(event)
+    assert store.get(key) == event
+    assert not store.client.exists(patch_key)
+
+
+@override_options({"eventstore.processing.patch-reads": True})
+def test_full_write_discards_patches(store):
+    event = make_event(level="error")
+    key = store.store(event)
+
+    with override_options({"eventstore.processing.patch-writes": True}):
+        store.store(event)
+        event["level"] = "fatal"
+        store.store(event)
+        assert store.client.exists(f"{{{key}}}:p")
+
+    event["level"] = "info"
+    store.store(event)
+    assert store.get(key) == event
+    assert not store.client.exists(f"{{{key}}}:p")
+
+    store.delete_by_key(key)
+    assert not store.client.exists(f"{{{key}}}:d")
+
+
+def test_store_many_compressed():
+    store = RedisClusterEventProcessingStore(codec=FORMAT_ZSTD_MSGPACK)
+    events = [make_event(event_id=event_id * 32) for event_id in "bc"]
+    keys = store.store_many(events)
+    assert [store.get(key) for key in keys] == events
+
+
+@override_options({"eventstore.processing.patch-reads": True})
+def test_store_many_discards_patches(store):
+    events = [make_event(event_id=event_id * 32, level="error") for event_id in "bc"]
+    keys = store.store_many(events)
+
+    with override_options({"eventstore.processing.patch-writes": True}):
+        assert store.store_many(events) == keys
+        for event in events:
+            event["level"] = "fatal"
+        store.store_many(events)
+        assert all(store.client.exists(f"{{{key}}}:p") for key in keys)
+
+    for event in events:
+        event["level"] = "info"
+    store.store_many(events)
+    assert [store.get(key) for key in keys] == events
+    assert not any(store.client.exists(f"{{{key}}}:p") for key in keys)
+    assert not any(store.client.exists(f"{{{key}}}:d") for key in keys)
+
+
+def test_patches_are_ignored_without_patch_options(store):
+    event = make_event(level="error")
+    key = store.store(event)
+    store.client.hset(f"{{{key}}}:p", "level", store.codec.encode("fatal"))
+
+    assert store.get(key) == event
+    with override_options({"eventstore.processing.patch-reads": True}):
+        assert store.get(key) == {**event, "level": "fatal"}
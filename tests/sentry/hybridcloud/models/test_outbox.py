@@ -16,7 +16,7 @@ from sentry.hybridcloud.models.outbox import (
     outbox_context,
 )
 from sentry.hybridcloud.outbox.category import OutboxCategory, OutboxScope
-from sentry.hybridcloud.tasks.deliver_from_outbox import enqueue_outbox_jobs
+from sentry.hybridcloud.tasks.deliver_from_outbox import enqueue_outbox_jobs, process_outbox_batch
 from sentry.models.organization import Organization
 from sentry.models.organizationmember import OrganizationMember
 from sentry.models.organizationmemberteam import OrganizationMemberTeam
@@ -297,6 +297,85 @@ class OutboxDrainTest(TransactionTestCase):
 
         assert mock_process_region_outbox.call_count == 2
 
+    @patch("sentry.hybridcloud.models.outbox.process_region_outbox.send")
+    def test_drain_shard_in_batches(self, mock_send: Mock) -> None:
+        with outbox_context(flush=False):
+            org_outbox = Organization(id=1).outbox_for_update()
+            org_outbox.save()
+            OrganizationMember(id=2, organization_id=1, user_id=2).outbox_for_update().save()
+            Organization(id=1).outbox_for_update().save()
+            other_org_outbox = Organization(id=2).outbox_for_update()
+            other_org_outbox.save()
+
+        org_outbox.drain_shard(flush_all=True, batch_size=2)
+
+        # Coalesced messages are sent once, in the order of their first message.
+        assert [c.kwargs["sender"] for c in mock_send.call_args_list] == [
+            OutboxCategory.ORGANIZATION_UPDATE,
+            OutboxCategory.ORGANIZATION_MEMBER_UPDATE,
+        ]
+        assert list(RegionOutbox.objects.values_list("id", flat=True)) == [other_org_outbox.id]
+
+    @patch("sentry.hybridcloud.models.outbox.process_region_outbox.send")
+    def test_drain_shard_in_batches_failure(self, mock_send: Mock) -> None:
+        mock_send.side_effect = [None, ValueError("oops")]
+        with outbox_context(flush=False):
+            org_outbox = Organization(id=1).outbox_for_update()
+            org_outbox.save()
+            Organization(id=1).outbox_for_update().save()
+            member_outbox = OrganizationMember(
+                id=2, organization_id=1, user_id=2
+            ).outbox_for_update()
+            member_outbox.save()
+
+        with raises(OutboxFlushError):
+            org_outbox.drain_shard(flush_all=True, batch_size=10)
+
+        # Groups that were sent before the failure are still deleted.
+        assert list(RegionOutbox.objects.values_list("id", flat=True)) == [member_outbox.id]
+
+    @patch("sentry.hybridcloud.models.outbox.process_region_outbox.send")
+    def test_drain_shard_in_batches_failure_rolls_back_receiver_writes(
+        self, mock_send: Mock
+    ) -> None:
+        def write_and_fail(*args: Any, **kwds: Any) -> None:
+            if kwds["sender"] == OutboxCategory.ORGANIZATION_MEMBER_UPDATE:
+                Organization.objects.create(slug="written-by-receiver")
+                raise ValueError("oops")
+
+        mock_send.side_effect = write_and_fail
+        with outbox_context(flush=False):
+            org_outbox = Organization(id=1).outbox_for_update()
+            org_outbox.save()
+            member_outbox = OrganizationMember(
+                id=2, organization_id=1, user_id=2
+            ).outbox_for_update()
+            member_outbox.save()
+
+        with raises(OutboxFlushError):
+            org_outbox.drain_shard(flush_all=True, batch_size=10)
+
+        # The writes of the failing receiver are rolled back, the sent group is still deleted.
+        assert not Organization.objects.filter(slug="written-by-receiver").exists()
+        assert list(RegionOutbox.objects.values_list("id", flat=True)) == [member_outbox.id]
+
+    @patch("sentry.hybridcloud.models.outbox.process_region_outbox.send")
+    def test_process_outbox_batch_parallel(self, mock_send: Mock) -> None:
+        with outbox_context(flush=False):
+            for org_id in (1, 2, 3):
+                Organization(id=org_id).outbox_for_update().save()
+                Organization(id=org_id).outbox_for_update().save()
+
+        with self.options(
+            {"hybrid_cloud.outbox.drain_workers": 2, "hybrid_cloud.outbox.drain_batch_size": 10}
+        ):
+            assert (
+                process_outbox_batch(RegionOutbox.objects.latest("id").id + 1, 0, RegionOutbox) == 3
+            )
+
+        assert mock_send.call_count == 3
+        assert not RegionOutbox.objects.exists()
+
 
 class RegionOutboxTest(TestCase):
     def test_creating_org_outboxes(self) -> None:
@@ -452,6 +531,24 @@ class RegionOutboxTest(TestCase):
 
             assert last_call_count == 2
 
+    def test_prepare_next_from_shards(self) -> None:
+        start_time = datetime(year=2022, month=10, day=1, second=0, tzinfo=timezone.utc)
+        with freeze_time(start_time), outbox_context(flush=False):
+            first = Organization(id=10001).outbox_for_update()
+            first.save()
+            Organization(id=10001).outbox_for_update().save()
+            second = Organization(id=10002).outbox_for_update()
+            second.save()
+
+            claimed = RegionOutbox.prepare_next_from_shards(RegionOutbox.find_scheduled_shards())
+
+            assert [outbox.id for outbox in claimed] == [first.id, second.id]
+            # All messages of the claimed shards are rescheduled.
+            assert RegionOutbox.find_scheduled_shards() == []
+            assert not RegionOutbox.objects.filter(scheduled_for__lte=start_time).exists()
+
+        assert RegionOutbox.prepare_next_from_shards([]) == []
+
     def test_region_sharding_keys(self) -> None:
         org1 = Factories.create_organization()
         org2 = Factories.create_organization()
@@ -628,6 +725,14 @@ class OutboxAggregationTest(TestCase):
             )
         ]
 
+    def test_calculate_sharding_depths_with_lag(self) -> None:
+        oldest = ControlOutbox.objects.filter(shard_identifier=2).earliest("date_added")
+        with freeze_time(oldest.date_added + timedelta(seconds=30)):
+            (shard_depth,) = ControlOutbox.get_shard_depths_descending(limit=1, with_lag=True)
+
+        assert shard_depth["depth"] == 7
+        assert shard_depth["lag"] == 30
+
     def test_calculate_sharding_depths_empty(self) -> None:
         ControlOutbox.objects.all().delete()
         assert ControlOutbox.objects.count() == 0
@@ -3,6 +3,7 @@ from random import Random
 
 from django.core.cache import cache
 
+from sentry.hybridcloud.models.cacheversion import RegionCacheVersion
 from sentry.hybridcloud.rpc.caching import (
     back_with_silo_cache,
     back_with_silo_cache_list,
@@ -10,7 +11,12 @@ from sentry.hybridcloud.rpc.caching import (
     control_caching_service,
     region_caching_service,
 )
-from sentry.hybridcloud.rpc.caching.impl import CacheBackend, _consume_generator
+from sentry.hybridcloud.rpc.caching.impl import (
+    CacheBackend,
+    LocalCache,
+    _consume_generator,
+    local_cache,
+)
 from sentry.organizations.services.organization.model import (
     RpcOrganizationMember,
     RpcOrganizationSummary,
@@ -18,6 +24,7 @@ from sentry.organizations.services.organization.model import (
 from sentry.organizations.services.organization.service import organization_service
 from sentry.silo.base import SiloMode
 from sentry.testutils.factories import Factories
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.pytest.fixtures import django_db_all
 from sentry.testutils.silo import assume_test_silo_mode, control_silo_test, no_silo_test
 from sentry.types.region import get_local_region
@@ -117,6 +124,86 @@ def test_caching_function_none_value() -> None:
     assert result is None
 
 
+@django_db_all(transaction=True)
+@override_options({"hybridcloud.caching.local_cache_size": 100})
+def test_caching_function_local_cache() -> None:
+    cache.clear()
+    local_cache.clear()
+
+    @back_with_silo_cache(base_key="my-test-key", silo_mode=SiloMode.REGION, t=RpcUser)
+    def get_user(user_id: int) -> RpcUser:
+        return user_service.get_many(filter=dict(user_ids=[user_id]))[0]
+
+    user = Factories.create_user()
+    cached = get_user(user.id)
+    assert cached
+    cached.username = "mutated"
+
+    # Served from the local cache, which does not hand out shared records.
+    cache.clear()
+    local = get_user(user.id)
+    assert local
+    assert local.username == user.username
+
+    with assume_test_silo_mode(SiloMode.CONTROL):
+        user.update(username=user.username + "moocow")
+
+    # Another process clears the key, which only increments its version here. The local entry
+    # is not returned for the new version.
+    RegionCacheVersion.incr_version(get_user.key_from(user.id))
+    updated = get_user(user.id)
+    assert updated
+    assert updated.username == user.username
+
+
+@django_db_all(transaction=True)
+@override_options({"hybridcloud.caching.local_cache_size": 100})
+def test_caching_many_local_cache() -> None:
+    cache.clear()
+    local_cache.clear()
+
+    @back_with_silo_cache_many(base_key="get_users", silo_mode=SiloMode.REGION, t=RpcUser)
+    def get_users(user_ids: list[int]) -> list[RpcUser]:
+        return user_service.get_many(filter=dict(user_ids=user_ids))
+
+    users = [Factories.create_user() for _ in range(3)]
+    user_ids = [u.id for u in users]
+    get_users(user_ids[:2])
+    cache.clear()
+
+    with assume_test_silo_mode(SiloMode.CONTROL):
+        for user in users:
+            user.update(username=user.username + "moo")
+    region_caching_service.clear_key(
+        region_name=get_local_region().name, key=get_users.key_from(user_ids[1])
+    )
+
+    results = get_users(user_ids)
+    assert [u.id for u in results] == user_ids
+    # Only the first user is still in the local cache at its current version.
+    assert not results[0].username.endswith("moo")
+    assert results[1].username.endswith("moo")
+    assert results[2].username.endswith("moo")
+
+
+def test_local_cache_eviction() -> None:
+    local = LocalCache(ttl=60)
+    with override_options({"hybridcloud.caching.local_cache_size": 2}):
+        local.set("a", 1, "a1")
+        local.set("b", 1, "b1")
+        assert local.get_many(["a"], {"a": 1}) == {"a": "a1"}
+        local.set("c", 1, "c1")
+
+        # The least recently used entry is evicted.
+        assert local.get_many(["a", "b", "c"], {"a": 1, "b": 1, "c": 1}) == {"a": "a1", "c": "c1"}
+        # Entries of other versions are dropped.
+        assert local.get_many(["a"], {"a": 2}) == {}
+        assert local.get_many(["a"], {"a": 1}) == {}
+
+    with override_options({"hybridcloud.caching.local_cache_size": 0}):
+        assert local.get_many(["c"], {"c": 1}) == {}
+
+
 @django_db_all(transaction=True)
 @no_silo_test
 def test_cache_versioning() -> None:
@@ -46,9 +46,12 @@ from sentry.incidents.subscription_processor import (
     build_alert_rule_trigger_stat_key,
     build_trigger_stat_keys,
     get_alert_rule_stats,
+    get_alert_rule_stats_many,
     get_redis_client,
     partition,
+    process_subscription_updates,
     update_alert_rule_stats,
+    update_alert_rule_stats_many,
 )
 from sentry.incidents.utils.types import DATA_SOURCE_SNUBA_QUERY_SUBSCRIPTION
 from sentry.issues.grouptype import MetricIssuePOC
@@ -71,6 +74,7 @@ from sentry.testutils.helpers.datetime import freeze_time
 from sentry.testutils.helpers.features import with_feature
 from sentry.types.group import PriorityLevel
 from sentry.utils import json
+from sentry.utils.dates import to_datetime
 
 EMPTY = object()
 
@@ -1155,6 +1159,46 @@ class ProcessUpdateTest(ProcessUpdateBaseClass):
         self.assert_trigger_does_not_exist(self.trigger)
         self.assert_action_handler_called_with_actions(None, [])
 
+    def test_process_subscription_updates(self):
+        # Updates of a batch are evaluated as if they were processed one by one, and
+        # the stats are written once at the end.
+        rule = self.rule
+        rule.update(threshold_period=2)
+        trigger = self.trigger
+        value = trigger.alert_threshold + 1
+        updates = [
+            (self.build_subscription_update(self.sub, timedelta(minutes=-3), value), self.sub),
+            (
+                self.build_subscription_update(self.other_sub, timedelta(minutes=-3), value),
+                self.other_sub,
+            ),
+            # Already processed
+            (self.build_subscription_update(self.sub, timedelta(minutes=-3), value), self.sub),
+            (self.build_subscription_update(self.sub, timedelta(minutes=-2), value), self.sub),
+        ]
+        with (
+            self.feature(["organizations:incidents", "organizations:performance-view"]),
+            self.capture_on_commit_callbacks(execute=True),
+            mock.patch(
+                "sentry.incidents.subscription_processor.update_alert_rule_stats_many",
+                wraps=update_alert_rule_stats_many,
+            ) as update_stats,
+        ):
+            process_subscription_updates(updates)
+
+        assert update_stats.call_count == 1
+        self.metrics.incr.assert_any_call("incidents.alert_rules.skipping_already_processed_update")
+        incident = self.assert_active_incident(rule, self.sub)
+        self.assert_trigger_exists_with_status(incident, trigger, TriggerStatus.ACTIVE)
+        self.assert_no_active_incident(rule, self.other_sub)
+
+        last_update, alert_counts, _ = get_alert_rule_stats(rule, self.sub, [trigger])
+        assert last_update == updates[3][0]["timestamp"]
+        assert alert_counts == {trigger.id: 0}
+        last_update, alert_counts, _ = get_alert_rule_stats(rule, self.other_sub, [trigger])
+        assert last_update == updates[1][0]["timestamp"]
+        assert alert_counts == {trigger.id: 1}
+
     def test_no_active_incident_resolve(self):
         # Test that we don't track stats for resolving if there are no active incidents
         # related to the alert rule.
@@ -4726,6 +4770,14 @@ class TestGetAlertRuleStats(TestCase):
         assert alert_counts == {3: 1, 4: 3}
         assert resolve_counts == {3: 2, 4: 4}
 
+        other_sub = QuerySubscription(project_id=5)
+        assert get_alert_rule_stats_many(
+            [(alert_rule, sub, triggers), (alert_rule, other_sub, triggers[:1])]
+        ) == [
+            (timestamp, {3: 1, 4: 3}, {3: 2, 4: 4}),
+            (to_datetime(0), {3: 0}, {3: 0}),
+        ]
+
 
 class TestUpdateAlertRuleStats(TestCase):
     def test(self):
@@ -4749,3 +4801,18 @@ class TestUpdateAlertRuleStats(TestCase):
         ]
 
         assert results == [int(date.timestamp()), 20, 10, 3, 15]
+
+    def test_many(self):
+        alert_rule = AlertRule(id=1)
+        date = timezone.now()
+        update_alert_rule_stats_many(
+            [
+                (alert_rule, QuerySubscription(project_id=2), date, {3: 20}, {}),
+                (alert_rule, QuerySubscription(project_id=5), date, {}, {3: 10}),
+            ]
+        )
+        client = get_redis_client()
+        assert client.get("{alert_rule:1:project:2}:trigger:3:alert_triggered") == "20"
+        assert client.get("{alert_rule:1:project:2}:trigger:3:resolve_triggered") is None
+        assert client.get("{alert_rule:1:project:5}:trigger:3:resolve_triggered") == "10"
+        assert client.get("{alert_rule:1:project:5}:last_update") == str(int(date.timestamp()))
@@ -0,0 +1,133 @@
+import time
+from datetime import datetime
+
+import msgpack
+import orjson
+import pytest
+from arroyo.backends.kafka import KafkaPayload
+from arroyo.dlq import InvalidMessage
+from arroyo.types import BrokerValue, Message, Partition, Topic
+
+from sentry.event_manager import EventManager
+from sentry.eventstore.processing import event_processing_store
+from sentry.ingest.consumer.batched_event import (
+    InvalidEvent,
+    PreparedEvent,
+    prepare_event_batch,
+    process_event_batch,
+    reject_invalid_event_message,
+)
+from sentry.ingest.types import ConsumerType
+from sentry.testutils.helpers.options import override_options
+from sentry.testutils.pytest.fixtures import django_db_all
+
+PARTITION = Partition(Topic("ingest-events"), 0)
+
+
+def make_batch(payloads: list[bytes]) -> Message:
+    values = [
+        BrokerValue(KafkaPayload(None, payload, []), PARTITION, offset, datetime.now())
+        for offset, payload in enumerate(payloads)
+    ]
+    return Message(BrokerValue(values, PARTITION, len(values), datetime.now()))
+
+
+def make_payload(project_id: int, data: dict) -> bytes:
+    return msgpack.packb(
+        {
+            "type": "event",
+            "project_id": project_id,
+            "payload": orjson.dumps(data),
+            "start_time": int(time.time()),
+            "event_id": data["event_id"],
+        }
+    )
+
+
+def get_normalized_event(data, project):
+    mgr = EventManager(data, project=project)
+    mgr.normalize()
+    return dict(mgr.get_data())
+
+
+@pytest.fixture
+def preprocess_event(monkeypatch):
+    calls = []
+
+    def inner(**kwargs):
+        calls.append(kwargs)
+
+    monkeypatch.setattr("sentry.ingest.consumer.processors.preprocess_event", inner)
+    return calls
+
+
+@django_db_all
+def test_prepare_event_batch(default_project, preprocess_event):
+    event = get_normalized_event({"message": "hello world"}, default_project)
+    other_event = get_normalized_event({"message": "hello world"}, default_project)
+
+    batch = make_batch(
+        [
+            make_payload(default_project.id, event),
+            b"bogus message",
+            make_payload(default_project.id + 1000, other_event),
+            make_payload(default_project.id, event),
+        ]
+    )
+    prepared = [value.payload for value in prepare_event_batch(batch, ConsumerType.Events)]
+
+    assert isinstance(prepared[0], PreparedEvent)
+    assert prepared[0].project == default_project
+    assert prepared[0].organization == default_project.organization
+    assert prepared[0].data == event
+    assert isinstance(prepared[1], InvalidEvent)
+    # unknown project
+    assert prepared[2] is None
+    # duplicate within the batch
+    assert prepared[3] is None
+
+    assert event_processing_store.get(prepared[0].cache_key) == event
+
+
+@django_db_all
+def test_process_event_batch(default_project, preprocess_event):
+    event = get_normalized_event({"message": "hello world"}, default_project)
+
+    batch = make_batch([make_payload(default_project.id, event), b"bogus message"])
+    processed = [value.payload for value in process_event_batch(batch, ConsumerType.Events)]
+
+    assert processed[0] is None
+    assert isinstance(processed[1], InvalidEvent)
+    (kwargs,) = preprocess_event
+    assert kwargs["cache_key"] == f"e:{event['event_id']}:{default_project.id}"
+    assert kwargs["data"] == event
+
+    # the event is now known, and deduplicated in the next batch
+    (prepared_again,) = prepare_event_batch(
+        make_batch([make_payload(default_project.id, event)]), ConsumerType.Events
+    )
+    assert prepared_again.payload is None
+
+
+@django_db_all
+def test_prepare_event_batch_killswitch(default_project):
+    event = get_normalized_event({"message": "hello world"}, default_project)
+
+    with override_options(
+        {"store.load-shed-parsed-pipeline-projects": [{"project_id": str(default_project.id)}]}
+    ):
+        (prepared,) = prepare_event_batch(
+            make_batch([make_payload(default_project.id, event)]), ConsumerType.Events
+        )
+    assert prepared.payload is None
+
+
+def test_reject_invalid_event():
+    reject_invalid_event_message(Message(BrokerValue(None, PARTITION, 4, datetime.now())))
+
+    message = Message(BrokerValue(InvalidEvent("bogus"), PARTITION, 5, datetime.now()))
+    with pytest.raises(InvalidMessage) as exc_info:
+        reject_invalid_event_message(message)
+
+    assert exc_info.value.partition == PARTITION
+    assert exc_info.value.offset == 5
@@ -5,6 +5,7 @@ from hashlib import md5
 from unittest import mock
 from unittest.mock import patch
 
+import pytest
 from django.utils import timezone
 
 from sentry.constants import LOG_LEVELS_MAP, MAX_CULPRIT_LENGTH
@@ -23,8 +24,10 @@ from sentry.issues.ingest import (
     materialize_metadata,
     save_issue_from_occurrence,
     save_issue_occurrence,
+    save_issue_occurrences,
     send_issue_occurrence_to_eventstream,
 )
+from sentry.issues.issue_occurrence import IssueOccurrence
 from sentry.models.environment import Environment
 from sentry.models.group import Group
 from sentry.models.groupassignee import GroupAssignee
@@ -165,6 +168,106 @@ class SaveIssueOccurrenceTest(OccurrenceTestMixin, TestCase):
         assert assignee.team_id == self.team.id
 
 
+class SaveIssueOccurrencesTest(OccurrenceTestMixin, TestCase):
+    def test(self) -> None:
+        events = [
+            self.store_event(
+                data={"timestamp": (timezone.now() - timedelta(minutes=3 - i)).isoformat()},
+                project_id=self.project.id,
+            )
+            for i in range(3)
+        ]
+        items = [
+            (
+                self.build_occurrence_data(
+                    event_id=event.event_id, project_id=self.project.id, subtitle=f"subtitle {i}"
+                ),
+                event,
+            )
+            for i, event in enumerate(events)
+        ]
+
+        with self.tasks(), mock.patch("sentry.issues.ingest.eventstream") as eventstream:
+            results = save_issue_occurrences(items)
+
+        group_infos = [group_info for _, group_info in results]
+        assert all(group_info is not None for group_info in group_infos)
+        group = group_infos[0].group
+        assert [group_info.group.id for group_info in group_infos] == [group.id] * 3
+        assert [group_info.is_new for group_info in group_infos] == [True, False, False]
+        assert [group_info.is_new_group_environment for group_info in group_infos] == [
+            True,
+            False,
+            False,
+        ]
+        for occurrence, _ in results:
+            fetched = IssueOccurrence.fetch(occurrence.id, self.project.id)
+            assert fetched is not None
+            self.assert_occurrences_identical(occurrence, fetched)
+
+        group.refresh_from_db()
+        assert group.times_seen == 3
+        assert group.data["metadata"]["value"] == "subtitle 2"
+        assert eventstream.backend.insert.call_count == 3
+
+    def test_group_not_created(self) -> None:
+        events = [self.store_event(data={}, project_id=self.project.id) for _ in range(2)]
+        items = [
+            (self.build_occurrence_data(event_id=event.event_id, project_id=self.project.id), event)
+            for event in events
+        ]
+
+        with (
+            mock.patch(
+                "sentry.issues.ingest.save_issue_from_occurrence", return_value=None
+            ) as save,
+            mock.patch("sentry.issues.ingest.eventstream") as eventstream,
+        ):
+            results = save_issue_occurrences(items)
+
+        # Every occurrence may still create the group.
+        assert save.call_count == 2
+        assert [group_info for _, group_info in results] == [None, None]
+        assert eventstream.backend.insert.call_count == 0
+
+    def test_failure_sends_saved_occurrences(self) -> None:
+        events = [self.store_event(data={}, project_id=self.project.id) for _ in range(3)]
+        items = [
+            (self.build_occurrence_data(event_id=event.event_id, project_id=self.project.id), event)
+            for event in events
+        ]
+
+        saved = []
+        with (
+            self.tasks(),
+            mock.patch("sentry.issues.ingest.eventstream") as eventstream,
+            mock.patch(
+                "sentry.issues.ingest._save_occurrences_to_existing_group",
+                side_effect=Exception("boom"),
+            ),
+            pytest.raises(Exception, match="boom"),
+        ):
+            save_issue_occurrences(items, on_saved=saved.append)
+
+        # The occurrence that created the group was sent and marked before the failure.
+        assert saved == [0]
+        assert eventstream.backend.insert.call_count == 1
+
+    def test_different_fingerprints(self) -> None:
+        events = [self.store_event(data={}, project_id=self.project.id) for _ in range(2)]
+        items = [
+            (
+                self.build_occurrence_data(
+                    event_id=event.event_id, project_id=self.project.id, fingerprint=[str(i)]
+                ),
+                event,
+            )
+            for i, event in enumerate(events)
+        ]
+        with pytest.raises(ValueError):
+            save_issue_occurrences(items)
+
+
 class ProcessOccurrenceDataTest(OccurrenceTestMixin, TestCase):
     def test(self) -> None:
         data = self.build_occurrence_data(fingerprint=["hi", "bye"])
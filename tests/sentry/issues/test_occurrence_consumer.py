@@ -16,6 +16,7 @@ from sentry import eventstore, options
 from sentry.eventstore.models import Event
 from sentry.eventstore.snuba.backend import SnubaEventStorage
 from sentry.issues.grouptype import PerformanceSlowDBQueryGroupType, ProfileFileIOGroupType
+from sentry.issues.ingest import save_issue_occurrences
 from sentry.issues.issue_occurrence import IssueOccurrence
 from sentry.issues.occurrence_consumer import (
     EventLookupError,
@@ -284,6 +285,47 @@ class IssueOccurrenceProcessMessageTest(IssueOccurrenceTestBase):
         assert rate_limit_quota.granularity_seconds == 60
         assert rate_limit_quota.limit == 1000
 
+    @django_db_all
+    def test_process_occurrence_group_batched(self) -> None:
+        messages = [get_test_message(self.project.id) for _ in range(3)]
+        with (
+            self.feature("organizations:profile-file-io-main-thread-ingest"),
+            self.options({"issues.occurrence-consumer.batched-saving.enabled": True}),
+            mock.patch(
+                "sentry.issues.occurrence_consumer.save_issue_occurrences",
+                side_effect=save_issue_occurrences,
+            ) as mock_save,
+        ):
+            process_occurrence_group(messages)
+
+        # Occurrences of the same fingerprint are saved together.
+        assert mock_save.call_count == 1
+        occurrences = [
+            IssueOccurrence.fetch(uuid.UUID(message["id"]).hex, self.project.id)
+            for message in messages
+        ]
+        assert all(occurrences)
+        groups = Group.objects.filter(grouphash__hash=occurrences[0].fingerprint[0])
+        assert groups.count() == 1
+
+    @django_db_all
+    def test_process_occurrence_group_batched_invalid_message(self) -> None:
+        messages = [
+            get_test_message(self.project.id),
+            get_test_message(self.project.id, event={"title": "no project id"}),
+            get_test_message(self.project.id),
+        ]
+        with (
+            self.feature("organizations:profile-file-io-main-thread-ingest"),
+            self.options({"issues.occurrence-consumer.batched-saving.enabled": True}),
+        ):
+            with pytest.raises(InvalidEventPayloadError):
+                process_occurrence_group(messages)
+
+        # Occurrences before the invalid message are saved, as they would be one by one.
+        assert IssueOccurrence.fetch(uuid.UUID(messages[0]["id"]).hex, self.project.id)
+        assert not IssueOccurrence.fetch(uuid.UUID(messages[2]["id"]).hex, self.project.id)
+
 
 class IssueOccurrenceLookupEventIdTest(IssueOccurrenceTestBase):
     def test_lookup_event_doesnt_exist(self) -> None:
@@ -0,0 +1,117 @@
+import threading
+from unittest import mock
+
+import pytest
+
+from sentry.metrics.base import MetricsBackend
+from sentry.metrics.preaggregation import MetricsAggregator, PreAggregatingMetricsBackend
+
+
+@pytest.fixture
+def inner():
+    return mock.Mock(spec=MetricsBackend)
+
+
+@pytest.fixture
+def aggregator(inner):
+    return MetricsAggregator(inner, flush_interval=3600)
+
+
+@pytest.fixture
+def backend(aggregator):
+    return PreAggregatingMetricsBackend(aggregator)
+
+
+def test_counters_are_summed(backend, aggregator, inner):
+    backend.incr("foo", tags={"a": "b"})
+    backend.incr("foo", tags={"a": "b"}, amount=2)
+    backend.incr("foo", tags={"a": "c"})
+    backend.incr("bar", instance="x")
+    assert not inner.incr.called
+
+    aggregator.flush()
+    assert sorted(inner.incr.call_args_list) == sorted(
+        [
+            mock.call("foo", None, {"a": "b"}, 3, 1, None),
+            mock.call("foo", None, {"a": "c"}, 1, 1, None),
+            mock.call("bar", "x", {}, 1, 1, None),
+        ]
+    )
+
+    inner.incr.reset_mock()
+    aggregator.flush()
+    assert not inner.incr.called
+
+
+def test_gauges_keep_last_value(backend, aggregator, inner):
+    backend.gauge("foo", 1)
+    backend.gauge("foo", 5, unit="byte")
+    backend.gauge("foo", 3)
+
+    aggregator.flush()
+    assert sorted(inner.gauge.call_args_list) == sorted(
+        [
+            mock.call("foo", 3, None, {}, 1, None),
+            mock.call("foo", 5, None, {}, 1, "byte"),
+        ]
+    )
+
+
+def test_timings_and_distributions_are_not_buffered(backend, aggregator, inner):
+    backend.distribution("foo", 1000.0001, unit="millisecond")
+    backend.timing("bar", 0.5, sample_rate=0.5)
+
+    inner.distribution.assert_called_once_with("foo", 1000.0001, None, None, 1, "millisecond", 1)
+    inner.timing.assert_called_once_with("bar", 0.5, None, None, 0.5, 1)
+
+    inner.reset_mock()
+    aggregator.flush()
+    assert not inner.distribution.called
+    assert not inner.timing.called
+
+
+def test_flushes_all_threads(backend, aggregator, inner):
+    def record():
+        for _ in range(100):
+            backend.incr("foo")
+
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    aggregator.flush()
+    inner.incr.assert_called_once_with("foo", None, {}, 400, 1, None)
+    # buffers of the finished threads are dropped
+    assert aggregator._buffers == []
+
+
+def test_cardinality_guard(inner):
+    aggregator = MetricsAggregator(inner, flush_interval=3600, max_series=2)
+    backend = PreAggregatingMetricsBackend(aggregator)
+
+    for tag in ("a", "b", "c", "a"):
+        backend.incr("foo", tags={"tag": tag})
+
+    # the third series is sent right away
+    assert inner.incr.call_args_list == [
+        mock.call("metrics.preaggregation.overflow", tags={"key": "foo"}),
+        mock.call("foo", None, {"tag": "c"}, 1, 1, None),
+    ]
+
+    inner.incr.reset_mock()
+    aggregator.flush()
+    assert sorted(inner.incr.call_args_list) == [
+        mock.call("foo", None, {"tag": "a"}, 2, 1, None),
+        mock.call("foo", None, {"tag": "b"}, 1, 1, None),
+    ]
+
+
+def test_sampled_counters(backend, aggregator, inner):
+    with mock.patch("sentry.metrics.preaggregation.random", side_effect=[0.1, 0.9]):
+        backend.incr("foo", sample_rate=0.5)
+        backend.incr("foo", sample_rate=0.5)
+
+    aggregator.flush()
+    inner.incr.assert_called_once_with("foo", None, {}, 2, 1, None)
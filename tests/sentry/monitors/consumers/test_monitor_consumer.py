@@ -19,7 +19,12 @@ from sentry.constants import ObjectStatus
 from sentry.db.models import BoundedPositiveIntegerField
 from sentry.models.environment import Environment
 from sentry.monitors.constants import TIMEOUT, PermitCheckInStatus
-from sentry.monitors.consumers.monitor_consumer import StoreMonitorCheckInStrategyFactory
+from sentry.monitors.consumers.monitor_consumer import (
+    PreloadedCheckin,
+    StoreMonitorCheckInStrategyFactory,
+    preload_checkin_groups,
+    process_checkin_group,
+)
 from sentry.monitors.models import (
     CheckInStatus,
     Monitor,
@@ -249,6 +254,75 @@ class MonitorConsumerTest(TestCase):
         # The last group is monitor_2 but with a diff environment
         assert group_3[0].payload.get("environment") == "test"
 
+    def create_checkin_item(self, monitor_slug: str, **overrides: Any) -> CheckinItem:
+        ts = datetime.now()
+        payload = {
+            "monitor_slug": monitor_slug,
+            "status": "ok",
+            "check_in_id": uuid.uuid4().hex,
+            "environment": "production",
+        }
+        payload.update(overrides)
+        message: CheckIn = {
+            "message_type": "check_in",
+            "start_time": ts.timestamp(),
+            "project_id": self.project.id,
+            "payload": json.dumps(payload).encode(),
+            "sdk": "test/1.0",
+            "retention_days": 90,
+        }
+        return CheckinItem(ts, self.partition.index, message, payload)
+
+    @mock.patch("sentry.monitors.consumers.monitor_consumer.handle_processing_errors")
+    @mock.patch("sentry.monitors.consumers.monitor_consumer.CHECKIN_QUOTA_LIMIT", 2)
+    def test_preload_checkin_groups(self, handle_processing_errors) -> None:
+        monitor = self._create_monitor(slug="my-monitor")
+        monitor_environment = MonitorEnvironment.objects.ensure_environment(
+            self.project, monitor, "production"
+        )
+
+        checkin_mapping = {
+            "production": [self.create_checkin_item("my-monitor") for _ in range(3)],
+            "dev": [self.create_checkin_item("my-monitor", environment="dev")],
+            "unknown": [self.create_checkin_item("unknown-monitor")],
+        }
+
+        # monitors, environments and monitor environments
+        with self.assertNumQueries(3):
+            preloaded = preload_checkin_groups(checkin_mapping)
+
+        first, *rest = preloaded["production"]
+        assert first.monitor == monitor
+        assert first.monitor_environment == monitor_environment
+        assert all(checkin.monitor is None for checkin in rest)
+        assert [checkin.is_ratelimited for checkin in preloaded["production"]] == [
+            False,
+            False,
+            True,
+        ]
+
+        # Each group gets its own instances
+        (dev,) = preloaded["dev"]
+        assert dev.monitor == monitor
+        assert dev.monitor is not first.monitor
+        assert dev.monitor_environment is None
+
+        assert preloaded["unknown"] == [PreloadedCheckin(is_ratelimited=False)]
+
+        for processing_key, group in checkin_mapping.items():
+            process_checkin_group(group, preloaded[processing_key])
+
+        assert MonitorCheckIn.objects.filter(monitor_environment=monitor_environment).count() == 2
+        assert MonitorCheckIn.objects.filter(monitor=monitor).count() == 3
+
+        # The rate-limited check-in and the check-in of the unknown monitor
+        assert handle_processing_errors.call_count == 2
+        errors = [call.args[1].processing_errors for call in handle_processing_errors.mock_calls]
+        assert errors == [
+            [{"type": ProcessingErrorType.MONITOR_ENVIRONMENT_RATELIMITED}],
+            [{"type": ProcessingErrorType.MONITOR_NOT_FOUND}],
+        ]
+
     def test_passing(self) -> None:
         monitor = self._create_monitor(slug="my-monitor")
         self.send_checkin(monitor.slug)
@@ -51,6 +51,13 @@ def test_set(ns):
     assert ns.get(node_id) == data
 
 
+@override_options({"nodestore.set-subkeys.enable-set-cache-item": False})
+def test_set_multi(ns):
+    nodes = {"a" * 32: {"foo": "a"}, "b" * 32: {"foo": "b"}}
+    ns.set_multi(nodes)
+    assert ns.get_multi(list(nodes)) == nodes
+
+
 @override_options({"nodestore.set-subkeys.enable-set-cache-item": False})
 def test_delete(ns):
     node_id = "d2502ebbd7df41ceba8d3275595cac33"
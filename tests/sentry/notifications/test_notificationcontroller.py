@@ -13,6 +13,7 @@ from sentry.notifications.types import (
 from sentry.silo.base import SiloMode
 from sentry.testutils.cases import TestCase
 from sentry.testutils.helpers.features import with_feature
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.helpers.slack import link_team
 from sentry.testutils.silo import assume_test_silo_mode, control_silo_test
 from sentry.types.actor import Actor, ActorType
@@ -904,3 +905,61 @@ class NotificationControllerTest(TestCase):
         )
 
         assert len(controller.recipients) == 2
+
+    @override_options({"notifications.cache-recipient-settings": True})
+    def test_cached_settings(self):
+        other_user = self.create_user()
+        team = self.create_team()
+        add_notification_setting_option(
+            scope_type=NotificationScopeEnum.TEAM,
+            scope_identifier=team.id,
+            type=NotificationSettingEnum.ISSUE_ALERTS,
+            value=NotificationSettingsOptionEnum.NEVER,
+            team_id=team.id,
+        )
+        # Settings for other projects are cached, but not used.
+        add_notification_setting_option(
+            scope_type=NotificationScopeEnum.PROJECT,
+            scope_identifier=self.create_project().id,
+            type=NotificationSettingEnum.ISSUE_ALERTS,
+            value=NotificationSettingsOptionEnum.NEVER,
+            user_id=self.user.id,
+        )
+
+        def get_controller(**kwargs):
+            return NotificationController(
+                recipients=[self.user, other_user, team],
+                project_ids=[self.project.id],
+                organization_id=self.organization.id,
+                **kwargs,
+            )
+
+        with override_options({"notifications.cache-recipient-settings": False}):
+            uncached = get_controller()
+            uncached_issue_alerts = get_controller(type=NotificationSettingEnum.ISSUE_ALERTS)
+
+        controller = get_controller()
+        assert list(controller.get_all_setting_options) == list(uncached.get_all_setting_options)
+        assert list(controller.get_all_setting_providers) == list(
+            uncached.get_all_setting_providers
+        )
+        assert controller.get_combined_settings() == uncached.get_combined_settings()
+
+        with self.assertNumQueries(1):
+            # Only the organization mapping is queried.
+            controller = get_controller(type=NotificationSettingEnum.ISSUE_ALERTS)
+        assert list(controller.get_all_setting_options) == list(
+            uncached_issue_alerts.get_all_setting_options
+        )
+        assert controller.get_participants() == uncached_issue_alerts.get_participants()
+
+        # Changing a setting invalidates the cached settings of its user.
+        NotificationSettingOption.objects.filter(
+            user_id=self.user.id, scope_type=NotificationScopeEnum.ORGANIZATION.value
+        ).delete()
+        controller = get_controller()
+        assert list(controller.get_all_setting_options) == [
+            self.setting_options[0],
+            self.setting_options[1],
+            NotificationSettingOption.objects.get(team_id=team.id),
+        ]
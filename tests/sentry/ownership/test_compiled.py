@@ -0,0 +1,91 @@
+import pytest
+
+from sentry.ownership.compiled import CompiledRules, get_compiled_rules, get_required_literal
+from sentry.ownership.grammar import dump_schema, parse_rules
+
+RULES = """
+path:*.py #python
+path:src/app/* #app
+codeowners:/docs/ #docs
+codeowners:*.txt #text
+codeowners:**/views/checkout.js #checkout
+module:foo.bar #foo
+url:*example.com/* #web
+tags.foo:bar #tags
+path:* #everyone
+path:{a,b}.js #alternatives
+"""
+
+
+def make_event(frames, url=None, tags=None):
+    return {
+        "platform": "python",
+        "request": {"url": url} if url else {},
+        "tags": tags or [],
+        "exception": {"values": [{"stacktrace": {"frames": frames}}]},
+    }
+
+
+@pytest.mark.parametrize(
+    "pattern, literal",
+    [
+        ("src/app/*.py", "app"),
+        ("*.JS", ".js"),
+        ("/docs/", "docs"),
+        ("**/foo[ab]ar/baz.txt", "baz.txt"),
+        ("\\*weird", "weird"),
+        ("{a,b}.py", None),
+        ("*", None),
+        ("ünïcode/*", None),
+    ],
+)
+def test_get_required_literal(pattern, literal):
+    assert get_required_literal(pattern) == literal
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        make_event([{"filename": "src/app/views.py", "in_app": True}]),
+        make_event([{"filename": "SRC\\APP\\VIEWS.PY"}]),
+        make_event([{"abs_path": "/repo/docs/index.txt", "in_app": False}]),
+        make_event([{"filename": "web/views/checkout.js"}]),
+        make_event([{"module": "foo.bar", "filename": "a.js"}]),
+        make_event([{"filename": "other.rb"}], url="https://example.com/foo"),
+        make_event([], tags=[["foo", "bar"]]),
+        make_event([]),
+    ],
+)
+def test_same_rules_as_testing_every_rule(data):
+    rules = parse_rules(RULES)
+    compiled = CompiledRules(rules)
+
+    expected = [rule for rule in rules if rule.test(data, rule.matcher.munge_if_needed(data))]
+    assert compiled.get_matching_rules(data) == expected
+
+
+def test_only_candidates_are_tested(monkeypatch):
+    rules = parse_rules("\n".join(f"path:src/module{i}/* #team" for i in range(1000)))
+    compiled = CompiledRules(rules)
+    assert not compiled.unindexed
+
+    tested = []
+    original_test = type(rules[0]).test
+
+    def test(self, data, munged_data):
+        tested.append(self)
+        return original_test(self, data, munged_data)
+
+    monkeypatch.setattr(type(rules[0]), "test", test)
+    data = make_event([{"filename": "src/module12/views.py"}])
+    assert compiled.get_matching_rules(data) == [rules[12]]
+    # module12 contains module1 as well
+    assert tested == [rules[1], rules[12]]
+
+
+def test_get_compiled_rules_is_cached():
+    schema = dump_schema(parse_rules(RULES))
+    compiled = get_compiled_rules(("projectownership", 1, 1), schema)
+    assert get_compiled_rules(("projectownership", 1, 1), schema) is compiled
+    assert get_compiled_rules(("projectownership", 1, 2), schema) is not compiled
+    assert get_compiled_rules(None, schema) is not compiled
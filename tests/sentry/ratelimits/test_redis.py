@@ -65,6 +65,18 @@ class RedisRateLimiterTest(TestCase):
             assert value == 1
             assert reset_time == expected_reset_time + 5
 
+    def test_is_limited_many(self):
+        with freeze_time("2000-01-01"):
+            assert self.backend.is_limited_many(["foo", "bar", "foo", "foo"], 2) == [
+                False,
+                False,
+                False,
+                True,
+            ]
+            assert self.backend.current_value("foo") == 3
+            assert self.backend.is_limited("bar", 2) is False
+            assert self.backend.is_limited_many([], 2) == []
+
     def test_reset(self):
         with freeze_time("2000-01-01"):
             assert not self.backend.is_limited("foo", 1, self.project)
@@ -0,0 +1,190 @@
+from datetime import UTC, datetime, timedelta
+from unittest import mock
+from uuid import uuid4
+
+from django.utils import timezone
+
+from sentry.rules.conditions import frequency_counters
+from sentry.rules.conditions.event_frequency import (
+    EventFrequencyCondition,
+    EventFrequencyPercentCondition,
+    EventUniqueUserFrequencyCondition,
+)
+from sentry.rules.conditions.frequency_counters import FrequencyCounterType
+from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.datetime import freeze_time
+from sentry.testutils.helpers.options import override_options
+
+
+@freeze_time()
+class FrequencyCountersTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        frequency_counters.get_redis_client().flushdb()
+        frequency_counters._started_refreshed_at = None
+        self.now = timezone.now()
+        self.environment = self.create_environment(project=self.project)
+
+    def get_counts(self, counter_type, group_ids, environment_id=None, minutes=5):
+        return frequency_counters.get_counts(
+            counter_type,
+            group_ids,
+            environment_id,
+            self.now - timedelta(minutes=minutes),
+            self.now,
+        )
+
+    def test_counts_events(self):
+        for _ in range(3):
+            frequency_counters.record_event(1, uuid4().hex, self.environment.id, None, self.now)
+        frequency_counters.record_event(1, uuid4().hex, None, None, self.now - timedelta(minutes=2))
+        frequency_counters.record_event(2, uuid4().hex, self.environment.id, None, self.now)
+
+        assert self.get_counts(FrequencyCounterType.EVENTS, [1, 2, 3]) == {1: 4, 2: 1, 3: 0}
+        assert self.get_counts(FrequencyCounterType.EVENTS, [1], self.environment.id) == {1: 3}
+        assert self.get_counts(FrequencyCounterType.EVENTS, [1], minutes=1) == {1: 3}
+
+    def test_counts_unique_users(self):
+        for user in ("a", "b", "a"):
+            frequency_counters.record_event(1, uuid4().hex, self.environment.id, user, self.now)
+        frequency_counters.record_event(
+            1, uuid4().hex, self.environment.id, "c", self.now - timedelta(minutes=3)
+        )
+        frequency_counters.record_event(1, uuid4().hex, self.environment.id, None, self.now)
+
+        assert self.get_counts(FrequencyCounterType.USERS, [1]) == {1: 3}
+        assert self.get_counts(FrequencyCounterType.USERS, [1], minutes=1) == {1: 2}
+
+    def test_counts_events_once(self):
+        event_id = uuid4().hex
+        for _ in range(2):
+            frequency_counters.record_event(1, event_id, self.environment.id, "a", self.now)
+
+        assert self.get_counts(FrequencyCounterType.EVENTS, [1]) == {1: 1}
+        assert self.get_counts(FrequencyCounterType.EVENTS, [1], self.environment.id) == {1: 1}
+
+    def test_prorates_partial_buckets(self):
+        now = datetime(2026, 1, 1, 12, 0, 30, tzinfo=UTC)
+        with freeze_time(now):
+            # Half of the first minute of the window is within it.
+            for user in ("a", "b", "c", "d"):
+                frequency_counters.record_event(
+                    1, uuid4().hex, None, user, now - timedelta(minutes=5, seconds=20)
+                )
+            frequency_counters.record_event(1, uuid4().hex, None, "a", now - timedelta(minutes=3))
+            # The current minute is counted in full.
+            frequency_counters.record_event(1, uuid4().hex, None, "e", now)
+
+            start = now - timedelta(minutes=5)
+            assert frequency_counters.get_counts(
+                FrequencyCounterType.EVENTS, [1], None, start, now
+            ) == {1: 4}
+            assert frequency_counters.get_counts(
+                FrequencyCounterType.USERS, [1], None, start, now
+            ) == {1: 4}
+
+            # A quarter of the last minute of a window that ended is within it.
+            end = now - timedelta(minutes=1, seconds=15)
+            assert frequency_counters.get_counts(
+                FrequencyCounterType.EVENTS, [1], None, start, end
+            ) == {1: 3}
+
+    def test_ignores_events_older_than_retention(self):
+        frequency_counters.record_event(
+            1,
+            uuid4().hex,
+            None,
+            None,
+            self.now - frequency_counters.RETENTION - timedelta(minutes=1),
+        )
+        assert frequency_counters.get_redis_client().keys("rfc:*") == []
+
+    def test_can_serve(self):
+        with freeze_time(self.now - timedelta(hours=1, minutes=1)):
+            frequency_counters.record_event(1, uuid4().hex, None, None, timezone.now())
+
+        with override_options({"rules.frequency-counters.read": True}):
+            assert frequency_counters.can_serve(self.now - timedelta(hours=1), self.now)
+            assert not frequency_counters.can_serve(self.now - timedelta(days=1), self.now)
+        assert not frequency_counters.can_serve(self.now - timedelta(hours=1), self.now)
+
+    @override_options({"rules.frequency-counters.read": True})
+    def test_can_serve_after_warm_up(self):
+        assert not frequency_counters.can_serve(self.now - timedelta(minutes=5), self.now)
+
+        frequency_counters.record_event(1, uuid4().hex, None, None, self.now)
+        # Windows starting before the counters did are not complete.
+        assert not frequency_counters.can_serve(self.now - timedelta(minutes=5), self.now)
+
+        later = self.now + timedelta(minutes=6)
+        with freeze_time(later):
+            assert frequency_counters.can_serve(later - timedelta(minutes=5), later)
+            assert not frequency_counters.can_serve(later - timedelta(minutes=10), later)
+
+    def test_records_started_at(self):
+        assert frequency_counters.get_started_at() is None
+        frequency_counters.record_event(1, uuid4().hex, None, None, self.now)
+        started_at = frequency_counters.get_started_at()
+        assert started_at is not None
+        assert abs(started_at - self.now) < timedelta(seconds=1)
+        # The counters are started again when no events are recorded for a while.
+        assert (
+            frequency_counters.get_redis_client().ttl(frequency_counters.STARTED_KEY)
+            == frequency_counters.STARTED_KEY_TTL
+        )
+
+
+@freeze_time()
+class EventFrequencyConditionCountersTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        frequency_counters.get_redis_client().flushdb()
+        frequency_counters._started_refreshed_at = None
+        self.now = timezone.now()
+        with freeze_time(self.now - timedelta(hours=1)):
+            frequency_counters.record_event(0, uuid4().hex, None, None, timezone.now())
+
+    def get_condition(self, condition_cls, interval="5m"):
+        return condition_cls(
+            project=self.project, data={"interval": interval, "value": 1}, rule=mock.Mock()
+        )
+
+    @override_options({"rules.frequency-counters.read": True})
+    def test_batch_query_reads_counters(self):
+        frequency_counters.record_event(1, uuid4().hex, None, "a", self.now)
+        frequency_counters.record_event(1, uuid4().hex, None, "a", self.now)
+        frequency_counters.record_event(2, uuid4().hex, None, "b", self.now)
+        start = self.now - timedelta(minutes=5)
+
+        condition = self.get_condition(EventFrequencyCondition)
+        with mock.patch.object(condition, "batch_query_hook") as batch_query_hook:
+            assert condition.batch_query({1, 2}, start, self.now, None) == {1: 2, 2: 1}
+        assert not batch_query_hook.called
+
+        condition = self.get_condition(EventUniqueUserFrequencyCondition)
+        with mock.patch.object(condition, "batch_query_hook") as batch_query_hook:
+            assert condition.batch_query({1, 2}, start, self.now, None) == {1: 1, 2: 1}
+        assert not batch_query_hook.called
+
+    @override_options({"rules.frequency-counters.read": True})
+    def test_query_falls_back_to_snuba(self):
+        event = mock.Mock(group_id=1)
+
+        condition = self.get_condition(EventFrequencyCondition)
+        with mock.patch.object(condition, "query_hook", return_value=5) as query_hook:
+            assert condition.query(event, self.now - timedelta(days=7), self.now, None) == 5
+        assert query_hook.called
+
+        condition = self.get_condition(EventFrequencyPercentCondition)
+        with mock.patch.object(condition, "query_hook", return_value=5) as query_hook:
+            assert condition.query(event, self.now - timedelta(minutes=5), self.now, None) == 5
+        assert query_hook.called
+
+    def test_query_uses_snuba_when_disabled(self):
+        frequency_counters.record_event(1, uuid4().hex, None, None, self.now)
+        event = mock.Mock(group_id=1)
+
+        condition = self.get_condition(EventFrequencyCondition)
+        with mock.patch.object(condition, "query_hook", return_value=0) as query_hook:
+            assert condition.query(event, self.now - timedelta(minutes=5), self.now, None) == 0
+        assert query_hook.called
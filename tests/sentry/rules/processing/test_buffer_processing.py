@@ -8,6 +8,7 @@ from sentry.models.project import Project
 from sentry.rules.conditions.event_frequency import ComparisonType, EventFrequencyConditionData
 from sentry.rules.processing.buffer_processing import (
     bucket_num_groups,
+    process_across_projects,
     process_buffer,
     process_in_batches,
 )
@@ -292,3 +293,51 @@ class ProcessInBatchesTest(CreateEventTestCase):
 
         # Validate that we've cleared the original data to reduce storage usage
         assert not buffer.backend.get_hash(model=Project, field={"project_id": self.project.id})
+
+
+class ProcessAcrossProjectsTest(CreateEventTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.project = self.create_project()
+        self.project_two = self.create_project(organization=self.organization)
+        self.other_project = self.create_project(organization=self.create_organization())
+        self.rule = self.create_alert_rule()
+
+    @override_options({"delayed_processing.cross_project_batch_size": 10})
+    @patch("sentry.rules.processing.delayed_processing.apply_delayed_for_projects.delay")
+    def test_groups_projects_by_organization(self, mock_apply_delayed_for_projects):
+        for project in (self.project, self.project_two, self.other_project):
+            self.push_to_hash(project.id, self.rule.id, self.create_group(project).id)
+
+        process_across_projects(
+            [self.project.id, self.other_project.id, self.project_two.id], "delayed_processing"
+        )
+
+        assert sorted(
+            sorted(call.args[0]) for call in mock_apply_delayed_for_projects.call_args_list
+        ) == sorted([sorted([self.project.id, self.project_two.id]), [self.other_project.id]])
+
+    @override_options({"delayed_processing.cross_project_batch_size": 1})
+    @patch("sentry.rules.processing.delayed_processing.apply_delayed_for_projects.delay")
+    def test_chunks_projects(self, mock_apply_delayed_for_projects):
+        process_across_projects([self.project.id, self.project_two.id], "delayed_processing")
+
+        assert mock_apply_delayed_for_projects.call_count == 2
+
+    @override_options(
+        {"delayed_processing.cross_project_batch_size": 10, "delayed_processing.batch_size": 2}
+    )
+    @patch("sentry.rules.processing.delayed_processing.apply_delayed.delay")
+    @patch("sentry.rules.processing.delayed_processing.apply_delayed_for_projects.delay")
+    def test_large_projects_are_batched_alone(
+        self, mock_apply_delayed_for_projects, mock_apply_delayed
+    ):
+        for _ in range(3):
+            self.push_to_hash(self.project.id, self.rule.id, self.create_group(self.project).id)
+
+        process_across_projects([self.project.id, self.project_two.id], "delayed_processing")
+
+        mock_apply_delayed_for_projects.assert_called_once_with([self.project_two.id])
+        assert mock_apply_delayed.call_count == 2
+        assert {call.args[0] for call in mock_apply_delayed.call_args_list} == {self.project.id}
@@ -23,6 +23,7 @@ from sentry.rules.processing.delayed_processing import (
     DataAndGroups,
     UniqueConditionQuery,
     apply_delayed,
+    apply_delayed_for_projects,
     bulk_fetch_events,
     cleanup_redis_buffer,
     generate_unique_queries,
@@ -33,6 +34,7 @@ from sentry.rules.processing.delayed_processing import (
     get_rules_to_groups,
     get_slow_conditions,
     parse_rulegroup_to_event_data,
+    process_project_delayed_data,
 )
 from sentry.rules.processing.processor import PROJECT_ID_BUFFER_LIST_KEY, RuleProcessor
 from sentry.testutils.cases import RuleTestCase, TestCase
@@ -1322,6 +1324,90 @@ class ApplyDelayedTest(ProcessDelayedAlertConditionsTestBase):
         self._assert_count_percent_results(safe_execute_callthrough)
 
 
+class ApplyDelayedForProjectsTest(ProcessDelayedAlertConditionsTestBase):
+    @patch("sentry.rules.conditions.event_frequency.MIN_SESSIONS_TO_FIRE", 1)
+    def test_apply_delayed_for_projects_rules_to_fire(self):
+        self._push_base_events()
+        apply_delayed_for_projects([self.project.id, self.project_two.id])
+
+        rule_fire_histories = RuleFireHistory.objects.filter(
+            rule__in=[self.rule1, self.rule2, self.rule3, self.rule4],
+        ).values_list("rule", "group")
+        assert set(rule_fire_histories) == {
+            (self.rule1.id, self.group1.id),
+            (self.rule2.id, self.group2.id),
+            (self.rule3.id, self.group3.id),
+            (self.rule4.id, self.group4.id),
+        }
+        self.assert_buffer_cleared(project_id=self.project.id)
+        self.assert_buffer_cleared(project_id=self.project_two.id)
+
+    def test_apply_delayed_for_projects_nonexistent_project(self):
+        self._push_base_events()
+        project_two_id = self.project_two.id
+        self.project_two.delete()
+
+        apply_delayed_for_projects([self.project.id, project_two_id])
+
+        assert RuleFireHistory.objects.filter(project=self.project).count() == 2
+        self.assert_buffer_cleared(project_id=self.project.id)
+
+    def test_apply_delayed_for_projects_failed_project(self):
+        self._push_base_events()
+        buffer.backend.delete_key(PROJECT_ID_BUFFER_LIST_KEY, min=0, max=self.buffer_timestamp)
+
+        def process(project_data, condition_group_results):
+            if project_data.project.id == self.project_two.id:
+                raise ValueError("failed")
+            return process_project_delayed_data(project_data, condition_group_results)
+
+        with (
+            patch(
+                "sentry.rules.processing.delayed_processing.process_project_delayed_data",
+                side_effect=process,
+            ),
+            pytest.raises(ValueError),
+        ):
+            apply_delayed_for_projects([self.project.id, self.project_two.id])
+
+        # The other project is still processed, the failed one is processed by the next flush.
+        self.assert_buffer_cleared(project_id=self.project.id)
+        project_ids = buffer.backend.get_sorted_set(
+            PROJECT_ID_BUFFER_LIST_KEY, 0, self.buffer_timestamp
+        )
+        assert [project_id for project_id, _ in project_ids] == [self.project_two.id]
+
+    @patch("sentry.rules.processing.delayed_processing.safe_execute", side_effect=safe_execute)
+    def test_shares_queries_between_projects(self, safe_execute_callthrough):
+        rule = self.create_project_rule(
+            project=self.project_two,
+            condition_data=[self.event_frequency_condition],
+            environment_id=self.environment.id,
+        )
+        event = self.create_event(
+            self.project_two.id, FROZEN_TIME, "group-5", self.environment.name
+        )
+        self.create_event(self.project_two.id, FROZEN_TIME, "group-5", self.environment.name)
+        assert event.group
+        self.push_to_hash(self.project.id, self.rule1.id, self.group1.id, self.event1.event_id)
+        self.push_to_hash(self.project_two.id, rule.id, event.group.id, event.event_id)
+
+        apply_delayed_for_projects([self.project.id, self.project_two.id])
+
+        rule_fire_histories = RuleFireHistory.objects.filter(
+            rule__in=[self.rule1, rule]
+        ).values_list("rule", "group")
+        assert set(rule_fire_histories) == {
+            (self.rule1.id, self.group1.id),
+            (rule.id, event.group.id),
+        }
+        assert safe_execute_callthrough.call_count == 1
+        assert safe_execute_callthrough.call_args.kwargs["group_ids"] == {
+            self.group1.id,
+            event.group.id,
+        }
+
+
 class UniqueConditionQueryTest(TestCase):
     """
     Tests for the UniqueConditionQuery class. Currently, this is just to pass codecov.
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import datetime
 import re
+from copy import deepcopy
 from datetime import timezone
 
 import pytest
@@ -18,7 +19,12 @@ from sentry.search.events.types import ParamsType, QueryBuilderConfig
 from sentry.snuba.dataset import Dataset
 from sentry.snuba.referrer import Referrer
 from sentry.testutils.cases import TestCase
-from sentry.utils.snuba import QueryOutsideRetentionError, UnqualifiedQueryError, bulk_snuba_queries
+from sentry.utils.snuba import (
+    QueryOutsideRetentionError,
+    UnqualifiedQueryError,
+    _to_columnar,
+    bulk_snuba_queries,
+)
 from sentry.utils.validators import INVALID_ID_DETAILS
 
 pytestmark = pytest.mark.sentry_metrics
@@ -1001,3 +1007,30 @@ class DiscoverQueryBuilderTest(TestCase):
             ],
         )
         query.get_snql_query().validate()
+
+    def test_process_columnar_results(self):
+        query = DiscoverQueryBuilder(
+            Dataset.Discover,
+            self.params,
+            query="",
+            selected_columns=["user.email", "release", "p50(transaction.duration)"],
+        )
+        rows = {
+            "data": [
+                {
+                    "user.email": "foo@example.com",
+                    "release": "1.2.1",
+                    "p50_transaction_duration": 1.5,
+                },
+                {"user.email": None, "release": "1.2.2", "p50_transaction_duration": float("nan")},
+            ],
+            "meta": [
+                {"name": "user.email", "type": "Nullable(String)"},
+                {"name": "release", "type": "LowCardinality(Nullable(String))"},
+                {"name": "p50_transaction_duration", "type": "Float64"},
+            ],
+        }
+        columnar = deepcopy(rows)
+        _to_columnar(columnar)
+
+        assert query.process_results(columnar) == query.process_results(rows)
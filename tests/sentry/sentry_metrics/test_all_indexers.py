@@ -7,6 +7,7 @@ the mock indexer actually behaves the same as the postgres indexer.
 """
 
 from collections.abc import Mapping
+from unittest import mock
 
 import pytest
 
@@ -14,6 +15,7 @@ from sentry.sentry_metrics.indexer.base import FetchType, FetchTypeExt, Metadata
 from sentry.sentry_metrics.indexer.cache import (
     BULK_RECORD_CACHE_NAMESPACE,
     CachingIndexer,
+    LocalStringIndexerCache,
     StringIndexerCache,
 )
 from sentry.sentry_metrics.indexer.mock import RawSimpleIndexer
@@ -294,6 +296,49 @@ def test_resolve_and_reverse_resolve(indexer, indexer_cache, use_case_id):
         assert indexer.reverse_resolve(use_case_id=use_case_id, org_id=org1_id, id=1234) is None
 
 
+def test_local_cache(indexer, indexer_cache, use_case_id):
+    with override_options(
+        {
+            "sentry-metrics.indexer.read-new-cache-namespace": False,
+            "sentry-metrics.indexer.write-new-cache-namespace": False,
+            "sentry-metrics.indexer.local-cache.enabled": True,
+        }
+    ):
+        org_id = 1
+        caching_indexer = CachingIndexer(indexer_cache, indexer, LocalStringIndexerCache())
+
+        # Misses are cached before the string is indexed...
+        assert caching_indexer.resolve(use_case_id, org_id, "hello") is None
+        results = caching_indexer.bulk_record({use_case_id: {org_id: {"hello", "hey"}}})
+        id = results[use_case_id][org_id]["hello"]
+        assert id is not None
+
+        # ...and replaced once it is indexed in this process.
+        indexer_cache.cache.clear()
+        with (
+            mock.patch.object(indexer, "resolve") as resolve,
+            mock.patch.object(indexer, "reverse_resolve") as reverse_resolve,
+            mock.patch.object(indexer, "bulk_record") as bulk_record,
+        ):
+            assert caching_indexer.resolve(use_case_id, org_id, "hello") == id
+            assert caching_indexer.reverse_resolve(use_case_id, org_id, id) == "hello"
+            assert caching_indexer.bulk_reverse_resolve(use_case_id, org_id, [id, 1234]) == {
+                id: "hello"
+            }
+
+            results = caching_indexer.bulk_record({use_case_id: {org_id: {"hello"}}})
+            assert results[use_case_id][org_id]["hello"] == id
+            assert results.get_fetch_metadata()[use_case_id][org_id]["hello"] == Metadata(
+                id=id, fetch_type=FetchType.CACHE_HIT
+            )
+
+        assert not resolve.called
+        assert not reverse_resolve.called
+        assert not bulk_record.called
+        # Ids that are not mapped are left out, whether they were cached or not.
+        assert caching_indexer.bulk_reverse_resolve(use_case_id, org_id, [1234]) == {}
+
+
 def test_already_created_plus_written_results(indexer, indexer_cache, use_case_id) -> None:
     """
     Test that we correctly combine db read results with db write results
@@ -1,10 +1,15 @@
 from datetime import timedelta
+from unittest import mock
 
 import pytest
 from django.conf import settings
 from django.utils import timezone
 
-from sentry.sentry_metrics.indexer.cache import StringIndexerCache
+from sentry.sentry_metrics.indexer.cache import (
+    NOT_CACHED,
+    LocalStringIndexerCache,
+    StringIndexerCache,
+)
 from sentry.sentry_metrics.use_case_id_registry import UseCaseID
 from sentry.testutils.helpers.options import override_options
 from sentry.utils.cache import cache
@@ -240,3 +245,41 @@ def test_is_valid_timestamp() -> None:
 
     assert not indexer_cache._is_valid_timestamp(str(stale_ts))
     assert indexer_cache._is_valid_timestamp(str(new_ts))
+
+
+def test_local_cache() -> None:
+    local_cache = LocalStringIndexerCache(max_size=2)
+    with (
+        override_options(
+            {
+                "sentry-metrics.indexer.local-cache.ttl": 100,
+                "sentry-metrics.indexer.local-cache.negative-ttl": 10,
+            }
+        ),
+        mock.patch("sentry.sentry_metrics.indexer.cache.time.monotonic") as monotonic,
+    ):
+        monotonic.return_value = 1000.0
+        assert local_cache.get("sessions:1:a") is NOT_CACHED
+        local_cache.set_many({"sessions:1:a": 1, "sessions:1:b": None})
+        assert local_cache.get("sessions:1:a") == 1
+        assert local_cache.get("sessions:1:b") is None
+        assert local_cache.get_many(["sessions:1:a", "sessions:1:b", "sessions:1:c"]) == {
+            "sessions:1:a": 1,
+            "sessions:1:b": None,
+        }
+
+        # The least recently used entry is evicted.
+        local_cache.get("sessions:1:a")
+        local_cache.set("sessions:1:c", 3)
+        assert local_cache.get_many(["sessions:1:a", "sessions:1:b", "sessions:1:c"]) == {
+            "sessions:1:a": 1,
+            "sessions:1:c": 3,
+        }
+
+        # Misses expire much sooner than ids, both with up to 25% jitter.
+        local_cache.set("sessions:1:b", None)
+        monotonic.return_value = 1000.0 + 13
+        assert local_cache.get("sessions:1:b") is NOT_CACHED
+        assert local_cache.get("sessions:1:c") == 3
+        monotonic.return_value = 1000.0 + 126
+        assert local_cache.get("sessions:1:c") is NOT_CACHED
@@ -17,6 +17,7 @@ from sentry.snuba.models import SnubaQuery
 from sentry.snuba.query_subscriptions.consumer import (
     InvalidSchemaError,
     parse_message_value,
+    register_batch_subscriber,
     register_subscriber,
     subscriber_registry,
 )
@@ -138,6 +139,57 @@ class HandleMessageTest(BaseQuerySubscriptionTest, TestCase):
         )
         mock_callback.assert_called_once_with(data["payload"], sub)
 
+    def test_arroyo_consumer_batched(self):
+        registration_key = "registered_test_batched"
+        mock_callback = mock.Mock()
+        mock_batch_callback = mock.Mock()
+        register_subscriber(registration_key)(mock_callback)
+        register_batch_subscriber(registration_key)(mock_batch_callback)
+        with self.tasks():
+            snuba_query = create_snuba_query(
+                SnubaQuery.Type.ERROR,
+                Dataset.Events,
+                "hello",
+                "count()",
+                timedelta(minutes=10),
+                timedelta(minutes=1),
+                None,
+            )
+            sub = create_snuba_subscription(self.project, registration_key, snuba_query)
+        sub.refresh_from_db()
+
+        data = deepcopy(self.valid_wrapper)
+        data["payload"]["subscription_id"] = sub.subscription_id
+        partition = Partition(ArroyoTopic("test"), 0)
+        strategy = QuerySubscriptionStrategyFactory(
+            self.dataset.value,
+            2,
+            1,
+            1,
+            DEFAULT_BLOCK_SIZE,
+            DEFAULT_BLOCK_SIZE,
+            mode="batched",
+        ).create_with_partitions(mock.Mock(), {partition: 0})
+        for offset in (1, 2):
+            strategy.submit(
+                Message(
+                    BrokerValue(
+                        KafkaPayload(b"key", json.dumps(data).encode("utf-8"), []),
+                        partition,
+                        offset,
+                        datetime.now(),
+                    )
+                )
+            )
+        strategy.close()
+        strategy.join()
+
+        # Both updates are passed to the batch subscriber at once
+        assert not mock_callback.called
+        (updates,), _ = mock_batch_callback.call_args
+        assert [subscription for _, subscription in updates] == [sub, sub]
+        assert updates[0][0]["subscription_id"] == sub.subscription_id
+
 
 class ParseMessageValueTest(BaseQuerySubscriptionTest, unittest.TestCase):
     def run_test(self, message):
@@ -324,3 +324,112 @@ def test_moving_average_relative_change_detector(
 
     assert all_regressed == [payloads[i] for i in regressed_indices]
     assert all_improved == [payloads[i] for i in improved_indices]
+
+
+@pytest.mark.parametrize(
+    "state",
+    [
+        pytest.param(
+            MovingAverageDetectorState(
+                timestamp=datetime(2023, 8, 31, 11, 28, 52, tzinfo=timezone.utc),
+                count=10,
+                moving_avg_short=10.5,
+                moving_avg_long=9.25,
+            ),
+            id="with timestamp",
+        ),
+        pytest.param(
+            MovingAverageDetectorState(
+                timestamp=None,
+                count=10,
+                moving_avg_short=10,
+                moving_avg_long=10,
+            ),
+            id="without timestamp",
+        ),
+    ],
+)
+def test_moving_average_detector_state_bytes_round_trip(state):
+    data = state.to_bytes()
+    assert len(data) == MovingAverageDetectorState.PACKED_FORMAT.size
+    assert MovingAverageDetectorState.from_bytes(data) == state
+
+
+def test_moving_average_detector_state_from_bytes_unknown_version():
+    data = MovingAverageDetectorState.PACKED_FORMAT.pack(0, -1, 1, 1.0, 1.0)
+    with pytest.raises(ValueError):
+        MovingAverageDetectorState.from_bytes(data)
+
+
+def test_moving_average_relative_change_detector_update_batch():
+    now = datetime(2023, 8, 31, 11, 28, 52, tzinfo=timezone.utc)
+
+    detector = MovingAverageRelativeChangeDetector(
+        "transaction",
+        "endpoint",
+        min_data_points=6,
+        moving_avg_short_factory=lambda: ExponentialMovingAverage(2 / 21),
+        moving_avg_long_factory=lambda: ExponentialMovingAverage(2 / 41),
+        threshold=0.1,
+    )
+
+    series = [
+        [1 for _ in range(10)] + [2 for _ in range(10)],
+        [2 for _ in range(10)] + [1 for _ in range(10)],
+        [(i / 10) ** 2 for i in range(-10, 10)],
+    ]
+
+    dict_states: list[Mapping[str | bytes, bytes | float | int | str]] = [{} for _ in series]
+    packed_states: list[bytes] = [b"" for _ in series]
+
+    for i in range(len(series[0])):
+        payloads = [
+            DetectorPayload(
+                project_id=1,
+                group=j,
+                fingerprint=str(j),
+                count=i + 1,
+                value=values[i],
+                timestamp=now + timedelta(hours=i + 1),
+            )
+            for j, values in enumerate(series)
+        ]
+
+        expected = [
+            detector.update(state, payload) for state, payload in zip(dict_states, payloads)
+        ]
+        results = detector.update_batch(packed_states, payloads)
+        assert results == expected
+
+        dict_states = [state.to_redis_dict() for _, _, state in expected if state is not None]
+        packed_states = [state.to_bytes() for _, _, state in results if state is not None]
+
+
+def test_moving_average_relative_change_detector_update_batch_skips_out_of_order():
+    now = datetime(2023, 8, 31, 11, 28, 52, tzinfo=timezone.utc)
+
+    detector = MovingAverageRelativeChangeDetector(
+        "transaction",
+        "endpoint",
+        min_data_points=6,
+        moving_avg_short_factory=lambda: ExponentialMovingAverage(2 / 21),
+        moving_avg_long_factory=lambda: ExponentialMovingAverage(2 / 41),
+        threshold=0.1,
+    )
+
+    state = MovingAverageDetectorState(
+        timestamp=now, count=10, moving_avg_short=1, moving_avg_long=1
+    )
+    payload = DetectorPayload(
+        project_id=1,
+        group=0,
+        fingerprint="0",
+        count=1,
+        value=1,
+        timestamp=now - timedelta(hours=1),
+    )
+
+    assert detector.update_batch([state.to_bytes(), b""], [payload, payload]) == [
+        (TrendType.Skipped, 0, None),
+        detector.update({}, payload),
+    ]
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from sentry.models.statistical_detectors import RegressionType
+from sentry.statistical_detectors.algorithm import MovingAverageDetectorState
+from sentry.statistical_detectors.base import DetectorPayload
+from sentry.statistical_detectors.redis import RedisDetectorStore
+
+
+@pytest.fixture
+def payload():
+    return DetectorPayload(
+        project_id=1,
+        group="foo",
+        fingerprint="foo",
+        count=100,
+        value=1.0,
+        timestamp=datetime(2023, 8, 31, 11, 0, 0, tzinfo=timezone.utc),
+    )
+
+
+@pytest.fixture
+def state():
+    return MovingAverageDetectorState(
+        timestamp=datetime(2023, 8, 31, 11, 0, 0, tzinfo=timezone.utc),
+        count=10,
+        moving_avg_short=1.5,
+        moving_avg_long=1.25,
+    )
+
+
+def write_state(store, payload, state):
+    [raw_state] = store.bulk_read_states([payload])
+    store.bulk_write_states([payload], [store.encode_state(state, raw_state)])
+
+
+def read_state(store, payload):
+    [raw_state] = store.bulk_read_states([payload])
+    if isinstance(raw_state, bytes):
+        return MovingAverageDetectorState.from_bytes(raw_state)
+    return MovingAverageDetectorState.from_redis_dict(raw_state)
+
+
+@pytest.mark.parametrize("packed", [True, False])
+def test_unchanged_states_are_not_written(packed, payload, state):
+    store = RedisDetectorStore(RegressionType.ENDPOINT, packed=packed)
+    write_state(store, payload, state)
+
+    [raw_state] = store.bulk_read_states([payload])
+    assert store.encode_state(state, raw_state) is None
+
+    changed = MovingAverageDetectorState(
+        timestamp=state.timestamp,
+        count=state.count + 1,
+        moving_avg_short=state.moving_avg_short,
+        moving_avg_long=state.moving_avg_long,
+    )
+    assert store.encode_state(changed, raw_state) is not None
+
+
+@pytest.mark.parametrize("packed", [True, False])
+def test_switching_formats_never_reads_stale_states(packed, payload, state):
+    store = RedisDetectorStore(RegressionType.ENDPOINT, packed=packed)
+    other_store = RedisDetectorStore(RegressionType.ENDPOINT, packed=not packed)
+
+    write_state(store, payload, state)
+    assert read_state(other_store, payload) == state
+
+    newer = MovingAverageDetectorState(
+        timestamp=state.timestamp,
+        count=state.count + 1,
+        moving_avg_short=2.0,
+        moving_avg_long=1.75,
+    )
+    write_state(other_store, payload, newer)
+    assert read_state(other_store, payload) == newer
+
+    # switching back reads the newer state, not the one left in the first format
+    assert read_state(store, payload) == newer
@@ -17,7 +17,7 @@ from sentry_protos.taskbroker.v1.taskbroker_pb2 import (
     TaskActivation,
 )
 
-from sentry.taskworker.client import TaskworkerClient
+from sentry.taskworker.client import TaskStatusUpdate, TaskworkerClient
 from sentry.testutils.pytest.fixtures import django_db_all
 
 
@@ -53,6 +53,12 @@ class MockServiceMethod:
             raise res.response
         return res.response
 
+    def future(self, *args, **kwargs):
+        try:
+            return MockFuture(self(*args, **kwargs))
+        except MockGrpcError as err:
+            return err
+
     def with_call(self, *args, **kwargs):
         res = self.responses[0]
         if res.metadata:
@@ -62,6 +68,14 @@ class MockServiceMethod:
         return (res.response, None)
 
 
+class MockFuture:
+    def __init__(self, response: Any):
+        self._response = response
+
+    def result(self):
+        return self._response
+
+
 class MockChannel:
     def __init__(self):
         self._responses = defaultdict(list)
@@ -218,6 +232,93 @@ def test_get_task_failure():
             client.get_task()
 
 
+@django_db_all
+def test_get_tasks():
+    channel = MockChannel()
+    for task_id in ("abc123", "def456"):
+        channel.add_response(
+            "/sentry_protos.taskbroker.v1.ConsumerService/GetTask",
+            GetTaskResponse(
+                task=TaskActivation(
+                    id=task_id,
+                    namespace="testing",
+                    taskname="do_thing",
+                    parameters="",
+                    headers={},
+                    processing_deadline_duration=10,
+                )
+            ),
+        )
+    channel.add_response(
+        "/sentry_protos.taskbroker.v1.ConsumerService/GetTask",
+        MockGrpcError(grpc.StatusCode.NOT_FOUND, "no pending task found"),
+    )
+    channel.add_response(
+        "/sentry_protos.taskbroker.v1.ConsumerService/GetTask",
+        MockGrpcError(grpc.StatusCode.INTERNAL, "something bad"),
+    )
+    with patch("sentry.taskworker.client.grpc.insecure_channel") as mock_channel:
+        mock_channel.return_value = channel
+        client = TaskworkerClient("localhost:50051", 1)
+
+        # Errors are only raised if no task was fetched.
+        tasks = client.get_tasks(limit=4)
+        assert [task.id for task in tasks] == ["abc123", "def456"]
+        assert client._task_id_to_host == {
+            "abc123": "localhost-0:50051",
+            "def456": "localhost-0:50051",
+        }
+
+        with pytest.raises(grpc.RpcError):
+            client.get_tasks(limit=2)
+
+
+@django_db_all
+def test_update_tasks():
+    channel = MockChannel()
+    channel.add_response(
+        "/sentry_protos.taskbroker.v1.ConsumerService/SetTaskStatus",
+        SetTaskStatusResponse(
+            task=TaskActivation(
+                id="ghi789",
+                namespace="testing",
+                taskname="do_thing",
+                parameters="",
+                headers={},
+                processing_deadline_duration=10,
+            )
+        ),
+    )
+    channel.add_response(
+        "/sentry_protos.taskbroker.v1.ConsumerService/SetTaskStatus",
+        MockGrpcError(grpc.StatusCode.UNAVAILABLE, "broker unavailable"),
+    )
+    with patch("sentry.taskworker.client.grpc.insecure_channel") as mock_channel:
+        mock_channel.return_value = channel
+        client = TaskworkerClient("localhost:50051", 1)
+        client._task_id_to_host = {
+            "abc123": "localhost-0:50051",
+            "def456": "localhost-0:50051",
+        }
+        results = client.update_tasks(
+            [
+                TaskStatusUpdate(
+                    "abc123", TASK_ACTIVATION_STATUS_COMPLETE, FetchNextTask(namespace=None)
+                ),
+                TaskStatusUpdate("def456", TASK_ACTIVATION_STATUS_RETRY),
+                TaskStatusUpdate("unknown", TASK_ACTIVATION_STATUS_COMPLETE),
+            ]
+        )
+
+        next_task, error, unknown = results
+        assert isinstance(next_task, TaskActivation)
+        assert next_task.id == "ghi789"
+        assert isinstance(error, grpc.RpcError)
+        assert error.code() == grpc.StatusCode.UNAVAILABLE
+        assert unknown is None
+        assert client._task_id_to_host == {"ghi789": "localhost-0:50051"}
+
+
 @django_db_all
 def test_update_task_ok_with_next():
     channel = MockChannel()
@@ -1,5 +1,7 @@
 import queue
+import threading
 import time
+from collections import deque
 from multiprocessing import Event
 from unittest import mock
 
@@ -15,6 +17,7 @@ from sentry_protos.taskbroker.v1.taskbroker_pb2 import (
 )
 from sentry_sdk.crons import MonitorStatus
 
+from sentry.taskworker.client import TaskStatusUpdate
 from sentry.taskworker.state import current_task
 from sentry.taskworker.worker import TaskWorker
 from sentry.taskworker.workerchild import (
@@ -92,6 +95,68 @@ SCHEDULED_TASK = TaskActivation(
 )
 
 
+class FakeBroker:
+    """
+    In-process stand-in for the brokers behind `TaskworkerClient`. Tasks are
+    delivered again once their processing deadline passed without a status update.
+    """
+
+    def __init__(self, tasks: list[TaskActivation]) -> None:
+        self.pending = deque(tasks)
+        self.inflight: dict[str, tuple[TaskActivation, float]] = {}
+        self.statuses: list[tuple[str, int]] = []
+        self.update_batch_sizes: list[int] = []
+        self.clock = 0.0
+        self._lock = threading.Lock()
+
+    def advance(self, seconds: float) -> None:
+        with self._lock:
+            self.clock += seconds
+
+    def _next_task(self) -> TaskActivation | None:
+        for task_id, (task, deadline) in list(self.inflight.items()):
+            if self.clock > deadline:
+                del self.inflight[task_id]
+                self.pending.append(task)
+        if not self.pending:
+            return None
+        task = self.pending.popleft()
+        self.inflight[task.id] = (task, self.clock + task.processing_deadline_duration)
+        return task
+
+    def get_task(self, namespace: str | None = None) -> TaskActivation | None:
+        tasks = self.get_tasks(namespace)
+        return tasks[0] if tasks else None
+
+    def get_tasks(self, namespace: str | None = None, limit: int = 1) -> list[TaskActivation]:
+        with self._lock:
+            tasks = [self._next_task() for _ in range(limit)]
+        return [task for task in tasks if task is not None]
+
+    def update_tasks(self, updates: list[TaskStatusUpdate]) -> list[TaskActivation | None]:
+        results = []
+        with self._lock:
+            self.update_batch_sizes.append(len(updates))
+            for update in updates:
+                if self.inflight.pop(update.task_id, None) is None:
+                    # The processing deadline has passed.
+                    results.append(None)
+                    continue
+                self.statuses.append((update.task_id, update.status))
+                results.append(self._next_task() if update.fetch_next_task else None)
+        return results
+
+
+def make_simple_tasks(count: int) -> list[TaskActivation]:
+    tasks = []
+    for i in range(count):
+        task = TaskActivation()
+        task.CopyFrom(SIMPLE_TASK)
+        task.id = f"simple-{i}"
+        tasks.append(task)
+    return tasks
+
+
 @pytest.mark.django_db
 class TestTaskWorker(TestCase):
     def test_tasks_exist(self) -> None:
@@ -272,6 +337,91 @@ class TestTaskWorker(TestCase):
             assert redis.get("no-retries-remaining"), "key should exist if except block was hit"
             redis.delete("no-retries-remaining")
 
+    def test_run_batched(self) -> None:
+        max_runtime = 10
+        tasks = make_simple_tasks(8)
+        broker = FakeBroker(tasks)
+        taskworker = TaskWorker(
+            rpc_host="127.0.0.1:50051",
+            num_brokers=1,
+            max_child_task_count=100,
+            process_type="fork",
+            batch_size=3,
+        )
+        taskworker.client = broker  # type: ignore[assignment]
+        taskworker.start_result_thread()
+        taskworker.start_spawn_children_thread()
+
+        start = time.time()
+        while len(broker.statuses) < len(tasks):
+            taskworker.run_once()
+            if time.time() - start > max_runtime:
+                taskworker.shutdown()
+                raise AssertionError("Timeout waiting for tasks to complete")
+        taskworker.shutdown()
+
+        # Every task is executed and reported exactly once.
+        assert sorted(broker.statuses) == sorted(
+            (task.id, TASK_ACTIVATION_STATUS_COMPLETE) for task in tasks
+        )
+        assert not broker.pending
+        assert not broker.inflight
+        assert max(broker.update_batch_sizes) <= 3
+
+    def test_fetch_tasks_bounded_by_capacity(self) -> None:
+        broker = FakeBroker(make_simple_tasks(10))
+        taskworker = TaskWorker(
+            rpc_host="127.0.0.1:50051",
+            num_brokers=1,
+            max_child_task_count=100,
+            process_type="fork",
+            child_tasks_queue_maxsize=2,
+            batch_size=5,
+        )
+        taskworker.client = broker  # type: ignore[assignment]
+
+        assert taskworker.run_once() is None
+        # Wait for the queue feeder thread.
+        start = time.time()
+        while taskworker._child_tasks.qsize() < 2 and time.time() - start < 5:
+            time.sleep(0.01)
+
+        assert [task_id for task_id in broker.inflight] == ["simple-0", "simple-1"]
+        assert not taskworker._add_task()
+        assert len(broker.inflight) == 2
+
+    def test_expired_task_delivered_again(self) -> None:
+        (task,) = make_simple_tasks(1)
+        broker = FakeBroker([task])
+        taskworker = TaskWorker(
+            rpc_host="127.0.0.1:50051",
+            num_brokers=1,
+            max_child_task_count=100,
+            process_type="fork",
+            batch_size=2,
+        )
+        taskworker.client = broker  # type: ignore[assignment]
+
+        (fetched,) = taskworker.fetch_tasks(2)
+        # The task could not be handed to a child before its deadline.
+        taskworker._task_receive_timing[fetched.id] -= task.processing_deadline_duration + 1
+        taskworker._put_child_task(fetched)
+        with pytest.raises(queue.Empty):
+            taskworker._child_tasks.get(timeout=0.1)
+
+        # Nothing is delivered until the broker sees the deadline pass.
+        assert taskworker.fetch_tasks(2) == []
+        broker.advance(task.processing_deadline_duration + 1)
+        (redelivered,) = taskworker.fetch_tasks(2)
+        assert redelivered.id == task.id
+
+        # The task is executed from its second delivery.
+        taskworker._send_results(
+            [ProcessingResult(task_id=task.id, status=TASK_ACTIVATION_STATUS_COMPLETE)]
+        )
+        assert broker.statuses == [(task.id, TASK_ACTIVATION_STATUS_COMPLETE)]
+        assert not broker.inflight
+
 
 @pytest.mark.django_db
 @mock.patch("sentry.taskworker.workerchild.capture_checkin")
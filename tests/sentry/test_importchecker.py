@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+
+def test_import_profile(tmp_path):
+    prog = """\
+import sys
+sys.argv = ["sentry", "run", "worker", "--concurrency", "4"]
+import sentry.api.helpers.mobile
+"""
+    env = dict(os.environ, SENTRY_PROFILE_IMPORTS="1", SENTRY_PROFILE_IMPORTS_DIR=str(tmp_path))
+    env.pop("SENTRY_TRACK_IMPORTS", None)
+    subprocess.check_call((sys.executable, "-c", prog), env=env)
+
+    report = (tmp_path / "import-profile-sentry-run-worker.txt").read_text()
+    assert "Entry point: sentry run worker --concurrency 4\n" in report
+    assert "Slowest imports:\n" in report
+    assert " sentry.api.helpers.mobile\n" in report
+    # The table of Android devices is only imported once it is used.
+    assert "sentry.api.helpers.android_models" not in report
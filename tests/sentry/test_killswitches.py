@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from unittest import mock
+
 import pytest
 
-from sentry.killswitches import _value_matches, normalize_value
+from sentry.killswitches import KillswitchMatcher, _value_matches, normalize_value
+from sentry.testutils.helpers.options import override_options
 
 
 def test_normalize_value():
@@ -97,3 +100,21 @@ def test_value_matches_positive(cfg, value):
 )
 def test_value_matches_negative(cfg, value):
     assert not _value_matches("store.load-shed-group-creation-projects", cfg, value)
+
+
+@override_options({"store.load-shed-pipeline-projects": [{"project_id": 2}]})
+def test_killswitch_matcher():
+    matcher = KillswitchMatcher("store.load-shed-pipeline-projects")
+    assert matcher.fields == ["project_id"]
+
+    with mock.patch("sentry.killswitches._value_matches", wraps=_value_matches) as value_matches:
+        for event_id in ("a", "b", "c"):
+            assert matcher.matches(
+                {"project_id": 2, "event_id": event_id, "has_attachments": False}
+            )
+            assert not matcher.matches(
+                {"project_id": 3, "event_id": event_id, "has_attachments": False}
+            )
+
+    # Contexts that only differ in unused fields share a result.
+    assert value_matches.call_count == 2
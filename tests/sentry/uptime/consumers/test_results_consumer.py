@@ -1,4 +1,5 @@
 import abc
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
 from hashlib import md5
@@ -28,9 +29,13 @@ from sentry.testutils.abstract import Abstract
 from sentry.testutils.helpers.datetime import freeze_time
 from sentry.testutils.helpers.options import override_options
 from sentry.uptime.consumers.results_consumer import (
+    ACTIVE_THRESHOLD_REDIS_TTL,
     AUTO_DETECTED_ACTIVE_SUBSCRIPTION_INTERVAL,
+    LAST_UPDATE_REDIS_TTL,
     ONBOARDING_MONITOR_PERIOD,
+    UptimeResultProcessor,
     UptimeResultsStrategyFactory,
+    build_active_consecutive_status_key,
     build_last_update_key,
     build_onboarding_failure_key,
 )
@@ -1339,6 +1344,97 @@ class ProcessResultSerialTest(ProcessResultTest):
         assert group_1 == [result_1, result_2]
         assert group_2 == [result_3]
 
+    def test_local_state(self):
+        redis = _get_cluster()
+        last_update_key = build_last_update_key(self.project_subscription)
+        failure_key = build_active_consecutive_status_key(
+            self.project_subscription, CHECKSTATUS_FAILURE
+        )
+        processor = UptimeResultProcessor(local_state=True)
+
+        result_1 = self.create_uptime_result(
+            self.subscription.subscription_id,
+            scheduled_check_time=datetime.now() - timedelta(minutes=5),
+        )
+        result_2 = self.create_uptime_result(
+            self.subscription.subscription_id,
+            scheduled_check_time=datetime.now() - timedelta(minutes=4),
+        )
+        with (
+            self.feature(
+                [
+                    "organizations:uptime",
+                    "organizations:uptime-create-issues",
+                    UptimeDomainCheckFailure.build_ingest_feature_name(),
+                ]
+            ),
+            mock.patch(
+                "sentry.uptime.consumers.results_consumer.get_active_failure_threshold",
+                return_value=2,
+            ),
+        ):
+            processor(result_1)
+            # Nothing is written to redis until the state is flushed
+            assert redis.get(last_update_key) is None
+            assert redis.get(failure_key) is None
+
+            processor.flush()
+            assert redis.get(last_update_key) == str(result_1["scheduled_check_time_ms"])
+            assert redis.get(failure_key) == "1"
+
+            # The state is kept in memory
+            redis.delete(last_update_key, failure_key)
+            processor(result_1)
+            processor(result_2)
+
+        self.project_subscription.refresh_from_db()
+        assert self.project_subscription.uptime_status == UptimeStatus.FAILED
+
+        processor.flush()
+        assert redis.get(last_update_key) == str(result_2["scheduled_check_time_ms"])
+        assert redis.get(failure_key) == "2"
+
+        # Once reset, the state is loaded from redis again
+        redis.set(failure_key, 5)
+        processor.reset()
+        assert processor.get_state([failure_key]) == [5]
+
+    def test_local_state_expires(self):
+        redis = _get_cluster()
+        failure_key = build_active_consecutive_status_key(
+            self.project_subscription, CHECKSTATUS_FAILURE
+        )
+        processor = UptimeResultProcessor(local_state=True)
+        processor.set_state(failure_key, 3, ACTIVE_THRESHOLD_REDIS_TTL)
+        processor.flush()
+        assert redis.pttl(failure_key) > 0
+
+        redis.set(failure_key, 5)
+        assert processor.get_state([failure_key]) == [3]
+
+        # Expired state is loaded from redis again, like keys that are not known
+        expired = time.monotonic() + ACTIVE_THRESHOLD_REDIS_TTL.total_seconds() + 1
+        with mock.patch("time.monotonic", return_value=expired):
+            assert processor.get_state([failure_key]) == [5]
+
+    def test_local_state_is_bounded(self):
+        with mock.patch("sentry.uptime.consumers.results_consumer.LOCAL_STATE_MAX_SIZE", 2):
+            processor = UptimeResultProcessor(local_state=True)
+        for i in range(3):
+            processor.set_state(f"key:{i}", i + 1, LAST_UPDATE_REDIS_TTL)
+        assert len(processor._state) == 2
+
+        # Evicted values that were not written yet are still known
+        assert processor.get_state(["key:0", "key:1", "key:2"]) == [1, 2, 3]
+
+    def test_local_state_batched_parallel_only(self):
+        factory = UptimeResultsStrategyFactory(mode="batched-parallel", local_state=True)
+        assert factory.result_processor.local_state
+        factory.shutdown()
+
+        factory = UptimeResultsStrategyFactory(mode="serial", local_state=True)
+        assert not factory.result_processor.local_state
+
 
 class ProcessResultParallelTest(ProcessResultTest):
     strategy_processing_mode = "parallel"
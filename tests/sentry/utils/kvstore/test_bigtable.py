@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import functools
 import os
+from unittest import mock
 
 import pytest
+from google.api_core import exceptions
+from google.rpc.status_pb2 import Status
 
-from sentry.utils.kvstore.bigtable import BigtableKVStorage
+from sentry.utils.kvstore.bigtable import BigtableError, BigtableKVStorage
 
 
 def create_store(request, compression: str | None = None) -> BigtableKVStorage:
@@ -80,3 +83,32 @@ def test_compression_compatibility(request, store_factory) -> None:
 
         for reader in stores.values():
             assert reader.get(key) == value
+
+
+def test_set_many_retries_once() -> None:
+    store = BigtableKVStorage(project="test", instance="test", table_name="test")
+    table = mock.Mock()
+    table.mutate_rows.side_effect = [
+        exceptions.ServiceUnavailable("unavailable"),
+        [Status(code=0), Status(code=0)],
+    ]
+    store._BigtableKVStorage__table = table  # type: ignore[attr-defined]
+
+    with mock.patch.object(store, "_get_table", return_value=table):
+        store.set_many([("a", b"a"), ("b", b"b")])
+
+    assert table.mutate_rows.call_count == 2
+    # The cached table was dropped before the retry.
+    assert not hasattr(store, "_BigtableKVStorage__table")
+
+
+def test_set_many_error() -> None:
+    store = BigtableKVStorage(project="test", instance="test", table_name="test")
+    table = mock.Mock()
+    table.mutate_rows.return_value = [Status(code=0), Status(code=13, message="internal")]
+
+    with mock.patch.object(store, "_get_table", return_value=table):
+        with pytest.raises(BigtableError) as excinfo:
+            store.set_many([("a", b"a"), ("b", b"b")])
+
+    assert excinfo.value.args == (13, "internal")
@@ -1,9 +1,12 @@
+import array
 import unittest
 from datetime import datetime, timedelta
 from unittest import mock
 
+import orjson
 import pytest
 from django.utils import timezone
+from snuba_sdk import Column, Condition, Entity, Op, Query, Request
 from urllib3 import HTTPConnectionPool
 from urllib3.exceptions import HTTPError, ReadTimeoutError
 
@@ -23,6 +26,7 @@ from sentry.utils.snuba import (
     get_snuba_column_name,
     get_snuba_translators,
     quantize_time,
+    raw_snql_query,
 )
 
 
@@ -443,3 +447,60 @@ def test_retries():
         snuba_pool.urlopen("POST", "/query", body="{}")
 
     assert connection_mock.request.call_count == 1
+
+
+class RawSnqlQueryResultTest(TestCase):
+    def setUp(self):
+        self.request = Request(
+            dataset="events",
+            app_id="tests",
+            query=Query(
+                match=Entity("events"),
+                select=[Column("project_id"), Column("title"), Column("count")],
+                where=[Condition(Column("project_id"), Op.EQ, self.project.id)],
+            ),
+            tenant_ids={"organization_id": self.organization.id},
+        )
+        self.body = {
+            "data": [
+                {"project_id": self.project.id, "title": "a", "count": 1, "avg": 0.5},
+                {"project_id": self.project.id, "title": "b", "count": 2, "avg": None},
+            ],
+            "meta": [
+                {"name": "project_id", "type": "UInt64"},
+                {"name": "title", "type": "String"},
+                {"name": "count", "type": "UInt64"},
+                {"name": "avg", "type": "Float64"},
+            ],
+        }
+
+    def query(self, **kwargs):
+        response = mock.Mock(status=200, data=orjson.dumps(self.body))
+        with mock.patch("sentry.utils.snuba._raw_snql_query", return_value=response):
+            return raw_snql_query(self.request, referrer="test", **kwargs)
+
+    def test_rows(self):
+        assert self.query() == self.body
+
+    def test_columns(self):
+        result = self.query(columns=["title", "count"])
+        assert result["data"] == [{"title": "a", "count": 1}, {"title": "b", "count": 2}]
+        assert result["meta"] == [
+            {"name": "title", "type": "String"},
+            {"name": "count", "type": "UInt64"},
+        ]
+
+    def test_columnar(self):
+        result = self.query(columnar=True)
+        assert result["data"] == {
+            "project_id": array.array("Q", [self.project.id] * 2),
+            "title": ["a", "b"],
+            "count": array.array("Q", [1, 2]),
+            # nulls are kept in lists
+            "avg": [0.5, None],
+        }
+
+    def test_columnar_no_rows(self):
+        self.body["data"] = []
+        result = self.query(columns=["count"], columnar=True)
+        assert result["data"] == {"count": array.array("Q")}
@@ -0,0 +1,110 @@
+from sentry.eventstream.base import GroupState
+from sentry.grouping.grouptype import ErrorGroupType
+from sentry.testutils.helpers import override_options
+from sentry.workflow_engine.models import DataConditionGroup
+from sentry.workflow_engine.models.data_condition import Condition
+from sentry.workflow_engine.processors.workflow import process_workflows
+from sentry.workflow_engine.processors.workflow_graph import (
+    get_workflow_graph,
+    workflow_graph_cache,
+)
+from sentry.workflow_engine.types import WorkflowEventData
+from tests.sentry.workflow_engine.test_base import BaseWorkflowTest
+
+
+class TestWorkflowGraph(BaseWorkflowTest):
+    def setUp(self):
+        workflow_graph_cache.clear()
+        self.workflow, self.detector, _, self.workflow_triggers = self.create_detector_and_workflow(
+            name_prefix="error",
+            workflow_triggers=self.create_data_condition_group(),
+            detector_type=ErrorGroupType.slug,
+        )
+        self.group, self.event, self.group_event = self.create_group_event()
+        self.event_data = WorkflowEventData(
+            event=self.group_event,
+            group_state=GroupState(
+                id=1, is_new=False, is_regression=True, is_new_group_environment=False
+            ),
+        )
+
+    def test_compiles_workflows(self):
+        graph = get_workflow_graph(self.detector)
+
+        assert [compiled.workflow for compiled in graph.workflows] == [self.workflow]
+        compiled = graph.workflows[0]
+        assert compiled.trigger_group is not None
+        assert compiled.trigger_group.id == self.workflow_triggers.id
+        assert [c.type for c in compiled.trigger_group.fast_conditions] == [
+            Condition.EVENT_SEEN_COUNT
+        ]
+        assert compiled.trigger_group.slow_conditions == ()
+        assert compiled.action_filters == ()
+
+    def test_partitions_slow_conditions(self):
+        self.create_data_condition(
+            condition_group=self.workflow_triggers,
+            type=Condition.EVENT_FREQUENCY_COUNT,
+            comparison={"interval": "1h", "value": 100},
+            condition_result=True,
+        )
+        compiled = get_workflow_graph(self.detector).workflows[0]
+
+        assert compiled.trigger_group is not None
+        assert len(compiled.trigger_group.fast_conditions) == 1
+        assert [c.type for c in compiled.trigger_group.slow_conditions] == [
+            Condition.EVENT_FREQUENCY_COUNT
+        ]
+
+    def test_reuses_graph_until_invalidated(self):
+        graph = get_workflow_graph(self.detector)
+        assert get_workflow_graph(self.detector) is graph
+
+        action_filters = self.create_data_condition_group(logic_type=DataConditionGroup.Type.ALL)
+        self.create_workflow_data_condition_group(
+            workflow=self.workflow, condition_group=action_filters
+        )
+
+        rebuilt = get_workflow_graph(self.detector)
+        assert rebuilt is not graph
+        assert rebuilt.version != graph.version
+        assert [f.id for f in rebuilt.workflows[0].action_filters] == [action_filters.id]
+
+    def test_invalidated_by_condition_change(self):
+        graph = get_workflow_graph(self.detector)
+        condition = self.workflow_triggers.conditions.get()
+        condition.update(comparison=5)
+
+        rebuilt = get_workflow_graph(self.detector)
+        assert rebuilt is not graph
+        assert rebuilt.workflows[0].trigger_group is not None
+        assert rebuilt.workflows[0].trigger_group.fast_conditions[0].comparison == 5
+
+    def test_disabled_workflows_are_excluded(self):
+        get_workflow_graph(self.detector)
+        self.workflow.update(enabled=False)
+
+        assert get_workflow_graph(self.detector).workflows == ()
+
+    def test_filters_by_environment(self):
+        environment = self.create_environment(project=self.project, name="production")
+        self.workflow.update(environment=environment)
+        graph = get_workflow_graph(self.detector)
+
+        assert graph.get_workflows(None) == []
+        assert [c.workflow for c in graph.get_workflows(environment.id)] == [self.workflow]
+
+    @override_options({"workflow_engine.use_compiled_workflow_graph": True})
+    def test_process_workflows_matches_uncompiled(self):
+        with override_options({"workflow_engine.use_compiled_workflow_graph": False}):
+            expected = process_workflows(self.event_data)
+
+        assert process_workflows(self.event_data) == expected == {self.workflow}
+
+    @override_options({"workflow_engine.use_compiled_workflow_graph": True})
+    def test_process_workflows_no_queries_for_cached_graph(self):
+        get_workflow_graph(self.detector)
+
+        with self.assertNumQueries(0):
+            graph = get_workflow_graph(self.detector)
+            graph.get_workflows(None)[0].evaluate_trigger(self.event_data)
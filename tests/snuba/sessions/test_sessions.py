@@ -126,6 +126,38 @@ class SnubaSessionsTest(TestCase, BaseMetricsTestCase):
         data = self.backend.check_has_health_data({self.project.id})
         assert data == {self.project.id}
 
+    def test_get_release_health_data_overview(self):
+        project_releases = [
+            (self.project.id, self.session_release),
+            (self.project.id, self.session_crashed_release),
+        ]
+        data = self.backend.get_release_health_data_overview(
+            project_releases, summary_stats_period="24h", health_stats_period="24h"
+        )
+
+        inner = data[(self.project.id, self.session_release)]
+        assert inner["total_sessions"] == 2
+        assert inner["total_users"] == 1
+        assert inner["sessions_crashed"] == 0
+        assert inner["sessions_errored"] == 0
+        assert inner["crash_free_sessions"] == 100
+        assert inner["crash_free_users"] == 100
+        assert inner["has_health_data"]
+
+        inner = data[(self.project.id, self.session_crashed_release)]
+        assert inner["total_sessions"] == 1
+        assert inner["sessions_crashed"] == 1
+        assert inner["crash_free_sessions"] == 0
+        assert inner["crash_free_users"] == 0
+
+        with self.options({"release-health.overview-concurrent-queries": True}):
+            assert (
+                self.backend.get_release_health_data_overview(
+                    project_releases, summary_stats_period="24h", health_stats_period="24h"
+                )
+                == data
+            )
+
     def test_get_project_releases_by_stability(self):
         # Add an extra session with a different `distinct_id` so that sorting by users
         # is stable